@@ -74,6 +74,11 @@ from .protocols import (
     IRigidBody2D,
     IRigidBody3D,
     IPhysicsEngine,
+    ICollisionBits,
+    IShapeCollider2D,
+    IBulletBody2D,
+    ISurfaceEffector,
+    ISensorEventQueue,
 
     # Property imports for protocols that support properties.
     IHasProperties,
@@ -181,6 +186,11 @@ __all__ = (
     'IRigidBody2D',
     'IRigidBody3D',
     'IPhysicsEngine',
+    'ICollisionBits',
+    'IShapeCollider2D',
+    'IBulletBody2D',
+    'ISurfaceEffector',
+    'ISensorEventQueue',
     # Property protocols
     'IHasProperties',
     # Connectable protocols
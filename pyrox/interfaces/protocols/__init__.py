@@ -56,6 +56,11 @@ from .physics import (
     IRigidBody2D,
     IRigidBody3D,
     IPhysicsEngine,
+    ICollisionBits,
+    IShapeCollider2D,
+    IBulletBody2D,
+    ISurfaceEffector,
+    ISensorEventQueue,
 )
 
 # Property imports for protocols that support properties.
@@ -121,6 +126,11 @@ __all__ = [
     "IRigidBody3D",
     "IPhysicsBody2D",
     "IPhysicsEngine",
+    "ICollisionBits",
+    "IShapeCollider2D",
+    "IBulletBody2D",
+    "ISurfaceEffector",
+    "ISensorEventQueue",
 
     # Property protocols
     "IHasProperties",
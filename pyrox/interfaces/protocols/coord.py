@@ -18,6 +18,8 @@ class ICoord2D(
 ):
     """Protocol for 2D coordinates."""
 
+    __slots__ = ()
+
     @property
     def x(self) -> float:
         """Get the X coordinate.
@@ -120,6 +122,8 @@ class IArea2D(
 ):
     """Protocol for 2D area defined by width and height."""
 
+    __slots__ = ()
+
     @property
     def width(self) -> float:
         """Get the width.
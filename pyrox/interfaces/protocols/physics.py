@@ -3,10 +3,12 @@
 Defines interfaces for physics bodies, colliders, materials, and rigid body dynamics.
 """
 from typing import (
+    Iterable,
     List,
     Protocol,
     runtime_checkable,
     Self,
+    Sequence,
     Tuple,
 )
 from enum import Enum, auto
@@ -78,11 +80,35 @@ class CollisionLayer(Enum):
         }
         return mapping[value.upper()]
 
+    @property
+    def bit(self) -> int:
+        """Bit flag for this layer in a collision bitmask."""
+        return 1 << (self.value - 1)
+
+    @classmethod
+    def all_bits(cls) -> int:
+        """Bitmask with every layer set."""
+        return (1 << len(cls)) - 1
+
+    @classmethod
+    def to_bits(cls, layers: Iterable['CollisionLayer']) -> int:
+        """Compile layers into a bitmask.
+
+        An empty collection produces a mask with every layer set, matching
+        the convention that an empty collision mask collides with everything.
+        """
+        bits = 0
+        for layer in layers:
+            bits |= layer.bit
+        return bits or cls.all_bits()
+
 
 @runtime_checkable
 class IMaterial(Protocol):
     """Protocol for material properties that affect physics interactions."""
 
+    __slots__ = ()
+
     @property
     def density(self) -> float:
         """Mass per unit area (kg/m²) or volume (kg/m³)."""
@@ -134,6 +160,8 @@ class IMaterial(Protocol):
 class ICollider2D(IArea2D):
     """Protocol for collision detection."""
 
+    __slots__ = ()
+
     @property
     def collider_type(self) -> ColliderType:
         """The type of collider shape."""
@@ -400,6 +428,110 @@ class IPhysicsBody2D(
     def is_on_top_of(self, other: 'IPhysicsBody2D') -> bool: ...
 
 
+@runtime_checkable
+class ICollisionBits(Protocol):
+    """Protocol for colliders that keep their layer and mask compiled to bitmasks.
+
+    Optional: the collision services compile ``collision_layer`` and
+    ``collision_mask`` themselves for colliders that don't implement it.
+    """
+
+    __slots__ = ()
+
+    @property
+    def layer_bits(self) -> int:
+        """The collision layer compiled into a single-bit mask."""
+        return self.get_layer_bits()
+
+    @property
+    def mask_bits(self) -> int:
+        """The collision mask compiled into a bitmask."""
+        return self.get_mask_bits()
+
+    def get_layer_bits(self) -> int: ...
+    def get_mask_bits(self) -> int: ...
+
+
+@runtime_checkable
+class IShapeCollider2D(Protocol):
+    """Protocol for colliders that describe their shape to the narrow phase.
+
+    Optional: colliders without it are treated as their unrotated box, with
+    a circle inscribed in it.
+    """
+
+    __slots__ = ()
+
+    def get_radius(self) -> float: ...
+    def get_world_vertices(self) -> List[Tuple[float, float]]: ...
+
+
+@runtime_checkable
+class IBulletBody2D(Protocol):
+    """Protocol for bodies that can opt into continuous collision detection.
+
+    Optional: bodies without it are never swept.
+    """
+
+    __slots__ = ()
+
+    @property
+    def bullet(self) -> bool:
+        """Whether the body is swept for continuous collision detection."""
+        return self.get_bullet()
+
+    @bullet.setter
+    def bullet(self, value: bool) -> None:
+        self.set_bullet(value)
+
+    def get_bullet(self) -> bool: ...
+    def set_bullet(self, value: bool) -> None: ...
+
+
+@runtime_checkable
+class ISurfaceEffector(Protocol):
+    """Protocol for bodies that act on the dynamic bodies touching them (belts, floors).
+
+    Once per step the physics engine collects every dynamic body in contact
+    with each effector and hands them over in a single call, instead of the
+    effector handling contacts one at a time in ``on_collision_stay``.
+    """
+
+    def apply_surface_effect(
+        self,
+        bodies: Sequence[IPhysicsBody2D],
+        bounds: Sequence[Tuple[float, float, float, float]],
+        dt: float,
+    ) -> None:
+        """Act on the dynamic bodies touching this effector.
+
+        Args:
+            bodies: Dynamic bodies in contact with the effector this step
+            bounds: Broad-phase bounds of each body, as (min_x, min_y, max_x, max_y)
+            dt: Timestep duration in seconds
+        """
+        ...
+
+
+@runtime_checkable
+class ISensorEventQueue(Protocol):
+    """Protocol for bodies that queue detection events during a step (sensors).
+
+    Transitions seen during collision detection are recorded rather than
+    dispatched, and the physics engine dispatches them once the step is
+    done, so callbacks never run inside the narrow phase.
+    """
+
+    @property
+    def has_pending_events(self) -> bool:
+        """Whether transitions are waiting to be dispatched."""
+        ...
+
+    def dispatch_events(self) -> None:
+        """Fire callbacks for the transitions queued since the last dispatch."""
+        ...
+
+
 @runtime_checkable
 class IPhysicsEngine(Protocol):
     """Protocol for the physics simulation engine."""
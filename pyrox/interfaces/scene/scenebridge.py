@@ -305,6 +305,20 @@ class ISceneBridge(ABC):
         """
         ...
 
+    @property
+    def on_source_applied(self) -> list[Callable[[ISceneBinding, Any], None]]:
+        """Callbacks run with ``(binding, scene_value)`` whenever a source value is applied to the scene."""
+        return self.get_on_source_applied()
+
+    @abstractmethod
+    def get_on_source_applied(self) -> list[Callable[[ISceneBinding, Any], None]]:
+        """Return the callbacks run whenever a source value is applied to the scene.
+
+        Callbacks receive the binding and the value written to the scene
+        (after any transform), from ticks, pushes and polls alike.
+        """
+        ...
+
     # ------------------------------------------------------------------
     # Serialization
     # ------------------------------------------------------------------
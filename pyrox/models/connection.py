@@ -3,11 +3,21 @@ from pyrox.interfaces import Connection, IConnectionRegistry
 
 
 class ConnectionRegistry(IConnectionRegistry):
-    """Manages connections between scene objects."""
+    """Manages connections between scene objects.
+
+    Adding or removing a connection bumps :attr:`revision`, so savers can
+    tell the connections changed without serializing them.
+    """
 
     def __init__(self):
         self._connections: list[Connection] = []
         self._objects: dict[str, Any] = {}
+        self._revision: int = 0
+
+    @property
+    def revision(self) -> int:
+        """Get the number of times connections were added or removed."""
+        return self._revision
 
     def register_object(self, obj_id: str, obj: Any):
         """Register an object that can be connected."""
@@ -19,16 +29,20 @@ class ConnectionRegistry(IConnectionRegistry):
             del self._objects[obj_id]
 
         # Remove connections involving this object
-        self._connections = [
+        remaining = [
             c for c in self._connections
             if c.source_id != obj_id and c.target_id != obj_id
         ]
+        if len(remaining) != len(self._connections):
+            self._revision += 1
+        self._connections = remaining
 
     def connect(self, source_id: str, output_name: str,
                 target_id: str, input_name: str) -> Connection:
         """Create a connection between objects."""
         conn = Connection(source_id, output_name, target_id, input_name)
         self._connections.append(conn)
+        self._revision += 1
 
         # Wire it up
         source = self._objects[source_id]
@@ -41,6 +55,25 @@ class ConnectionRegistry(IConnectionRegistry):
         callback_list.append(target_method)
         return conn
 
+    def disconnect(self, conn: Connection) -> None:
+        """Remove a connection and unwire it."""
+        self._connections.remove(conn)
+        self._revision += 1
+
+        source = self._objects.get(conn.source_id)
+        target = self._objects.get(conn.target_id)
+        if source is None or target is None:
+            return
+        callback_list = getattr(source, conn.source_output, [])
+        target_method = getattr(target, conn.target_input, None)
+        if target_method is not None and target_method in callback_list:
+            callback_list.remove(target_method)
+
+    def clear_connections(self) -> None:
+        """Remove and unwire every connection."""
+        for conn in list(self._connections):
+            self.disconnect(conn)
+
     def serialize(self) -> dict:
         """Serialize connections for saving."""
         return {
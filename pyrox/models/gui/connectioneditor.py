@@ -766,24 +766,13 @@ class ConnectionEditor(ttk.Frame):
             if expected_tag1 in tags and expected_tag2 in tags:
                 # Remove from registry
                 if self._registry:
-                    # Find and remove from connections list
-                    for i, conn in enumerate(self._registry._connections):
+                    # Find it, then remove it and its callback
+                    for conn in self._registry._connections:
                         if (conn.source_id == source_id and
                             conn.source_output == source_port and
                             conn.target_id == target_id and
                                 conn.target_input == target_port):
-
-                            # Remove from callback list
-                            source_obj = self._registry._objects[source_id]
-                            target_obj = self._registry._objects[target_id]
-                            callback_list = getattr(source_obj, source_port)
-                            target_method = getattr(target_obj, target_port)
-
-                            if target_method in callback_list:
-                                callback_list.remove(target_method)
-
-                            # Remove from connections list
-                            self._registry._connections.pop(i)
+                            self._registry.disconnect(conn)
                             break
 
                 # Remove from canvas
@@ -889,18 +878,7 @@ class ConnectionEditor(ttk.Frame):
 
         if result and self._registry:
             # Clear from registry
-            for conn in list(self._registry._connections):
-                source_obj = self._registry._objects.get(conn.source_id)
-                target_obj = self._registry._objects.get(conn.target_id)
-
-                if source_obj and target_obj:
-                    callback_list = getattr(source_obj, conn.source_output, [])
-                    target_method = getattr(target_obj, conn.target_input, None)
-
-                    if target_method and target_method in callback_list:
-                        callback_list.remove(target_method)
-
-            self._registry._connections.clear()
+            self._registry.clear_connections()
 
             # Clear from canvas - delete all connection items
             self._canvas.delete("connection")
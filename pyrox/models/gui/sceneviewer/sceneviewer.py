@@ -125,6 +125,8 @@ class SceneViewerFrame(TkinterTaskFrame):
         self._needs_render: bool = False
         self._render_timer_id: str | None = None
         self._render_interval_ms: int = 33  # ~30 FPS for rendering (decoupled from 60 Hz updates)
+        self._physics_profile_shown: bool = False
+        self._synced_bodies: dict = {}  # Bodies drawn as moving by the last position sync, to their object ids
 
         # TODO: remove these following properties and abstract with services
         self._entity_names_visible: bool = True
@@ -544,6 +546,10 @@ class SceneViewerFrame(TkinterTaskFrame):
         max_scene_x = (canvas_width - self.viewport.x + margin) / self.viewport.zoom
         max_scene_y = (canvas_height - self.viewport.y + margin) / self.viewport.zoom
 
+        # Build lazily loaded objects and load chunks as they come into view
+        if isinstance(self._scene, Scene):
+            self._scene.set_focus(min_scene_x, min_scene_y, max_scene_x, max_scene_y)
+
         # Sort objects by layer (z-order) before rendering
         # Lower layer values render first (background), higher values render last (foreground)
         sorted_objects = sorted(
@@ -728,10 +734,32 @@ class SceneViewerFrame(TkinterTaskFrame):
         if self._properties_panel_visible and self._canvas_object_management_service.selected_objects:
             self._update_properties_panel()
 
+        self._update_physics_profile()
+
         # Schedule next render check
         if self._canvas and self._canvas.winfo_exists():
             self._render_timer_id = self._canvas.after(self._render_interval_ms, self._render_loop)
 
+    def _update_physics_profile(self) -> None:
+        """Feed the physics step profile to the status bar while profiling is enabled.
+
+        The status section falls back to "Physics: --" once, when profiling is
+        turned off, and is left alone while no profile is being shown.
+        """
+        profile = None
+        if self._runner:
+            try:
+                physics_engine = self._runner.get_physics_engine()
+            except (AttributeError, RuntimeError):
+                physics_engine = None
+            if physics_engine is not None and physics_engine.profiler is not None:
+                profile = physics_engine.profiler.to_dict()
+
+        if profile is None and not self._physics_profile_shown:
+            return
+        self._physics_profile_shown = profile is not None
+        self._viewport_service.status.set_physics_profile(profile)
+
     def _mark_dirty(self, *_) -> None:
         """Mark scene as needing re-render.
 
@@ -746,6 +774,12 @@ class SceneViewerFrame(TkinterTaskFrame):
         Updates canvas item positions based on scene object positions
         without full re-render. Used during continuous physics simulation.
 
+        With a physics engine running, only the bodies that moved in the
+        last step are visited, drawn at the engine's interpolated positions
+        so motion stays smooth when physics steps slower than the scene
+        updates. Bodies that stopped since the last sync are drawn once more
+        at their resting position. Without one, every object is synced.
+
         NOTE: This is called at scene update rate (~60 FPS). Keep operations minimal.
         """
         if not self._scene or not self._canvas:
@@ -756,38 +790,73 @@ class SceneViewerFrame(TkinterTaskFrame):
         if not objects_dict:
             return
 
-        # Batch update - iterate through objects and update positions
-        for obj_id, canvas_id in objects_dict.items():
-            scene_obj = self._scene.scene_objects.get(obj_id)
-            if not scene_obj:
-                continue
+        physics_engine = None
+        if self._runner:
+            try:
+                physics_engine = self._runner.get_physics_engine()
+            except (AttributeError, RuntimeError):
+                physics_engine = None
 
-            # Calculate new canvas position
-            new_canvas_x = scene_obj.x * self.viewport.zoom + self.viewport.x
-            new_canvas_y = scene_obj.y * self.viewport.zoom + self.viewport.y
+        if physics_engine is None:
+            # Batch update - iterate through objects and update positions
+            for obj_id, canvas_id in objects_dict.items():
+                scene_obj = self._scene.scene_objects.get(obj_id)
+                if scene_obj:
+                    self._move_canvas_object(obj_id, canvas_id, scene_obj.x, scene_obj.y)
+            self._synced_bodies = {}
+            return
 
-            # Get current canvas position
-            try:
-                coords = self._canvas.coords(canvas_id)
-                if not coords or len(coords) < 2:
-                    continue
-            except tk.TclError:
-                continue
+        # Scene objects share their physics body's id
+        moving = {}
+        for body, (x, y) in physics_engine.iter_moving_positions():
+            obj_id = getattr(body, 'id', None)
+            canvas_id = objects_dict.get(obj_id)
+            if canvas_id is not None:
+                moving[body] = obj_id
+                self._move_canvas_object(obj_id, canvas_id, x, y)
+
+        for body, obj_id in self._synced_bodies.items():
+            if body not in moving:
+                canvas_id = objects_dict.get(obj_id)
+                if canvas_id is not None:
+                    self._move_canvas_object(obj_id, canvas_id, body.x, body.y)
+        self._synced_bodies = moving
+
+    def _move_canvas_object(self, obj_id: str, canvas_id: int, x: float, y: float) -> None:
+        """Move an object's canvas items so they are drawn at a scene position.
 
-            current_canvas_x = coords[0]
-            current_canvas_y = coords[1]
+        Args:
+            obj_id: Scene object id, which tags all of its canvas items
+            canvas_id: The object's main canvas item
+            x: Scene X coordinate to draw at
+            y: Scene Y coordinate to draw at
+        """
+        # Calculate new canvas position
+        new_canvas_x = x * self.viewport.zoom + self.viewport.x
+        new_canvas_y = y * self.viewport.zoom + self.viewport.y
 
-            # Calculate delta
-            dx = new_canvas_x - current_canvas_x
-            dy = new_canvas_y - current_canvas_y
+        # Get current canvas position
+        try:
+            coords = self._canvas.coords(canvas_id)
+            if not coords or len(coords) < 2:
+                return
+        except tk.TclError:
+            return
 
-            # Only update if meaningful change (threshold increased from 0.01 to 0.5 pixels)
-            # This significantly reduces unnecessary canvas operations when objects are stationary
-            if abs(dx) > 0.5 or abs(dy) > 0.5:
-                # Move all items with this obj_id tag (shape + label) in one batch
-                # Note: find_withtag is still expensive, but only called when movement detected
-                for item in self._canvas.find_withtag(obj_id):
-                    self._canvas.move(item, dx, dy)
+        current_canvas_x = coords[0]
+        current_canvas_y = coords[1]
+
+        # Calculate delta
+        dx = new_canvas_x - current_canvas_x
+        dy = new_canvas_y - current_canvas_y
+
+        # Only update if meaningful change (threshold increased from 0.01 to 0.5 pixels)
+        # This significantly reduces unnecessary canvas operations when objects are stationary
+        if abs(dx) > 0.5 or abs(dy) > 0.5:
+            # Move all items with this obj_id tag (shape + label) in one batch
+            # Note: find_withtag is still expensive, but only called when movement detected
+            for item in self._canvas.find_withtag(obj_id):
+                self._canvas.move(item, dx, dy)
 
     # ==================== UI Building Methods ====================
 
@@ -1443,10 +1512,40 @@ class SceneViewerFrame(TkinterTaskFrame):
         Args:
             event: Mouse release event
         """
+        if self._is_dragging:
+            self._refresh_dragged_physics_bodies()
         self._is_dragging = False
         self._drag_start_x = None
         self._drag_start_y = None
 
+    def _refresh_dragged_physics_bodies(self) -> None:
+        """Re-bin moved bodies in the physics broad phase.
+
+        Static and sleeping bodies are not re-binned automatically each step,
+        so bodies moved by a drag must be refreshed explicitly.
+        """
+        if not self._runner or not self._scene:
+            return
+        try:
+            physics_engine = self._runner.get_physics_engine()
+        except (AttributeError, RuntimeError):
+            return
+        if physics_engine is None:
+            return
+
+        for obj_id in self._canvas_object_management_service.selected_objects:
+            scene_obj = self._scene.scene_objects.get(obj_id)
+            if not scene_obj:
+                continue
+            if isinstance(scene_obj, SceneGroup):
+                member_ids = [obj_id, *scene_obj.get_member_ids()]
+            else:
+                member_ids = [obj_id]
+            for member_id in member_ids:
+                member = self._scene.scene_objects.get(member_id)
+                if member is not None:
+                    physics_engine.refresh_body(member.physics_body)
+
     # ==================== Drawing & Placement Event Handlers ====================
 
     def _create_scene_object(
@@ -1867,7 +1966,7 @@ class SceneViewerFrame(TkinterTaskFrame):
                 return self._paste_group_data(obj_data)
 
             # Clear the body's id so BasePhysicsBody.__init__ generates a fresh one.
-            # (The SceneObject's own .id is proxied to physics_body.id via __getattribute__,
+            # (The SceneObject's own .id is proxied to physics_body.id via get_id(),
             # so replacing only the top-level obj_data['id'] has no effect — the body id
             # is what actually gets reused and collides with the original object.)
             if 'body' in obj_data:
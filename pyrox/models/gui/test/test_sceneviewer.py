@@ -1,8 +1,15 @@
 """Unit tests for SceneViewerFrame coordinate transformation logic."""
+import tempfile
 import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
-from pyrox.models.scene import Scene, SceneObject
+from pyrox.models.gui.sceneviewer.sceneviewer import SceneViewerFrame
+from pyrox.models.scene import Scene, SceneObject, SceneChunkStore
 from pyrox.models.physics import BasePhysicsBody
+from pyrox.models.physics.sensor import ProximitySensorBody
+from pyrox.services.physics import PhysicsEngineService
 
 
 class TestSceneViewerCoordinates(unittest.TestCase):
@@ -133,5 +140,83 @@ class TestZoomLogic(unittest.TestCase):
         self.assertEqual(clamped, max_zoom)
 
 
+class TestPhysicsProfileStatus(unittest.TestCase):
+    """Test the render loop feeding the physics profile to the status bar."""
+
+    def _viewer(self, engine):
+        runner = MagicMock()
+        runner.get_physics_engine.return_value = engine
+        return SimpleNamespace(
+            _runner=runner,
+            _viewport_service=MagicMock(),
+            _physics_profile_shown=False,
+        )
+
+    def test_profile_fed_while_profiling(self):
+        """Test the profiler's histograms reach the status service."""
+        engine = PhysicsEngineService(profiling=True)
+        engine.step(engine.get_physics_step())
+        viewer = self._viewer(engine)
+
+        SceneViewerFrame._update_physics_profile(viewer)
+
+        profile = viewer._viewport_service.status.set_physics_profile.call_args[0][0]
+        self.assertEqual(profile['step']['count'], 1)
+        self.assertTrue(viewer._physics_profile_shown)
+
+    def test_nothing_sent_without_profiler(self):
+        """Test the status section is left alone when profiling is off."""
+        viewer = self._viewer(PhysicsEngineService())
+
+        SceneViewerFrame._update_physics_profile(viewer)
+
+        viewer._viewport_service.status.set_physics_profile.assert_not_called()
+
+    def test_profile_cleared_once_when_profiling_stops(self):
+        """Test turning profiling off resets the section a single time."""
+        engine = PhysicsEngineService(profiling=True)
+        viewer = self._viewer(engine)
+        SceneViewerFrame._update_physics_profile(viewer)
+
+        engine.profiling = False
+        SceneViewerFrame._update_physics_profile(viewer)
+        SceneViewerFrame._update_physics_profile(viewer)
+
+        status = viewer._viewport_service.status
+        self.assertEqual(status.set_physics_profile.call_count, 2)
+        status.set_physics_profile.assert_called_with(None)
+
+
+class TestRenderFocus(unittest.TestCase):
+    """Test the redraw handing the visible region to the scene."""
+
+    def _viewer(self, scene):
+        canvas = MagicMock()
+        canvas.winfo_width.return_value = 200
+        canvas.winfo_height.return_value = 100
+        return SimpleNamespace(
+            _scene=scene,
+            _canvas=canvas,
+            viewport=SimpleNamespace(x=0.0, y=0.0, zoom=1.0),
+            _render_scene_object=MagicMock(),
+        )
+
+    def test_redraw_loads_visible_chunks(self):
+        """Test a chunk store loads the chunks in view when the viewer redraws."""
+        scene = Scene(name="Chunked")
+        for x in (0.0, 250.0, 900.0):
+            body = ProximitySensorBody(name=f"Sensor{x}", x=x, y=0.0, width=10.0, height=10.0)
+            scene.add_scene_object(SceneObject(name=body.name, scene_object_type="sensor", physics_body=body))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            SceneChunkStore.split(scene, Path(temp_dir), chunk_size=200.0)
+            store = SceneChunkStore.open(Path(temp_dir))
+
+            SceneViewerFrame.render_scene_objects(self._viewer(store.scene))
+
+            self.assertEqual(sorted(store.loaded_chunks), [(0, 0), (1, 0)])
+            self.assertEqual(len(store.scene.get_scene_objects()), 2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -41,6 +41,8 @@ class TopDownPlayerBody(BasePhysicsBody):
         keyboard: Optional keyboard source that drives automatic movement.
     """
 
+    __slots__ = ('_movement_speed', '_movement_direction')
+
     def __init__(
         self,
         name: str = "Player",
@@ -37,6 +37,8 @@ class BasePhysicsBody(
         tags: List of string tags for categorization
     """
 
+    __slots__ = ('_name', '_id', '_connections', '_template_name', '_tags')
+
     def __init__(
         self,
         name: str = "",
@@ -65,6 +67,7 @@ class BasePhysicsBody(
         pitch: float = 0.0,
         yaw: float = 0.0,
         material: IMaterial | None = None,
+        bullet: bool = False,
     ):
         """Initialize base physics body.
 
@@ -93,6 +96,7 @@ class BasePhysicsBody(
             pitch: Pitch rotation in degrees
             yaw: Yaw rotation in degrees
             material: Material properties (creates default if None)
+            bullet: Whether to sweep the body for continuous collision detection
         """
         Nameable.__init__(self=self, name=name)
         id = id or f'physics-body-{name}-{IdGeneratorService.get_id()}'
@@ -121,10 +125,20 @@ class BasePhysicsBody(
             pitch=pitch,
             yaw=yaw,
             material=material,
+            bullet=bullet,
         )
         self._template_name = template_name
         self._tags = tags or []
 
+    def set_name(self, name: str) -> None:
+        """Set the name of this body.
+
+        Args:
+            name: The name to set
+        """
+        self._name = name
+        self._bump_revision()
+
     def get_tags(self) -> list[str]:
         """Get the list of tags associated with this body.
 
@@ -140,6 +154,7 @@ class BasePhysicsBody(
             tags: List of tags to set
         """
         self._tags = tags
+        self._bump_revision()
 
     def has_tag(self, tag: str) -> bool:
         """Check if this body has a specific tag.
@@ -160,6 +175,7 @@ class BasePhysicsBody(
         """
         if tag not in self.tags:
             self.tags.append(tag)
+            self._bump_revision()
 
     def remove_tag(self, tag: str) -> None:
         """Remove a tag from this body.
@@ -169,6 +185,7 @@ class BasePhysicsBody(
         """
         if tag in self.tags:
             self.tags.remove(tag)
+            self._bump_revision()
 
     # IConnectable methods
     def get_inputs(self) -> dict[str, Any]:
@@ -219,6 +236,7 @@ class BasePhysicsBody(
             "collision_layer": self.collider.collision_layer.name,
             "collsion_mask": [layer.name for layer in self.collider.collision_mask],
             "is_trigger": self.collider.is_trigger,
+            "bullet": self.bullet,
             # Material properties
             "density": self.material.density,
             "restitution": self.material.restitution,
@@ -264,6 +282,7 @@ class BasePhysicsBody(
             pitch=data.get('pitch', 0.0),
             yaw=data.get('yaw', 0.0),
             material=Material.from_dict(data['material']) if data.get('material') else None,
+            bullet=data.get('bullet', False),
         )
 
     def to_dict(self) -> dict:
@@ -298,6 +317,7 @@ class BasePhysicsBody(
             "roll": self.roll,
             "pitch": self.pitch,
             "yaw": self.yaw,
+            "bullet": self.bullet,
             "material": {
                 "density": self.material.density,
                 "restitution": self.material.restitution,
@@ -4,7 +4,8 @@ Provides a static or kinematic conveyor belt that moves objects
 placed on top of it in a specified direction and speed.
 """
 from enum import Enum
-from typing import Any, Callable, List, Set
+from typing import Any, Callable, List, Sequence, Set, Tuple
+import numpy as np
 from pyrox.interfaces.protocols.physics import (
     BodyType,
     ColliderType,
@@ -71,6 +72,8 @@ class ConveyorBody(BasePhysicsBody):
 
     A conveyor belt is typically a STATIC or KINEMATIC body that doesn't
     move itself, but applies velocity to dynamic objects sitting on top.
+    The physics engine treats it as a surface effector and calls
+    :meth:`apply_surface_effect` with everything on the belt each step.
 
     Attributes:
         belt_velocity: (vx, vy) velocity applied to objects on the belt
@@ -79,6 +82,8 @@ class ConveyorBody(BasePhysicsBody):
         belt_speed: Speed of the belt in units/second
     """
 
+    __slots__ = ('_direction', '_objects_on_belt', '_belt_speed', '_is_active')
+
     def __init__(
         self,
         name: str = "Conveyor",
@@ -159,9 +164,41 @@ class ConveyorBody(BasePhysicsBody):
         else:
             self._direction = direction
 
-        self.belt_speed = belt_speed
-        self.is_active = is_active
         self._objects_on_belt: Set[IPhysicsBody2D] = set()
+        self._belt_speed = belt_speed
+        self._is_active = is_active
+
+    @property
+    def belt_speed(self) -> float:
+        """Get the belt speed in units/second."""
+        return self._belt_speed
+
+    @belt_speed.setter
+    def belt_speed(self, value: float) -> None:
+        """Set the belt speed, waking any sleeping objects on the belt."""
+        if value != self._belt_speed:
+            self._belt_speed = value
+            self._bump_revision()
+            self._wake_objects_on_belt()
+
+    @property
+    def is_active(self) -> bool:
+        """Get whether the conveyor is running."""
+        return self._is_active
+
+    @is_active.setter
+    def is_active(self, value: bool) -> None:
+        """Set whether the conveyor is running, waking any sleeping objects on the belt."""
+        if value != self._is_active:
+            self._is_active = value
+            self._bump_revision()
+            self._wake_objects_on_belt()
+
+    def _wake_objects_on_belt(self) -> None:
+        """Wake objects resting on the belt so they react to a belt change."""
+        for body in self._objects_on_belt:
+            if body.sleeping:
+                body.set_sleeping(False)
 
     @property
     def belt_velocity(self) -> tuple[float, float]:
@@ -184,6 +221,7 @@ class ConveyorBody(BasePhysicsBody):
             velocity: (vx, vy) velocity tuple
         """
         vx, vy = velocity
+        previous_direction = self._direction
         if vx > 0:
             self._direction = Direction.EAST
             self.belt_speed = vx
@@ -199,6 +237,9 @@ class ConveyorBody(BasePhysicsBody):
         else:
             # No movement, keep current direction but set speed to 0
             self.belt_speed = 0.0
+        if self._direction != previous_direction:
+            self._bump_revision()
+            self._wake_objects_on_belt()
 
     @property
     def direction(self) -> Direction:
@@ -217,9 +258,11 @@ class ConveyorBody(BasePhysicsBody):
             direction: Direction enum or string ("north", "south", "east", "west")
         """
         if isinstance(direction, str):
-            self._direction = Direction.from_str(direction)
-        else:
+            direction = Direction.from_str(direction)
+        if direction != self._direction:
             self._direction = direction
+            self._bump_revision()
+            self._wake_objects_on_belt()
 
     def get_direction(self) -> str:
         """Get the belt direction as a string.
@@ -236,9 +279,11 @@ class ConveyorBody(BasePhysicsBody):
             direction: Direction enum or string ("north", "south", "east", "west")
         """
         if isinstance(direction, str):
-            self._direction = Direction.from_str(direction)
-        else:
+            direction = Direction.from_str(direction)
+        if direction != self._direction:
             self._direction = direction
+            self._bump_revision()
+            self._wake_objects_on_belt()
 
     def set_belt_speed(self, belt_speed: float) -> None:
         """Set the belt speed.
@@ -278,53 +323,62 @@ class ConveyorBody(BasePhysicsBody):
         if other.is_on_top_of(self):
             self._objects_on_belt.add(other)
 
-    def on_collision_stay(self, other: IPhysicsBody2D) -> None:
-        """Called each frame while an object is colliding with the conveyor.
+    def apply_surface_effect(
+        self,
+        bodies: Sequence[IPhysicsBody2D],
+        bounds: Sequence[Tuple[float, float, float, float]],
+        dt: float,
+    ) -> None:
+        """Move the dynamic bodies on top of the belt.
 
-        This is where we apply the conveyor motion to objects on top.
+        Called by the physics engine once per step with every dynamic body
+        touching the conveyor. Which bodies are on top is worked out for all
+        of them at once from their broad-phase bounds; bodies touching only
+        a side are dropped from the belt.
 
         Args:
-            other: The colliding physics body
+            bodies: Dynamic bodies in contact with the conveyor this step
+            bounds: Bounds of each body, as (min_x, min_y, max_x, max_y)
+            dt: Timestep duration in seconds
         """
-        if not self.is_active:
-            return
-
-        # Only affect dynamic bodies that are on top of the conveyor
-        if other.body_type != BodyType.DYNAMIC:
-            return
-
-        if not other.is_on_top_of(self):
-            # Object is touching but not on top (side collision)
-            self._objects_on_belt.discard(other)
+        if not self._is_active or not bodies:
             return
 
-        # Add to tracking set
-        self._objects_on_belt.add(other)
-
-        # Apply conveyor velocity to the object
-        belt_vx, belt_vy = self.belt_velocity
-        current_vx, current_vy = other.linear_velocity
+        # Same overlap test as is_on_top_of, for every body in one pass
+        min_x, min_y, max_x, max_y = self.get_bounds()
+        body_bounds = np.asarray(bounds, dtype=float).reshape(-1, 4)
+        on_top = ((body_bounds[:, 2] >= min_x) & (body_bounds[:, 0] <= max_x)
+                  & (body_bounds[:, 3] >= min_y) & (body_bounds[:, 1] <= max_y)).tolist()
+
+        objects_on_belt = self._objects_on_belt
+        carried = []
+        for body, is_on_top in zip(bodies, on_top):
+            if is_on_top:
+                objects_on_belt.add(body)
+                carried.append(body)
+            else:
+                objects_on_belt.discard(body)
 
         # Apply belt velocity while preserving perpendicular movement
         # For top-down: set velocity along belt direction, preserve perpendicular
         # For side-view: replace horizontal, preserve vertical (falling)
+        belt_vx, belt_vy = self.belt_velocity
         if self.is_trigger:  # Top-down mode
-            # Calculate the velocity component along the belt direction
-            # and perpendicular to it
-            if abs(belt_vx) > 0.01:  # Belt moving horizontally
-                # Set X to belt speed, preserve Y
-                other.set_linear_velocity(belt_vx, current_vy)
-            elif abs(belt_vy) > 0.01:  # Belt moving vertically
-                # Set Y to belt speed, preserve X
-                other.set_linear_velocity(current_vx, belt_vy)
+            if abs(belt_vx) > 0.01:
+                horizontal = True
+            elif abs(belt_vy) > 0.01:
+                horizontal = False
             else:
-                # Belt is stopped, don't change velocity
-                pass
+                return  # Belt is stopped, don't change velocity
         else:  # Side-scroller mode
-            if abs(belt_vx) > 0:  # Moving horizontally
-                other.set_linear_velocity(belt_vx, current_vy)
-            else:  # Moving vertically
-                other.set_linear_velocity(current_vx, belt_vy)
+            horizontal = abs(belt_vx) > 0
+
+        if horizontal:
+            for body in carried:
+                body.set_linear_velocity(belt_vx, body.linear_velocity[1])
+        else:
+            for body in carried:
+                body.set_linear_velocity(body.linear_velocity[0], belt_vy)
 
     def on_collision_exit(self, other: IPhysicsBody2D) -> None:
         """Called when an object stops colliding with the conveyor.
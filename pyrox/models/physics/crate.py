@@ -26,6 +26,8 @@ class CrateBody(BasePhysicsBody):
         crate_type: Type identifier (e.g., "wooden", "metal", "cardboard")
     """
 
+    __slots__ = ('crate_type',)
+
     def __init__(
         self,
         name: str = "Crate",
@@ -40,6 +42,7 @@ class CrateBody(BasePhysicsBody):
         collision_layer: CollisionLayer = CollisionLayer.DEFAULT,
         collision_mask: List[CollisionLayer] | None = None,
         material: Material | None = None,
+        bullet: bool = False,
         *args,
         **kwargs
     ):
@@ -56,6 +59,8 @@ class CrateBody(BasePhysicsBody):
             collision_layer: Collision layer
             collision_mask: Which layers this crate collides with
             material: Material properties (auto-selected based on type if None)
+            bullet: Sweep the crate between steps so it can't tunnel through
+                thin bodies when moving fast
         """
         # Default collision mask includes most common layers
         if collision_mask is None:
@@ -93,6 +98,7 @@ class CrateBody(BasePhysicsBody):
             width=width,
             height=height,
             material=material,
+            bullet=bullet,
         )
 
         self.crate_type = crate_type
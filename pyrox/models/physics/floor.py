@@ -3,7 +3,8 @@
 Provides a static floor surface with configurable friction properties,
 ideal for top-down environments where objects should slide and stop naturally.
 """
-from typing import Any, List
+from typing import Any, List, Sequence, Tuple
+import numpy as np
 from pyrox.interfaces.protocols.physics import (
     BodyType,
     ColliderType,
@@ -24,7 +25,8 @@ class FloorBody(BasePhysicsBody):
 
     **For Top-Down Games (default):**
         - Set `is_trigger=True` (default) - objects move through the floor
-        - Floor applies direct velocity damping via `on_collision_stay` callback
+        - Floor applies direct velocity damping via `apply_surface_effect`,
+          which the physics engine calls once per step for all contacts
         - Objects slide and stop based on material's friction/drag values
         - Damping is applied every frame while objects overlap the floor
         - More realistic stopping behavior than force-based friction
@@ -49,6 +51,8 @@ class FloorBody(BasePhysicsBody):
         friction_coefficient: How much friction the surface provides
     """
 
+    __slots__ = ('_surface_type',)
+
     # Preset surface types with their material properties
     SURFACE_PRESETS = {
         'concrete': {
@@ -187,6 +191,7 @@ class FloorBody(BasePhysicsBody):
             )
 
         self._surface_type = surface_lower
+        self._bump_revision()
         preset = self.SURFACE_PRESETS[surface_lower]
 
         # Update material properties
@@ -213,25 +218,33 @@ class FloorBody(BasePhysicsBody):
         # Floor is passive - doesn't need special collision behavior
         pass
 
-    def on_collision_stay(self, other: IPhysicsBody2D) -> None:
-        """Called each frame while an object is colliding with the floor.
+    def apply_surface_effect(
+        self,
+        bodies: Sequence[IPhysicsBody2D],
+        bounds: Sequence[Tuple[float, float, float, float]],
+        dt: float,
+    ) -> None:
+        """Damp the velocity of the dynamic bodies on the floor.
 
-        For trigger floors (top-down games), this uses direct velocity damping
-        for more realistic stopping behavior instead of force-based friction.
+        Called by the physics engine once per step with every dynamic body
+        touching the floor. For trigger floors (top-down games), this uses
+        direct velocity damping for more realistic stopping behavior instead
+        of force-based friction, worked out for all bodies in one array pass.
 
         Args:
-            other: The colliding physics body
+            bodies: Dynamic bodies in contact with the floor this step
+            bounds: Bounds of each body (unused; every contact is on the floor)
+            dt: Timestep duration in seconds
         """
-        # Only apply if this is a trigger floor and the other body is dynamic
-        if not self.collider.is_trigger or other.body_type != BodyType.DYNAMIC:
+        # Only apply if this is a trigger floor
+        if not self.collider.is_trigger or not bodies:
             return
 
-        # Get the other body's velocity
-        vx, vy = other.linear_velocity
+        velocities = np.array([body.linear_velocity for body in bodies], dtype=float).reshape(-1, 2)
 
-        # Calculate velocity magnitude
-        speed = (vx**2 + vy**2)**0.5
-        if speed < 0.01:  # Skip if nearly stationary
+        # Skip bodies that are nearly stationary
+        moving = np.hypot(velocities[:, 0], velocities[:, 1]) >= 0.01
+        if not moving.any():
             return
 
         # For top-down games, use direct velocity damping instead of forces
@@ -260,16 +273,13 @@ class FloorBody(BasePhysicsBody):
         combined_damping = damping_factor * drag_damping
 
         # Apply damping to velocity
-        new_vx = vx * combined_damping
-        new_vy = vy * combined_damping
+        damped = velocities * combined_damping
 
         # Snap to zero if very slow (prevents infinite asymptotic decay and oscillation)
-        if abs(new_vx) < 1.0:
-            new_vx = 0.0
-        if abs(new_vy) < 1.0:
-            new_vy = 0.0
+        damped[np.abs(damped) < 1.0] = 0.0
 
-        other.set_linear_velocity(new_vx, new_vy)
+        for index in np.flatnonzero(moving).tolist():
+            bodies[index].set_linear_velocity(float(damped[index, 0]), float(damped[index, 1]))
 
     def on_collision_exit(self, other: IPhysicsBody2D) -> None:
         """Called when an object stops colliding with the floor.
@@ -3,7 +3,7 @@
 Provides a trigger-based proximity sensor that detects when objects
 enter or exit its detection zone without physically interacting with them.
 """
-from typing import List, Callable, Set, Any
+from typing import Dict, List, Callable, Set, Any
 from pyrox.interfaces.protocols.physics import (
     BodyType,
     ColliderType,
@@ -12,6 +12,7 @@ from pyrox.interfaces.protocols.physics import (
 )
 from pyrox.models.physics.base import BasePhysicsBody
 from pyrox.models.protocols.physics import Material
+from pyrox.services.logging import log
 from .factory import PhysicsSceneTemplate, PhysicsSceneFactory
 
 
@@ -26,12 +27,32 @@ class ProximitySensorBody(BasePhysicsBody):
     - Activated: When first object enters (empty -> occupied)
     - Deactivated: When last object exits (occupied -> empty)
 
+    Detection state updates as soon as collisions are detected, but the
+    callbacks are queued and fired by :meth:`dispatch_events`, which the
+    physics engine calls once per step after collisions are resolved.
+    Transitions are coalesced per dispatch: an object that enters and exits
+    between two dispatches fires neither callback, and the sensor only
+    reports activate or deactivate if its state differs from the last one
+    it reported.
+
     Attributes:
         is_active: Whether the sensor currently detects any objects
         detected_objects: Set of objects currently in the sensor zone
         detection_count: Number of objects currently detected
     """
 
+    __slots__ = (
+        '_detected_objects',
+        '_is_active',
+        '_reported_active',
+        '_pending_enters',
+        '_pending_exits',
+        '_on_activate_callbacks',
+        '_on_deactivate_callbacks',
+        '_on_object_enter_callbacks',
+        '_on_object_exit_callbacks',
+    )
+
     def __init__(
         self,
         name: str = "ProximitySensor",
@@ -93,6 +114,11 @@ class ProximitySensorBody(BasePhysicsBody):
         self._detected_objects: Set[IPhysicsBody2D] = set()
         self._is_active: bool = False
 
+        # Queued transitions, in the order they happened
+        self._reported_active: bool = False
+        self._pending_enters: Dict[IPhysicsBody2D, None] = {}
+        self._pending_exits: Dict[IPhysicsBody2D, None] = {}
+
         # State change callbacks
         self._on_activate_callbacks: List[Callable[['ProximitySensorBody'], None]] = []
         self._on_deactivate_callbacks: List[Callable[['ProximitySensorBody'], None]] = []
@@ -128,6 +154,15 @@ class ProximitySensorBody(BasePhysicsBody):
         """
         return len(self._detected_objects)
 
+    @property
+    def has_pending_events(self) -> bool:
+        """Check if transitions are waiting to be dispatched.
+
+        Returns:
+            True if :meth:`dispatch_events` would fire any callback
+        """
+        return bool(self._pending_enters or self._pending_exits) or self._reported_active != self._is_active
+
     @property
     def on_activate_callbacks(self) -> List[Callable[['ProximitySensorBody'], None]]:
         """Get list of callbacks fired when sensor activates (empty -> occupied).
@@ -174,12 +209,11 @@ class ProximitySensorBody(BasePhysicsBody):
         if other not in self._detected_objects:
             self._detected_objects.add(other)
 
-            # Fire object enter callbacks
-            for callback in self._on_object_enter_callbacks:
-                try:
-                    callback(self, other)
-                except Exception as e:
-                    print(f"Error in sensor object_enter callback: {e}")
+            # Queue the enter, unless it undoes an exit not yet dispatched
+            if other in self._pending_exits:
+                del self._pending_exits[other]
+            else:
+                self._pending_enters[other] = None
 
             # Check if this activates the sensor
             if not self._is_active:
@@ -195,12 +229,11 @@ class ProximitySensorBody(BasePhysicsBody):
         if other in self._detected_objects:
             self._detected_objects.remove(other)
 
-            # Fire object exit callbacks
-            for callback in self._on_object_exit_callbacks:
-                try:
-                    callback(self, other)
-                except Exception as e:
-                    print(f"Error in sensor object_exit callback: {e}")
+            # Queue the exit, unless it undoes an enter not yet dispatched
+            if other in self._pending_enters:
+                del self._pending_enters[other]
+            else:
+                self._pending_exits[other] = None
 
             # Check if this deactivates the sensor
             if self._is_active and len(self._detected_objects) == 0:
@@ -209,39 +242,64 @@ class ProximitySensorBody(BasePhysicsBody):
     def _activate(self) -> None:
         """Activate the sensor (first object entered).
 
-        Fires all on_activate callbacks.
+        The on_activate callbacks fire at the next dispatch.
         """
-        if not self._is_active:
-            self._is_active = True
-
-            # Fire activate callbacks
-            for callback in self._on_activate_callbacks:
-                try:
-                    callback(self)
-                except Exception as e:
-                    print(f"Error in sensor activate callback: {e}")
+        self._is_active = True
 
     def _deactivate(self) -> None:
         """Deactivate the sensor (last object exited).
 
-        Fires all on_deactivate callbacks.
+        The on_deactivate callbacks fire at the next dispatch.
         """
-        if self._is_active:
-            self._is_active = False
+        self._is_active = False
+
+    def dispatch_events(self) -> None:
+        """Fire callbacks for the transitions queued since the last dispatch.
 
-            # Fire deactivate callbacks
-            for callback in self._on_deactivate_callbacks:
-                try:
-                    callback(self)
-                except Exception as e:
-                    print(f"Error in sensor deactivate callback: {e}")
+        Exits fire before enters, then activate or deactivate if the
+        sensor's state changed. Callbacks may safely move bodies or change
+        other sensors; transitions they cause are queued for the next
+        dispatch.
+        """
+        enters = self._pending_enters
+        exits = self._pending_exits
+        self._pending_enters = {}
+        self._pending_exits = {}
+
+        for other in exits:
+            self._fire(self._on_object_exit_callbacks, 'object_exit', self, other)
+        for other in enters:
+            self._fire(self._on_object_enter_callbacks, 'object_enter', self, other)
+
+        if self._reported_active != self._is_active:
+            self._reported_active = self._is_active
+            if self._is_active:
+                self._fire(self._on_activate_callbacks, 'activate', self)
+            else:
+                self._fire(self._on_deactivate_callbacks, 'deactivate', self)
+
+    def _fire(self, callbacks: List[Callable[..., None]], event: str, *args: Any) -> None:
+        """Call each callback, logging any that raise.
+
+        Args:
+            callbacks: Callbacks to call
+            event: Event name for the log message
+            *args: Arguments passed to each callback
+        """
+        for callback in list(callbacks):
+            try:
+                callback(*args)
+            except Exception as e:
+                log(self).error(f"Error in sensor {event} callback: {e}")
 
     def clear_detected_objects(self) -> None:
         """Clear all detected objects and deactivate sensor.
 
-        Useful for resetting sensor state.
+        Useful for resetting sensor state. Cleared objects don't fire exit
+        callbacks; deactivate fires at the next dispatch.
         """
         self._detected_objects.clear()
+        self._pending_enters.clear()
         if self._is_active:
             self._deactivate()
 
@@ -113,6 +113,16 @@ class TestBasePhysicsBody(unittest.TestCase):
         self.assertEqual(body.collider.collider_type, ColliderType.CIRCLE)
         self.assertTrue(body.collider.is_trigger)
 
+    def test_bullet_flag_serialized(self):
+        """Test the bullet flag survives a dictionary round trip."""
+        body = BasePhysicsBody(bullet=True)
+
+        data = body.to_dict()
+        self.assertTrue(data['bullet'])
+        self.assertTrue(body.get_properties()['bullet'])
+        self.assertTrue(BasePhysicsBody.from_dict(data).bullet)
+        self.assertFalse(BasePhysicsBody.from_dict({}).bullet)
+
     def test_inheritance_from_physics_body_2d(self):
         """Test that BasePhysicsBody properly inherits from PhysicsBody2D."""
         body = BasePhysicsBody()
@@ -435,6 +445,17 @@ class TestBasePhysicsBody(unittest.TestCase):
         self.assertTrue(body.has_tag("тест"))
         self.assertTrue(body.has_tag("🚀"))
 
+    def test_state_stored_in_slots(self):
+        """Test the body's fields live in slots while ad hoc attributes still work."""
+        body = BasePhysicsBody(name="Slotted", tags=["a"])
+
+        self.assertEqual(vars(body), {})
+        self.assertEqual(body.name, "Slotted")
+        self.assertEqual(body.tags, ["a"])
+
+        body.custom_attribute = 1  # type: ignore[attr-defined]
+        self.assertEqual(vars(body), {'custom_attribute': 1})
+
 
 class TestBasePhysicsBodyFactory(unittest.TestCase):
     """Test the factory registration for BasePhysicsBody."""
@@ -411,6 +411,33 @@ class TestConveyorBody(unittest.TestCase):
         conveyor.deactivate()
         self.assertFalse(conveyor.is_active)
 
+    def test_activate_wakes_sleeping_objects(self):
+        """Test activating the belt wakes objects resting on it."""
+        conveyor = ConveyorBody(is_active=False)
+        sleeping = Mock(spec=IPhysicsBody2D)
+        sleeping.sleeping = True
+        awake = Mock(spec=IPhysicsBody2D)
+        awake.sleeping = False
+        conveyor._objects_on_belt.update((sleeping, awake))
+
+        conveyor.activate()
+
+        sleeping.set_sleeping.assert_called_once_with(False)
+        awake.set_sleeping.assert_not_called()
+
+    def test_belt_speed_change_wakes_sleeping_objects(self):
+        """Test changing belt speed wakes objects resting on it."""
+        conveyor = ConveyorBody(belt_speed=50.0, is_active=True)
+        sleeping = Mock(spec=IPhysicsBody2D)
+        sleeping.sleeping = True
+        conveyor._objects_on_belt.add(sleeping)
+
+        conveyor.belt_speed = 50.0
+        sleeping.set_sleeping.assert_not_called()
+
+        conveyor.belt_speed = 80.0
+        sleeping.set_sleeping.assert_called_once_with(False)
+
     # ==================== Object Tracking Tests ====================
 
     def test_initial_objects_on_belt_empty(self):
@@ -449,8 +476,8 @@ class TestConveyorBody(unittest.TestCase):
         objects = conveyor.get_objects_on_belt()
         self.assertIn(mock_object, objects)
 
-    def test_on_collision_stay_applies_velocity_when_active(self):
-        """Test on_collision_stay applies belt velocity to dynamic object."""
+    def test_apply_surface_effect_applies_velocity_when_active(self):
+        """Test apply_surface_effect applies belt velocity to objects on top."""
         conveyor = ConveyorBody(
             x=100.0, y=100.0, width=100.0, height=20.0,
             direction=Direction.EAST, belt_speed=50.0, is_active=True
@@ -460,45 +487,56 @@ class TestConveyorBody(unittest.TestCase):
         mock_object.body_type = BodyType.DYNAMIC
         mock_object.linear_velocity = (0.0, -10.0)
 
-        with patch.object(conveyor, 'is_on_top_of', return_value=True):
-            conveyor.on_collision_stay(mock_object)
+        conveyor.apply_surface_effect([mock_object], [(110.0, 80.0, 130.0, 100.0)], 1.0 / 60.0)
 
         # Should apply belt velocity (50.0, 0.0) but preserve Y velocity
         mock_object.set_linear_velocity.assert_called_once_with(50.0, -10.0)
+        self.assertIn(mock_object, conveyor.get_objects_on_belt())
 
-    def test_on_collision_stay_does_nothing_when_inactive(self):
-        """Test on_collision_stay doesn't apply velocity when inactive."""
+    def test_apply_surface_effect_does_nothing_when_inactive(self):
+        """Test apply_surface_effect doesn't apply velocity when inactive."""
         conveyor = ConveyorBody(is_active=False)
 
         mock_object = Mock(spec=IPhysicsBody2D)
         mock_object.body_type = BodyType.DYNAMIC
 
-        conveyor.on_collision_stay(mock_object)
+        conveyor.apply_surface_effect([mock_object], [conveyor.get_bounds()], 1.0 / 60.0)
 
         # Should not call set_linear_velocity
         mock_object.set_linear_velocity.assert_not_called()
 
-    def test_on_collision_stay_ignores_static_bodies(self):
-        """Test on_collision_stay ignores static bodies."""
-        conveyor = ConveyorBody(is_active=True)
+    def test_apply_surface_effect_drops_side_contacts(self):
+        """Test objects whose bounds don't overlap the belt are not moved and leave the belt."""
+        conveyor = ConveyorBody(x=100.0, y=100.0, width=100.0, height=20.0, is_active=True)
 
-        mock_object = Mock(spec=IPhysicsBody2D)
-        mock_object.body_type = BodyType.STATIC
+        on_top = Mock(spec=IPhysicsBody2D)
+        on_top.linear_velocity = (0.0, 0.0)
+        beside = Mock(spec=IPhysicsBody2D)
+        beside.linear_velocity = (0.0, 0.0)
+        conveyor._objects_on_belt.add(beside)
 
-        conveyor.on_collision_stay(mock_object)
+        conveyor.apply_surface_effect(
+            [on_top, beside],
+            [(150.0, 90.0, 160.0, 100.0), (250.0, 100.0, 260.0, 110.0)],
+            1.0 / 60.0,
+        )
 
-        mock_object.set_linear_velocity.assert_not_called()
+        on_top.set_linear_velocity.assert_called_once_with(50.0, 0.0)
+        beside.set_linear_velocity.assert_not_called()
+        self.assertEqual(conveyor.get_objects_on_belt(), {on_top})
 
-    def test_on_collision_stay_ignores_kinematic_bodies(self):
-        """Test on_collision_stay ignores kinematic bodies."""
-        conveyor = ConveyorBody(is_active=True)
+    def test_apply_surface_effect_vertical_belt(self):
+        """Test a north-moving belt sets Y velocity and preserves X velocity."""
+        conveyor = ConveyorBody(x=0.0, y=0.0, width=20.0, height=100.0, direction=Direction.NORTH, belt_speed=30.0)
 
-        mock_object = Mock(spec=IPhysicsBody2D)
-        mock_object.body_type = BodyType.KINEMATIC
+        bodies = [Mock(spec=IPhysicsBody2D) for _ in range(3)]
+        for index, body in enumerate(bodies):
+            body.linear_velocity = (float(index), 5.0)
 
-        conveyor.on_collision_stay(mock_object)
+        conveyor.apply_surface_effect(bodies, [(5.0, 10.0 * i, 15.0, 10.0 * i + 10.0) for i in range(3)], 1.0 / 60.0)
 
-        mock_object.set_linear_velocity.assert_not_called()
+        for index, body in enumerate(bodies):
+            body.set_linear_velocity.assert_called_once_with(float(index), -30.0)
 
     def test_on_collision_exit_removes_object(self):
         """Test on_collision_exit removes object from tracking."""
@@ -694,7 +732,7 @@ class TestConveyorBody(unittest.TestCase):
 
         self.assertEqual(conveyor.collider.collision_layer, CollisionLayer.DEFAULT)
 
-    def test_collision_callbacks_preserve_y_velocity(self):
+    def test_surface_effect_preserves_y_velocity(self):
         """Test that conveyor preserves Y velocity when applying belt motion."""
         conveyor = ConveyorBody(
             x=100.0, y=100.0,
@@ -705,8 +743,7 @@ class TestConveyorBody(unittest.TestCase):
         mock_object.body_type = BodyType.DYNAMIC
         mock_object.linear_velocity = (10.0, -30.0)  # Falling
 
-        with patch.object(conveyor, 'is_on_top_of', return_value=True):
-            conveyor.on_collision_stay(mock_object)
+        conveyor.apply_surface_effect([mock_object], [conveyor.get_bounds()], 1.0 / 60.0)
 
         # Y velocity should be preserved
         mock_object.set_linear_velocity.assert_called_with(50.0, -30.0)
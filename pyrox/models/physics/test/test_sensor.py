@@ -289,25 +289,30 @@ class TestProximitySensorBody(unittest.TestCase):
         self.assertFalse(sensor.is_active)
 
     def test_activate_only_once(self):
-        """Test _activate only changes state once."""
+        """Test _activate only reports the state change once."""
         sensor = ProximitySensorBody()
         callback = Mock()
         sensor.on_activate_callbacks.append(callback)
 
         sensor._activate()
         sensor._activate()  # Should not trigger again
+        sensor.dispatch_events()
+        sensor.dispatch_events()
 
         callback.assert_called_once()
 
     def test_deactivate_only_once(self):
-        """Test _deactivate only changes state once."""
+        """Test _deactivate only reports the state change once."""
         sensor = ProximitySensorBody()
-        sensor._is_active = True
+        sensor._activate()
+        sensor.dispatch_events()
         callback = Mock()
         sensor.on_deactivate_callbacks.append(callback)
 
         sensor._deactivate()
         sensor._deactivate()  # Should not trigger again
+        sensor.dispatch_events()
+        sensor.dispatch_events()
 
         callback.assert_called_once()
 
@@ -321,6 +326,9 @@ class TestProximitySensorBody(unittest.TestCase):
 
         mock_object = Mock(spec=IPhysicsBody2D)
         sensor.on_collision_enter(mock_object)
+        callback.assert_not_called()
+
+        sensor.dispatch_events()
 
         callback.assert_called_once_with(sensor)
 
@@ -332,7 +340,9 @@ class TestProximitySensorBody(unittest.TestCase):
 
         mock_object = Mock(spec=IPhysicsBody2D)
         sensor.on_collision_enter(mock_object)
+        sensor.dispatch_events()
         sensor.on_collision_exit(mock_object)
+        sensor.dispatch_events()
 
         callback.assert_called_once_with(sensor)
 
@@ -347,6 +357,7 @@ class TestProximitySensorBody(unittest.TestCase):
 
         sensor.on_collision_enter(mock_obj1)
         sensor.on_collision_enter(mock_obj2)
+        sensor.dispatch_events()
 
         self.assertEqual(callback.call_count, 2)
         callback.assert_any_call(sensor, mock_obj1)
@@ -363,8 +374,10 @@ class TestProximitySensorBody(unittest.TestCase):
 
         sensor.on_collision_enter(mock_obj1)
         sensor.on_collision_enter(mock_obj2)
+        sensor.dispatch_events()
         sensor.on_collision_exit(mock_obj1)
         sensor.on_collision_exit(mock_obj2)
+        sensor.dispatch_events()
 
         self.assertEqual(callback.call_count, 2)
         callback.assert_any_call(sensor, mock_obj1)
@@ -381,6 +394,7 @@ class TestProximitySensorBody(unittest.TestCase):
 
         mock_object = Mock(spec=IPhysicsBody2D)
         sensor.on_collision_enter(mock_object)
+        sensor.dispatch_events()
 
         callback1.assert_called_once()
         callback2.assert_called_once()
@@ -398,6 +412,7 @@ class TestProximitySensorBody(unittest.TestCase):
 
         # Should not raise exception
         sensor.on_collision_enter(mock_object)
+        sensor.dispatch_events()
 
         # Good callback should still be called
         good_callback.assert_called_once()
@@ -412,7 +427,9 @@ class TestProximitySensorBody(unittest.TestCase):
         mock_obj2 = Mock(spec=IPhysicsBody2D)
 
         sensor.on_collision_enter(mock_obj1)
+        sensor.dispatch_events()
         sensor.on_collision_enter(mock_obj2)  # Already active
+        sensor.dispatch_events()
 
         callback.assert_called_once()  # Only called once
 
@@ -427,7 +444,9 @@ class TestProximitySensorBody(unittest.TestCase):
 
         sensor.on_collision_enter(mock_obj1)
         sensor.on_collision_enter(mock_obj2)
+        sensor.dispatch_events()
         sensor.on_collision_exit(mock_obj1)  # Still has obj2
+        sensor.dispatch_events()
 
         callback.assert_not_called()
 
@@ -468,11 +487,106 @@ class TestProximitySensorBody(unittest.TestCase):
 
         mock_object = Mock(spec=IPhysicsBody2D)
         sensor.on_collision_enter(mock_object)
+        sensor.dispatch_events()
 
         sensor.clear_detected_objects()
+        sensor.dispatch_events()
 
         callback.assert_called_once()
 
+    # ==================== Event Queue Tests ====================
+
+    def test_has_pending_events(self):
+        """Test that transitions are pending until dispatched."""
+        sensor = ProximitySensorBody()
+        self.assertFalse(sensor.has_pending_events)
+
+        sensor.on_collision_enter(Mock(spec=IPhysicsBody2D))
+        self.assertTrue(sensor.has_pending_events)
+
+        sensor.dispatch_events()
+        self.assertFalse(sensor.has_pending_events)
+
+    def test_enter_and_exit_between_dispatches_coalesce(self):
+        """Test that an object entering and leaving before a dispatch fires nothing."""
+        sensor = ProximitySensorBody()
+        callbacks = [Mock() for _ in range(4)]
+        sensor.on_activate_callbacks.append(callbacks[0])
+        sensor.on_deactivate_callbacks.append(callbacks[1])
+        sensor.on_object_enter_callbacks.append(callbacks[2])
+        sensor.on_object_exit_callbacks.append(callbacks[3])
+
+        mock_object = Mock(spec=IPhysicsBody2D)
+        sensor.on_collision_enter(mock_object)
+        sensor.on_collision_exit(mock_object)
+
+        self.assertFalse(sensor.has_pending_events)
+        sensor.dispatch_events()
+        for callback in callbacks:
+            callback.assert_not_called()
+
+    def test_exit_and_reenter_between_dispatches_coalesce(self):
+        """Test that an object leaving and coming back before a dispatch fires nothing."""
+        sensor = ProximitySensorBody()
+        mock_object = Mock(spec=IPhysicsBody2D)
+        sensor.on_collision_enter(mock_object)
+        sensor.dispatch_events()
+        enter_callback = Mock()
+        exit_callback = Mock()
+        deactivate_callback = Mock()
+        sensor.on_object_enter_callbacks.append(enter_callback)
+        sensor.on_object_exit_callbacks.append(exit_callback)
+        sensor.on_deactivate_callbacks.append(deactivate_callback)
+
+        sensor.on_collision_exit(mock_object)
+        sensor.on_collision_enter(mock_object)
+        sensor.dispatch_events()
+
+        enter_callback.assert_not_called()
+        exit_callback.assert_not_called()
+        deactivate_callback.assert_not_called()
+        self.assertTrue(sensor.is_active)
+
+    def test_dispatch_order(self):
+        """Test that exits fire before enters, and state changes fire last."""
+        sensor = ProximitySensorBody()
+        leaving = Mock(spec=IPhysicsBody2D)
+        arriving = Mock(spec=IPhysicsBody2D)
+        sensor.on_collision_enter(leaving)
+        sensor.dispatch_events()
+
+        calls = []
+        sensor.on_object_enter_callbacks.append(lambda s, o: calls.append(('enter', o)))
+        sensor.on_object_exit_callbacks.append(lambda s, o: calls.append(('exit', o)))
+        sensor.on_activate_callbacks.append(lambda s: calls.append(('activate', None)))
+        sensor.on_deactivate_callbacks.append(lambda s: calls.append(('deactivate', None)))
+
+        sensor.on_collision_exit(leaving)
+        sensor.on_collision_enter(arriving)
+        sensor.dispatch_events()
+        self.assertEqual(calls, [('exit', leaving), ('enter', arriving)])
+
+        calls.clear()
+        sensor.on_collision_exit(arriving)
+        sensor.dispatch_events()
+        self.assertEqual(calls, [('exit', arriving), ('deactivate', None)])
+
+    def test_transitions_from_callbacks_wait_for_next_dispatch(self):
+        """Test that callbacks changing the sensor queue events for the next dispatch."""
+        sensor = ProximitySensorBody()
+        other = Mock(spec=IPhysicsBody2D)
+        exit_callback = Mock()
+        sensor.on_object_exit_callbacks.append(exit_callback)
+        sensor.on_object_enter_callbacks.append(lambda s, o: s.on_collision_exit(o))
+
+        sensor.on_collision_enter(other)
+        sensor.dispatch_events()
+        exit_callback.assert_not_called()
+        self.assertTrue(sensor.has_pending_events)
+
+        sensor.dispatch_events()
+        exit_callback.assert_called_once_with(sensor, other)
+
     def test_is_detecting_returns_true_for_detected_object(self):
         """Test is_detecting returns True for detected object."""
         sensor = ProximitySensorBody()
@@ -583,24 +697,28 @@ class TestProximitySensorBody(unittest.TestCase):
 
         # Object 1 enters (activate)
         sensor.on_collision_enter(mock_obj1)
+        sensor.dispatch_events()
         self.assertTrue(sensor.is_active)
         self.assertEqual(len(activate_calls), 1)
         self.assertEqual(len(enter_calls), 1)
 
         # Object 2 enters (stay active)
         sensor.on_collision_enter(mock_obj2)
+        sensor.dispatch_events()
         self.assertTrue(sensor.is_active)
         self.assertEqual(len(activate_calls), 1)  # Still 1
         self.assertEqual(len(enter_calls), 2)
 
         # Object 1 exits (stay active)
         sensor.on_collision_exit(mock_obj1)
+        sensor.dispatch_events()
         self.assertTrue(sensor.is_active)
         self.assertEqual(len(deactivate_calls), 0)
         self.assertEqual(len(exit_calls), 1)
 
         # Object 2 exits (deactivate)
         sensor.on_collision_exit(mock_obj2)
+        sensor.dispatch_events()
         self.assertFalse(sensor.is_active)
         self.assertEqual(len(deactivate_calls), 1)
         self.assertEqual(len(exit_calls), 2)
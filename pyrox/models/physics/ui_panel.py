@@ -26,6 +26,8 @@ class UIPanelBody(BasePhysicsBody):
         panel_type: Type of UI panel (panel, button, slider, etc.)
     """
 
+    __slots__ = ('interactive', 'panel_type')
+
     def __init__(
         self,
         name: str = "UI Panel",
@@ -113,6 +115,8 @@ class UIButtonBody(UIPanelBody):
         toggle: Whether button stays pressed when clicked (toggle mode)
     """
 
+    __slots__ = ('_pressed', '_toggle')
+
     def __init__(
         self,
         name: str = "UI Button",
@@ -12,6 +12,8 @@ class Coord2D(
 ):
     """Protocol for 2D coordinates."""
 
+    __slots__ = ('_x', '_y')
+
     def __init__(
         self,
         x: float = 0.0,
@@ -76,6 +78,8 @@ class Area2D(
 ):
     """Protocol for 2D areas."""
 
+    __slots__ = ('_width', '_height')
+
     def __init__(
         self,
         x: float = 0.0,
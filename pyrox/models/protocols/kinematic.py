@@ -11,6 +11,8 @@ class Velocity2D(
 ):
     """Protocol for 2D velocity (linear motion)."""
 
+    __slots__ = ('_velocity_x', '_velocity_y')
+
     def __init__(
         self,
         velocity_x: float = 0.0,
@@ -100,6 +102,8 @@ class Kinematic2D(
 ):
     """Protocol for full 2D kinematic state (velocity + acceleration)."""
 
+    __slots__ = ('_acceleration_x', '_acceleration_y')
+
     def __init__(
         self,
         x: float = 0.0,
@@ -3,13 +3,17 @@
 Provides concrete implementations of physics protocols that can be mixed
 into scene objects to add physics simulation capabilities.
 """
-from typing import List, Self, Tuple
+import math
+from typing import Callable, List, Optional, Self, Tuple
 from pyrox.interfaces import (
     ISpatial2D,
     IPhysicsBody2D,
     ICollider2D,
     IMaterial,
     IRigidBody2D,
+    IBulletBody2D,
+    ICollisionBits,
+    IShapeCollider2D,
     BodyType,
     ColliderType,
     CollisionLayer,
@@ -19,7 +23,12 @@ from pyrox.models.protocols.kinematic import Kinematic2D
 
 
 class Material(IMaterial):
-    """Concrete implementation of material properties."""
+    """Concrete implementation of material properties.
+
+    Setters bump :attr:`revision`, so savers can tell which materials changed.
+    """
+
+    __slots__ = ('_density', '_restitution', '_friction', '_drag', '_revision')
 
     def __init__(
         self,
@@ -40,6 +49,12 @@ class Material(IMaterial):
         self._restitution = max(0.0, min(1.0, restitution))
         self._friction = max(0.0, min(1.0, friction))
         self._drag = drag
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """Get the number of changes made through the material's setters."""
+        return self._revision
 
     def get_density(self) -> float:
         return self._density
@@ -48,18 +63,21 @@ class Material(IMaterial):
         if value < 0:
             raise ValueError("Density must be non-negative")
         self._density = value
+        self._revision += 1
 
     def get_restitution(self) -> float:
         return self._restitution
 
     def set_restitution(self, value: float) -> None:
         self._restitution = max(0.0, min(1.0, value))
+        self._revision += 1
 
     def get_friction(self) -> float:
         return self._friction
 
     def set_friction(self, value: float) -> None:
         self._friction = max(0.0, min(1.0, value))
+        self._revision += 1
 
     def get_drag(self) -> float:
         return self._drag
@@ -68,6 +86,7 @@ class Material(IMaterial):
         if value < 0:
             raise ValueError("Drag must be non-negative")
         self._drag = value
+        self._revision += 1
 
     @classmethod
     def from_dict(cls, data: dict) -> Self:
@@ -88,6 +107,8 @@ class Material(IMaterial):
 
 class Collider2D(
     ICollider2D,
+    ICollisionBits,
+    IShapeCollider2D,
     Area2D,
 ):
     """Standalone collider implementation.
@@ -95,6 +116,18 @@ class Collider2D(
     Can be used independently or composed into other objects.
     """
 
+    __slots__ = (
+        '_parent',
+        '_collider_type',
+        '_vertices',
+        '_roll',
+        '_collision_layer',
+        '_collision_mask',
+        '_layer_bits',
+        '_mask_bits',
+        '_is_trigger',
+    )
+
     def __init__(
         self,
         parent: ISpatial2D | None = None,
@@ -106,6 +139,7 @@ class Collider2D(
         y: float = 0.0,
         width: float = 10.0,
         height: float = 10.0,
+        vertices: Optional[List[Tuple[float, float]]] = None,
     ):
         """Initialize collider.
 
@@ -116,11 +150,17 @@ class Collider2D(
             is_trigger: Whether this is a trigger (no physics response)
             x, y: Position coordinates
             width, height: Size dimensions
+            vertices: Convex polygon outline for POLYGON colliders, relative
+                to the unrotated top-left corner (defaults to the box corners)
         """
         self._parent = parent
         self._collider_type = collider_type
+        self._vertices = vertices
+        self._roll = 0.0
         self._collision_layer = collision_layer
         self._collision_mask = collision_mask or []
+        self._layer_bits = collision_layer.bit
+        self._mask_bits = CollisionLayer.to_bits(self._collision_mask)
         self._is_trigger = is_trigger
         Area2D.__init__(
             self,
@@ -131,41 +171,102 @@ class Collider2D(
         )
 
     def get_x(self) -> float:
-        if self.parent:
-            return self.parent.x
+        parent = self._parent
+        if parent is not None:
+            return parent.x
         return self._x
 
     def set_x(self, x: float) -> None:
-        if not self.parent:
+        if self._parent is None:
             self._x = x
 
     def get_y(self) -> float:
-        if self.parent:
-            return self.parent.y
+        parent = self._parent
+        if parent is not None:
+            return parent.y
         return self._y
 
     def set_y(self, y: float) -> None:
-        if not self.parent:
+        if self._parent is None:
             self._y = y
 
     def get_width(self) -> float:
-        if self.parent:
-            return self.parent.width
+        parent = self._parent
+        if parent is not None:
+            return parent.width
         return self._width
 
     def set_width(self, width: float) -> None:
-        if not self.parent:
+        if self._parent is None:
             self._width = width
 
     def get_height(self) -> float:
-        if self.parent:
-            return self.parent.height
+        parent = self._parent
+        if parent is not None:
+            return parent.height
         return self._height
 
     def set_height(self, height: float) -> None:
-        if not self.parent:
+        if self._parent is None:
             self._height = height
 
+    def get_roll(self) -> float:
+        """Get the rotation in degrees, taken from the parent when there is one."""
+        parent = self._parent
+        if parent is not None:
+            return parent.roll
+        return self._roll
+
+    def set_roll(self, roll: float) -> None:
+        if self._parent is None:
+            self._roll = roll
+
+    def get_vertices(self) -> Optional[List[Tuple[float, float]]]:
+        return self._vertices
+
+    def set_vertices(self, value: Optional[List[Tuple[float, float]]]) -> None:
+        self._vertices = value
+
+    def get_center(self) -> Tuple[float, float]:
+        """Get the center of the collider's box, which it rotates around."""
+        return (self.x + self.width / 2, self.y + self.height / 2)
+
+    def get_radius(self) -> float:
+        """Get the radius of a CIRCLE collider, inscribed in its box."""
+        return min(self.width, self.height) / 2
+
+    def get_world_vertices(self) -> List[Tuple[float, float]]:
+        """Get the outline in world space, rotated by roll around the center.
+
+        Uses the polygon vertices for POLYGON colliders with an outline and
+        the box corners otherwise.
+        """
+        x = self.x
+        y = self.y
+        width = self.width
+        height = self.height
+        local = self._vertices if self._collider_type is ColliderType.POLYGON and self._vertices else (
+            (0.0, 0.0), (width, 0.0), (width, height), (0.0, height)
+        )
+        half_width = width / 2
+        half_height = height / 2
+        center_x = x + half_width
+        center_y = y + half_height
+
+        roll = self.get_roll()
+        if not roll:
+            return [(x + vx, y + vy) for vx, vy in local]
+
+        radians = math.radians(roll)
+        cos = math.cos(radians)
+        sin = math.sin(radians)
+        vertices = []
+        for vx, vy in local:
+            dx = vx - half_width
+            dy = vy - half_height
+            vertices.append((center_x + dx * cos - dy * sin, center_y + dx * sin + dy * cos))
+        return vertices
+
     def get_collider_type(self) -> ColliderType:
         return self._collider_type
 
@@ -177,12 +278,25 @@ class Collider2D(
 
     def set_collision_layer(self, value: CollisionLayer) -> None:
         self._collision_layer = value
+        self._layer_bits = value.bit
 
     def get_collision_mask(self) -> List[CollisionLayer]:
         return self._collision_mask
 
     def set_collision_mask(self, value: List[CollisionLayer]) -> None:
+        """Set the collision mask and recompile its bitmask.
+
+        The bitmask is cached, so assign a new list rather than mutating
+        the one returned by :meth:`get_collision_mask`.
+        """
         self._collision_mask = value
+        self._mask_bits = CollisionLayer.to_bits(value)
+
+    def get_layer_bits(self) -> int:
+        return self._layer_bits
+
+    def get_mask_bits(self) -> int:
+        return self._mask_bits
 
     def get_is_trigger(self) -> bool:
         return self._is_trigger
@@ -202,12 +316,30 @@ class Collider2D(
         return not (max_ax < min_bx or min_ax > max_bx or max_ay < min_by or min_ay > max_by)
 
     def get_bounds(self) -> Tuple[float, float, float, float]:
-        """Get bounding box as (min_x, min_y, max_x, max_y)."""
+        """Get bounding box as (min_x, min_y, max_x, max_y).
+
+        Circles are bounded by their radius, and rotated boxes and polygons
+        by their rotated outline.
+        """
+        collider_type = self._collider_type
+        if collider_type is ColliderType.CIRCLE:
+            center_x, center_y = self.get_center()
+            radius = self.get_radius()
+            return (center_x - radius, center_y - radius, center_x + radius, center_y + radius)
+
+        if collider_type is ColliderType.POLYGON or self.get_roll():
+            vertices = self.get_world_vertices()
+            xs = [vx for vx, _ in vertices]
+            ys = [vy for _, vy in vertices]
+            return (min(xs), min(ys), max(xs), max(ys))
+
+        x = self.x
+        y = self.y
         return (
-            self.x,
-            self.y,
-            self.x + self.width,
-            self.y + self.height
+            x,
+            y,
+            x + self.width,
+            y + self.height
         )
 
     # Properties for convenience
@@ -240,6 +372,22 @@ class Collider2D(
     def collision_mask(self, value: List[CollisionLayer]) -> None:
         self.set_collision_mask(value)
 
+    @property
+    def vertices(self) -> Optional[List[Tuple[float, float]]]:
+        return self.get_vertices()
+
+    @vertices.setter
+    def vertices(self, value: Optional[List[Tuple[float, float]]]) -> None:
+        self.set_vertices(value)
+
+    @property
+    def layer_bits(self) -> int:
+        return self._layer_bits
+
+    @property
+    def mask_bits(self) -> int:
+        return self._mask_bits
+
     @property
     def is_trigger(self) -> bool:
         return self.get_is_trigger()
@@ -259,6 +407,16 @@ class RigidBody2D(
     spatial attributes from the parent class.
     """
 
+    __slots__ = (
+        '_mass',
+        '_inverse_mass',
+        '_moment_of_inertia',
+        '_angular_velocity',
+        '_force_x',
+        '_force_y',
+        '_torque',
+    )
+
     def __init__(
         self,
         x: float = 0.0,
@@ -417,7 +575,10 @@ class RigidBody2D(
 
 class PhysicsBody2D(
     IPhysicsBody2D,
+    IBulletBody2D,
     ICollider2D,
+    ICollisionBits,
+    IShapeCollider2D,
     IMaterial,
     RigidBody2D
 ):
@@ -425,8 +586,33 @@ class PhysicsBody2D(
 
     Combines all physics components (rigid body, collider, material) into
     a single object. Can be used independently without mixing into other classes.
+
+    State lives in ``__slots__`` along the whole Coord2D -> RigidBody2D
+    chain, so a body stores its fields inline instead of in an instance
+    dictionary.
+
+    Static and sleeping bodies aren't re-indexed by the broad phase each
+    step, so moving or resizing one reports it to the collision service
+    the body is registered with (see :meth:`set_moved_callback`), as does
+    falling asleep or changing type or enabled state.
+
+    Setters for edited state (type, mass, size, collider, material) bump
+    :attr:`revision`, so savers can tell which bodies changed. State the
+    simulation changes every step (position, velocity, forces, sleep) is
+    not counted. Savers that don't want to compare revisions can instead
+    be told about each edit, move while static or sleeping, and change of
+    sleep state (see :meth:`set_changed_callback`).
+
+    While attached to an array store (see :meth:`set_array_store`), the
+    store holds the simulated state: getters sync from it first, and
+    setters report the write so the store reads the body back.
     """
 
+    __slots__ = (
+        '_body_type', '_enabled', '_sleeping', '_bullet', '_collider', '_material',
+        '_on_moved', '_on_changed', '_revision', '_array_store', '_array_epoch',
+    )
+
     def __init__(
         self,
         body_type: BodyType = BodyType.DYNAMIC,
@@ -452,8 +638,10 @@ class PhysicsBody2D(
         roll: float = 0.0,
         pitch: float = 0.0,
         yaw: float = 0.0,
+        vertices: List[Tuple[float, float]] | None = None,
         # Material parameters
         material: IMaterial | None = None,
+        bullet: bool = False,
     ):
         """Initialize complete physics body.
 
@@ -472,14 +660,24 @@ class PhysicsBody2D(
             is_trigger: Whether this is a trigger (no physics response)
             x, y: Position coordinates
             width, height: Size dimensions
+            vertices: Convex outline for POLYGON colliders, relative to the
+                unrotated top-left corner
             material: Material properties (creates default if None)
+            bullet: Sweep the body between steps so fast movement can't
+                tunnel through thin bodies
         """
         # Physics body state
         if isinstance(body_type, str):
             body_type = BodyType.from_str(body_type)
         self._body_type = body_type
+        self._on_moved: Optional[Callable[[IPhysicsBody2D], None]] = None
+        self._on_changed: Optional[Callable[[IPhysicsBody2D], None]] = None
+        self._array_store = None
+        self._array_epoch: Optional[int] = None
+        self._revision = 0
         self._enabled = enabled
         self._sleeping = sleeping
+        self._bullet = bullet
 
         RigidBody2D.__init__(
             self,
@@ -521,46 +719,375 @@ class PhysicsBody2D(
             y=y,
             width=width,
             height=height,
+            vertices=vertices,
         )
 
         self._material = material or Material()
 
+    @property
+    def revision(self) -> int:
+        """Get the number of edits made through the body's and its material's setters."""
+        return self._revision + getattr(self._material, 'revision', 0)
+
     # IPhysicsBody implementation
 
     def get_body_type(self) -> BodyType:
         return self._body_type
 
     def set_body_type(self, value: BodyType) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        changed = value != self._body_type
         self._body_type = value
+        self._bump_revision()
         # Update inverse mass for static bodies
         if value == BodyType.STATIC:
             self._inverse_mass = 0.0
         elif self._mass > 0:
             self._inverse_mass = 1.0 / self._mass
+        if changed and self._on_moved is not None:
+            # Re-index once, as the broad phase treats static bodies differently
+            self._on_moved(self)
+
+    def get_bullet(self) -> bool:
+        return self._bullet
+
+    def set_bullet(self, value: bool) -> None:
+        self._bullet = value
+        self._bump_revision()
 
     def get_enabled(self) -> bool:
         return self._enabled
 
     def set_enabled(self, enabled: bool) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        changed = enabled != self._enabled
         self._enabled = enabled
+        self._bump_revision()
+        if changed and self._on_moved is not None:
+            self._on_moved(self)
+
+    def set_mass(self, value: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        RigidBody2D.set_mass(self, value)
+        self._bump_revision()
+
+    def set_moment_of_inertia(self, value: float) -> None:
+        self._moment_of_inertia = value
+        self._bump_revision()
 
     def get_sleeping(self) -> bool:
         return self._sleeping
 
     def set_sleeping(self, value: bool) -> None:
+        changed = value != self._sleeping
+        if self._array_store is not None and changed:
+            self._array_store.touch(self)
+        if value and changed and self._on_moved is not None:
+            # Re-index once more, in case it moved since the last broad-phase update
+            self._on_moved(self)
         self._sleeping = value
+        if changed and self._on_changed is not None:
+            self._on_changed(self)
+
+    # Array-backed state
+
+    def set_array_store(self, store) -> None:
+        """Set the array store holding the body's simulated state.
+
+        The fields are synced from the old store before it is replaced.
+
+        Args:
+            store: Store with a row for the body (see
+                :class:`pyrox.services.physics_arrays.PhysicsBodyArrays`),
+                or None to keep the state on the body again
+        """
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        self._array_store = store
+        self._array_epoch = None if store is None else store.epoch
+
+    def has_box_bounds(self) -> bool:
+        """Check whether the bounds are the body's own position and size while unrotated."""
+        collider = self._collider
+        return (
+            type(collider) is Collider2D
+            and collider._parent is self
+            and collider._collider_type is ColliderType.RECTANGLE
+        )
+
+    def get_x(self) -> float:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return self._x
+
+    def get_y(self) -> float:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return self._y
+
+    def get_position(self) -> Tuple[float, float]:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return self._x, self._y
+
+    def get_roll(self) -> float:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return self._roll
+
+    def get_rotation(self) -> Tuple[float, float, float]:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return (self._pitch, self._yaw, self._roll)
+
+    def get_velocity_x(self) -> float:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return self._velocity_x
+
+    def set_velocity_x(self, value: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._velocity_x = value
+
+    def get_velocity_y(self) -> float:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return self._velocity_y
+
+    def set_velocity_y(self, value: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._velocity_y = value
+
+    def get_linear_velocity(self) -> Tuple[float, float]:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return (self._velocity_x, self._velocity_y)
+
+    def get_speed(self) -> float:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return RigidBody2D.get_speed(self)
+
+    def get_acceleration_x(self) -> float:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return self._acceleration_x
+
+    def set_acceleration_x(self, value: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._acceleration_x = value
+
+    def get_acceleration_y(self) -> float:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return self._acceleration_y
+
+    def set_acceleration_y(self, value: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._acceleration_y = value
+
+    def get_linear_acceleration(self) -> Tuple[float, float]:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return (self._acceleration_x, self._acceleration_y)
+
+    def set_linear_acceleration(self, ax: float, ay: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._acceleration_x = ax
+        self._acceleration_y = ay
+
+    def get_acceleration(self) -> float:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return RigidBody2D.get_acceleration(self)
+
+    def set_angular_velocity(self, value: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        RigidBody2D.set_angular_velocity(self, value)
+
+    def get_force(self) -> Tuple[float, float]:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return (self._force_x, self._force_y)
+
+    def set_force(self, fx: float, fy: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._force_x = fx
+        self._force_y = fy
+
+    def get_torque(self) -> float:
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        return self._torque
+
+    def set_torque(self, value: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._torque = value
+
+    def apply_force(self, fx: float, fy: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        RigidBody2D.apply_force(self, fx, fy)
+
+    def apply_torque(self, torque: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        RigidBody2D.apply_torque(self, torque)
+
+    def clear_forces(self) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        RigidBody2D.clear_forces(self)
+
+    # Broad-phase notification
+
+    def set_moved_callback(self, callback: Optional[Callable[[IPhysicsBody2D], None]]) -> None:
+        """Set what is called when the body needs re-indexing by the broad phase.
+
+        That is when it moves or resizes while static or sleeping, falls
+        asleep, or changes type or enabled state.
+
+        Args:
+            callback: Called with the body, or None to stop reporting moves
+        """
+        self._on_moved = callback
+
+    def set_changed_callback(self, callback: Optional[Callable[[IPhysicsBody2D], None]]) -> None:
+        """Set what is called when the body changes outside of the simulation's motion.
+
+        That is when an edit bumps :attr:`revision`, the body moves or
+        resizes while static or sleeping, or it falls asleep or wakes up.
+
+        Args:
+            callback: Called with the body, or None to stop reporting changes
+        """
+        self._on_changed = callback
+
+    def _bump_revision(self) -> None:
+        """Count an edit made through a setter and report it."""
+        self._revision += 1
+        if self._on_changed is not None:
+            self._on_changed(self)
+
+    def _report_move(self) -> None:
+        """Report a move made while static or sleeping, which the simulation won't pick up."""
+        if self._on_moved is not None:
+            self._on_moved(self)
+        if self._on_changed is not None:
+            self._on_changed(self)
+
+    def set_x(self, x: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._x = x
+        if self._sleeping or self._body_type == BodyType.STATIC:
+            self._report_move()
+
+    def set_y(self, y: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._y = y
+        if self._sleeping or self._body_type == BodyType.STATIC:
+            self._report_move()
+
+    def set_position(self, position: Tuple[float, float]) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._x, self._y = position
+        if self._sleeping or self._body_type == BodyType.STATIC:
+            self._report_move()
+
+    def set_width(self, width: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._width = width
+        self._bump_revision()
+        if self._sleeping or self._body_type == BodyType.STATIC:
+            self._report_move()
+
+    def set_height(self, height: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._height = height
+        self._bump_revision()
+        if self._sleeping or self._body_type == BodyType.STATIC:
+            self._report_move()
+
+    def set_size(self, size: Tuple[float, float]) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._width, self._height = size
+        self._bump_revision()
+        if self._sleeping or self._body_type == BodyType.STATIC:
+            self._report_move()
+
+    def set_roll(self, roll: float) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        self._roll = roll
+        if self._sleeping or self._body_type == BodyType.STATIC:
+            self._report_move()
+
+    def set_rotation(self, pitch: float, yaw: float, roll: float) -> None:
+        self._pitch = pitch
+        self._yaw = yaw
+        self.set_roll(roll)
+
+    def __getstate__(self):
+        """Leave the callbacks and array store out of copies, which start unregistered."""
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        state = super().__getstate__()
+        if isinstance(state, tuple):
+            state = (state[0], {
+                **state[1], '_on_moved': None, '_on_changed': None, '_array_store': None, '_array_epoch': None,
+            })
+        return state
+
+    def set_linear_velocity(self, vx: float, vy: float) -> None:
+        """Set linear velocity, waking the body if the velocity is non-zero."""
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        RigidBody2D.set_linear_velocity(self, vx, vy)
+        if self._sleeping and (vx or vy):
+            self.set_sleeping(False)
+
+    def apply_impulse(self, jx: float, jy: float) -> None:
+        """Apply an impulse, waking the body if it has any effect."""
+        if self._array_store is not None:
+            self._array_store.touch(self)
+        RigidBody2D.apply_impulse(self, jx, jy)
+        if self._sleeping and self._inverse_mass > 0 and (jx or jy):
+            self.set_sleeping(False)
 
     def get_collider(self) -> ICollider2D:
         return self._collider
 
     def set_collider(self, collider: ICollider2D) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
         self._collider = collider
+        self._bump_revision()
 
     def get_material(self) -> IMaterial:
         return self._material
 
     def set_material(self, material: IMaterial) -> None:
+        # Count the old material's edits too, so the revision never goes back
+        self._revision += getattr(self._material, 'revision', 0)
         self._material = material
+        self._bump_revision()
 
     def update(self, dt: float) -> None:
         """Update physics state. Override for custom behavior."""
@@ -584,31 +1111,63 @@ class PhysicsBody2D(
         return self._collider.get_collider_type()
 
     def set_collider_type(self, value: ColliderType) -> None:
+        if self._array_store is not None:
+            self._array_store.touch(self)
         self._collider.set_collider_type(value)
+        self._bump_revision()
 
     def get_collision_layer(self) -> CollisionLayer:
         return self._collider.get_collision_layer()
 
     def set_collision_layer(self, value: CollisionLayer) -> None:
         self._collider.set_collision_layer(value)
+        self._bump_revision()
 
     def get_collision_mask(self) -> List[CollisionLayer]:
         return self._collider.get_collision_mask()
 
     def set_collision_mask(self, value: List[CollisionLayer]) -> None:
         self._collider.set_collision_mask(value)
+        self._bump_revision()
+
+    def get_layer_bits(self) -> int:
+        return self._collider.get_layer_bits()
+
+    def get_mask_bits(self) -> int:
+        return self._collider.get_mask_bits()
+
+    def get_radius(self) -> float:
+        return self._collider.get_radius()
+
+    def get_world_vertices(self) -> List[Tuple[float, float]]:
+        return self._collider.get_world_vertices()
 
     def get_is_trigger(self) -> bool:
         return self._collider.get_is_trigger()
 
     def set_is_trigger(self, value: bool) -> None:
         self._collider.set_is_trigger(value)
+        self._bump_revision()
 
     def check_collision(self, other: ICollider2D) -> bool:
         return self._collider.check_collision(other)
 
     def get_bounds(self) -> Tuple[float, float, float, float]:
-        return self._collider.get_bounds()
+        if self._array_store is not None:
+            self._array_store.sync(self)
+        collider = self._collider
+        if (
+            type(collider) is Collider2D
+            and collider._parent is self
+            and collider._collider_type is ColliderType.RECTANGLE
+            and not self._roll
+        ):
+            # Own unrotated box: read the fields directly rather than
+            # through the collider's parent delegation
+            x = self._x
+            y = self._y
+            return (x, y, x + self._width, y + self._height)
+        return collider.get_bounds()
 
     # IMaterial delegation
 
@@ -617,24 +1176,32 @@ class PhysicsBody2D(
 
     def set_density(self, value: float) -> None:
         self._material.set_density(value)
+        if self._on_changed is not None:
+            self._on_changed(self)
 
     def get_restitution(self) -> float:
         return self._material.get_restitution()
 
     def set_restitution(self, value: float) -> None:
         self._material.set_restitution(value)
+        if self._on_changed is not None:
+            self._on_changed(self)
 
     def get_friction(self) -> float:
         return self._material.get_friction()
 
     def set_friction(self, value: float) -> None:
         self._material.set_friction(value)
+        if self._on_changed is not None:
+            self._on_changed(self)
 
     def get_drag(self) -> float:
         return self._material.get_drag()
 
     def set_drag(self, value: float) -> None:
         self._material.set_drag(value)
+        if self._on_changed is not None:
+            self._on_changed(self)
 
     # Properties for convenience
     def get_inverse_mass(self) -> float:
@@ -107,6 +107,9 @@ class Spatial2D(
 ):
     """Protocol for 2D spatial objects."""
 
+    # Rotatable is also used standalone, so its storage is declared here
+    __slots__ = ('_pitch', '_yaw', '_roll')
+
     def __init__(
         self,
         x: float = 0.0,
@@ -1,5 +1,6 @@
 """Unit tests for physics.py protocols module."""
 
+import copy
 import unittest
 
 from pyrox.models.protocols.physics import (
@@ -238,6 +239,69 @@ class TestCollider(unittest.TestCase):
         col.is_trigger = False
         self.assertFalse(col.is_trigger)
 
+    def test_layer_and_mask_bits_cached(self):
+        """Test layer and mask bitmasks are compiled when set."""
+        col = Collider2D(
+            collision_layer=CollisionLayer.PLAYER,
+            collision_mask=[CollisionLayer.TERRAIN, CollisionLayer.ENEMY],
+        )
+        self.assertEqual(col.layer_bits, CollisionLayer.PLAYER.bit)
+        self.assertEqual(col.mask_bits, CollisionLayer.TERRAIN.bit | CollisionLayer.ENEMY.bit)
+
+        col.collision_layer = CollisionLayer.ENEMY
+        col.collision_mask = [CollisionLayer.PLAYER]
+        self.assertEqual(col.get_layer_bits(), CollisionLayer.ENEMY.bit)
+        self.assertEqual(col.get_mask_bits(), CollisionLayer.PLAYER.bit)
+
+    def test_empty_mask_bits_cover_all_layers(self):
+        """Test an empty mask compiles to every layer."""
+        col = Collider2D()
+        self.assertEqual(col.mask_bits, CollisionLayer.all_bits())
+        for layer in CollisionLayer:
+            self.assertTrue(col.mask_bits & layer.bit)
+
+    def test_layer_bits_are_unique(self):
+        """Test each layer maps to its own bit."""
+        bits = [layer.bit for layer in CollisionLayer]
+        self.assertEqual(len(set(bits)), len(bits))
+        for bit in bits:
+            self.assertEqual(bit & (bit - 1), 0)
+
+    def test_circle_bounds_use_radius(self):
+        """Test circle bounds are the inscribed circle's square."""
+        col = Collider2D(collider_type=ColliderType.CIRCLE, x=0.0, y=0.0, width=20.0, height=10.0)
+        self.assertEqual(col.get_radius(), 5.0)
+        self.assertEqual(col.get_bounds(), (5.0, 0.0, 15.0, 10.0))
+
+    def test_rotated_box_vertices_and_bounds(self):
+        """Test a rotated box turns around its center and grows its bounds."""
+        col = Collider2D(x=0.0, y=0.0, width=20.0, height=10.0)
+        col.set_roll(90.0)
+        vertices = col.get_world_vertices()
+
+        self.assertAlmostEqual(vertices[0][0], 15.0)
+        self.assertAlmostEqual(vertices[0][1], -5.0)
+        for actual, expected in zip(col.get_bounds(), (5.0, -5.0, 15.0, 15.0)):
+            self.assertAlmostEqual(actual, expected)
+
+    def test_polygon_vertices_offset_by_position(self):
+        """Test polygon vertices are relative to the collider position."""
+        col = Collider2D(
+            collider_type=ColliderType.POLYGON,
+            x=5.0,
+            y=5.0,
+            vertices=[(0.0, 0.0), (10.0, 0.0), (5.0, 8.0)],
+        )
+        self.assertEqual(col.vertices, [(0.0, 0.0), (10.0, 0.0), (5.0, 8.0)])
+        self.assertEqual(col.get_world_vertices(), [(5.0, 5.0), (15.0, 5.0), (10.0, 13.0)])
+        self.assertEqual(col.get_bounds(), (5.0, 5.0, 15.0, 13.0))
+
+    def test_roll_follows_parent(self):
+        """Test a parented collider takes its rotation from the parent."""
+        body = PhysicsBody2D(width=10.0, height=10.0, roll=45.0)
+        self.assertEqual(body.collider.get_roll(), 45.0)
+        self.assertAlmostEqual(body.get_bounds()[2] - body.get_bounds()[0], 200.0 ** 0.5)
+
 
 class TestRigidBody2D(unittest.TestCase):
     """Test cases for RigidBody class."""
@@ -537,6 +601,81 @@ class TestPhysicsBody(unittest.TestCase):
         pb.set_sleeping(False)
         self.assertFalse(pb.sleeping)
 
+    def test_state_stored_in_slots(self):
+        """Test body, collider and material state lives in slots, not instance dicts."""
+        pb = PhysicsBody2D(x=1.0, y=2.0, roll=3.0, velocity_x=4.0, mass=5.0)
+
+        self.assertEqual(vars(pb), {})
+        self.assertFalse(hasattr(pb.collider, '__dict__'))
+        self.assertFalse(hasattr(pb.material, '__dict__'))
+        self.assertEqual((pb.x, pb.y, pb.roll, pb.velocity_x, pb.mass), (1.0, 2.0, 3.0, 4.0, 5.0))
+
+    def test_bounds_follow_collider_shape(self):
+        """Test the direct box bounds match the collider's for every shape."""
+        box = PhysicsBody2D(x=10.0, y=20.0, width=30.0, height=40.0)
+        self.assertEqual(box.get_bounds(), (10.0, 20.0, 40.0, 60.0))
+        self.assertEqual(box.get_bounds(), box.collider.get_bounds())
+
+        box.x = 15.0
+        self.assertEqual(box.get_bounds(), (15.0, 20.0, 45.0, 60.0))
+
+        rotated = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0, roll=45.0)
+        self.assertEqual(rotated.get_bounds(), rotated.collider.get_bounds())
+        self.assertLess(rotated.get_bounds()[0], 0.0)
+
+        circle = PhysicsBody2D(collider_type=ColliderType.CIRCLE, x=0.0, y=0.0, width=20.0, height=10.0)
+        self.assertEqual(circle.get_bounds(), (5.0, 0.0, 15.0, 10.0))
+
+    def test_moved_callback_reports_static_and_sleeping_moves(self):
+        """Test that only bodies the broad phase doesn't update each step report moves."""
+        moved = []
+        dynamic = PhysicsBody2D()
+        static = PhysicsBody2D(body_type=BodyType.STATIC)
+        for pb in (dynamic, static):
+            pb.set_moved_callback(moved.append)
+
+        dynamic.x = 5.0
+        static.x = 5.0
+        static.height = 20.0
+        self.assertEqual(moved, [static, static])
+
+        moved.clear()
+        dynamic.set_sleeping(True)
+        dynamic.set_position((1.0, 2.0))
+        self.assertEqual(moved, [dynamic, dynamic])
+
+    def test_copies_drop_moved_callback(self):
+        """Test that copying a body doesn't copy its moved callback."""
+        moved = []
+        pb = PhysicsBody2D(body_type=BodyType.STATIC, x=3.0)
+        pb.set_moved_callback(moved.append)
+
+        duplicate = copy.deepcopy(pb)
+        duplicate.x = 10.0
+
+        self.assertEqual(moved, [])
+        self.assertEqual(duplicate.width, pb.width)
+
+    def test_revision_counts_edits_but_not_simulation(self):
+        """Test that edits bump the revision and simulated state changes don't."""
+        pb = PhysicsBody2D()
+        start = pb.revision
+
+        pb.x = 5.0
+        pb.set_linear_velocity(1.0, 2.0)
+        pb.apply_force(3.0, 4.0)
+        pb.set_sleeping(True)
+        self.assertEqual(pb.revision, start)
+
+        pb.mass = 2.0
+        pb.set_collision_layer(CollisionLayer.TERRAIN)
+        pb.material.set_friction(0.9)
+        self.assertEqual(pb.revision, start + 3)
+
+        revision = pb.revision
+        pb.set_material(Material())
+        self.assertGreater(pb.revision, revision)
+
 
 class TestIntegration(unittest.TestCase):
     """Integration tests for physics components working together."""
@@ -1,5 +1,6 @@
 from .sceneobject import SceneObject
-from .scene import Scene
+from .scene import Scene, SceneObjectRecord
+from .scenechunks import SceneChunk, SceneChunkStore
 from .scenebridge import (
     BindingDirection,
     SceneBinding,
@@ -15,6 +16,9 @@ from . import sources
 __all__ = [
     "SceneObject",
     "Scene",
+    "SceneObjectRecord",
+    "SceneChunk",
+    "SceneChunkStore",
     "BindingDirection",
     "SceneBinding",
     "SceneBridge",
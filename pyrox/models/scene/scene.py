@@ -1,12 +1,14 @@
 """ Scene class for maintaining a collection of scene objects.
 """
-import json
+from dataclasses import dataclass
 from pathlib import Path
 from typing import (
     Any,
     Callable,
 )
+import numpy as np
 from pyrox.interfaces import (
+    BodyType,
     IConnectionRegistry,
     IScene,
     ISceneObject,
@@ -15,10 +17,42 @@ from pyrox.interfaces import (
 )
 from pyrox.models.connection import ConnectionRegistry
 from pyrox.models.scene.sceneobject import SceneObject
+from pyrox.services import scene_binary
+
+
+@dataclass(slots=True)
+class SceneObjectRecord:
+    """Index entry for a scene object that hasn't been built yet.
+
+    Attributes:
+        id: ID of the scene object
+        name: Name of the scene object
+        scene_object_type: Type of the scene object
+        bounds: Bounds of the object's body, as (min_x, min_y, max_x, max_y)
+        layer: Rendering layer
+        data: The object's dictionary, as stored in the scene file
+    """
+    id: str
+    name: str
+    scene_object_type: str
+    bounds: tuple[float, float, float, float]
+    layer: int
+    data: dict
 
 
 class Scene(IScene):
     """Class representing a scene containing scene_objects and tags.
+
+    Scenes loaded lazily (``Scene.from_dict(data, lazy=True)``) start with
+    an index of :class:`SceneObjectRecord` entries instead of objects. An
+    object is built and added to the scene the first time it is asked for
+    by ID, falls in a region passed to :meth:`materialize_region`, or when
+    :meth:`materialize_all` is called; :meth:`get_scene_objects` and
+    :meth:`update` only see the objects built so far. Scene runners call
+    :meth:`materialize_reachable` every frame so that physics sees every
+    moving body and whatever those bodies are about to touch. Connections are
+    wired once both of their ends exist, and :meth:`to_dict` writes records
+    that were never built back out unchanged.
     """
 
     def __init__(
@@ -36,6 +70,23 @@ class Scene(IScene):
         # Connection registry
         self._connection_registry = ConnectionRegistry()
 
+        # Lazy loading: records of objects not built yet, their row in the
+        # bounds array, and connections waiting for both of their ends
+        self._records: dict[str, SceneObjectRecord] = {}
+        self._record_rows: dict[str, int] = {}
+        self._record_ids: list[str] = []
+        self._record_bounds = np.empty((0, 4))
+        self._record_pending = np.empty(0, dtype=bool)
+        self._record_moving = np.empty(0, dtype=bool)
+        self._pending_connections: list[dict] = []
+
+        # Regions already built around each moving object, by object ID
+        self._reached: dict[str, tuple[float, float, float, float]] = {}
+
+        # Region of interest (e.g. the viewport), and who to tell when it moves
+        self._focus: tuple[float, float, float, float] | None = None
+        self._on_focus_changed: list[Callable] = []
+
     def get_name(self) -> str:
         """Get the name of the scene."""
         return self._name
@@ -66,7 +117,7 @@ class Scene(IScene):
         Raises:
             ValueError: If scene object ID already exists
         """
-        if scene_object.id in self._scene_objects:
+        if scene_object.id in self._scene_objects or scene_object.id in self._records:
             raise ValueError(f"Scene object with ID '{scene_object.id}' already exists in scene")
 
         self._scene_objects[scene_object.id] = scene_object
@@ -92,16 +143,31 @@ class Scene(IScene):
             self._connection_registry.unregister_object(scene_object_id)
             # Remove the object
             del self._scene_objects[scene_object_id]
+            self._reached.pop(scene_object_id, None)
+        elif scene_object_id in self._records:
+            # Never built, so nothing was told about it
+            self._drop_record(scene_object_id)
+            self._pending_connections = [
+                c for c in self._pending_connections
+                if scene_object_id not in (c["source"], c["target"])
+            ]
 
     def get_scene_object(
         self,
         scene_object_id: str
     ) -> ISceneObject | ICompositeSceneObject | ISceneGroup | None:
-        """Get a scene object by ID."""
-        return self._scene_objects.get(scene_object_id)
+        """Get a scene object by ID, building it first if it was loaded lazily."""
+        scene_object = self._scene_objects.get(scene_object_id)
+        if scene_object is None and scene_object_id in self._records:
+            self._materialize([scene_object_id])
+            scene_object = self._scene_objects.get(scene_object_id)
+        return scene_object
 
     def get_scene_objects(self) -> dict[str, ISceneObject | ICompositeSceneObject | ISceneGroup]:
-        """Get all scene objects in the scene.
+        """Get all scene objects in the scene that have been built.
+
+        Objects of a lazily loaded scene that haven't been built yet are
+        not included; see :meth:`get_object_records`.
 
         Returns:
             dict[str, ISceneObject]: A dictionary of scene objects by their IDs.
@@ -167,14 +233,15 @@ class Scene(IScene):
             "description": self._description,
             "scene_objects": [
                 scene_object.to_dict() for scene_object in self._scene_objects.values()
-            ],
-            "connections": self._connection_registry.serialize()["connections"],
+            ] + [record.data for record in self._records.values()],
+            "connections": self._connection_registry.serialize()["connections"] + self._pending_connections,
         }
 
     @classmethod
     def from_dict(
         cls,
         data: dict,
+        lazy: bool = False,
     ) -> IScene:
         """Create scene from dictionary.
 
@@ -182,45 +249,39 @@ class Scene(IScene):
         * Pass 1 — create all plain SceneObjects, CompositeSceneObjects, and
           SceneGroup *shells* (without member links).
         * Pass 2 — link SceneGroup shells to their previously-created members.
+
+        With ``lazy`` set, only an index of object records is built; each
+        object goes through the same two passes when it is first needed.
+
+        Args:
+            data: Scene dictionary, as created by :meth:`to_dict`
+            lazy: Defer building scene objects until they are needed
         """
-        # Import here to avoid circular imports at module level.
-        from pyrox.models.scene.scenegroup import SceneGroup, SCENE_OBJECT_TYPE_GROUP
-        from pyrox.models.scene.compositesceneobject import (
-            CompositeSceneObject,
-            SCENE_OBJECT_TYPE_COMPOSITE,
-        )
+        from pyrox.models.scene.scenegroup import SceneGroup
 
         scene = cls(
             name=data.get("name", "Untitled Scene"),
             description=data.get("description", ""),
         )
 
+        if lazy:
+            scene._index_records(data.get("scene_objects", []))
+            scene.set_pending_connections(data.get("connections", []))
+            return scene
+
         # ------ Pass 1: instantiate every scene object ------
         groups: list[SceneGroup] = []
         for scene_object_data in data.get("scene_objects", []):
-            sot = scene_object_data.get("scene_object_type", "")
-
-            if sot == SCENE_OBJECT_TYPE_GROUP:
-                obj = SceneGroup.from_dict(scene_object_data)
+            obj = cls._object_from_dict(scene_object_data)
+            if isinstance(obj, SceneGroup):
                 groups.append(obj)
-            elif sot == SCENE_OBJECT_TYPE_COMPOSITE or scene_object_data.get("components"):
-                obj = CompositeSceneObject.from_dict(scene_object_data)
-            else:
-                obj = SceneObject.from_dict(scene_object_data)
 
             scene.add_scene_object(obj)
             scene._connection_registry.register_object(obj.id, obj)
 
         # ------ Pass 2: link group members ------
         for group in groups:
-            pending_ids: list[str] = getattr(group, "_pending_member_ids", [])
-            for member_id in pending_ids:
-                member = scene.get_scene_object(member_id)
-                if member is not None:
-                    group.add_member(member)
-            # Clear the temporary attribute
-            if hasattr(group, "_pending_member_ids"):
-                object.__setattr__(group, "_pending_member_ids", [])
+            scene._link_group_members(group)
 
         # ------ Connections ------
         for conn_data in data.get("connections", []):
@@ -233,6 +294,338 @@ class Scene(IScene):
 
         return scene
 
+    @staticmethod
+    def _object_from_dict(data: dict) -> ISceneObject | ICompositeSceneObject | ISceneGroup:
+        """Create a scene object of the right class from its dictionary."""
+        # Import here to avoid circular imports at module level.
+        from pyrox.models.scene.scenegroup import SceneGroup, SCENE_OBJECT_TYPE_GROUP
+        from pyrox.models.scene.compositesceneobject import (
+            CompositeSceneObject,
+            SCENE_OBJECT_TYPE_COMPOSITE,
+        )
+
+        sot = data.get("scene_object_type", "")
+        if sot == SCENE_OBJECT_TYPE_GROUP:
+            return SceneGroup.from_dict(data)
+        if sot == SCENE_OBJECT_TYPE_COMPOSITE or data.get("components"):
+            return CompositeSceneObject.from_dict(data)
+        return SceneObject.from_dict(data)
+
+    def _link_group_members(self, group: ISceneGroup) -> None:
+        """Link a group shell created by ``SceneGroup.from_dict`` to its members."""
+        pending_ids: list[str] = getattr(group, "_pending_member_ids", [])
+        for member_id in pending_ids:
+            member = self.get_scene_object(member_id)
+            if member is not None:
+                group.add_member(member)
+        # Clear the temporary attribute
+        if hasattr(group, "_pending_member_ids"):
+            object.__setattr__(group, "_pending_member_ids", [])
+
+    def load_scene_objects(
+        self,
+        scene_objects_data: list[dict],
+    ) -> list[ISceneObject | ICompositeSceneObject | ISceneGroup]:
+        """Build scene objects from their dictionaries and add them to the scene.
+
+        Groups are linked to members loaded in the same call, as in
+        :meth:`from_dict`. Connections left unwired by
+        :meth:`unload_scene_objects` or a lazy load are wired once both of
+        their ends exist.
+
+        Args:
+            scene_objects_data: Scene object dictionaries, as in ``to_dict()["scene_objects"]``
+
+        Returns:
+            The objects added
+        """
+        from pyrox.models.scene.scenegroup import SceneGroup
+
+        created = []
+        for scene_object_data in scene_objects_data:
+            obj = self._object_from_dict(scene_object_data)
+            self.add_scene_object(obj)
+            created.append(obj)
+        for obj in created:
+            if isinstance(obj, SceneGroup):
+                self._link_group_members(obj)
+
+        if created and self._pending_connections:
+            self._connect_pending()
+        return created
+
+    def unload_scene_objects(self, scene_object_ids: list[str]) -> list[dict]:
+        """Remove scene objects, keeping their state and connections to load back later.
+
+        Connections to or from the objects are unwired but kept, and are
+        wired again by :meth:`load_scene_objects` once both ends are back;
+        :meth:`to_dict` still writes them out in the meantime.
+
+        Args:
+            scene_object_ids: IDs of the objects to unload
+
+        Returns:
+            The unloaded objects' dictionaries, for :meth:`load_scene_objects`
+        """
+        unloading = {object_id for object_id in scene_object_ids if object_id in self._scene_objects}
+        if not unloading:
+            return []
+
+        for conn_data in self._connection_registry.serialize()["connections"]:
+            source_id = conn_data["source"]
+            target_id = conn_data["target"]
+            if source_id not in unloading and target_id not in unloading:
+                continue
+            self._pending_connections.append(conn_data)
+            if source_id not in unloading:
+                # The source stays, so stop it calling into the unloaded target
+                callbacks = getattr(self._scene_objects[source_id], conn_data["output"])
+                target_method = getattr(self._scene_objects[target_id], conn_data["input"])
+                if target_method in callbacks:
+                    callbacks.remove(target_method)
+
+        unloaded = []
+        for object_id in scene_object_ids:
+            if object_id in unloading:
+                unloaded.append(self._scene_objects[object_id].to_dict())
+                self.remove_scene_object(object_id)
+        return unloaded
+
+    def get_pending_connections(self) -> list[dict]:
+        """Get the connections waiting for an end that is unloaded or not built yet.
+
+        These are kept in the :meth:`to_dict` form and are written out with
+        the scene's wired connections.
+        """
+        return list(self._pending_connections)
+
+    def set_pending_connections(self, connections: list[dict]) -> None:
+        """Set the connections to wire once both of their ends are loaded.
+
+        Connections whose ends are already in the scene are wired straight away.
+
+        Args:
+            connections: Connection dictionaries, as in ``to_dict()["connections"]``
+        """
+        self._pending_connections = list(connections)
+        if self._pending_connections and self._scene_objects:
+            self._connect_pending()
+
+    # ------------------------------------------------------------------
+    # Lazy loading
+    # ------------------------------------------------------------------
+
+    @property
+    def lazy_object_count(self) -> int:
+        """Get the number of lazily loaded objects not built yet."""
+        return len(self._records)
+
+    def get_object_records(self) -> list[SceneObjectRecord]:
+        """Get the index records of lazily loaded objects not built yet."""
+        return list(self._records.values())
+
+    def materialize_region(
+        self,
+        min_x: float,
+        min_y: float,
+        max_x: float,
+        max_y: float,
+    ) -> list[ISceneObject | ICompositeSceneObject | ISceneGroup]:
+        """Build every lazily loaded object whose bounds overlap a region.
+
+        Args:
+            min_x: Left edge of the region
+            min_y: Top edge of the region
+            max_x: Right edge of the region
+            max_y: Bottom edge of the region
+
+        Returns:
+            The objects built (including group members built along with
+            their group)
+        """
+        if not self._records:
+            return []
+        bounds = self._record_bounds
+        overlapping = (
+            self._record_pending
+            & (bounds[:, 0] <= max_x) & (bounds[:, 2] >= min_x)
+            & (bounds[:, 1] <= max_y) & (bounds[:, 3] >= min_y)
+        )
+        record_ids = self._record_ids
+        return self._materialize([record_ids[row] for row in np.flatnonzero(overlapping)])
+
+    def materialize_all(self) -> list[ISceneObject | ICompositeSceneObject | ISceneGroup]:
+        """Build every lazily loaded object.
+
+        Returns:
+            The objects built
+        """
+        return self._materialize(list(self._records))
+
+    def materialize_reachable(self, margin: float = 0.0) -> list[ISceneObject | ICompositeSceneObject | ISceneGroup]:
+        """Build the lazily loaded objects that physics needs to simulate.
+
+        Objects with dynamic or kinematic bodies are built first, since
+        they move on their own. After that, every object overlapping an
+        awake moving body's bounds grown by ``margin`` is built, so bodies
+        find the floors, conveyors and walls in their way. A body is only
+        checked again once it leaves the region built around it, so a
+        scene that has settled costs one pass over its objects.
+
+        Args:
+            margin: Distance around each moving body to build; it should
+                exceed how far a body travels in one frame
+
+        Returns:
+            The objects built
+        """
+        if not self._records:
+            return []
+
+        record_ids = self._record_ids
+        created = self._materialize([
+            record_ids[row] for row in np.flatnonzero(self._record_pending & self._record_moving)
+        ])
+
+        boxes = []
+        reached = self._reached
+        for object_id, scene_object in self._scene_objects.items():
+            body = scene_object.physics_body
+            if body is None or body.body_type == BodyType.STATIC or body.sleeping or not body.enabled:
+                continue
+            min_x, min_y, max_x, max_y = body.get_bounds()
+            box = reached.get(object_id)
+            if box is not None and box[0] <= min_x and box[1] <= min_y and box[2] >= max_x and box[3] >= max_y:
+                continue
+            box = reached[object_id] = (min_x - margin, min_y - margin, max_x + margin, max_y + margin)
+            boxes.append(box)
+        if not boxes:
+            return created
+
+        bounds = self._record_bounds
+        regions = np.array(boxes)
+        overlapping = np.zeros(len(bounds), dtype=bool)
+        # Test the regions in slices to keep the overlap matrix small
+        step = max(1, 1_000_000 // max(1, len(bounds)))
+        for start in range(0, len(regions), step):
+            region = regions[start:start + step, None, :]
+            overlapping |= (
+                (bounds[None, :, 0] <= region[..., 2]) & (bounds[None, :, 2] >= region[..., 0])
+                & (bounds[None, :, 1] <= region[..., 3]) & (bounds[None, :, 3] >= region[..., 1])
+            ).any(axis=0)
+        overlapping &= self._record_pending
+        return created + self._materialize([record_ids[row] for row in np.flatnonzero(overlapping)])
+
+    def get_focus(self) -> tuple[float, float, float, float] | None:
+        """Get the region of interest, as (min_x, min_y, max_x, max_y), or None if not set."""
+        return self._focus
+
+    def set_focus(
+        self,
+        min_x: float,
+        min_y: float,
+        max_x: float,
+        max_y: float,
+    ) -> list[ISceneObject | ICompositeSceneObject | ISceneGroup]:
+        """Set the region of interest, e.g. the area shown in a viewport.
+
+        Lazily loaded objects overlapping the region are built, and the
+        focus-changed callbacks (such as a chunk store loading the chunks
+        around the region) are called with the scene and the region when
+        it differs from the last one.
+
+        Args:
+            min_x: Left edge of the region
+            min_y: Top edge of the region
+            max_x: Right edge of the region
+            max_y: Bottom edge of the region
+
+        Returns:
+            The lazily loaded objects built
+        """
+        created = self.materialize_region(min_x, min_y, max_x, max_y)
+        focus = (min_x, min_y, max_x, max_y)
+        if focus != self._focus:
+            self._focus = focus
+            for callback in self._on_focus_changed.copy():
+                callback(self, focus)
+        return created
+
+    def get_on_focus_changed(self) -> list[Callable]:
+        return self._on_focus_changed
+
+    def _index_records(self, scene_objects_data: list[dict]) -> None:
+        """Index scene object dictionaries as records to build later."""
+        records: dict[str, SceneObjectRecord] = {}
+        for scene_object_data in scene_objects_data:
+            body = scene_object_data.get("body") or {}
+            x = body.get("x", 0.0)
+            y = body.get("y", 0.0)
+            record = SceneObjectRecord(
+                id=scene_object_data.get("id") or body.get("id", ""),
+                name=scene_object_data.get("name", ""),
+                scene_object_type=scene_object_data.get("scene_object_type", ""),
+                bounds=(x, y, x + body.get("width", 0.0), y + body.get("height", 0.0)),
+                layer=scene_object_data.get("layer", 0),
+                data=scene_object_data,
+            )
+            if record.id in records:
+                raise ValueError(f"Scene object with ID '{record.id}' already exists in scene")
+            records[record.id] = record
+
+        self._records = records
+        self._record_ids = list(records)
+        self._record_rows = {record_id: row for row, record_id in enumerate(self._record_ids)}
+        self._record_bounds = np.array([record.bounds for record in records.values()], dtype=float).reshape(-1, 4)
+        self._record_pending = np.ones(len(records), dtype=bool)
+        self._record_moving = np.array([
+            bool(record.data.get("body")) and record.data["body"].get("body_type", "DYNAMIC") != BodyType.STATIC.name
+            for record in records.values()
+        ], dtype=bool)
+        self._reached = {}
+
+    def _drop_record(self, scene_object_id: str) -> SceneObjectRecord:
+        """Remove a record from the lazy index."""
+        self._record_pending[self._record_rows.pop(scene_object_id)] = False
+        return self._records.pop(scene_object_id)
+
+    def _materialize(self, scene_object_ids: list[str]) -> list[ISceneObject | ICompositeSceneObject | ISceneGroup]:
+        """Build lazily loaded objects, add them to the scene and wire their connections."""
+        from pyrox.models.scene.scenegroup import SceneGroup
+
+        created = []
+        for scene_object_id in scene_object_ids:
+            if scene_object_id not in self._records:
+                continue  # Already built, e.g. as a group member
+            record = self._drop_record(scene_object_id)
+            obj = self._object_from_dict(record.data)
+            self.add_scene_object(obj)
+            created.append(obj)
+            if isinstance(obj, SceneGroup):
+                before = len(self._scene_objects)
+                self._link_group_members(obj)
+                if len(self._scene_objects) != before:
+                    created.extend(list(self._scene_objects.values())[before:])
+
+        if created and self._pending_connections:
+            self._connect_pending()
+        return created
+
+    def _connect_pending(self) -> None:
+        """Wire the pending connections whose ends have both been built."""
+        waiting = []
+        for conn_data in self._pending_connections:
+            if conn_data["source"] in self._scene_objects and conn_data["target"] in self._scene_objects:
+                self._connection_registry.connect(
+                    source_id=conn_data["source"],
+                    output_name=conn_data["output"],
+                    target_id=conn_data["target"],
+                    input_name=conn_data["input"],
+                )
+            else:
+                waiting.append(conn_data)
+        self._pending_connections = waiting
+
     # ------------------------------------------------------------------
     # Group convenience helpers
     # ------------------------------------------------------------------
@@ -331,40 +724,42 @@ class Scene(IScene):
         self.remove_scene_object(group_id)
         return members
 
-    def save(self, filepath: str | Path) -> None:
+    def save(
+        self,
+        filepath: str | Path,
+        binary: bool | None = None,
+        compression: str = scene_binary.COMPRESSION_NONE,
+    ) -> None:
         """
-        Save scene to JSON file.
+        Save scene to a JSON or binary file.
 
         Args:
             filepath: Path to save the scene
+            binary: Save in the compact binary format (defaults to binary
+                for ``.pxscene`` files, JSON otherwise)
+            compression: Compression of the binary format ('none', 'lzma' or 'zstd')
         """
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        scene_binary.save_file(filepath, self.to_dict(), binary=binary, compression=compression)
 
     @classmethod
     def load(
         cls,
         filepath: str | Path,
+        lazy: bool = False,
     ) -> IScene:
         """
-        Load scene from JSON file.
+        Load scene from a JSON or binary file.
+
+        The format is detected from the file's contents.
 
         Args:
             filepath: Path to load the scene from
-            factory: Factory for creating scene objects
+            lazy: Defer building scene objects until they are needed
 
         Returns:
             Scene: Loaded scene instance
-
-        Raises:
-            ValueError: If scene_object_factory is not provided
         """
-        filepath = Path(filepath)
-
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-
-        return cls.from_dict(data)
+        return cls.from_dict(scene_binary.load_file(filepath), lazy=lazy)
@@ -65,6 +65,7 @@ class SceneBridge(ISceneBridge):
         self._last_read_time: dict[str, float] = {}
         self._read_throttle_ms = 100.0
         self._tick_callback_registered = False
+        self._on_source_applied: list[Callable[[SceneBinding, Any], None]] = []
 
     def create_default_bound_object(self) -> ISceneBoundLayer:
         """Create the default source object for bindings.
@@ -440,6 +441,9 @@ class SceneBridge(ISceneBridge):
                     f"{binding.object_id}.{binding.property_path}: {exc}"
                 )
                 binding.enabled = False
+                continue
+
+            self._notify_source_applied(binding, scene_value)
 
     def _apply_source_value_to_scene(self, binding: SceneBinding, source_value: Any) -> None:
         binding.last_source_value = source_value
@@ -460,6 +464,19 @@ class SceneBridge(ISceneBridge):
                 f"Error setting {binding.object_id}.{binding.property_path} from "
                 f"{binding.binding_key}: {exc}"
             )
+            return
+
+        self._notify_source_applied(binding, scene_value)
+
+    def get_on_source_applied(self) -> list[Callable[[SceneBinding, Any], None]]:
+        return self._on_source_applied
+
+    def _notify_source_applied(self, binding: SceneBinding, scene_value: Any) -> None:
+        for callback in self._on_source_applied.copy():
+            try:
+                callback(binding, scene_value)
+            except Exception as exc:
+                log(self).error(f"Error in source applied callback for {binding.binding_key}: {exc}")
 
     def _read_source_value(self, binding: SceneBinding) -> Any:
         return self._get_bound_property(binding.binding_key)
@@ -0,0 +1,419 @@
+"""Spatial chunking of large scenes.
+
+A :class:`SceneChunkStore` splits a scene into square tiles ("chunks")
+saved as separate files in a directory, next to a JSON manifest holding
+each chunk's bounding box and the scene's connections. Chunks are then
+loaded into and unloaded from a live :class:`Scene` as the region of
+interest (the viewport, or the area being simulated) moves, so only the
+objects near that region are in memory and registered with physics.
+
+The store follows the scene's focus (see :meth:`Scene.set_focus`, which
+the scene viewer calls as the view moves); :meth:`SceneChunkStore.update_focus`
+can also be called directly, e.g. for a headless run.
+
+Example:
+    SceneChunkStore.split(scene, 'warehouse', chunk_size=2000.0)
+
+    store = SceneChunkStore.open('warehouse', focus_margin=500.0)
+    SceneRunnerService.set_scene(store.scene)
+"""
+from dataclasses import dataclass, field
+import json
+import math
+from pathlib import Path
+from pyrox.interfaces import ISceneObject
+from pyrox.models.scene.scene import Scene
+from pyrox.services import scene_binary
+
+
+MANIFEST_NAME = "chunks.json"
+
+ChunkKey = tuple[int, int]
+
+
+@dataclass
+class SceneChunk:
+    """A tile of a chunked scene.
+
+    Attributes:
+        key: Column and row of the tile
+        filename: Chunk file, relative to the store's directory
+        bounds: Bounds of the chunk's objects, as (min_x, min_y, max_x, max_y)
+        object_count: Number of objects in the chunk
+        object_ids: IDs of the chunk's objects while it is loaded
+        loaded: Whether the chunk's objects are in the scene
+    """
+    key: ChunkKey
+    filename: str
+    bounds: tuple[float, float, float, float]
+    object_count: int = 0
+    object_ids: list[str] = field(default_factory=list)
+    loaded: bool = False
+
+    def overlaps(self, min_x: float, min_y: float, max_x: float, max_y: float) -> bool:
+        """Check whether the chunk's bounds overlap a region."""
+        return (self.bounds[0] <= max_x and self.bounds[2] >= min_x
+                and self.bounds[1] <= max_y and self.bounds[3] >= min_y)
+
+
+class SceneChunkStore:
+    """Directory of scene chunks, loaded into one scene as needed.
+
+    Objects are assigned to the tile containing their position, and group
+    members to their group's tile so that groups are linked within one
+    chunk. A chunk's bounds cover all of its objects, so objects that
+    overhang their tile are still found by region queries.
+
+    An object stays in the chunk it was loaded from when it moves; objects
+    added to the scene are assigned to a chunk by position when the store
+    is saved. Unloading a chunk saves it first, so changes aren't lost.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        scene: Scene,
+        chunk_size: float,
+        chunks: dict[ChunkKey, SceneChunk] | None = None,
+        binary: bool = True,
+        compression: str = scene_binary.COMPRESSION_NONE,
+        focus_margin: float = 0.0,
+    ):
+        """Initialize the store. Use :meth:`split` or :meth:`open` to create one.
+
+        Args:
+            directory: Directory holding the manifest and chunk files
+            scene: Scene that chunks are loaded into
+            chunk_size: Width and height of each tile
+            chunks: Chunks by key
+            binary: Write chunk files in the binary scene format
+            compression: Compression of binary chunk files
+            focus_margin: Margin passed to :meth:`update_focus` when the
+                scene's focus changes
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self._directory = Path(directory)
+        self._scene = scene
+        self._chunk_size = chunk_size
+        self._chunks: dict[ChunkKey, SceneChunk] = chunks if chunks is not None else {}
+        self._binary = binary
+        self._compression = compression
+        self._focus_margin = focus_margin
+        scene.get_on_focus_changed().append(self._on_focus_changed)
+
+    @property
+    def directory(self) -> Path:
+        """Get the store's directory."""
+        return self._directory
+
+    @property
+    def scene(self) -> Scene:
+        """Get the scene chunks are loaded into."""
+        return self._scene
+
+    @property
+    def chunk_size(self) -> float:
+        """Get the width and height of each tile."""
+        return self._chunk_size
+
+    @property
+    def chunks(self) -> dict[ChunkKey, SceneChunk]:
+        """Get every chunk by key."""
+        return dict(self._chunks)
+
+    @property
+    def focus_margin(self) -> float:
+        """Get the margin kept loaded around the scene's focus."""
+        return self._focus_margin
+
+    @focus_margin.setter
+    def focus_margin(self, value: float) -> None:
+        """Set the margin kept loaded around the scene's focus."""
+        self._focus_margin = value
+
+    @property
+    def loaded_chunks(self) -> list[ChunkKey]:
+        """Get the keys of the chunks currently loaded."""
+        return [key for key, chunk in self._chunks.items() if chunk.loaded]
+
+    @classmethod
+    def split(
+        cls,
+        scene: Scene,
+        directory: str | Path,
+        chunk_size: float = 1000.0,
+        binary: bool = True,
+        compression: str = scene_binary.COMPRESSION_NONE,
+    ) -> 'SceneChunkStore':
+        """Write a scene out as chunks.
+
+        The scene itself is left untouched; open the directory with
+        :meth:`open` to work with the chunks.
+
+        Args:
+            scene: Scene to split
+            directory: Directory to write (created if needed)
+            chunk_size: Width and height of each tile
+            binary: Write chunk files in the binary scene format
+            compression: Compression of binary chunk files
+
+        Returns:
+            Store over the written chunks, loading into a new empty scene
+        """
+        data = scene.to_dict()
+        store = cls(
+            directory,
+            Scene(name=data["name"], description=data["description"]),
+            chunk_size,
+            binary=binary,
+            compression=compression,
+        )
+        store._scene.set_pending_connections(data["connections"])
+        store._write_chunks(store._assign(data["scene_objects"]))
+        store._write_manifest()
+        return store
+
+    @classmethod
+    def open(cls, directory: str | Path, focus_margin: float = 0.0) -> 'SceneChunkStore':
+        """Open a chunk directory without loading any chunks.
+
+        Chunks are loaded once the scene's focus is set.
+
+        Args:
+            directory: Directory written by :meth:`split` or :meth:`save`
+            focus_margin: Margin kept loaded around the scene's focus
+
+        Returns:
+            Store loading into a new empty scene
+        """
+        directory = Path(directory)
+        with open(directory / MANIFEST_NAME, 'r') as f:
+            manifest = json.load(f)
+
+        chunks = {}
+        for chunk_data in manifest.get("chunks", []):
+            key = (chunk_data["key"][0], chunk_data["key"][1])
+            chunks[key] = SceneChunk(
+                key=key,
+                filename=chunk_data["file"],
+                bounds=tuple(chunk_data["bounds"]),  # type: ignore
+                object_count=chunk_data.get("object_count", 0),
+            )
+
+        scene = Scene(name=manifest.get("name", "Untitled Scene"), description=manifest.get("description", ""))
+        scene.set_pending_connections(manifest.get("connections", []))
+        return cls(
+            directory,
+            scene,
+            manifest["chunk_size"],
+            chunks,
+            binary=manifest.get("binary", True),
+            compression=manifest.get("compression", scene_binary.COMPRESSION_NONE),
+            focus_margin=focus_margin,
+        )
+
+    def chunk_key(self, x: float, y: float) -> ChunkKey:
+        """Get the key of the tile containing a point."""
+        return (math.floor(x / self._chunk_size), math.floor(y / self._chunk_size))
+
+    def load_chunk(self, key: ChunkKey) -> list[ISceneObject]:
+        """Load a chunk's objects into the scene.
+
+        Args:
+            key: Chunk to load
+
+        Returns:
+            The objects added (empty if the chunk was already loaded)
+
+        Raises:
+            KeyError: If there is no such chunk
+        """
+        chunk = self._chunks[key]
+        if chunk.loaded:
+            return []
+        data = scene_binary.load_file(self._directory / chunk.filename)
+        objects = self._scene.load_scene_objects(data.get("scene_objects", []))
+        chunk.object_ids = [obj.id for obj in objects]
+        chunk.loaded = True
+        return objects
+
+    def unload_chunk(self, key: ChunkKey, save: bool = True) -> None:
+        """Remove a chunk's objects from the scene.
+
+        Args:
+            key: Chunk to unload
+            save: Write the chunk's current state back to its file first
+
+        Raises:
+            KeyError: If there is no such chunk
+        """
+        chunk = self._chunks[key]
+        if not chunk.loaded:
+            return
+        scene_objects = self._scene.unload_scene_objects(chunk.object_ids)
+        chunk.object_ids = []
+        chunk.loaded = False
+        if save:
+            self._write_chunk(chunk, scene_objects)
+            self._write_manifest()
+
+    def update_focus(
+        self,
+        min_x: float,
+        min_y: float,
+        max_x: float,
+        max_y: float,
+        margin: float = 0.0,
+    ) -> tuple[list[ChunkKey], list[ChunkKey]]:
+        """Load the chunks overlapping a region and unload the rest.
+
+        Args:
+            min_x: Left edge of the region
+            min_y: Top edge of the region
+            max_x: Right edge of the region
+            max_y: Bottom edge of the region
+            margin: Distance around the region whose chunks are also kept
+                loaded, so objects just outside it keep simulating
+
+        Returns:
+            Keys of the chunks loaded and unloaded
+        """
+        region = (min_x - margin, min_y - margin, max_x + margin, max_y + margin)
+        wanted = {key for key, chunk in self._chunks.items() if chunk.overlaps(*region)}
+
+        unloaded = [key for key in self.loaded_chunks if key not in wanted]
+        for key in unloaded:
+            self.unload_chunk(key)
+        loaded = [key for key in wanted if not self._chunks[key].loaded]
+        for key in sorted(loaded):
+            self.load_chunk(key)
+        return sorted(loaded), unloaded
+
+    def detach(self) -> None:
+        """Stop following the scene's focus."""
+        if self._on_focus_changed in self._scene.get_on_focus_changed():
+            self._scene.get_on_focus_changed().remove(self._on_focus_changed)
+
+    def _on_focus_changed(self, scene: Scene, focus: tuple[float, float, float, float]) -> None:
+        """Load the chunks around the scene's new focus."""
+        self.update_focus(*focus, margin=self._focus_margin)
+
+    def save(self) -> None:
+        """Write every loaded chunk and the manifest.
+
+        Objects added to the scene since their chunks were loaded are
+        assigned to chunks by position; chunks that don't exist yet are
+        created.
+        """
+        scene_objects = self._scene.get_scene_objects()
+        known = set()
+        for chunk in self._chunks.values():
+            if chunk.loaded:
+                chunk.object_ids = [object_id for object_id in chunk.object_ids if object_id in scene_objects]
+                known.update(chunk.object_ids)
+
+        new_ids = [object_id for object_id in scene_objects if object_id not in known]
+        for key, object_ids in self._assign_ids(new_ids).items():
+            chunk = self._chunks.get(key)
+            if chunk is None:
+                chunk = self._chunks[key] = self._new_chunk(key)
+                chunk.loaded = True
+            elif not chunk.loaded:
+                self.load_chunk(key)  # Merge with what's on disk
+            chunk.object_ids.extend(object_ids)
+
+        for chunk in self._chunks.values():
+            if chunk.loaded:
+                self._write_chunk(chunk, [scene_objects[object_id].to_dict() for object_id in chunk.object_ids])
+        self._write_manifest()
+
+    def _new_chunk(self, key: ChunkKey) -> SceneChunk:
+        """Create an empty chunk for a tile."""
+        suffix = scene_binary.SUFFIX if self._binary else ".json"
+        size = self._chunk_size
+        return SceneChunk(
+            key=key,
+            filename=f"chunk_{key[0]}_{key[1]}{suffix}",
+            bounds=(key[0] * size, key[1] * size, (key[0] + 1) * size, (key[1] + 1) * size),
+        )
+
+    def _assign(self, scene_objects_data: list[dict]) -> dict[ChunkKey, list[dict]]:
+        """Group scene object dictionaries by tile, keeping group members with their group."""
+        group_keys: dict[str, ChunkKey] = {}
+        for scene_object_data in scene_objects_data:
+            for member_id in scene_object_data.get("member_ids", []):
+                group_keys[member_id] = self._data_key(scene_object_data)
+
+        assigned: dict[ChunkKey, list[dict]] = {}
+        for scene_object_data in scene_objects_data:
+            key = group_keys.get(scene_object_data.get("id", "")) or self._data_key(scene_object_data)
+            assigned.setdefault(key, []).append(scene_object_data)
+        return assigned
+
+    def _assign_ids(self, object_ids: list[str]) -> dict[ChunkKey, list[str]]:
+        """Group scene objects in the scene by tile, keeping group members with their group."""
+        scene_objects = self._scene.get_scene_objects()
+        assigned = self._assign([scene_objects[object_id].to_dict() for object_id in object_ids])
+        return {key: [data["id"] for data in datas] for key, datas in assigned.items()}
+
+    def _data_key(self, scene_object_data: dict) -> ChunkKey:
+        """Get the tile of a scene object dictionary from its body's position."""
+        body = scene_object_data.get("body") or {}
+        return self.chunk_key(body.get("x", 0.0), body.get("y", 0.0))
+
+    def _write_chunks(self, assigned: dict[ChunkKey, list[dict]]) -> None:
+        """Write freshly assigned chunks."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        for key in sorted(assigned):
+            chunk = self._chunks[key] = self._new_chunk(key)
+            self._write_chunk(chunk, assigned[key])
+
+    def _write_chunk(self, chunk: SceneChunk, scene_objects_data: list[dict]) -> None:
+        """Write a chunk file and update the chunk's bounds and count."""
+        bounds = [_data_bounds(data) for data in scene_objects_data]
+        if bounds:
+            chunk.bounds = (
+                min(b[0] for b in bounds), min(b[1] for b in bounds),
+                max(b[2] for b in bounds), max(b[3] for b in bounds),
+            )
+        chunk.object_count = len(scene_objects_data)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        scene_binary.save_file(
+            self._directory / chunk.filename,
+            {"name": self._scene.name, "scene_objects": scene_objects_data, "connections": []},
+            binary=self._binary,
+            compression=self._compression,
+        )
+
+    def _write_manifest(self) -> None:
+        """Write the manifest: chunk bounds and the scene's connections."""
+        manifest = {
+            "name": self._scene.name,
+            "description": self._scene.description,
+            "chunk_size": self._chunk_size,
+            "binary": self._binary,
+            "compression": self._compression,
+            # The registry holds wired connections, the scene those with an end unloaded
+            "connections": (self._scene.get_connection_registry().serialize()["connections"]
+                            + self._scene.get_pending_connections()),
+            "chunks": [
+                {
+                    "key": list(chunk.key),
+                    "file": chunk.filename,
+                    "bounds": list(chunk.bounds),
+                    "object_count": chunk.object_count,
+                }
+                for chunk in self._chunks.values()
+            ],
+        }
+        with open(self._directory / MANIFEST_NAME, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+
+def _data_bounds(scene_object_data: dict) -> tuple[float, float, float, float]:
+    """Get the bounds of a scene object dictionary's body."""
+    body = scene_object_data.get("body") or {}
+    x = body.get("x", 0.0)
+    y = body.get("y", 0.0)
+    return (x, y, x + body.get("width", 0.0), y + body.get("height", 0.0))
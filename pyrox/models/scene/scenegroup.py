@@ -80,6 +80,7 @@ class SceneGroup(SceneObject, ISceneGroup):
         if hasattr(obj, "set_group_id"):
             obj.set_group_id(self.id)  # type: ignore[union-attr]
         self.recompute_bounds()
+        self._bump_revision()
 
     def remove_member(self, obj_id: str) -> None:
         """Remove a member by ID (object stays in scene)."""
@@ -88,6 +89,7 @@ class SceneGroup(SceneObject, ISceneGroup):
             if hasattr(obj, "set_group_id"):
                 obj.set_group_id(None)  # type: ignore[union-attr]
             self.recompute_bounds()
+            self._bump_revision()
 
     def get_members(self) -> Dict[str, ISceneObject]:
         return dict(self._members)
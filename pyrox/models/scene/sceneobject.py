@@ -16,23 +16,76 @@ from pyrox.interfaces import (
 from pyrox.models.physics.factory import PhysicsSceneFactory
 
 
+def _body_property(name: str) -> property:
+    """Build a property that forwards an attribute to the scene object's physics body.
+
+    Render and sync loops read position and size from every scene object every
+    frame, so these attributes resolve straight to the body instead of going
+    through the ``__getattr__`` fallback.
+
+    Args:
+        name: Attribute name on the physics body
+
+    Returns:
+        property: Property reading and writing ``physics_body.<name>``
+    """
+    def fget(self: 'SceneObject') -> Any:
+        return getattr(self._physics_body, name)
+
+    def fset(self: 'SceneObject', value: Any) -> None:
+        setattr(self._physics_body, name, value)
+        self._bump_revision()
+
+    return property(fget, fset, doc=f"Get or set the physics body's {name}.")
+
+
 class SceneObject(
         ISceneObject,
         INameable,
         IDescribable,
 ):
     """Base class for scene objects.
+
+    Spatial and physics attributes (``x``, ``width``, ``velocity_x`` and so
+    on) are forwarded to the physics body through properties built once when
+    the class is defined. Any other attribute of the physics body is still
+    reachable through ``__getattr__``, which only runs once normal lookup
+    has failed.
+
+    Setters bump :attr:`revision`, so savers can tell which objects changed
+    without comparing their serialized forms, and report each bump to the
+    callback set with :meth:`set_changed_callback`. Edits made on the
+    physics body itself bump the body's own revision instead. The physics
+    engine moves bodies directly, so simulated motion doesn't count as a
+    revision.
     """
 
-    def __getattribute__(self, name: str) -> Any:
-        # Override to allow dynamic properties from physics body
+    # Spatial attributes
+    x = _body_property('x')
+    y = _body_property('y')
+    width = _body_property('width')
+    height = _body_property('height')
+    roll = _body_property('roll')
+    pitch = _body_property('pitch')
+    yaw = _body_property('yaw')
+
+    # Physics attributes
+    velocity_x = _body_property('velocity_x')
+    velocity_y = _body_property('velocity_y')
+    mass = _body_property('mass')
+    body_type = _body_property('body_type')
+    enabled = _body_property('enabled')
+    sleeping = _body_property('sleeping')
+
+    def __getattr__(self, name: str) -> Any:
+        # Allow dynamic properties from the physics body
+        if name == '_physics_body':
+            # Not set yet (e.g. while copying); don't recurse
+            raise AttributeError(name)
         try:
-            return super().__getattribute__(name)
+            return getattr(self._physics_body, name)
         except AttributeError:
-            physics_body = super().__getattribute__("_physics_body")
-            if hasattr(physics_body, name):
-                return getattr(physics_body, name)
-            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
 
     def __init__(
         self,
@@ -69,12 +122,42 @@ class SceneObject(
         # Group membership — ID of the SceneGroup this object belongs to, or None
         self._group_id: Optional[str] = None
 
+        # Number of changes made through setters, and who to tell about them
+        self._revision: int = 0
+        self._on_changed: Optional[Callable[['SceneObject'], None]] = None
+
+    @property
+    def revision(self) -> int:
+        """Get the number of changes made through the scene object's setters."""
+        return self._revision
+
+    def set_changed_callback(self, callback: Optional[Callable[['SceneObject'], None]]) -> None:
+        """Set what is called when a setter bumps :attr:`revision`.
+
+        Args:
+            callback: Called with the scene object, or None to stop reporting changes
+        """
+        self._on_changed = callback
+
+    def _bump_revision(self) -> None:
+        """Count a change made through a setter and report it."""
+        self._revision += 1
+        if self._on_changed is not None:
+            self._on_changed(self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Leave the changed callback out of copies, which start untracked."""
+        state = self.__dict__.copy()
+        state['_on_changed'] = None
+        return state
+
     # INamable methods
     def get_name(self) -> str:
         return self._physics_body.name
 
     def set_name(self, name: str) -> None:
         self._physics_body.name = name
+        self._bump_revision()
 
     # IDescribable methods
     def get_description(self) -> str:
@@ -82,6 +165,7 @@ class SceneObject(
 
     def set_description(self, description: str) -> None:
         self._description = description
+        self._bump_revision()
 
     # Properties and serialization methods
     def get_property(self, name: str) -> Any:
@@ -120,6 +204,7 @@ class SceneObject(
         elif hasattr(self, name):
             setattr(self, name, value)
         self._properties[name] = value
+        self._bump_revision()
 
     def set_properties(self, properties: Dict) -> None:
         """Set the properties of the scene object.
@@ -130,6 +215,7 @@ class SceneObject(
         if not isinstance(properties, dict):
             raise ValueError("Properties must be a dictionary")
         self._properties = properties
+        self._bump_revision()
 
     def get_scene_object_type(self) -> str:
         """Get the type of the scene object.
@@ -146,6 +232,7 @@ class SceneObject(
             scene_object_type (str): The type of the scene object.
         """
         self._scene_object_type = scene_object_type
+        self._bump_revision()
 
     def to_dict(self) -> dict:
         """Convert scene object to dictionary for JSON serialization."""
@@ -203,6 +290,7 @@ class SceneObject(
 
     def set_physics_body(self, physics_body: IBasePhysicsBody) -> None:
         self._physics_body = physics_body
+        self._bump_revision()
 
     # Parent-child relationship methods
 
@@ -347,25 +435,30 @@ class SceneObject(
                    200: Foreground/UI elements
         """
         self._layer = layer
+        self._bump_revision()
 
     def move_layer_up(self) -> None:
         """Move this object one layer up (toward foreground)."""
         self._layer += 1
+        self._bump_revision()
 
     def move_layer_down(self) -> None:
         """Move this object one layer down (toward background)."""
         self._layer -= 1
+        self._bump_revision()
 
     def bring_to_front(self) -> None:
         """Bring this object to the front (highest layer)."""
         # Scene will need to determine max layer if we want to be relative
         # For now, use a large value
         self._layer = 1000
+        self._bump_revision()
 
     def send_to_back(self) -> None:
         """Send this object to the back (lowest layer)."""
         # Use a very low value for back
         self._layer = -1000
+        self._bump_revision()
 
     # ------------------------------------------------------------------
     # IGroupable — group membership
@@ -382,6 +475,7 @@ class SceneObject(
             group_id: The owning SceneGroup's scene object ID, or None.
         """
         self._group_id = group_id
+        self._bump_revision()
 
     def _compile_properties(self) -> None:
         """Compile properties for physics simulation."""
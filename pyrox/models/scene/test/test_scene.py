@@ -2,6 +2,7 @@
 import json
 import os
 import tempfile
+import timeit
 import unittest
 from pathlib import Path
 from typing import Any, Dict
@@ -17,6 +18,9 @@ from pyrox.models import (
     BasePhysicsBody,
     Material,
 )
+from pyrox.models.physics.crate import CrateBody
+from pyrox.models.physics.sensor import ProximitySensorBody
+from pyrox.models.scene import SceneGroup, SceneObjectRecord
 
 
 class TestScene(unittest.TestCase):
@@ -328,6 +332,33 @@ class TestScene(unittest.TestCase):
         # Check that the object exists (ID may differ after load)
         self.assertGreater(len(loaded_scene.scene_objects), 0)
 
+    def test_save_binary_by_suffix(self):
+        """Test that .pxscene files are saved in the binary format and loaded back."""
+        original = Scene(name="BinaryScene", description="Binary save")
+        for index in range(3):
+            original.add_scene_object(self.TestSceneObject(
+                scene_object_type="TestSceneObject",
+                name=f"Body{index}",
+                properties={"index": index},
+                physics_body=self.TestPhysicsBody(x=float(index)),
+            ))
+
+        filepath = Path(self.test_dir) / "scene.pxscene"
+        original.save(filepath, compression="lzma")
+
+        self.assertEqual(filepath.read_bytes()[:4], b"PXSC")
+        loaded = Scene.load(filepath)
+        self.assertEqual(loaded.to_dict(), original.to_dict())
+
+    def test_load_detects_format(self):
+        """Test that the format is detected from the contents, not the suffix."""
+        original = Scene(name="DetectScene")
+
+        filepath = Path(self.test_dir) / "scene.json"
+        original.save(filepath, binary=True)
+
+        self.assertEqual(Scene.load(filepath).name, "DetectScene")
+
     def test_scene_roundtrip(self):
         """Test that saving and loading a scene preserves data."""
         original = Scene(name="RoundtripScene", description="Full roundtrip test")
@@ -553,5 +584,202 @@ class TestScene(unittest.TestCase):
         self.assertIsNone(registered_obj_after)
 
 
+class TestSceneLazyLoading(unittest.TestCase):
+    """Test cases for lazily loaded scenes."""
+
+    def setUp(self):
+        """Build a row of sensors, a group of two of them and a connection."""
+        scene = Scene(name="Lazy", description="Lazy loading")
+        for index in range(10):
+            body = ProximitySensorBody(name=f"Sensor{index}", x=index * 100.0, y=0.0, width=10.0, height=10.0)
+            scene.add_scene_object(SceneObject(
+                name=body.name, scene_object_type="sensor", physics_body=body, layer=index,
+            ))
+        self.ids = list(scene.scene_objects)
+        self.group = scene.group_objects(self.ids[8:10], name="Pair")
+        scene.get_connection_registry().connect(
+            self.ids[0], "on_activate_callbacks", self.ids[5], "clear_detected_objects",
+        )
+        self.data = scene.to_dict()
+
+    def _by_id(self, data):
+        return {scene_object["id"]: scene_object for scene_object in data["scene_objects"]}
+
+    def test_lazy_load_builds_index_only(self):
+        """Test that a lazy load indexes records without building objects."""
+        scene = Scene.from_dict(self.data, lazy=True)
+
+        self.assertEqual(scene.get_scene_objects(), {})
+        self.assertEqual(scene.lazy_object_count, 11)
+        record = {r.id: r for r in scene.get_object_records()}[self.ids[3]]
+        self.assertIsInstance(record, SceneObjectRecord)
+        self.assertEqual(record.scene_object_type, "sensor")
+        self.assertEqual(record.bounds, (300.0, 0.0, 310.0, 10.0))
+        self.assertEqual(record.layer, 3)
+
+    def test_get_scene_object_builds_on_demand(self):
+        """Test that asking for an object by ID builds and adds it once."""
+        scene = Scene.from_dict(self.data, lazy=True)
+        added = []
+        scene.on_scene_object_added.append(added.append)
+
+        obj = scene.get_scene_object(self.ids[3])
+
+        self.assertEqual(obj.name, "Sensor3")
+        self.assertIs(scene.get_scene_object(self.ids[3]), obj)
+        self.assertEqual(added, [obj])
+        self.assertEqual(list(scene.get_scene_objects()), [self.ids[3]])
+        self.assertEqual(scene.lazy_object_count, 10)
+
+    def test_materialize_region(self):
+        """Test that only objects overlapping a region are built."""
+        scene = Scene.from_dict(self.data, lazy=True)
+
+        built = scene.materialize_region(150.0, -5.0, 405.0, 5.0)
+
+        self.assertEqual({obj.id for obj in built}, set(self.ids[2:5]))
+        self.assertEqual(scene.materialize_region(150.0, -5.0, 405.0, 5.0), [])
+
+    def test_materialize_reachable(self):
+        """Test that moving bodies are built, then what they come within reach of."""
+        crate = CrateBody(x=150.0, y=0.0)
+        crate_data = SceneObject(name="Crate", scene_object_type="crate", physics_body=crate).to_dict()
+        scene = Scene.from_dict({**self.data, "scene_objects": self.data["scene_objects"] + [crate_data]}, lazy=True)
+
+        built = scene.materialize_reachable(margin=60.0)
+        self.assertEqual({obj.id for obj in built}, {crate.id, self.ids[1], self.ids[2]})
+        self.assertEqual(scene.materialize_reachable(margin=60.0), [])
+
+        scene.get_scene_object(crate.id).x = 290.0
+        self.assertEqual({obj.id for obj in scene.materialize_reachable(margin=60.0)}, {self.ids[3]})
+
+        scene.get_scene_object(crate.id).sleeping = True
+        scene.get_scene_object(crate.id).x = 590.0
+        self.assertEqual(scene.materialize_reachable(margin=60.0), [])
+
+    def test_set_focus_builds_region_and_notifies(self):
+        """Test that setting the focus builds the region and reports only changes."""
+        scene = Scene.from_dict(self.data, lazy=True)
+        focuses = []
+        scene.get_on_focus_changed().append(lambda _, focus: focuses.append(focus))
+
+        built = scene.set_focus(150.0, -5.0, 405.0, 5.0)
+        scene.set_focus(150.0, -5.0, 405.0, 5.0)
+
+        self.assertEqual({obj.id for obj in built}, set(self.ids[2:5]))
+        self.assertEqual(scene.get_focus(), (150.0, -5.0, 405.0, 5.0))
+        self.assertEqual(focuses, [(150.0, -5.0, 405.0, 5.0)])
+
+    def test_pending_connections(self):
+        """Test that pending connections are wired once their ends are in the scene."""
+        scene = Scene.from_dict(self.data, lazy=True)
+        connections = self.data["connections"]
+        self.assertEqual(scene.get_pending_connections(), connections)
+
+        scene.materialize_all()
+        self.assertEqual(scene.get_pending_connections(), [])
+
+        eager = Scene.from_dict({**self.data, "connections": []})
+        eager.set_pending_connections(connections)
+        self.assertEqual(eager.get_pending_connections(), [])
+        self.assertEqual(eager.get_connection_registry().serialize()["connections"], connections)
+
+    def test_group_builds_its_members(self):
+        """Test that building a group builds and links its members."""
+        scene = Scene.from_dict(self.data, lazy=True)
+
+        group = scene.get_scene_object(self.group.id)
+
+        self.assertIsInstance(group, SceneGroup)
+        self.assertEqual(group.get_member_ids(), self.ids[8:10])
+        self.assertIn(self.ids[8], scene.get_scene_objects())
+
+    def test_connections_wired_when_both_ends_built(self):
+        """Test that connections wait for both of their objects."""
+        scene = Scene.from_dict(self.data, lazy=True)
+        registry = scene.get_connection_registry()
+
+        source = scene.get_scene_object(self.ids[0])
+        self.assertEqual(registry.serialize()["connections"], [])
+        self.assertEqual(source.on_activate_callbacks, [])
+
+        target = scene.get_scene_object(self.ids[5])
+        self.assertEqual(len(registry.serialize()["connections"]), 1)
+        self.assertEqual(source.on_activate_callbacks, [target.clear_detected_objects])
+
+    def test_to_dict_keeps_unbuilt_records(self):
+        """Test that saving a partly built scene keeps every object and connection."""
+        scene = Scene.from_dict(self.data, lazy=True)
+        scene.materialize_region(0.0, 0.0, 250.0, 10.0)
+
+        data = scene.to_dict()
+
+        self.assertEqual(self._by_id(data), self._by_id(self.data))
+        self.assertEqual(data["connections"], self.data["connections"])
+
+    def test_remove_unbuilt_object(self):
+        """Test that an unbuilt object can be removed along with its connections."""
+        scene = Scene.from_dict(self.data, lazy=True)
+
+        scene.remove_scene_object(self.ids[5])
+
+        self.assertIsNone(scene.get_scene_object(self.ids[5]))
+        self.assertEqual(scene.lazy_object_count, 10)
+        self.assertEqual(scene.to_dict()["connections"], [])
+        self.assertEqual(scene.materialize_region(495.0, 0.0, 505.0, 10.0), [])
+
+    def test_materialize_all_matches_eager_load(self):
+        """Test that building everything gives the same scene as an eager load."""
+        lazy = Scene.from_dict(self.data, lazy=True)
+        lazy.materialize_all()
+        eager = Scene.from_dict(self.data)
+
+        self.assertEqual(lazy.lazy_object_count, 0)
+        self.assertEqual(self._by_id(lazy.to_dict()), self._by_id(eager.to_dict()))
+        self.assertEqual(lazy.to_dict()["connections"], eager.to_dict()["connections"])
+
+    def test_unload_and_load_scene_objects(self):
+        """Test that unloaded objects come back with their connections rewired."""
+        scene = Scene.from_dict(self.data)
+        removed = []
+        scene.on_scene_object_removed.append(removed.append)
+
+        unloaded = scene.unload_scene_objects([self.ids[5]])
+
+        self.assertEqual([data["id"] for data in unloaded], [self.ids[5]])
+        self.assertEqual(len(removed), 1)
+        self.assertEqual(scene.get_scene_object(self.ids[0]).on_activate_callbacks, [])
+        self.assertEqual(scene.to_dict()["connections"], self.data["connections"])
+
+        loaded = scene.load_scene_objects(unloaded)
+
+        self.assertEqual(scene.get_scene_object(self.ids[0]).on_activate_callbacks,
+                         [loaded[0].clear_detected_objects])
+        self.assertEqual(self._by_id(scene.to_dict()), self._by_id(self.data))
+
+    def test_load_scene_objects_links_groups(self):
+        """Test that groups loaded with their members are linked to them."""
+        scene = Scene.from_dict(self.data)
+        unloaded = scene.unload_scene_objects([self.group.id, *self.ids[8:10]])
+
+        scene.load_scene_objects(unloaded)
+
+        self.assertEqual(scene.get_scene_object(self.group.id).get_member_ids(), self.ids[8:10])
+
+    @unittest.skipUnless(os.environ.get('PYROX_BENCHMARKS'), "set PYROX_BENCHMARKS to run timing benchmarks")
+    def test_lazy_load_throughput(self):
+        """Microbenchmark: indexing a large scene is far cheaper than building it."""
+        scene = Scene(name="Large")
+        for index in range(1000):
+            body = ProximitySensorBody(name=f"Sensor{index}", x=float(index), y=0.0)
+            scene.add_scene_object(SceneObject(name=body.name, scene_object_type="sensor", physics_body=body))
+        data = scene.to_dict()
+
+        def seconds(lazy):
+            return min(timeit.repeat(lambda: Scene.from_dict(data, lazy=lazy), number=1, repeat=3))
+
+        self.assertLess(seconds(True), seconds(False) / 5)
+
+
 if __name__ == '__main__':
     unittest.main()
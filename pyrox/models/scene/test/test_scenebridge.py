@@ -459,6 +459,23 @@ class TestUpdateSourceToScene(unittest.TestCase):
         self.bridge.update_source_to_scene()  # t=1s — throttled; scene unchanged
         self.assertEqual(self.scene_obj.speed, 7)
 
+    @patch("time.time", return_value=1.0)
+    def test_notifies_source_applied_callbacks(self, _):
+        """Applied values reach on_source_applied callbacks from ticks and pushes alike."""
+        applied = []
+        self.bridge.on_source_applied.append(lambda binding, value: applied.append((binding.property_path, value)))
+        self.bridge.add_binding(
+            "inputs.speed", "conveyor_1", "speed", BindingDirection.READ, transform=lambda v: v * 10,
+        )
+        self.bridge.add_binding("inputs.active", "conveyor_1", "status.active", BindingDirection.READ)
+        self.inputs.speed = 2
+        self.bridge.start()
+
+        self.bridge.update_source_to_scene()
+        self.bridge.handle_source_update("inputs.active", True)
+
+        self.assertEqual(applied, [("speed", 20), ("status.active", False), ("status.active", True)])
+
     @patch("time.time", return_value=1.0)
     def test_skips_none_source_values(self, _):
         """Bindings whose source attribute does not exist (returns None) are skipped."""
@@ -0,0 +1,170 @@
+"""Unit tests for pyrox.models.scene.scenechunks module."""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from pyrox.models import Scene, SceneObject
+from pyrox.models.physics.sensor import ProximitySensorBody
+from pyrox.models.scene import SceneChunk, SceneChunkStore, SceneGroup
+from pyrox.models.scene.scenechunks import MANIFEST_NAME
+from pyrox.services import EnvironmentService, HeadlessSceneRunner, PhysicsEngineService
+
+
+class TestSceneChunkStore(unittest.TestCase):
+    """Test cases for SceneChunkStore."""
+
+    def setUp(self):
+        """Build a row of sensors over five tiles, a group and a connection across tiles."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name) / "chunks"
+
+        scene = Scene(name="Chunked", description="Chunked scene")
+        for index, x in enumerate((0.0, 50.0, 120.0, 220.0, 320.0, 420.0)):
+            body = ProximitySensorBody(name=f"Sensor{index}", x=x, y=0.0, width=10.0, height=10.0)
+            scene.add_scene_object(SceneObject(name=body.name, scene_object_type="sensor", physics_body=body))
+        self.ids = list(scene.scene_objects)
+        self.group = scene.group_objects(self.ids[4:6], name="Pair")
+        scene.get_connection_registry().connect(
+            self.ids[0], "on_activate_callbacks", self.ids[3], "clear_detected_objects",
+        )
+        self.scene = scene
+
+    def tearDown(self):
+        """Remove the chunk directory."""
+        self.temp_dir.cleanup()
+
+    def _split_and_open(self, **kwargs):
+        SceneChunkStore.split(self.scene, self.directory, chunk_size=100.0, **kwargs)
+        return SceneChunkStore.open(self.directory)
+
+    def test_split_writes_manifest_and_chunks(self):
+        """Test that splitting writes one file per tile and a manifest."""
+        store = self._split_and_open()
+
+        chunks = store.chunks
+        self.assertEqual(set(chunks), {(0, 0), (1, 0), (2, 0), (3, 0)})
+        self.assertIsInstance(chunks[(0, 0)], SceneChunk)
+        self.assertEqual(chunks[(0, 0)].object_count, 2)
+        self.assertEqual(chunks[(0, 0)].bounds, (0.0, 0.0, 60.0, 10.0))
+        for chunk in chunks.values():
+            self.assertTrue((self.directory / chunk.filename).exists())
+
+        with open(self.directory / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["chunk_size"], 100.0)
+        self.assertEqual(manifest["connections"], self.scene.to_dict()["connections"])
+
+    def test_group_kept_with_members(self):
+        """Test that group members are stored in their group's chunk, past their own tile."""
+        store = self._split_and_open()
+
+        self.assertEqual(store.chunks[(3, 0)].object_count, 3)
+        self.assertEqual(store.chunks[(3, 0)].bounds, (320.0, 0.0, 430.0, 10.0))
+
+        store.load_chunk((3, 0))
+        group = store.scene.get_scene_object(self.group.id)
+        self.assertIsInstance(group, SceneGroup)
+        self.assertEqual(group.get_member_ids(), self.ids[4:6])
+
+    def test_open_loads_nothing(self):
+        """Test that opening a store leaves the scene empty."""
+        store = self._split_and_open()
+
+        self.assertEqual(store.scene.get_scene_objects(), {})
+        self.assertEqual(store.scene.name, "Chunked")
+        self.assertEqual(store.loaded_chunks, [])
+
+    def test_load_and_unload_chunk(self):
+        """Test that a chunk's objects enter and leave the scene, keeping their changes."""
+        store = self._split_and_open()
+
+        objects = store.load_chunk((1, 0))
+        self.assertEqual([obj.id for obj in objects], [self.ids[2]])
+        self.assertEqual(store.load_chunk((1, 0)), [])
+        objects[0].x = 150.0
+
+        store.unload_chunk((1, 0))
+        self.assertEqual(store.scene.get_scene_objects(), {})
+
+        store.load_chunk((1, 0))
+        self.assertEqual(store.scene.get_scene_object(self.ids[2]).x, 150.0)
+
+    def test_update_focus_with_margin(self):
+        """Test that only chunks near the focus region stay loaded."""
+        store = self._split_and_open()
+
+        loaded, unloaded = store.update_focus(0.0, 0.0, 100.0, 10.0)
+        self.assertEqual(loaded, [(0, 0)])
+        self.assertEqual(unloaded, [])
+
+        loaded, unloaded = store.update_focus(200.0, 0.0, 250.0, 10.0, margin=100.0)
+        self.assertEqual(loaded, [(1, 0), (2, 0), (3, 0)])
+        self.assertEqual(unloaded, [(0, 0)])
+        self.assertNotIn(self.ids[0], store.scene.get_scene_objects())
+
+    def test_connection_across_chunks(self):
+        """Test that a connection between chunks is wired only while both are loaded."""
+        store = self._split_and_open()
+        store.load_chunk((0, 0))
+        source = store.scene.get_scene_object(self.ids[0])
+        self.assertEqual(source.on_activate_callbacks, [])
+
+        target = store.load_chunk((2, 0))[0]
+        self.assertEqual(source.on_activate_callbacks, [target.clear_detected_objects])
+
+        store.unload_chunk((2, 0))
+        self.assertEqual(source.on_activate_callbacks, [])
+        self.assertEqual(store.scene.to_dict()["connections"], self.scene.to_dict()["connections"])
+
+    def test_save_assigns_new_objects(self):
+        """Test that objects added to the scene are saved to the chunk under them."""
+        store = self._split_and_open()
+        body = ProximitySensorBody(name="Far", x=950.0, y=0.0, width=10.0, height=10.0)
+        far = SceneObject(name="Far", scene_object_type="sensor", physics_body=body)
+        store.scene.add_scene_object(far)
+
+        store.save()
+
+        reopened = SceneChunkStore.open(self.directory)
+        self.assertIn((9, 0), reopened.chunks)
+        self.assertEqual([obj.id for obj in reopened.load_chunk((9, 0))], [far.id])
+
+    def test_physics_follows_focus(self):
+        """Test that only bodies in loaded chunks are simulated."""
+        store = self._split_and_open()
+        engine = PhysicsEngineService(environment=EnvironmentService(preset='space'))
+        runner = HeadlessSceneRunner(store.scene, physics_engine=engine)
+        try:
+            store.update_focus(0.0, 0.0, 100.0, 10.0)
+            self.assertEqual(len(engine.bodies), 2)
+
+            store.update_focus(300.0, 0.0, 400.0, 10.0)
+            self.assertEqual(len(engine.bodies), 3)
+            runner.step()
+        finally:
+            runner.close()
+            engine.shutdown()
+
+    def test_follows_scene_focus(self):
+        """Test that chunks are loaded as the scene's focus moves, until detached."""
+        SceneChunkStore.split(self.scene, self.directory, chunk_size=100.0)
+        store = SceneChunkStore.open(self.directory, focus_margin=100.0)
+
+        store.scene.set_focus(0.0, 0.0, 50.0, 10.0)
+        self.assertEqual(store.loaded_chunks, [(0, 0), (1, 0)])
+
+        store.scene.set_focus(330.0, 0.0, 400.0, 10.0)
+        self.assertEqual(sorted(store.loaded_chunks), [(2, 0), (3, 0)])
+
+        store.detach()
+        store.scene.set_focus(0.0, 0.0, 50.0, 10.0)
+        self.assertEqual(sorted(store.loaded_chunks), [(2, 0), (3, 0)])
+
+    def test_invalid_chunk_size(self):
+        """Test that the chunk size must be positive."""
+        with self.assertRaises(ValueError):
+            SceneChunkStore.split(self.scene, self.directory, chunk_size=0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -485,6 +485,51 @@ class TestConnectionRegistry(unittest.TestCase):
         self.assertEqual(len(self.registry._connections), 0)
         self.assertNotIn("motor_001", self.registry._objects)
 
+    def test_disconnect_unwires_callback(self):
+        """Test that disconnecting removes the connection and its callback."""
+        sensor = self.MockSensor("sensor_001")
+        motor = self.MockMotor("motor_001")
+        self.registry.register_object("sensor_001", sensor)
+        self.registry.register_object("motor_001", motor)
+        conn = self.registry.connect("sensor_001", "on_activate_callbacks", "motor_001", "start")
+
+        self.registry.disconnect(conn)
+
+        self.assertEqual(self.registry._connections, [])
+        self.assertEqual(sensor.on_activate_callbacks, [])
+
+    def test_clear_connections(self):
+        """Test that clearing removes and unwires every connection."""
+        sensor = self.MockSensor("sensor_001")
+        motor = self.MockMotor("motor_001")
+        self.registry.register_object("sensor_001", sensor)
+        self.registry.register_object("motor_001", motor)
+        self.registry.connect("sensor_001", "on_activate_callbacks", "motor_001", "start")
+        self.registry.connect("sensor_001", "on_deactivate_callbacks", "motor_001", "stop")
+
+        self.registry.clear_connections()
+
+        self.assertEqual(self.registry._connections, [])
+        self.assertEqual(sensor.on_activate_callbacks, [])
+        self.assertEqual(sensor.on_deactivate_callbacks, [])
+
+    def test_revision_counts_added_and_removed_connections(self):
+        """Test that the revision changes only when connections are added or removed."""
+        sensor = self.MockSensor("sensor_001")
+        motor = self.MockMotor("motor_001")
+        self.registry.register_object("sensor_001", sensor)
+        self.registry.register_object("motor_001", motor)
+        self.assertEqual(self.registry.revision, 0)
+
+        conn = self.registry.connect("sensor_001", "on_activate_callbacks", "motor_001", "start")
+        self.assertEqual(self.registry.revision, 1)
+
+        self.registry.disconnect(conn)
+        self.assertEqual(self.registry.revision, 2)
+
+        self.registry.unregister_object("motor_001")  # No connections left to remove
+        self.assertEqual(self.registry.revision, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -48,21 +48,32 @@ from .file import (
 # Process imports
 from .process import execute_file_as_subprocess
 
-# Collision imports
-from .collision import (
-    CollisionService,
-    SpatialGrid
+# Broad phase imports
+from .broadphase import (
+    BroadPhase,
+    CollisionLayerMatrix,
+    DynamicAABBTree,
+    SpatialGrid,
+    SweepAndPrune,
 )
 
+# Collision imports
+from .collision import CollisionService
+
 # Environment imports
 from .environment import EnvironmentService
 
 # Physics imports
 from .physics import PhysicsEngineService
+from .physics_arrays import PhysicsBodyArrays
+from .profiler import PhysicsProfiler, RollingHistogram
+from .solver import ContactSolver
 
 # Scene imports
 from .scene import (
     HasSceneMixin,
+    HeadlessRunResult,
+    HeadlessSceneRunner,
     SceneRunnerService,
     SceneBridgeService,
     SceneEvent,
@@ -70,6 +81,17 @@ from .scene import (
     SceneEventBus,
 )
 
+# Replay imports
+from .replay import (
+    InputEvent,
+    InputRecorder,
+    InputRecording,
+    InputReplayer,
+    ReplayResult,
+)
+
+# Scene journal imports
+from .scene_journal import SceneJournal
 
 # Canvas imports
 from .canvas import CanvasObjectManagmenentService
@@ -85,19 +107,28 @@ from .timer import TimerService
 # Other service imports
 from . import (
     archive,
+    batch,
     bit,
+    broadphase,
     byte,
     collision,
     decorate,
     dict,
     environment,
     logic,
+    narrowphase,
     notify_services,
     object,
     physics,
+    physics_arrays,
+    profiler,
     progress,
+    replay,
     scene,
+    scene_binary,
+    scene_journal,
     search,
+    solver,
     stream,
     timer,
     xml,
@@ -131,21 +162,40 @@ __all__ = (
     'PlatformDirectoryService',
     # Process imports
     'execute_file_as_subprocess',
+    # Broad phase imports
+    'BroadPhase',
+    'CollisionLayerMatrix',
+    'DynamicAABBTree',
+    'SpatialGrid',
+    'SweepAndPrune',
     # Collision imports
     'CollisionService',
-    'SpatialGrid',
     # Environment imports
     'EnvironmentService',
     # Physics imports
     'PhysicsEngineService',
+    'PhysicsBodyArrays',
+    'PhysicsProfiler',
+    'RollingHistogram',
+    'ContactSolver',
     # Scene imports
     'HasSceneMixin',
+    'HeadlessRunResult',
+    'HeadlessSceneRunner',
     'SceneRunnerService',
     'SceneBridgeService',
     # Scene events imports
     'SceneEvent',
     'SceneEventType',
     'SceneEventBus',
+    # Replay imports
+    'InputEvent',
+    'InputRecorder',
+    'InputRecording',
+    'InputReplayer',
+    'ReplayResult',
+    # Scene journal imports
+    'SceneJournal',
     # Menu registry imports
     'MenuRegistry',
     'MenuItemDescriptor',
@@ -157,19 +207,28 @@ __all__ = (
     'TimerService',
     # Other service imports
     'archive',
+    'batch',
     'bit',
+    'broadphase',
     'byte',
     'collision',
     'decorate',
     'dict',
     'environment',
     'logic',
+    'narrowphase',
     'notify_services',
     'object',
     'physics',
+    'physics_arrays',
+    'profiler',
     'progress',
+    'replay',
     'scene',
+    'scene_binary',
+    'scene_journal',
     'search',
+    'solver',
     'stream',
     'timer',
     'xml',
@@ -0,0 +1,310 @@
+"""Batch scenario runner for what-if studies over scene variants.
+
+Runs one scene file under many parameter combinations, each headless for a
+fixed simulated duration, spread across a process pool. Every run reports
+sensor activation counts and a histogram of where dynamic bodies spent
+their time.
+
+Parameter grid keys:
+    ``environment``: EnvironmentService preset name (e.g. ``'earth'``)
+    ``environment.<attribute>``: Environment attribute (e.g. ``environment.gravity``)
+    ``<object name>.<attribute>``: Attribute of a named scene object's physics
+        body (e.g. ``Belt 1.belt_speed`` or ``Checkpoint.x``)
+
+Example:
+    runner = BatchScenarioRunner(
+        'layout.json',
+        grid={'Belt 1.belt_speed': [50.0, 75.0, 100.0], 'environment': ['earth', 'moon']},
+        duration=3600.0,
+    )
+    for result in runner.run():
+        print(result.parameters, result.sensor_activations)
+"""
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import product
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from pyrox.interfaces import BodyType, IScene
+from pyrox.services import environment as env
+from pyrox.services import physics, scene_binary
+from pyrox.services.scene import HeadlessSceneRunner
+
+
+@dataclass
+class ScenarioResult:
+    """Metrics collected from one scenario run.
+
+    Attributes:
+        index: Position of the variant in the expanded grid
+        parameters: Parameter values used for the run
+        frames: Number of frames simulated
+        simulated_time: Simulated seconds covered
+        wall_time: Wall-clock seconds the simulation took
+        sensor_activations: Times each sensor went from empty to occupied, by name
+        sensor_detections: Objects that entered each sensor, by name
+        position_histogram: Samples of dynamic body centers per grid cell,
+            keyed by (cell_x, cell_y)
+        error: Error message if the run failed, None otherwise
+    """
+    index: int
+    parameters: Dict[str, Any]
+    frames: int = 0
+    simulated_time: float = 0.0
+    wall_time: float = 0.0
+    sensor_activations: Dict[str, int] = field(default_factory=dict)
+    sensor_detections: Dict[str, int] = field(default_factory=dict)
+    position_histogram: Dict[Tuple[int, int], int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the run completed without an error."""
+        return self.error is None
+
+
+def expand_grid(grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Expand a parameter grid into every combination of its values.
+
+    Args:
+        grid: Parameter names mapped to the values to try
+
+    Returns:
+        List of parameter dictionaries, one per combination, with the last
+        parameter varying fastest
+    """
+    if not grid:
+        return [{}]
+    names = list(grid)
+    return [dict(zip(names, values)) for values in product(*(grid[name] for name in names))]
+
+
+def apply_parameters(
+    scene: IScene,
+    environment: env.EnvironmentService,
+    parameters: Dict[str, Any],
+) -> None:
+    """Apply grid parameters to a scene and its environment.
+
+    The ``environment`` preset is applied before any other parameter, so
+    explicit ``environment.<attribute>`` values override the preset's
+    whatever order the keys are in.
+
+    Args:
+        scene: Scene whose objects are modified
+        environment: Environment the scene will run in
+        parameters: Parameter values keyed as described in the module docstring
+
+    Raises:
+        KeyError: If a parameter names an unknown scene object
+        AttributeError: If a parameter names an unknown attribute
+    """
+    if 'environment' in parameters:
+        environment.set_preset(parameters['environment'])
+
+    objects_by_name = {scene_object.name: scene_object for scene_object in scene.get_scene_objects().values()}
+    for key, value in parameters.items():
+        if key == 'environment':
+            continue
+
+        target_name, _, attribute = key.rpartition('.')
+        if not target_name:
+            raise KeyError(f"Parameter '{key}' must be 'environment' or '<target>.<attribute>'")
+        if target_name == 'environment':
+            target = environment
+        elif target_name in objects_by_name:
+            target = objects_by_name[target_name].physics_body
+        else:
+            raise KeyError(f"Scene has no object named '{target_name}'")
+
+        if not hasattr(target, attribute):
+            raise AttributeError(f"'{target_name}' has no attribute '{attribute}'")
+        setattr(target, attribute, value)
+
+
+def run_scenario(
+    scene_data: dict,
+    parameters: Dict[str, Any],
+    duration: float,
+    index: int = 0,
+    frame_time: Optional[float] = None,
+    histogram_cell_size: float = 100.0,
+    sample_interval: float = 1.0,
+) -> ScenarioResult:
+    """Run one scenario headless and collect its metrics.
+
+    Runs in a worker process, so everything it needs is passed in and the
+    scene is rebuilt from its dictionary form.
+
+    Args:
+        scene_data: Scene in its ``Scene.to_dict`` form
+        parameters: Parameter values to apply before running
+        duration: Simulated seconds to run for
+        index: Position of the variant in the batch
+        frame_time: Simulated seconds per frame (defaults to the physics step)
+        histogram_cell_size: Size of the position histogram's grid cells
+        sample_interval: Simulated seconds between position histogram samples
+
+    Returns:
+        Metrics collected from the run
+    """
+    # Imported here so the models package loads (and registers its body
+    # templates) in the worker process
+    from pyrox.models.physics.sensor import ProximitySensorBody
+    from pyrox.models.scene import Scene
+
+    scene = Scene.from_dict(scene_data)
+    environment = env.EnvironmentService()
+    apply_parameters(scene, environment, parameters)
+    engine = physics.PhysicsEngineService(environment=environment)
+    runner = HeadlessSceneRunner(scene, physics_engine=engine, frame_time=frame_time)
+
+    result = ScenarioResult(index=index, parameters=dict(parameters))
+    activations = result.sensor_activations
+    detections = result.sensor_detections
+
+    def count_activation(sensor: ProximitySensorBody) -> None:
+        activations[sensor.name] += 1
+
+    def count_detection(sensor: ProximitySensorBody, _) -> None:
+        detections[sensor.name] += 1
+
+    for scene_object in scene.get_scene_objects().values():
+        body = scene_object.physics_body
+        if not isinstance(body, ProximitySensorBody):
+            continue
+        activations[body.name] = 0
+        detections[body.name] = 0
+        body.on_activate_callbacks.append(count_activation)
+        body.on_object_enter_callbacks.append(count_detection)
+
+    histogram = result.position_histogram
+    sample_every = max(1, int(round(sample_interval / runner.frame_time)))
+
+    def sample_positions(headless: HeadlessSceneRunner) -> bool:
+        if headless.frames % sample_every == 0:
+            for body in engine.bodies:
+                if body.enabled and body.body_type == BodyType.DYNAMIC:
+                    cell = (
+                        int((body.x + body.width / 2) // histogram_cell_size),
+                        int((body.y + body.height / 2) // histogram_cell_size),
+                    )
+                    histogram[cell] = histogram.get(cell, 0) + 1
+        return False
+
+    run = runner.run(duration=duration, stop_condition=sample_positions)
+    runner.close()
+    engine.shutdown()
+
+    result.frames = run.frames
+    result.simulated_time = run.simulated_time
+    result.wall_time = run.wall_time
+    return result
+
+
+class BatchScenarioRunner:
+    """Run a scene under every combination of a parameter grid across a process pool.
+
+    Attributes:
+        scene_data: The scene in its dictionary form
+        variants: Parameter dictionaries for every run, in run order
+    """
+
+    def __init__(
+        self,
+        scene: str | Path | dict,
+        grid: Dict[str, Sequence[Any]],
+        duration: float,
+        frame_time: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        histogram_cell_size: float = 100.0,
+        sample_interval: float = 1.0,
+    ):
+        """Initialize the batch.
+
+        Args:
+            scene: Path to a JSON or binary scene file, or a scene in its ``Scene.to_dict`` form
+            grid: Parameter names mapped to the values to try
+            duration: Simulated seconds to run each variant for
+            frame_time: Simulated seconds per frame (defaults to the physics step)
+            max_workers: Process pool size (defaults to the executor's own default)
+            histogram_cell_size: Size of the position histogram's grid cells
+            sample_interval: Simulated seconds between position histogram samples
+
+        Raises:
+            ValueError: If the duration is not positive
+        """
+        if duration <= 0.0:
+            raise ValueError("Duration must be positive")
+
+        if isinstance(scene, dict):
+            self._scene_data = scene
+        else:
+            self._scene_data = scene_binary.load_file(scene)
+
+        self._variants = expand_grid(grid)
+        self._duration = duration
+        self._frame_time = frame_time
+        self._max_workers = max_workers
+        self._histogram_cell_size = histogram_cell_size
+        self._sample_interval = sample_interval
+
+    @property
+    def scene_data(self) -> dict:
+        """Get the scene in its dictionary form."""
+        return self._scene_data
+
+    @property
+    def variants(self) -> List[Dict[str, Any]]:
+        """Get the parameter dictionaries for every run."""
+        return self._variants
+
+    def run(
+        self,
+        executor: Optional[Executor] = None,
+        on_result: Optional[Callable[[ScenarioResult], None]] = None,
+    ) -> List[ScenarioResult]:
+        """Run every variant and collect the results.
+
+        A variant that raises is reported with its error rather than ending
+        the batch.
+
+        Args:
+            executor: Executor to submit runs to (creates a process pool if None)
+            on_result: Called with each result as it is collected, in run order
+
+        Returns:
+            Results for every variant, in the order of :attr:`variants`
+        """
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=self._max_workers)
+
+        try:
+            futures = [
+                executor.submit(
+                    run_scenario,
+                    self._scene_data,
+                    parameters,
+                    self._duration,
+                    index,
+                    self._frame_time,
+                    self._histogram_cell_size,
+                    self._sample_interval,
+                )
+                for index, parameters in enumerate(self._variants)
+            ]
+
+            results = []
+            for index, future in enumerate(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = ScenarioResult(index=index, parameters=dict(self._variants[index]), error=repr(e))
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+            return results
+        finally:
+            if own_executor:
+                executor.shutdown()
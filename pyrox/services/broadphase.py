@@ -0,0 +1,1236 @@
+"""Broad-phase collision strategies.
+
+A broad phase keeps track of registered bodies' bounding boxes and reports
+candidate pairs whose boxes may overlap, so the narrow phase only has to test
+a small subset of all possible pairs. Broad phases also answer point, area
+and ray queries against the current body bounds.
+
+Every body gets a stable integer index for as long as it is registered, and
+its bounds are cached in a flat buffer when it is inserted or updated. Pairs
+are reported as index pairs ``(i, j)`` with ``i < j``, which lets the
+narrow phase work from the buffer without calling back into the bodies.
+
+Each body's collision layer is cached by index as well. When a
+:class:`CollisionLayerMatrix` is attached, pairs whose layers are never
+allowed to meet are dropped before they are reported.
+"""
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from heapq import heappop, heappush
+from typing import List, Set, Tuple, Dict, Iterable, Optional
+from pyrox.interfaces.protocols.physics import ICollider2D, IPhysicsBody2D, BodyType, CollisionLayer
+
+
+def collider_layer_bits(collider: ICollider2D) -> int:
+    """Get a collider's layer bit, compiling it when the collider doesn't cache one."""
+    bits = getattr(collider, 'layer_bits', None)
+    return collider.collision_layer.bit if bits is None else bits
+
+
+def collider_mask_bits(collider: ICollider2D) -> int:
+    """Get a collider's mask bits, compiling them when the collider doesn't cache them."""
+    bits = getattr(collider, 'mask_bits', None)
+    return CollisionLayer.to_bits(collider.collision_mask) if bits is None else bits
+
+
+def _overlaps(
+    bounds: Tuple[float, float, float, float],
+    min_x: float,
+    min_y: float,
+    max_x: float,
+    max_y: float
+) -> bool:
+    """Check whether bounds overlap an area (touching edges count)."""
+    return bounds[2] >= min_x and bounds[0] <= max_x and bounds[3] >= min_y and bounds[1] <= max_y
+
+
+def _ray_fraction(
+    x: float,
+    y: float,
+    dx: float,
+    dy: float,
+    min_x: float,
+    min_y: float,
+    max_x: float,
+    max_y: float
+) -> Optional[float]:
+    """Intersect a ray segment with a box using the slab method.
+
+    Args:
+        x: Ray start X coordinate
+        y: Ray start Y coordinate
+        dx: Ray X extent (end - start)
+        dy: Ray Y extent (end - start)
+        min_x: Box minimum X coordinate
+        min_y: Box minimum Y coordinate
+        max_x: Box maximum X coordinate
+        max_y: Box maximum Y coordinate
+
+    Returns:
+        Fraction along the segment (0 to 1) where the ray enters the box,
+        or None if the segment misses the box
+    """
+    t_min = 0.0
+    t_max = 1.0
+    for origin, delta, lo, hi in ((x, dx, min_x, max_x), (y, dy, min_y, max_y)):
+        if delta == 0.0:
+            if origin < lo or origin > hi:
+                return None
+            continue
+        t1 = (lo - origin) / delta
+        t2 = (hi - origin) / delta
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_min:
+            t_min = t1
+        if t2 < t_max:
+            t_max = t2
+        if t_min > t_max:
+            return None
+    return t_min
+
+
+def _ray_hits(
+    bodies: Iterable[IPhysicsBody2D],
+    x: float,
+    y: float,
+    dx: float,
+    dy: float
+) -> List[Tuple[IPhysicsBody2D, float]]:
+    """Intersect a ray with each body's current bounds, sorted by distance."""
+    hits = []
+    for body in bodies:
+        fraction = _ray_fraction(x, y, dx, dy, *body.get_bounds())
+        if fraction is not None:
+            hits.append((body, fraction))
+    hits.sort(key=lambda hit: hit[1])
+    return hits
+
+
+class CollisionLayerMatrix:
+    """Symmetric table of which collision layers may ever pair up.
+
+    Layers are compared by bit, so each layer's row is a bitmask of the
+    layers it may pair with. By default every pair is allowed except those
+    involving the UI and TRANSPARENT layers, which never collide.
+    """
+
+    DEFAULT_DISABLED_LAYERS = (CollisionLayer.UI, CollisionLayer.TRANSPARENT)
+
+    def __init__(self, disabled_layers: Iterable[CollisionLayer] = DEFAULT_DISABLED_LAYERS):
+        """Initialize the matrix.
+
+        Args:
+            disabled_layers: Layers that never pair with any other layer
+        """
+        all_bits = CollisionLayer.all_bits()
+        self._rows: Dict[int, int] = {layer.bit: all_bits for layer in CollisionLayer}
+        for layer in disabled_layers:
+            self.set_layer_enabled(layer, False)
+
+    @property
+    def rows(self) -> Dict[int, int]:
+        """Get the allowed-layer bitmask keyed by layer bit."""
+        return self._rows
+
+    def can_collide(self, layer_a: CollisionLayer, layer_b: CollisionLayer) -> bool:
+        """Check whether two layers may pair up."""
+        return bool(self._rows[layer_a.bit] & layer_b.bit)
+
+    def set_pair(self, layer_a: CollisionLayer, layer_b: CollisionLayer, enabled: bool) -> None:
+        """Allow or forbid pairs between two layers.
+
+        Args:
+            layer_a: First layer
+            layer_b: Second layer (may equal ``layer_a``)
+            enabled: Whether the layers may pair up
+        """
+        bit_a = layer_a.bit
+        bit_b = layer_b.bit
+        rows = self._rows
+        if enabled:
+            rows[bit_a] |= bit_b
+            rows[bit_b] |= bit_a
+        else:
+            rows[bit_a] &= ~bit_b
+            rows[bit_b] &= ~bit_a
+
+    def set_layer_enabled(self, layer: CollisionLayer, enabled: bool) -> None:
+        """Allow or forbid every pair involving a layer.
+
+        Args:
+            layer: The layer to change
+            enabled: Whether the layer may pair with any layer
+        """
+        for other in CollisionLayer:
+            self.set_pair(layer, other, enabled)
+
+
+class BroadPhase(ABC):
+    """Base class for broad-phase collision strategies.
+
+    Implementations are incremental: bodies are inserted once, updated when
+    they move and removed when unregistered. The collision service decides
+    which bodies need updating each step.
+
+    The base class hands out stable body indices and owns the flat bounds
+    buffer and layer cache; strategies call :meth:`_add_body`,
+    :meth:`_remove_body` and :meth:`_store_bounds` to keep them current, and
+    :meth:`_layer_rows` to filter pairs by layer.
+    """
+
+    def __init__(self):
+        """Initialize the index table, bounds buffer and layer cache."""
+        self._indices: Dict[IPhysicsBody2D, int] = {}
+        self._bodies: List[Optional[IPhysicsBody2D]] = []
+        self._free_indices: List[int] = []
+        self._bounds: List[float] = []
+        self._layers: List[int] = []
+        self._layer_matrix: Optional[CollisionLayerMatrix] = None
+
+    @property
+    def layer_matrix(self) -> Optional[CollisionLayerMatrix]:
+        """Get the layer matrix used to filter pairs, or None to report all pairs."""
+        return self._layer_matrix
+
+    @layer_matrix.setter
+    def layer_matrix(self, value: Optional[CollisionLayerMatrix]) -> None:
+        self._layer_matrix = value
+
+    @property
+    def bodies(self) -> List[Optional[IPhysicsBody2D]]:
+        """Get bodies by index. Unused indices hold None."""
+        return self._bodies
+
+    @property
+    def bounds(self) -> List[float]:
+        """Get the flat bounds buffer.
+
+        Bounds of the body at index ``i`` are stored as min_x, min_y, max_x,
+        max_y starting at ``4 * i``. They reflect the body's bounds as of its
+        last insert or update.
+        """
+        return self._bounds
+
+    def get_index(self, body: IPhysicsBody2D) -> int:
+        """Get the stable index of a body.
+
+        Args:
+            body: The body to look up
+
+        Returns:
+            Index of the body
+
+        Raises:
+            KeyError: If the body is not in the broad phase
+        """
+        return self._indices[body]
+
+    def get_cached_bounds(self, body: IPhysicsBody2D) -> Tuple[float, float, float, float]:
+        """Get the bounds cached for a body at its last insert or update.
+
+        Args:
+            body: The body to look up
+
+        Returns:
+            Tuple of (min_x, min_y, max_x, max_y)
+        """
+        offset = self._indices[body] * 4
+        buffer = self._bounds
+        return (buffer[offset], buffer[offset + 1], buffer[offset + 2], buffer[offset + 3])
+
+    def contains(self, body: IPhysicsBody2D) -> bool:
+        """Check whether a body is in the broad phase."""
+        return body in self._indices
+
+    def update_layer(self, body: IPhysicsBody2D) -> None:
+        """Re-read a body's collision layer after it changed.
+
+        Args:
+            body: The body whose layer changed
+        """
+        self._layers[self._indices[body]] = collider_layer_bits(body.collider)
+
+    def _layer_rows(self) -> Optional[Dict[int, int]]:
+        """Get the layer matrix rows, or None when pairs are not filtered."""
+        matrix = self._layer_matrix
+        return matrix.rows if matrix is not None else None
+
+    def _add_body(self, body: IPhysicsBody2D, bounds: Tuple[float, float, float, float]) -> int:
+        """Assign an index to a new body and cache its bounds.
+
+        Freed indices are reused lowest first to keep the buffer compact.
+
+        Returns:
+            The body's index
+        """
+        layer = collider_layer_bits(body.collider)
+        if self._free_indices:
+            index = heappop(self._free_indices)
+            self._bodies[index] = body
+            offset = index * 4
+            self._bounds[offset:offset + 4] = bounds
+            self._layers[index] = layer
+        else:
+            index = len(self._bodies)
+            self._bodies.append(body)
+            self._bounds.extend(bounds)
+            self._layers.append(layer)
+        self._indices[body] = index
+        return index
+
+    def _remove_body(self, body: IPhysicsBody2D) -> Optional[int]:
+        """Release a body's index.
+
+        Returns:
+            The index the body had, or None if it was not present
+        """
+        index = self._indices.pop(body, None)
+        if index is None:
+            return None
+        self._bodies[index] = None
+        heappush(self._free_indices, index)
+        return index
+
+    def _store_bounds(self, index: int, bounds: Tuple[float, float, float, float]) -> bool:
+        """Cache new bounds for an index.
+
+        Returns:
+            True if the bounds changed, False otherwise
+        """
+        buffer = self._bounds
+        offset = index * 4
+        min_x, min_y, max_x, max_y = bounds
+        if (buffer[offset] == min_x and buffer[offset + 1] == min_y
+                and buffer[offset + 2] == max_x and buffer[offset + 3] == max_y):
+            return False
+        buffer[offset] = min_x
+        buffer[offset + 1] = min_y
+        buffer[offset + 2] = max_x
+        buffer[offset + 3] = max_y
+        return True
+
+    def _clear_bodies(self) -> None:
+        """Forget all indices and cached bounds."""
+        self._indices.clear()
+        self._bodies.clear()
+        self._free_indices.clear()
+        self._bounds.clear()
+        self._layers.clear()
+
+    @abstractmethod
+    def insert(self, body: IPhysicsBody2D) -> None:
+        """Insert a body into the broad phase."""
+
+    @abstractmethod
+    def update(self, body: IPhysicsBody2D, bounds: Optional[Tuple[float, float, float, float]] = None) -> bool:
+        """Refresh a body's cached bounds after it moved.
+
+        Args:
+            body: The body to update
+            bounds: The body's current bounds, if the caller already has
+                them; read from the body otherwise
+
+        Returns:
+            True if the broad phase had to change, False otherwise
+        """
+
+    @abstractmethod
+    def remove(self, body: IPhysicsBody2D) -> None:
+        """Remove a body from the broad phase."""
+
+    @abstractmethod
+    def query_nearby(self, body: IPhysicsBody2D) -> Set[IPhysicsBody2D]:
+        """Find all bodies that may overlap this body, excluding itself."""
+
+    @abstractmethod
+    def query_pairs(self) -> List[Tuple[int, int]]:
+        """Find all candidate pairs of bodies that may overlap.
+
+        Returns:
+            List of index pairs ``(i, j)`` with ``i < j``, each pair once
+        """
+
+    @abstractmethod
+    def query_area(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[IPhysicsBody2D]:
+        """Find all bodies whose current bounds overlap an area.
+
+        Args:
+            min_x: Minimum X coordinate
+            min_y: Minimum Y coordinate
+            max_x: Maximum X coordinate
+            max_y: Maximum Y coordinate
+
+        Returns:
+            List of bodies overlapping the area
+        """
+
+    def query_point(self, x: float, y: float) -> List[IPhysicsBody2D]:
+        """Find all bodies whose current bounds contain a point.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            List of bodies containing the point
+        """
+        return self.query_area(x, y, x, y)
+
+    def query_ray(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float
+    ) -> List[Tuple[IPhysicsBody2D, float]]:
+        """Find all bodies whose current bounds a ray segment crosses.
+
+        Args:
+            x1: Ray start X coordinate
+            y1: Ray start Y coordinate
+            x2: Ray end X coordinate
+            y2: Ray end Y coordinate
+
+        Returns:
+            List of (body, fraction) tuples sorted by the fraction along the
+            segment where the ray enters each body
+        """
+        dx = x2 - x1
+        dy = y2 - y1
+        candidates = self.query_area(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        return _ray_hits(candidates, x1, y1, dx, dy)
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all bodies."""
+
+
+class SpatialGrid(BroadPhase):
+    """Spatial partitioning grid for efficient broad-phase collision detection.
+
+    Divides the world into a grid of cells. Objects are assigned to cells based
+    on their bounding box, and only objects in the same or adjacent cells are
+    tested for collision.
+
+    The grid is incremental: each body remembers the range of cells it
+    occupies, so updating a body only touches cells when its bounds cross a
+    cell boundary, and removal only visits the cells the body occupies.
+    Cells hold body indices.
+    """
+
+    def __init__(self, cell_size: float = 100.0):
+        """Initialize the spatial grid.
+
+        Args:
+            cell_size: Size of each grid cell in world units
+        """
+        super().__init__()
+        self.cell_size = cell_size
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+        self._ranges: List[Optional[Tuple[int, int, int, int]]] = []
+
+    def _get_cell_coords(self, x: float, y: float) -> Tuple[int, int]:
+        """Convert world coordinates to grid cell coordinates."""
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def _get_cell_range(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Tuple[int, int, int, int]:
+        """Get the inclusive cell range (min_cx, min_cy, max_cx, max_cy) a bounding box overlaps."""
+        cell_size = self.cell_size
+        return (
+            int(min_x // cell_size),
+            int(min_y // cell_size),
+            int(max_x // cell_size),
+            int(max_y // cell_size),
+        )
+
+    def _get_cells_for_bounds(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[Tuple[int, int]]:
+        """Get all grid cells that a bounding box overlaps."""
+        return self._get_cells_for_range(self._get_cell_range(min_x, min_y, max_x, max_y))
+
+    @staticmethod
+    def _get_cells_for_range(cell_range: Tuple[int, int, int, int]) -> List[Tuple[int, int]]:
+        """Get all grid cells inside an inclusive cell range."""
+        min_cell_x, min_cell_y, max_cell_x, max_cell_y = cell_range
+        cells = []
+        for cx in range(min_cell_x, max_cell_x + 1):
+            for cy in range(min_cell_y, max_cell_y + 1):
+                cells.append((cx, cy))
+        return cells
+
+    def insert(self, body: IPhysicsBody2D) -> None:
+        """Insert a body into the spatial grid.
+
+        Inserting a body that is already in the grid updates its cells.
+        """
+        if body in self._indices:
+            self.update(body)
+            return
+
+        bounds = body.get_bounds()
+        index = self._add_body(body, bounds)
+        cell_range = self._get_cell_range(*bounds)
+        ranges = self._ranges
+        if index == len(ranges):
+            ranges.append(cell_range)
+        else:
+            ranges[index] = cell_range
+
+        grid = self._grid
+        for cell in self._get_cells_for_range(cell_range):
+            cell_indices = grid.get(cell)
+            if cell_indices is None:
+                grid[cell] = [index]
+            else:
+                cell_indices.append(index)
+
+    def update(self, body: IPhysicsBody2D, bounds: Optional[Tuple[float, float, float, float]] = None) -> bool:
+        """Move a body to the cells matching its current bounds.
+
+        Only cells the body entered or left are touched.
+
+        Args:
+            body: The body to update
+            bounds: The body's current bounds, if the caller already has
+                them; read from the body otherwise
+
+        Returns:
+            True if the body changed cells, False otherwise
+        """
+        index = self._indices.get(body)
+        if index is None:
+            self.insert(body)
+            return True
+
+        if bounds is None:
+            bounds = body.get_bounds()
+        if not self._store_bounds(index, bounds):
+            return False
+
+        old_range = self._ranges[index]
+        new_range = self._get_cell_range(*bounds)
+        if new_range == old_range:
+            return False
+
+        old_cells = set(self._get_cells_for_range(old_range))
+        new_cells = set(self._get_cells_for_range(new_range))
+        grid = self._grid
+        for cell in old_cells - new_cells:
+            grid[cell].remove(index)
+        for cell in new_cells - old_cells:
+            cell_indices = grid.get(cell)
+            if cell_indices is None:
+                grid[cell] = [index]
+            else:
+                cell_indices.append(index)
+
+        self._ranges[index] = new_range
+        return True
+
+    def remove(self, body: IPhysicsBody2D) -> None:
+        """Remove a body from the spatial grid."""
+        index = self._remove_body(body)
+        if index is None:
+            return
+        cell_range = self._ranges[index]
+        self._ranges[index] = None
+        grid = self._grid
+        for cell in self._get_cells_for_range(cell_range):
+            grid[cell].remove(index)
+
+    def query_nearby(self, body: IPhysicsBody2D) -> Set[IPhysicsBody2D]:
+        """Find all bodies in cells near this body."""
+        min_x, min_y, max_x, max_y = body.get_bounds()
+        cells = self._get_cells_for_bounds(min_x, min_y, max_x, max_y)
+
+        bodies = self._bodies
+        nearby = set()
+        for cell in cells:
+            cell_indices = self._grid.get(cell)
+            if cell_indices:
+                nearby.update(bodies[index] for index in cell_indices)
+
+        # Remove self
+        nearby.discard(body)
+        return nearby
+
+    def query_pairs(self) -> List[Tuple[int, int]]:
+        """Find all pairs of bodies whose cached bounds overlap.
+
+        Bodies spanning several cells would meet in each shared cell. Instead
+        of de-duplicating with a set, a pair is only reported from the cell
+        holding the top-left corner of the two bodies' shared cell range.
+        """
+        pairs = []
+        append = pairs.append
+        ranges = self._ranges
+        bounds = self._bounds
+        layers = self._layers
+        rows = self._layer_rows()
+        for (cx, cy), cell_indices in self._grid.items():
+            count = len(cell_indices)
+            if count < 2:
+                continue
+            for p in range(count - 1):
+                i = cell_indices[p]
+                range_i = ranges[i]
+                i_min_cx = range_i[0]
+                i_min_cy = range_i[1]
+                oi = i * 4
+                i_min_x = bounds[oi]
+                i_min_y = bounds[oi + 1]
+                i_max_x = bounds[oi + 2]
+                i_max_y = bounds[oi + 3]
+                i_row = rows[layers[i]] if rows is not None else -1
+                for q in range(p + 1, count):
+                    j = cell_indices[q]
+                    range_j = ranges[j]
+
+                    # Only the first shared cell reports the pair
+                    if (i_min_cx if i_min_cx > range_j[0] else range_j[0]) != cx:
+                        continue
+                    if (i_min_cy if i_min_cy > range_j[1] else range_j[1]) != cy:
+                        continue
+
+                    if rows is not None and not i_row & layers[j]:
+                        continue
+
+                    oj = j * 4
+                    if (bounds[oj + 2] < i_min_x or bounds[oj] > i_max_x
+                            or bounds[oj + 3] < i_min_y or bounds[oj + 1] > i_max_y):
+                        continue
+                    append((i, j) if i < j else (j, i))
+        return pairs
+
+    def query_area(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[IPhysicsBody2D]:
+        """Find all bodies whose current bounds overlap an area."""
+        min_cx, min_cy, max_cx, max_cy = self._get_cell_range(min_x, min_y, max_x, max_y)
+        cell_count = (max_cx - min_cx + 1) * (max_cy - min_cy + 1)
+        if cell_count > len(self._indices):
+            # Large areas cover more cells than there are bodies
+            candidates: Iterable[IPhysicsBody2D] = self._indices
+        else:
+            candidate_indices = set()
+            grid = self._grid
+            for cell in self._get_cells_for_range((min_cx, min_cy, max_cx, max_cy)):
+                cell_indices = grid.get(cell)
+                if cell_indices:
+                    candidate_indices.update(cell_indices)
+            bodies = self._bodies
+            candidates = [bodies[index] for index in sorted(candidate_indices)]
+
+        return [body for body in candidates if _overlaps(body.get_bounds(), min_x, min_y, max_x, max_y)]
+
+    def clear(self) -> None:
+        """Clear all bodies from the grid."""
+        self._grid.clear()
+        self._ranges.clear()
+        self._clear_bodies()
+
+
+class _Endpoint:
+    """One end of a body's interval on the sweep axis."""
+
+    __slots__ = ('value', 'index', 'is_max')
+
+    def __init__(self, value: float, index: int, is_max: bool):
+        self.value = value
+        self.index = index
+        self.is_max = is_max
+
+
+def _endpoint_key(endpoint: _Endpoint) -> Tuple[float, bool]:
+    """Sort key placing min endpoints before max endpoints at equal values."""
+    return (endpoint.value, endpoint.is_max)
+
+
+class SweepAndPrune(BroadPhase):
+    """Sort-and-sweep broad phase.
+
+    Keeps the interval endpoints of every body sorted along one axis. Bodies
+    overlap on that axis only while both intervals are open during a sweep,
+    so only those pairs get their other axis checked.
+
+    The endpoint list is kept between steps. Bodies move little from one step
+    to the next, so re-sorting with insertion sort is close to linear. Unlike
+    :class:`SpatialGrid` there is no cell size to tune, which suits scenes
+    that mix very small and very large bodies.
+    """
+
+    def __init__(self, axis: int = 0):
+        """Initialize the sweep and prune broad phase.
+
+        Args:
+            axis: Axis to sort along (0 for x, 1 for y)
+        """
+        if axis not in (0, 1):
+            raise ValueError("Axis must be 0 (x) or 1 (y)")
+        super().__init__()
+        self.axis = axis
+        self._endpoints: List[_Endpoint] = []
+        self._body_endpoints: Dict[int, Tuple[_Endpoint, _Endpoint]] = {}
+        self._dirty = False
+        # Upper bound on any body's extent along the axis, so area queries
+        # know how far before the area a body's min endpoint can be
+        self._max_extent = 0.0
+
+    def insert(self, body: IPhysicsBody2D) -> None:
+        """Insert a body, placing its endpoints in sorted position.
+
+        Inserting a body that is already present updates it.
+        """
+        if body in self._indices:
+            self.update(body)
+            return
+
+        if self._dirty:
+            self._sort()
+
+        bounds = body.get_bounds()
+        index = self._add_body(body, bounds)
+        axis = self.axis
+        lo = _Endpoint(bounds[axis], index, False)
+        hi = _Endpoint(bounds[axis + 2], index, True)
+        self._max_extent = max(self._max_extent, hi.value - lo.value)
+        insort(self._endpoints, lo, key=_endpoint_key)
+        insort(self._endpoints, hi, key=_endpoint_key)
+        self._body_endpoints[index] = (lo, hi)
+
+    def update(self, body: IPhysicsBody2D, bounds: Optional[Tuple[float, float, float, float]] = None) -> bool:
+        """Refresh a body's endpoints from its current bounds.
+
+        The endpoint list is re-sorted lazily on the next query.
+
+        Args:
+            body: The body to update
+            bounds: The body's current bounds, if the caller already has
+                them; read from the body otherwise
+
+        Returns:
+            True if the body's bounds changed, False otherwise
+        """
+        index = self._indices.get(body)
+        if index is None:
+            self.insert(body)
+            return True
+
+        if bounds is None:
+            bounds = body.get_bounds()
+        if not self._store_bounds(index, bounds):
+            return False
+
+        lo, hi = self._body_endpoints[index]
+        axis = self.axis
+        lo.value = bounds[axis]
+        hi.value = bounds[axis + 2]
+        if hi.value - lo.value > self._max_extent:
+            self._max_extent = hi.value - lo.value
+        self._dirty = True
+        return True
+
+    def remove(self, body: IPhysicsBody2D) -> None:
+        """Remove a body and its endpoints."""
+        index = self._remove_body(body)
+        if index is None:
+            return
+        lo, hi = self._body_endpoints.pop(index)
+        self._endpoints.remove(lo)
+        self._endpoints.remove(hi)
+
+    def _sort(self) -> None:
+        """Restore endpoint order with an insertion sort.
+
+        Nearly sorted input, which is the common case between steps, costs
+        close to one comparison per endpoint.
+        """
+        endpoints = self._endpoints
+        for i in range(1, len(endpoints)):
+            endpoint = endpoints[i]
+            value = endpoint.value
+            is_max = endpoint.is_max
+            j = i - 1
+            prev = endpoints[j]
+            if prev.value < value or (prev.value == value and (is_max or not prev.is_max)):
+                continue
+            while j >= 0:
+                prev = endpoints[j]
+                if prev.value < value or (prev.value == value and (is_max or not prev.is_max)):
+                    break
+                endpoints[j + 1] = prev
+                j -= 1
+            endpoints[j + 1] = endpoint
+        self._dirty = False
+
+    def query_nearby(self, body: IPhysicsBody2D) -> Set[IPhysicsBody2D]:
+        """Find all bodies whose cached bounds overlap this body's bounds."""
+        min_x, min_y, max_x, max_y = body.get_bounds()
+        bounds = self._bounds
+        bodies = self._bodies
+        nearby = set()
+        for index in self._body_endpoints:
+            offset = index * 4
+            if (bounds[offset + 2] >= min_x and bounds[offset] <= max_x
+                    and bounds[offset + 3] >= min_y and bounds[offset + 1] <= max_y):
+                nearby.add(bodies[index])
+
+        # Remove self
+        nearby.discard(body)
+        return nearby
+
+    def query_pairs(self) -> List[Tuple[int, int]]:
+        """Sweep the sorted endpoints and report pairs overlapping on both axes."""
+        if self._dirty:
+            self._sort()
+
+        other_axis = 1 - self.axis
+        bounds = self._bounds
+        layers = self._layers
+        rows = self._layer_rows()
+        active: Dict[int, Tuple[float, float]] = {}
+        pairs = []
+        append = pairs.append
+        for endpoint in self._endpoints:
+            index = endpoint.index
+            if endpoint.is_max:
+                del active[index]
+                continue
+
+            offset = index * 4 + other_axis
+            lo = bounds[offset]
+            hi = bounds[offset + 2]
+            row = rows[layers[index]] if rows is not None else -1
+            for other, (other_lo, other_hi) in active.items():
+                if other_hi >= lo and other_lo <= hi:
+                    if rows is not None and not row & layers[other]:
+                        continue
+                    append((other, index) if other < index else (index, other))
+            active[index] = (lo, hi)
+        return pairs
+
+    def query_area(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[IPhysicsBody2D]:
+        """Find all bodies whose cached bounds overlap an area.
+
+        Binary-searches the sorted endpoints for the min endpoints that can
+        belong to an overlapping body, then checks them against the bounds
+        buffer.
+        """
+        if self._dirty:
+            self._sort()
+
+        if self.axis == 0:
+            area_lo, area_hi = min_x, max_x
+        else:
+            area_lo, area_hi = min_y, max_y
+        endpoints = self._endpoints
+        start = bisect_left(endpoints, (area_lo - self._max_extent, False), key=_endpoint_key)
+        end = bisect_right(endpoints, (area_hi, False), key=_endpoint_key)
+
+        bounds = self._bounds
+        bodies = self._bodies
+        result = []
+        for position in range(start, end):
+            endpoint = endpoints[position]
+            if endpoint.is_max:
+                continue
+            offset = endpoint.index * 4
+            if (bounds[offset + 2] >= min_x and bounds[offset] <= max_x
+                    and bounds[offset + 3] >= min_y and bounds[offset + 1] <= max_y):
+                result.append(bodies[endpoint.index])
+        return result
+
+    def clear(self) -> None:
+        """Remove all bodies."""
+        self._endpoints.clear()
+        self._body_endpoints.clear()
+        self._clear_bodies()
+        self._dirty = False
+        self._max_extent = 0.0
+
+
+class _TreeNode:
+    """Node of a dynamic AABB tree. Leaves hold a body, branches two children."""
+
+    __slots__ = ('min_x', 'min_y', 'max_x', 'max_y', 'parent', 'child1', 'child2', 'height', 'body', 'index')
+
+    def __init__(self):
+        self.min_x = 0.0
+        self.min_y = 0.0
+        self.max_x = 0.0
+        self.max_y = 0.0
+        self.parent: Optional[_TreeNode] = None
+        self.child1: Optional[_TreeNode] = None
+        self.child2: Optional[_TreeNode] = None
+        self.height = 0
+        self.body: Optional[IPhysicsBody2D] = None
+        self.index = -1
+
+
+class DynamicAABBTree(BroadPhase):
+    """Dynamic bounding volume hierarchy broad phase.
+
+    Each body is a leaf holding a fattened copy of its bounds. A moving body
+    is only re-inserted when its bounds leave the fat box, so small motions
+    cost a containment check. Inserts pick the sibling that grows the tree's
+    total perimeter least, and rotations keep the tree height balanced.
+
+    Candidate pairs are only searched for from bodies that can move (non-static,
+    awake and enabled), so the cost of a step scales with the number of
+    moving bodies rather than the total. Pairs of two static bodies are never
+    reported. This suits very large scenes where most bodies are static.
+
+    The searching bodies are kept in a set that :meth:`insert`,
+    :meth:`update` and :meth:`remove` maintain, so a step never walks the
+    leaves of bodies that can't move. Bodies that fall asleep, wake or
+    change type must be updated for the set to follow.
+    """
+
+    def __init__(self, margin: float = 5.0):
+        """Initialize the tree.
+
+        Args:
+            margin: Distance each leaf's box is grown by on every side
+        """
+        if margin < 0:
+            raise ValueError("Margin must be non-negative")
+        super().__init__()
+        self.margin = margin
+        self._root: Optional[_TreeNode] = None
+        self._leaves: Dict[IPhysicsBody2D, _TreeNode] = {}
+        # Leaves of the bodies pairs are searched from, by index
+        self._searching: Dict[int, _TreeNode] = {}
+
+    @property
+    def height(self) -> int:
+        """Get the height of the tree (0 for a single leaf or an empty tree)."""
+        return self._root.height if self._root is not None else 0
+
+    def get_fat_bounds(self, body: IPhysicsBody2D) -> Tuple[float, float, float, float]:
+        """Get the fattened bounds stored for a body.
+
+        Args:
+            body: The body to look up
+
+        Returns:
+            Tuple of (min_x, min_y, max_x, max_y)
+        """
+        leaf = self._leaves[body]
+        return (leaf.min_x, leaf.min_y, leaf.max_x, leaf.max_y)
+
+    def _set_fat_bounds(self, leaf: _TreeNode, bounds: Tuple[float, float, float, float]) -> None:
+        """Store bounds grown by the margin on a leaf."""
+        margin = self.margin
+        leaf.min_x = bounds[0] - margin
+        leaf.min_y = bounds[1] - margin
+        leaf.max_x = bounds[2] + margin
+        leaf.max_y = bounds[3] + margin
+
+    def insert(self, body: IPhysicsBody2D) -> None:
+        """Insert a body as a new leaf.
+
+        Inserting a body that is already present updates it.
+        """
+        if body in self._leaves:
+            self.update(body)
+            return
+
+        bounds = body.get_bounds()
+        leaf = _TreeNode()
+        leaf.body = body
+        leaf.index = self._add_body(body, bounds)
+        self._set_fat_bounds(leaf, bounds)
+        self._leaves[body] = leaf
+        self._insert_leaf(leaf)
+        self._update_searching(leaf)
+
+    def update(self, body: IPhysicsBody2D, bounds: Optional[Tuple[float, float, float, float]] = None) -> bool:
+        """Re-insert a body if its bounds left its fat box.
+
+        Args:
+            body: The body to update
+            bounds: The body's current bounds, if the caller already has
+                them; read from the body otherwise
+
+        Returns:
+            True if the body was re-inserted, False otherwise
+        """
+        leaf = self._leaves.get(body)
+        if leaf is None:
+            self.insert(body)
+            return True
+
+        self._update_searching(leaf)
+        if bounds is None:
+            bounds = body.get_bounds()
+        min_x, min_y, max_x, max_y = bounds
+        if not self._store_bounds(leaf.index, bounds):
+            return False
+        if leaf.min_x <= min_x and leaf.min_y <= min_y and leaf.max_x >= max_x and leaf.max_y >= max_y:
+            return False
+
+        self._remove_leaf(leaf)
+        self._set_fat_bounds(leaf, bounds)
+        self._insert_leaf(leaf)
+        return True
+
+    def remove(self, body: IPhysicsBody2D) -> None:
+        """Remove a body's leaf from the tree."""
+        leaf = self._leaves.pop(body, None)
+        if leaf is None:
+            return
+        self._searching.pop(leaf.index, None)
+        self._remove_body(body)
+        self._remove_leaf(leaf)
+
+    @staticmethod
+    def _refit(node: _TreeNode) -> None:
+        """Recompute a branch node's box and height from its children."""
+        child1 = node.child1
+        child2 = node.child2
+        node.min_x = min(child1.min_x, child2.min_x)
+        node.min_y = min(child1.min_y, child2.min_y)
+        node.max_x = max(child1.max_x, child2.max_x)
+        node.max_y = max(child1.max_y, child2.max_y)
+        node.height = 1 + max(child1.height, child2.height)
+
+    def _insert_leaf(self, leaf: _TreeNode) -> None:
+        """Attach a leaf next to the sibling that grows the tree least."""
+        if self._root is None:
+            self._root = leaf
+            leaf.parent = None
+            return
+
+        # Find the best sibling by descending towards the cheapest child
+        leaf_min_x, leaf_min_y, leaf_max_x, leaf_max_y = leaf.min_x, leaf.min_y, leaf.max_x, leaf.max_y
+        node = self._root
+        while node.child1 is not None:
+            perimeter = 2.0 * ((node.max_x - node.min_x) + (node.max_y - node.min_y))
+            combined = 2.0 * (
+                (max(node.max_x, leaf_max_x) - min(node.min_x, leaf_min_x))
+                + (max(node.max_y, leaf_max_y) - min(node.min_y, leaf_min_y))
+            )
+
+            # Cost of creating a new parent for this node and the leaf
+            cost = 2.0 * combined
+
+            # Minimum cost of pushing the leaf further down the tree
+            inheritance_cost = 2.0 * (combined - perimeter)
+
+            costs = []
+            for child in (node.child1, node.child2):
+                child_combined = 2.0 * (
+                    (max(child.max_x, leaf_max_x) - min(child.min_x, leaf_min_x))
+                    + (max(child.max_y, leaf_max_y) - min(child.min_y, leaf_min_y))
+                )
+                if child.child1 is not None:
+                    child_combined -= 2.0 * (
+                        (child.max_x - child.min_x) + (child.max_y - child.min_y)
+                    )
+                costs.append(child_combined + inheritance_cost)
+
+            if cost < costs[0] and cost < costs[1]:
+                break
+            node = node.child1 if costs[0] < costs[1] else node.child2
+
+        sibling = node
+
+        # Create a new parent for the sibling and the leaf
+        old_parent = sibling.parent
+        new_parent = _TreeNode()
+        new_parent.parent = old_parent
+        new_parent.child1 = sibling
+        new_parent.child2 = leaf
+        sibling.parent = new_parent
+        leaf.parent = new_parent
+        self._refit(new_parent)
+
+        if old_parent is None:
+            self._root = new_parent
+        elif old_parent.child1 is sibling:
+            old_parent.child1 = new_parent
+        else:
+            old_parent.child2 = new_parent
+
+        self._fix_upwards(new_parent.parent)
+
+    def _remove_leaf(self, leaf: _TreeNode) -> None:
+        """Detach a leaf, replacing its parent with its sibling."""
+        if leaf is self._root:
+            self._root = None
+            return
+
+        parent = leaf.parent
+        grand_parent = parent.parent
+        sibling = parent.child2 if parent.child1 is leaf else parent.child1
+        leaf.parent = None
+
+        if grand_parent is None:
+            self._root = sibling
+            sibling.parent = None
+            return
+
+        # Replace the parent with the sibling
+        if grand_parent.child1 is parent:
+            grand_parent.child1 = sibling
+        else:
+            grand_parent.child2 = sibling
+        sibling.parent = grand_parent
+        self._fix_upwards(grand_parent)
+
+    def _fix_upwards(self, node: Optional[_TreeNode]) -> None:
+        """Rebalance and refit every node from this one up to the root."""
+        while node is not None:
+            node = self._balance(node)
+            self._refit(node)
+            node = node.parent
+
+    def _balance(self, a: _TreeNode) -> _TreeNode:
+        """Rotate a node's taller grandchild up if its children are unbalanced.
+
+        Returns:
+            The node now occupying a's position in the tree
+        """
+        if a.child1 is None or a.height < 2:
+            return a
+
+        b = a.child1
+        c = a.child2
+        balance = c.height - b.height
+        if -1 <= balance <= 1:
+            return a
+
+        # Promote the taller child
+        if balance > 1:
+            up, keep = c, b
+        else:
+            up, keep = b, c
+
+        f = up.child1
+        g = up.child2
+
+        # Swap a and up
+        up.child1 = a
+        up.parent = a.parent
+        a.parent = up
+        if up.parent is None:
+            self._root = up
+        elif up.parent.child1 is a:
+            up.parent.child1 = up
+        else:
+            up.parent.child2 = up
+
+        # The taller grandchild stays with up, the other moves under a
+        if f.height > g.height:
+            up.child2 = f
+            moved = g
+        else:
+            up.child2 = g
+            moved = f
+        a.child1 = keep
+        a.child2 = moved
+        moved.parent = a
+        self._refit(a)
+        self._refit(up)
+        return up
+
+    def _query_nodes(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[_TreeNode]:
+        """Find all leaves whose fat boxes overlap an area."""
+        leaves = []
+        root = self._root
+        if root is None:
+            return leaves
+        stack = [root]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            node = pop()
+            if node.max_x < min_x or node.min_x > max_x or node.max_y < min_y or node.min_y > max_y:
+                continue
+            if node.child1 is None:
+                leaves.append(node)
+            else:
+                push(node.child1)
+                push(node.child2)
+        return leaves
+
+    def query_nearby(self, body: IPhysicsBody2D) -> Set[IPhysicsBody2D]:
+        """Find all bodies whose fat boxes overlap this body's bounds."""
+        nearby = {leaf.body for leaf in self._query_nodes(*body.get_bounds())}
+
+        # Remove self
+        nearby.discard(body)
+        return nearby
+
+    def _update_searching(self, leaf: _TreeNode) -> None:
+        """Add or drop a leaf from the searching set to match its body's state."""
+        body = leaf.body
+        if body.enabled and not body.sleeping and body.body_type != BodyType.STATIC:
+            self._searching[leaf.index] = leaf
+        else:
+            self._searching.pop(leaf.index, None)
+
+    def query_pairs(self) -> List[Tuple[int, int]]:
+        """Find candidate pairs by querying the tree with each moving body's fat box.
+
+        When both bodies of a pair search, the pair is only reported from the
+        body with the lower index.
+        """
+        searching = self._searching
+        layers = self._layers
+        rows = self._layer_rows()
+
+        pairs = []
+        append = pairs.append
+        for index, leaf in searching.items():
+            row = rows[layers[index]] if rows is not None else -1
+            for other in self._query_nodes(leaf.min_x, leaf.min_y, leaf.max_x, leaf.max_y):
+                other_index = other.index
+                if other_index == index:
+                    continue
+                if rows is not None and not row & layers[other_index]:
+                    continue
+                if other_index < index:
+                    if other_index in searching:
+                        continue
+                    append((other_index, index))
+                else:
+                    append((index, other_index))
+        return pairs
+
+    def query_area(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[IPhysicsBody2D]:
+        """Find all bodies whose current bounds overlap an area."""
+        result = []
+        for leaf in self._query_nodes(min_x, min_y, max_x, max_y):
+            if _overlaps(leaf.body.get_bounds(), min_x, min_y, max_x, max_y):
+                result.append(leaf.body)
+        return result
+
+    def query_ray(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float
+    ) -> List[Tuple[IPhysicsBody2D, float]]:
+        """Find all bodies a ray segment crosses, descending only into boxes the ray hits."""
+        dx = x2 - x1
+        dy = y2 - y1
+        candidates = []
+        root = self._root
+        stack = [root] if root is not None else []
+        while stack:
+            node = stack.pop()
+            if _ray_fraction(x1, y1, dx, dy, node.min_x, node.min_y, node.max_x, node.max_y) is None:
+                continue
+            if node.child1 is None:
+                candidates.append(node.body)
+            else:
+                stack.append(node.child1)
+                stack.append(node.child2)
+        return _ray_hits(candidates, x1, y1, dx, dy)
+
+    def clear(self) -> None:
+        """Remove all bodies."""
+        self._root = None
+        self._leaves.clear()
+        self._searching.clear()
+        self._clear_bodies()
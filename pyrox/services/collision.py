@@ -1,17 +1,27 @@
 """Collision detection and response service.
 
-Implements spatial partitioning for efficient broad-phase collision detection
-and provides collision response calculations.
+Uses a pluggable broad phase (spatial grid by default) to find candidate
+pairs and provides narrow-phase checks and collision response calculations.
+Fast bodies can be swept between steps for continuous collision detection.
 """
-from typing import List, Set, Tuple, Dict, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 from dataclasses import dataclass
 from pyrox.interfaces.protocols.physics import (
     IPhysicsBody2D,
-    BodyType
+    BodyType,
+    ColliderType,
 )
+from pyrox.services.broadphase import (
+    BroadPhase,
+    CollisionLayerMatrix,
+    SpatialGrid,
+    collider_layer_bits,
+    collider_mask_bits,
+)
+from pyrox.services.narrowphase import NARROW_PHASE_TESTS, sweep_bounds
 
 
-@dataclass
+@dataclass(slots=True)
 class CollisionInfo:
     """Information about a collision between two bodies."""
     body_a: IPhysicsBody2D
@@ -21,91 +31,77 @@ class CollisionInfo:
     contact_point: Tuple[float, float]
 
 
-class SpatialGrid:
-    """Spatial partitioning grid for efficient broad-phase collision detection.
-
-    Divides the world into a grid of cells. Objects are assigned to cells based
-    on their bounding box, and only objects in the same or adjacent cells are
-    tested for collision.
-    """
-
-    def __init__(self, cell_size: float = 100.0):
-        """Initialize the spatial grid.
-
-        Args:
-            cell_size: Size of each grid cell in world units
-        """
-        self.cell_size = cell_size
-        self._grid: Dict[Tuple[int, int], Set[IPhysicsBody2D]] = {}
-
-    def _get_cell_coords(self, x: float, y: float) -> Tuple[int, int]:
-        """Convert world coordinates to grid cell coordinates."""
-        return (int(x // self.cell_size), int(y // self.cell_size))
-
-    def _get_cells_for_bounds(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[Tuple[int, int]]:
-        """Get all grid cells that a bounding box overlaps."""
-        min_cell_x, min_cell_y = self._get_cell_coords(min_x, min_y)
-        max_cell_x, max_cell_y = self._get_cell_coords(max_x, max_y)
-
-        cells = []
-        for cx in range(min_cell_x, max_cell_x + 1):
-            for cy in range(min_cell_y, max_cell_y + 1):
-                cells.append((cx, cy))
-        return cells
-
-    def insert(self, body: IPhysicsBody2D) -> None:
-        """Insert a body into the spatial grid."""
-        min_x, min_y, max_x, max_y = body.get_bounds()
-        cells = self._get_cells_for_bounds(min_x, min_y, max_x, max_y)
-
-        for cell in cells:
-            if cell not in self._grid:
-                self._grid[cell] = set()
-            self._grid[cell].add(body)
-
-    def remove(self, body: IPhysicsBody2D) -> None:
-        """Remove a body from the spatial grid."""
-        for cell_bodies in self._grid.values():
-            cell_bodies.discard(body)
-
-    def query_nearby(self, body: IPhysicsBody2D) -> Set[IPhysicsBody2D]:
-        """Find all bodies in cells near this body."""
-        min_x, min_y, max_x, max_y = body.get_bounds()
-        cells = self._get_cells_for_bounds(min_x, min_y, max_x, max_y)
-
-        nearby = set()
-        for cell in cells:
-            if cell in self._grid:
-                nearby.update(self._grid[cell])
-
-        # Remove self
-        nearby.discard(body)
-        return nearby
-
-    def clear(self) -> None:
-        """Clear all bodies from the grid."""
-        self._grid.clear()
-
-
 class CollisionService:
     """Handles collision detection and response.
 
-    Uses spatial partitioning for efficient broad-phase detection,
-    then performs narrow-phase collision checks and calculates responses.
+    Uses a broad phase to find candidate pairs efficiently, then performs
+    narrow-phase collision checks and calculates responses. The broad phase
+    drops pairs whose layers the layer matrix never allows to meet, and the
+    remaining pairs are filtered by each collider's layer and mask bitmasks.
     """
 
     def __init__(
         self,
-        cell_size: float = 100.0
+        cell_size: float = 100.0,
+        broad_phase: Optional[BroadPhase] = None,
+        layer_matrix: Optional[CollisionLayerMatrix] = None
     ):
         """Initialize the collision service.
 
         Args:
-            cell_size: Size of spatial grid cells for broad-phase detection
+            cell_size: Size of spatial grid cells, used when no broad phase is given
+            broad_phase: Broad-phase strategy to use (defaults to a SpatialGrid)
+            layer_matrix: Layer pairs allowed to collide (defaults to every
+                pair except the UI and TRANSPARENT layers)
         """
-        self._spatial_grid = SpatialGrid(cell_size)
+        self._broad_phase = broad_phase or SpatialGrid(cell_size)
+        self._layer_matrix = layer_matrix or CollisionLayerMatrix()
+        self._broad_phase.layer_matrix = self._layer_matrix
         self._registered_bodies: List[IPhysicsBody2D] = []
-        self._colliding_pairs: Set[Tuple[IPhysicsBody2D, IPhysicsBody2D]] = set()
+        self._moved_bodies: Dict[IPhysicsBody2D, None] = {}
+        self._colliding_pairs: Dict[Tuple[IPhysicsBody2D, IPhysicsBody2D], None] = {}
+        self._sleeping_contacts: List[IPhysicsBody2D] = []
+        self._speculative_contacts: List[CollisionInfo] = []
+        self._candidate_pair_count = 0
+
+    @property
+    def broad_phase(self) -> BroadPhase:
+        """Get the broad-phase strategy."""
+        return self._broad_phase
+
+    @property
+    def layer_matrix(self) -> CollisionLayerMatrix:
+        """Get the matrix of layer pairs allowed to collide."""
+        return self._layer_matrix
+
+    @property
+    def sleeping_contacts(self) -> List[IPhysicsBody2D]:
+        """Get sleeping bodies touched by an awake body during the last detection."""
+        return self._sleeping_contacts
+
+    @property
+    def candidate_pair_count(self) -> int:
+        """Get how many candidate pairs the broad phase produced in the last detection."""
+        return self._candidate_pair_count
+
+    @property
+    def colliding_pairs(self) -> List[Tuple[IPhysicsBody2D, IPhysicsBody2D]]:
+        """Get the pairs in contact after the last detection, in the order they were found."""
+        return list(self._colliding_pairs)
+
+    @colliding_pairs.setter
+    def colliding_pairs(self, pairs: List[Tuple[IPhysicsBody2D, IPhysicsBody2D]]) -> None:
+        """Replace the pairs in contact, e.g. when restoring a snapshot.
+
+        No callbacks are fired; the next detection reports enter, stay and
+        exit against these pairs.
+        """
+        self._colliding_pairs = {pair: None for pair in pairs}
+
+    @property
+    def speculative_contacts(self) -> List[CollisionInfo]:
+        """Get contacts found by sweeps, waiting for the next detection."""
+        return self._speculative_contacts
 
     def register_body(
         self,
@@ -116,9 +112,12 @@ class CollisionService:
         Args:
             body: The physics body to register
         """
-        if body not in self._registered_bodies:
+        if not self._broad_phase.contains(body):
             self._registered_bodies.append(body)
-            self._spatial_grid.insert(body)
+            self._broad_phase.insert(body)
+            set_moved_callback = getattr(body, 'set_moved_callback', None)
+            if set_moved_callback is not None:
+                set_moved_callback(self._body_moved)
 
     def unregister_body(
         self,
@@ -129,70 +128,339 @@ class CollisionService:
         Args:
             body: The physics body to unregister
         """
-        if body in self._registered_bodies:
+        if self._broad_phase.contains(body):
             self._registered_bodies.remove(body)
-            self._spatial_grid.remove(body)
+            self._broad_phase.remove(body)
+            self._moved_bodies.pop(body, None)
+            set_moved_callback = getattr(body, 'set_moved_callback', None)
+            if set_moved_callback is not None:
+                set_moved_callback(None)
+
+    def _body_moved(self, body: IPhysicsBody2D) -> None:
+        """Note a body that moved while static or sleeping, or changed state, to re-index it on the next update."""
+        self._moved_bodies[body] = None
 
-    def update_spatial_grid(self) -> None:
-        """Rebuild the spatial grid after bodies have moved."""
-        self._spatial_grid.clear()
+    def update_spatial_grid(
+        self,
+        updates: Optional[Iterable[Tuple[IPhysicsBody2D, Optional[Tuple[float, float, float, float]]]]] = None,
+    ) -> None:
+        """Update the broad phase after bodies have moved.
+
+        Bodies that can move on their own are updated every time. Static
+        and sleeping bodies are only updated after they report a move
+        through their moved callback; bodies without one must be passed to
+        :meth:`refresh_body` after being moved externally.
+
+        Args:
+            updates: The awake, non-static bodies to update, each with its
+                bounds if already known (or None), in place of scanning
+                every registered body
+        """
+        broad_phase = self._broad_phase
+        if self._moved_bodies:
+            moved_bodies = self._moved_bodies
+            self._moved_bodies = {}
+            for body in moved_bodies:
+                broad_phase.update(body)
+        if updates is not None:
+            for body, bounds in updates:
+                broad_phase.update(body, bounds)
+            return
         for body in self._registered_bodies:
-            self._spatial_grid.insert(body)
+            if body.sleeping or body.body_type == BodyType.STATIC:
+                continue
+            broad_phase.update(body)
+
+    def refresh_body(
+        self,
+        body: IPhysicsBody2D
+    ) -> None:
+        """Update a single registered body in the broad phase, regardless of its type or state.
+
+        Call this after moving a static or sleeping body outside of the
+        simulation (e.g. dragging it in an editor), or after changing any
+        body's collision layer.
+
+        Args:
+            body: The physics body that moved or changed layer
+        """
+        if self._broad_phase.contains(body):
+            self._broad_phase.update(body)
+            self._broad_phase.update_layer(body)
+
+    def _in_index_order(self, bodies: List[IPhysicsBody2D]) -> List[IPhysicsBody2D]:
+        """Sort bodies by their broad-phase index."""
+        return sorted(bodies, key=self._broad_phase.get_index)
+
+    def query_point(
+        self,
+        x: float,
+        y: float
+    ) -> List[IPhysicsBody2D]:
+        """Find all registered bodies containing a point.
+
+        Pending movement is pushed to the broad phase first, so results
+        match the bodies' current positions.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            List of bodies containing the point, in index order
+        """
+        self.update_spatial_grid()
+        return self._in_index_order(self._broad_phase.query_point(x, y))
+
+    def query_area(
+        self,
+        min_x: float,
+        min_y: float,
+        max_x: float,
+        max_y: float
+    ) -> List[IPhysicsBody2D]:
+        """Find all registered bodies overlapping an area.
+
+        Args:
+            min_x: Minimum X coordinate
+            min_y: Minimum Y coordinate
+            max_x: Maximum X coordinate
+            max_y: Maximum Y coordinate
+
+        Returns:
+            List of bodies overlapping the area, in index order
+        """
+        self.update_spatial_grid()
+        return self._in_index_order(self._broad_phase.query_area(min_x, min_y, max_x, max_y))
+
+    def query_ray(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float
+    ) -> List[Tuple[IPhysicsBody2D, float]]:
+        """Find all registered bodies crossed by a ray segment.
+
+        Args:
+            x1: Ray start X coordinate
+            y1: Ray start Y coordinate
+            x2: Ray end X coordinate
+            y2: Ray end Y coordinate
+
+        Returns:
+            List of (body, fraction) tuples, nearest hit first
+        """
+        self.update_spatial_grid()
+        return self._broad_phase.query_ray(x1, y1, x2, y2)
+
+    def sweep_body(
+        self,
+        body: IPhysicsBody2D,
+        start_x: float,
+        start_y: float
+    ) -> Optional[float]:
+        """Sweep a body's bounds from a start position to where it is now.
+
+        Finds the earliest solid body the swept bounds run into, using
+        swept-AABB time of impact against other bodies' broad-phase bounds,
+        which are treated as stationary. Contacts with that body and with any
+        triggers crossed on the way are queued as speculative contacts for
+        the next :meth:`detect_collisions`, so thin sensors see bodies that
+        pass through them within one step.
+
+        Args:
+            body: The moved body, already updated in the broad phase
+            start_x: X position of the body before the move
+            start_y: Y position of the body before the move
+
+        Returns:
+            Fraction of the move at which the body hits a solid body, or None
+            if it reaches its new position without hitting one
+        """
+        dx = body.x - start_x
+        dy = body.y - start_y
+        if not dx and not dy:
+            return None
+
+        broad_phase = self._broad_phase
+        bounds = broad_phase.bounds
+        a = broad_phase.get_index(body) * 4
+        min_ax = bounds[a] - dx
+        min_ay = bounds[a + 1] - dy
+        max_ax = bounds[a + 2] - dx
+        max_ay = bounds[a + 3] - dy
+        start_bounds = (min_ax, min_ay, max_ax, max_ay)
+        swept = broad_phase.query_area(
+            min(min_ax, min_ax + dx), min(min_ay, min_ay + dy),
+            max(max_ax, max_ax + dx), max(max_ay, max_ay + dy),
+        )
+
+        body_is_trigger = body.collider.is_trigger
+        solid_hit = None
+        trigger_hits = []
+        for other in swept:
+            if other is body or not other.enabled or not self._should_collide(body, other):
+                continue
+            b = broad_phase.get_index(other) * 4
+            hit = sweep_bounds(start_bounds, dx, dy, (bounds[b], bounds[b + 1], bounds[b + 2], bounds[b + 3]))
+            if hit is None:
+                continue
+            if body_is_trigger or other.collider.is_trigger:
+                trigger_hits.append((hit, other))
+            elif solid_hit is None or hit[0] < solid_hit[0][0]:
+                solid_hit = (hit, other)
+
+        if solid_hit is not None:
+            toi = solid_hit[0][0]
+            trigger_hits = [(hit, other) for hit, other in trigger_hits if hit[0] <= toi]
+            trigger_hits.append(solid_hit)
+        else:
+            toi = None
+
+        half_width = (max_ax - min_ax) / 2
+        half_height = (max_ay - min_ay) / 2
+        for (fraction, normal_x, normal_y), other in trigger_hits:
+            if other.sleeping:
+                continue  # Sleeping bodies are woken through the regular detection
+            contact_point = (min_ax + half_width + dx * fraction, min_ay + half_height + dy * fraction)
+            self._speculative_contacts.append(CollisionInfo(
+                body_a=body,
+                body_b=other,
+                penetration_depth=0.0,
+                normal=(normal_x, normal_y),
+                contact_point=contact_point,
+            ))
+
+        return toi
 
     def detect_collisions(self) -> List[CollisionInfo]:
         """Detect all collisions between registered bodies.
 
+        Candidate pairs come from the broad phase as index pairs ``(i, j)``
+        with ``i < j`` and are visited in sorted order, so contacts and
+        callbacks come out in the same order for the same body layout
+        whatever order the broad phase found them in. The narrow phase reads bounds from the broad
+        phase's buffer, which was filled when bodies were last updated.
+
+        Pairs involving a sleeping body are not narrow-phased. Contacts that
+        were active when a body fell asleep are kept without callbacks, so
+        no exit is reported for bodies that are merely resting. Sleeping
+        bodies overlapped by an awake, non-static body are collected in
+        :attr:`sleeping_contacts` so the engine can wake them.
+
+        Speculative contacts queued by :meth:`sweep_body` are added for pairs
+        the overlap tests didn't find, then cleared.
+
         Returns:
             List of collision information for all detected collisions
         """
         collisions = []
-        checked_pairs = set()
-        current_colliding_pairs = set()
+        sleeping_contacts = self._sleeping_contacts
+        sleeping_contacts.clear()
+        current_colliding_pairs: Dict[Tuple[IPhysicsBody2D, IPhysicsBody2D], None] = {}
+        previous_colliding_pairs = self._colliding_pairs
+        broad_phase = self._broad_phase
+        bodies = broad_phase.bodies
+        bounds = broad_phase.bounds
+        should_collide = self._should_collide
+        check_shapes = self._check_shapes
+
+        pairs = broad_phase.query_pairs()
+        pairs.sort()
+        self._candidate_pair_count = len(pairs)
+        for i, j in pairs:
+            body = bodies[i]
+            other = bodies[j]
+
+            # Skip disabled bodies
+            if not body.enabled or not other.enabled:
+                continue
 
-        for body in self._registered_bodies:
-            # Skip disabled or sleeping bodies
-            if not body.enabled or body.sleeping:
+            # Check if collision should be tested based on layers
+            if not should_collide(body, other):
                 continue
 
-            # Get nearby bodies from spatial grid
-            nearby = self._spatial_grid.query_nearby(body)
+            a = i * 4
+            b = j * 4
 
-            for other in nearby:
-                # Skip disabled or sleeping bodies
-                if not other.enabled or other.sleeping:
+            # Skip sleeping bodies, noting any an awake body runs into
+            body_sleeping = body.sleeping
+            if body_sleeping or other.sleeping:
+                if body_sleeping == other.sleeping:
                     continue
-
-                # Create sorted pair to avoid duplicate checks
-                pair = tuple(sorted([id(body), id(other)]))
-                if pair in checked_pairs:
+                sleeper, awake = (body, other) if body_sleeping else (other, body)
+                if awake.body_type == BodyType.STATIC:
                     continue
-                checked_pairs.add(pair)
+                if (bounds[a + 2] >= bounds[b] and bounds[a] <= bounds[b + 2]
+                        and bounds[a + 3] >= bounds[b + 1] and bounds[a + 1] <= bounds[b + 3]):
+                    sleeping_contacts.append(sleeper)
+                continue
 
-                # Check if collision should be tested based on layers
-                if not self._should_collide(body, other):
-                    continue
+            # Narrow-phase collision detection
+            collision_info = check_shapes(
+                body, other,
+                bounds[a], bounds[a + 1], bounds[a + 2], bounds[a + 3],
+                bounds[b], bounds[b + 1], bounds[b + 2], bounds[b + 3],
+            )
+            if collision_info:
+                collisions.append(collision_info)
+                body_pair = (body, other)
+                current_colliding_pairs[body_pair] = None
+
+                # Trigger collision callbacks
+                if body_pair not in previous_colliding_pairs:
+                    # New collision
+                    body.on_collision_enter(other)
+                    other.on_collision_enter(body)
+                else:
+                    # Continuing collision
+                    body.on_collision_stay(other)
+                    other.on_collision_stay(body)
+
+        # Add contacts found by sweeps that no longer overlap at the end of the step
+        get_index = broad_phase.get_index
+        for collision_info in self._speculative_contacts:
+            body = collision_info.body_a
+            other = collision_info.body_b
+            if not broad_phase.contains(body) or not broad_phase.contains(other):
+                continue
+            if get_index(body) > get_index(other):
+                normal_x, normal_y = collision_info.normal
+                collision_info = CollisionInfo(
+                    body_a=other,
+                    body_b=body,
+                    penetration_depth=collision_info.penetration_depth,
+                    normal=(-normal_x, -normal_y),
+                    contact_point=collision_info.contact_point,
+                )
+                body, other = other, body
+            body_pair = (body, other)
+            if body_pair in current_colliding_pairs:
+                continue
 
-                # Narrow-phase collision detection
-                collision_info = self._check_collision(body, other)
-                if collision_info:
-                    collisions.append(collision_info)
-                    body_pair = (body, other)
-                    current_colliding_pairs.add(body_pair)
-
-                    # Trigger collision callbacks
-                    if body_pair not in self._colliding_pairs:
-                        # New collision
-                        body.on_collision_enter(other)
-                        other.on_collision_enter(body)
-                    else:
-                        # Continuing collision
-                        body.on_collision_stay(other)
-                        other.on_collision_stay(body)
+            collisions.append(collision_info)
+            current_colliding_pairs[body_pair] = None
+            if body_pair not in previous_colliding_pairs:
+                body.on_collision_enter(other)
+                other.on_collision_enter(body)
+            else:
+                body.on_collision_stay(other)
+                other.on_collision_stay(body)
+        self._speculative_contacts.clear()
 
         # Check for collisions that ended
-        for body_pair in self._colliding_pairs:
+        contains = broad_phase.contains
+        for body_pair in previous_colliding_pairs:
             if body_pair not in current_colliding_pairs:
                 body, other = body_pair
+
+                # Resting contacts of sleeping bodies stay active until woken
+                if ((body.sleeping or other.sleeping) and body.enabled and other.enabled
+                        and contains(body) and contains(other)):
+                    current_colliding_pairs[body_pair] = None
+                    continue
+
                 body.on_collision_exit(other)
                 other.on_collision_exit(body)
 
@@ -204,18 +472,18 @@ class CollisionService:
         body_a: IPhysicsBody2D,
         body_b: IPhysicsBody2D
     ) -> bool:
-        """Check if two bodies should collide based on layers and masks."""
+        """Check if two bodies should collide based on layers and masks.
 
-        layer_a = body_a.collider.collision_layer
-        layer_b = body_b.collider.collision_layer
-        mask_a = body_a.collider.collision_mask
-        mask_b = body_b.collider.collision_mask
+        Uses the bitmasks cached on each collider, compiling them for
+        colliders without :class:`ICollisionBits`; an empty mask compiles to
+        every layer, so it collides with everything.
+        """
+        collider_a = body_a.collider
+        collider_b = body_b.collider
 
         # Check if each body's mask includes the other's layer
-        a_collides_with_b = not mask_a or layer_b in mask_a
-        b_collides_with_a = not mask_b or layer_a in mask_b
-
-        return a_collides_with_b and b_collides_with_a
+        return bool(collider_mask_bits(collider_a) & collider_layer_bits(collider_b)
+                    and collider_mask_bits(collider_b) & collider_layer_bits(collider_a))
 
     def _check_collision(
         self,
@@ -227,10 +495,78 @@ class CollisionService:
         Returns:
             CollisionInfo if collision detected, None otherwise
         """
-        # Get bounding boxes
-        min_ax, min_ay, max_ax, max_ay = body_a.get_bounds()
-        min_bx, min_by, max_bx, max_by = body_b.get_bounds()
+        return self._check_shapes(body_a, body_b, *body_a.get_bounds(), *body_b.get_bounds())
+
+    @staticmethod
+    def _check_shapes(
+        body_a: IPhysicsBody2D,
+        body_b: IPhysicsBody2D,
+        min_ax: float,
+        min_ay: float,
+        max_ax: float,
+        max_ay: float,
+        min_bx: float,
+        min_by: float,
+        max_bx: float,
+        max_by: float
+    ) -> Optional[CollisionInfo]:
+        """Perform narrow-phase collision detection for the bodies' collider shapes.
+
+        Unrotated rectangles use the AABB test directly. Other shapes are
+        rejected by their bounds first, then tested by the function in
+        :data:`NARROW_PHASE_TESTS` for their pair of collider types; pairs
+        without one fall back to the AABB test.
+
+        Returns:
+            CollisionInfo if collision detected, None otherwise
+        """
+        type_a = body_a.collider_type
+        type_b = body_b.collider_type
+        if (type_a is ColliderType.RECTANGLE and type_b is ColliderType.RECTANGLE
+                and not body_a.roll and not body_b.roll):
+            return CollisionService._check_bounds(
+                body_a, body_b, min_ax, min_ay, max_ax, max_ay, min_bx, min_by, max_bx, max_by)
+
+        # Cheap rejection before the shape test
+        if max_ax < min_bx or min_ax > max_bx or max_ay < min_by or min_ay > max_by:
+            return None
+
+        shape_test = NARROW_PHASE_TESTS.get((type_a, type_b))
+        if shape_test is None:
+            return CollisionService._check_bounds(
+                body_a, body_b, min_ax, min_ay, max_ax, max_ay, min_bx, min_by, max_bx, max_by)
+
+        contact = shape_test(body_a, body_b)
+        if contact is None:
+            return None
+
+        penetration, normal_x, normal_y, contact_x, contact_y = contact
+        return CollisionInfo(
+            body_a=body_a,
+            body_b=body_b,
+            penetration_depth=penetration,
+            normal=(normal_x, normal_y),
+            contact_point=(contact_x, contact_y)
+        )
 
+    @staticmethod
+    def _check_bounds(
+        body_a: IPhysicsBody2D,
+        body_b: IPhysicsBody2D,
+        min_ax: float,
+        min_ay: float,
+        max_ax: float,
+        max_ay: float,
+        min_bx: float,
+        min_by: float,
+        max_bx: float,
+        max_by: float
+    ) -> Optional[CollisionInfo]:
+        """Perform narrow-phase collision detection from already-fetched bounds.
+
+        Returns:
+            CollisionInfo if collision detected, None otherwise
+        """
         # AABB collision check
         if max_ax < min_bx or min_ax > max_bx or max_ay < min_by or min_ay > max_by:
             return None  # No collision
@@ -362,6 +698,13 @@ class CollisionService:
 
     def clear(self) -> None:
         """Clear all registered bodies and collision state."""
+        for body in self._registered_bodies:
+            set_moved_callback = getattr(body, 'set_moved_callback', None)
+            if set_moved_callback is not None:
+                set_moved_callback(None)
         self._registered_bodies.clear()
-        self._spatial_grid.clear()
+        self._moved_bodies.clear()
+        self._broad_phase.clear()
         self._colliding_pairs.clear()
+        self._sleeping_contacts.clear()
+        self._speculative_contacts.clear()
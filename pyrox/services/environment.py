@@ -116,6 +116,7 @@ class EnvironmentService:
         # Additional physics parameters
         self._terminal_velocity = 200.0  # m/s - prevents objects from falling infinitely fast
         self._sleep_threshold = 0.01     # m/s - objects slower than this may sleep
+        self._time_to_sleep = 0.5        # s - how long a body must rest before sleeping
         self._collision_iterations = 8    # Number of constraint solver iterations
         self._linear_damping = 0.90      # Per-second velocity retention (0.90 = 10% loss/sec)
         # Simulates ground/surface friction in top-down games
@@ -191,6 +192,18 @@ class EnvironmentService:
             raise ValueError("Sleep threshold must be non-negative")
         self._sleep_threshold = value
 
+    @property
+    def time_to_sleep(self) -> float:
+        """Get how long (in seconds) bodies must stay below the sleep threshold before sleeping."""
+        return self._time_to_sleep
+
+    @time_to_sleep.setter
+    def time_to_sleep(self, value: float) -> None:
+        """Set time to sleep."""
+        if value < 0:
+            raise ValueError("Time to sleep must be non-negative")
+        self._time_to_sleep = value
+
     @property
     def collision_iterations(self) -> int:
         """Get number of collision solver iterations."""
@@ -234,7 +247,6 @@ class EnvironmentService:
         if value < 0:
             raise ValueError("Velocity threshold must be non-negative")
         self._velocity_threshold = value
-        self._collision_iterations = int(value)
 
     def apply_drag_force(self, velocity: Tuple[float, float], drag_coefficient: float, area: float) -> Tuple[float, float]:
         """Calculate drag force based on velocity.
@@ -307,6 +319,7 @@ class EnvironmentService:
             'default_restitution': self._default_restitution,
             'terminal_velocity': self._terminal_velocity,
             'sleep_threshold': self._sleep_threshold,
+            'time_to_sleep': self._time_to_sleep,
             'collision_iterations': self._collision_iterations,
         }
 
@@ -0,0 +1,295 @@
+"""Shape-specific narrow-phase collision tests.
+
+Each test takes two colliders whose bounding boxes already overlap and
+returns a contact as ``(penetration, normal_x, normal_y, contact_x,
+contact_y)``, or None if the shapes don't touch. Normals point from the
+first collider to the second.
+
+Tests are looked up by ``(ColliderType, ColliderType)`` in
+:data:`NARROW_PHASE_TESTS`. Rectangles and polygons share the separating
+axis test, with rectangles using their rotated corners as the outline.
+
+:func:`sweep_bounds` finds the time of impact of a moving box for
+continuous collision detection.
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+from pyrox.interfaces.protocols.physics import ColliderType, ICollider2D
+
+
+Contact = Tuple[float, float, float, float, float]
+ShapeTest = Callable[[ICollider2D, ICollider2D], Optional[Contact]]
+
+# Vertices this close to the deepest one share the contact point
+_CONTACT_TOLERANCE = 1e-6
+
+
+def _world_vertices(collider: ICollider2D) -> List[Tuple[float, float]]:
+    """Get a collider's outline, using its unrotated box when it doesn't describe its shape."""
+    get_world_vertices = getattr(collider, 'get_world_vertices', None)
+    if get_world_vertices is not None:
+        return get_world_vertices()
+    min_x, min_y, max_x, max_y = collider.get_bounds()
+    return [(min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y)]
+
+
+def _radius(collider: ICollider2D) -> float:
+    """Get a circle collider's radius, inscribed in its box when it doesn't describe its shape."""
+    get_radius = getattr(collider, 'get_radius', None)
+    if get_radius is not None:
+        return get_radius()
+    return min(collider.width, collider.height) / 2
+
+
+def _edge_normals(vertices: List[Tuple[float, float]]) -> List[Tuple[Tuple[float, float], Tuple[float, float]]]:
+    """Get each edge of a convex polygon as its start vertex and unit outward normal.
+
+    Zero-length edges (repeated vertices) have no normal and are left out,
+    so each normal stays paired with a vertex on its own edge.
+    """
+    count = len(vertices)
+    center_x = sum(vx for vx, _ in vertices) / count
+    center_y = sum(vy for _, vy in vertices) / count
+    normals = []
+    for index in range(count):
+        x1, y1 = vertices[index]
+        x2, y2 = vertices[(index + 1) % count]
+        normal_x = y2 - y1
+        normal_y = x1 - x2
+        length = (normal_x * normal_x + normal_y * normal_y) ** 0.5
+        if length == 0.0:
+            continue
+        normal_x /= length
+        normal_y /= length
+
+        # Winding is not fixed, so orient away from the centroid
+        if normal_x * ((x1 + x2) / 2 - center_x) + normal_y * ((y1 + y2) / 2 - center_y) < 0:
+            normal_x = -normal_x
+            normal_y = -normal_y
+        normals.append(((x1, y1), (normal_x, normal_y)))
+    return normals
+
+
+def _project(vertices: List[Tuple[float, float]], axis_x: float, axis_y: float) -> Tuple[float, float]:
+    """Project a polygon onto an axis."""
+    lo = hi = vertices[0][0] * axis_x + vertices[0][1] * axis_y
+    for vx, vy in vertices:
+        projection = vx * axis_x + vy * axis_y
+        if projection < lo:
+            lo = projection
+        elif projection > hi:
+            hi = projection
+    return lo, hi
+
+
+def _deepest_point(
+    vertices: List[Tuple[float, float]],
+    axis_x: float,
+    axis_y: float,
+) -> Tuple[float, float]:
+    """Average the vertices that reach furthest along -axis (an edge gives its midpoint)."""
+    projections = [vx * axis_x + vy * axis_y for vx, vy in vertices]
+    deepest = min(projections)
+    points = [vertex for vertex, projection in zip(vertices, projections) if projection - deepest <= _CONTACT_TOLERANCE]
+    return (sum(px for px, _ in points) / len(points), sum(py for _, py in points) / len(points))
+
+
+def collide_polygons(collider_a: ICollider2D, collider_b: ICollider2D) -> Optional[Contact]:
+    """Separating axis test between two convex outlines (rotated boxes or polygons)."""
+    vertices_a = _world_vertices(collider_a)
+    vertices_b = _world_vertices(collider_b)
+
+    best_overlap = float('inf')
+    best_x = best_y = 0.0
+    best_from_a = True
+    for from_a, normals in ((True, _edge_normals(vertices_a)), (False, _edge_normals(vertices_b))):
+        for _, (axis_x, axis_y) in normals:
+            min_a, max_a = _project(vertices_a, axis_x, axis_y)
+            min_b, max_b = _project(vertices_b, axis_x, axis_y)
+            overlap = (max_a if max_a < max_b else max_b) - (min_a if min_a > min_b else min_b)
+            if overlap < 0.0:
+                return None  # Separating axis found
+            if overlap < best_overlap:
+                best_overlap = overlap
+                best_x = axis_x
+                best_y = axis_y
+                best_from_a = from_a
+
+    # Point the normal from A to B
+    center_ax = sum(vx for vx, _ in vertices_a) / len(vertices_a)
+    center_ay = sum(vy for _, vy in vertices_a) / len(vertices_a)
+    center_bx = sum(vx for vx, _ in vertices_b) / len(vertices_b)
+    center_by = sum(vy for _, vy in vertices_b) / len(vertices_b)
+    if (center_bx - center_ax) * best_x + (center_by - center_ay) * best_y < 0:
+        best_x = -best_x
+        best_y = -best_y
+
+    # The incident shape's deepest vertices touch the reference face
+    if best_from_a:
+        contact_x, contact_y = _deepest_point(vertices_b, best_x, best_y)
+    else:
+        contact_x, contact_y = _deepest_point(vertices_a, -best_x, -best_y)
+
+    return (best_overlap, best_x, best_y, contact_x, contact_y)
+
+
+def collide_circles(collider_a: ICollider2D, collider_b: ICollider2D) -> Optional[Contact]:
+    """Test two circles."""
+    center_ax, center_ay = collider_a.get_center()
+    center_bx, center_by = collider_b.get_center()
+    radius_a = _radius(collider_a)
+    radius_sum = radius_a + _radius(collider_b)
+
+    dx = center_bx - center_ax
+    dy = center_by - center_ay
+    distance_sq = dx * dx + dy * dy
+    if distance_sq > radius_sum * radius_sum:
+        return None
+
+    distance = distance_sq ** 0.5
+    if distance == 0.0:
+        normal_x, normal_y = 1.0, 0.0  # Concentric; any direction separates them
+    else:
+        normal_x = dx / distance
+        normal_y = dy / distance
+    penetration = radius_sum - distance
+
+    # Contact at the middle of the overlap
+    reach = radius_a - penetration / 2
+    return (penetration, normal_x, normal_y, center_ax + normal_x * reach, center_ay + normal_y * reach)
+
+
+def collide_polygon_circle(collider_a: ICollider2D, collider_b: ICollider2D) -> Optional[Contact]:
+    """Test a rotated box or polygon (A) against a circle (B)."""
+    vertices = _world_vertices(collider_a)
+    center_x, center_y = collider_b.get_center()
+    radius = _radius(collider_b)
+
+    # Closest point on the outline to the circle center
+    count = len(vertices)
+    closest_x = closest_y = 0.0
+    closest_sq = float('inf')
+    for index in range(count):
+        x1, y1 = vertices[index]
+        x2, y2 = vertices[(index + 1) % count]
+        edge_x = x2 - x1
+        edge_y = y2 - y1
+        length_sq = edge_x * edge_x + edge_y * edge_y
+        t = ((center_x - x1) * edge_x + (center_y - y1) * edge_y) / length_sq if length_sq else 0.0
+        t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+        point_x = x1 + edge_x * t
+        point_y = y1 + edge_y * t
+        distance_sq = (center_x - point_x) ** 2 + (center_y - point_y) ** 2
+        if distance_sq < closest_sq:
+            closest_sq = distance_sq
+            closest_x = point_x
+            closest_y = point_y
+
+    # Inside when the center is behind every edge
+    inside = all(
+        (center_x - vx) * normal_x + (center_y - vy) * normal_y <= 0.0
+        for (vx, vy), (normal_x, normal_y) in _edge_normals(vertices)
+    )
+    distance = closest_sq ** 0.5
+    if not inside and distance > radius:
+        return None
+
+    if distance == 0.0:
+        # Center on the outline: push out along the nearest edge's normal
+        polygon_x = sum(vx for vx, _ in vertices) / count
+        polygon_y = sum(vy for _, vy in vertices) / count
+        normal_x = center_x - polygon_x
+        normal_y = center_y - polygon_y
+        length = (normal_x * normal_x + normal_y * normal_y) ** 0.5 or 1.0
+        normal_x /= length
+        normal_y /= length
+    else:
+        normal_x = (center_x - closest_x) / distance
+        normal_y = (center_y - closest_y) / distance
+
+    if inside:
+        normal_x = -normal_x
+        normal_y = -normal_y
+        penetration = radius + distance
+    else:
+        penetration = radius - distance
+
+    return (penetration, normal_x, normal_y, closest_x, closest_y)
+
+
+def collide_circle_polygon(collider_a: ICollider2D, collider_b: ICollider2D) -> Optional[Contact]:
+    """Test a circle (A) against a rotated box or polygon (B)."""
+    contact = collide_polygon_circle(collider_b, collider_a)
+    if contact is None:
+        return None
+    penetration, normal_x, normal_y, contact_x, contact_y = contact
+    return (penetration, -normal_x, -normal_y, contact_x, contact_y)
+
+
+def sweep_bounds(
+    bounds: Tuple[float, float, float, float],
+    dx: float,
+    dy: float,
+    target: Tuple[float, float, float, float],
+) -> Optional[Tuple[float, float, float]]:
+    """Find when a box moving by (dx, dy) first touches a stationary box.
+
+    Args:
+        bounds: Moving box at the start of the move as (min_x, min_y, max_x, max_y)
+        dx: X displacement over the move
+        dy: Y displacement over the move
+        target: Stationary box as (min_x, min_y, max_x, max_y)
+
+    Returns:
+        Tuple of (fraction, normal_x, normal_y), where fraction is how far
+        along the move the boxes touch and the normal points from the moving
+        box to the target, or None if they don't meet during the move or
+        already overlap at its start
+    """
+    min_ax, min_ay, max_ax, max_ay = bounds
+    min_bx, min_by, max_bx, max_by = target
+
+    if dx > 0.0:
+        entry_x = (min_bx - max_ax) / dx
+        exit_x = (max_bx - min_ax) / dx
+    elif dx < 0.0:
+        entry_x = (max_bx - min_ax) / dx
+        exit_x = (min_bx - max_ax) / dx
+    elif max_ax < min_bx or min_ax > max_bx:
+        return None
+    else:
+        entry_x = float('-inf')
+        exit_x = float('inf')
+
+    if dy > 0.0:
+        entry_y = (min_by - max_ay) / dy
+        exit_y = (max_by - min_ay) / dy
+    elif dy < 0.0:
+        entry_y = (max_by - min_ay) / dy
+        exit_y = (min_by - max_ay) / dy
+    elif max_ay < min_by or min_ay > max_by:
+        return None
+    else:
+        entry_y = float('-inf')
+        exit_y = float('inf')
+
+    entry = entry_x if entry_x > entry_y else entry_y
+    if entry < 0.0 or entry > 1.0 or entry > (exit_x if exit_x < exit_y else exit_y):
+        return None
+
+    # The last axis to start overlapping is the one the boxes meet on
+    if entry_x > entry_y:
+        return (entry, 1.0 if dx > 0.0 else -1.0, 0.0)
+    return (entry, 0.0, 1.0 if dy > 0.0 else -1.0)
+
+
+NARROW_PHASE_TESTS: Dict[Tuple[ColliderType, ColliderType], ShapeTest] = {
+    (ColliderType.RECTANGLE, ColliderType.RECTANGLE): collide_polygons,
+    (ColliderType.RECTANGLE, ColliderType.POLYGON): collide_polygons,
+    (ColliderType.POLYGON, ColliderType.RECTANGLE): collide_polygons,
+    (ColliderType.POLYGON, ColliderType.POLYGON): collide_polygons,
+    (ColliderType.CIRCLE, ColliderType.CIRCLE): collide_circles,
+    (ColliderType.RECTANGLE, ColliderType.CIRCLE): collide_polygon_circle,
+    (ColliderType.POLYGON, ColliderType.CIRCLE): collide_polygon_circle,
+    (ColliderType.CIRCLE, ColliderType.RECTANGLE): collide_circle_polygon,
+    (ColliderType.CIRCLE, ColliderType.POLYGON): collide_circle_polygon,
+}
@@ -3,10 +3,44 @@
 Main orchestrator for physics simulation, managing bodies, collisions,
 and integration with fixed timestep updates.
 """
-from typing import List
-from pyrox.interfaces.protocols.physics import IPhysicsBody2D, IPhysicsEngine, BodyType
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+from pyrox.interfaces.protocols.physics import (
+    IPhysicsBody2D,
+    IPhysicsEngine,
+    ISensorEventQueue,
+    ISurfaceEffector,
+    BodyType,
+)
 from pyrox.services.environment import EnvironmentService
 from pyrox.services.collision import CollisionService
+from pyrox.services.physics_arrays import PhysicsBodyArrays
+from pyrox.services.profiler import PhysicsProfiler
+from pyrox.services.solver import ContactSolver
+
+
+# Snapshot layout: a header, one record per registered body, then the rest
+# times, sleeping islands, colliding pairs and warm-start impulses, all
+# keyed by each body's index in the engine's body list
+_SNAPSHOT_MAGIC = b'PXSN'
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct('<4sHIddQQ')
+_SNAPSHOT_BODY = struct.Struct('<11dB')
+_SNAPSHOT_COUNT = struct.Struct('<I')
+_SNAPSHOT_REST_TIME = struct.Struct('<Id')
+_SNAPSHOT_PAIR = struct.Struct('<II')
+_SNAPSHOT_IMPULSE = struct.Struct('<II4d')
+
+_BODY_ENABLED = 0x01
+_BODY_SLEEPING = 0x02
+
+
+def _gil_enabled() -> bool:
+    """Check whether the interpreter runs with the GIL (always True before 3.13)."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled() if is_gil_enabled is not None else True
 
 
 class PhysicsEngineService(IPhysicsEngine):
@@ -17,15 +51,25 @@ class PhysicsEngineService(IPhysicsEngine):
 
     Features:
     - Fixed timestep physics (prevents tunneling and ensures consistency)
+    - Continuous collision detection for bodies flagged as bullets
     - Environment configuration (gravity, drag, etc.)
-    - Collision detection and response
-    - Sleep optimization for stationary objects
+    - Collision detection and an iterative contact solver with friction
+    - Batched surface effects (conveyor belts, floors) applied once per step
+    - Sensor events queued during detection and dispatched after each step
+    - Sleep optimization for stationary objects, grouped into contact islands
     - Time scaling for slow-motion/fast-forward effects
+    - Interpolated positions between the last two fixed steps for rendering
+    - Optional array-backed mode that vectorizes forces and integration
+    - Optional concurrent solving of independent contact islands (only
+      faster on free-threaded builds, see ``parallel_islands``)
+    - Optional per-phase step profiling
 
     Attributes:
         environment: EnvironmentService for physics constants
         collision: CollisionService for collision detection
+        solver: ContactSolver for collision response
         bodies: List of registered physics bodies
+        profiler: PhysicsProfiler while profiling is enabled, None otherwise
     """
 
     def __init__(
@@ -33,6 +77,12 @@ class PhysicsEngineService(IPhysicsEngine):
         environment: EnvironmentService | None = None,
         collision: CollisionService | None = None,
         physics_step: float = 1.0 / 60.0,  # 60 Hz physics
+        use_arrays: bool = False,
+        solver: ContactSolver | None = None,
+        parallel_islands: bool = False,
+        max_workers: int | None = None,
+        profiling: bool = False,
+        interpolation: bool = False,
     ):
         """Initialize the physics engine.
 
@@ -40,19 +90,61 @@ class PhysicsEngineService(IPhysicsEngine):
             environment: EnvironmentService instance (creates default if None)
             collision: CollisionService instance (creates default if None)
             physics_step: Fixed physics timestep in seconds
+            use_arrays: Keep body state in NumPy arrays and run forces and
+                integration as vectorized passes over them
+            solver: ContactSolver instance (creates default if None)
+            parallel_islands: Solve independent contact islands on a thread
+                pool. Only useful on free-threaded builds; with the GIL the
+                islands are solved one at a time plus the pool's overhead,
+                so the step is slower than the default serial solve.
+            max_workers: Thread pool size for parallel islands (defaults to
+                the executor's own default)
+            profiling: Time each phase of the fixed step
+            interpolation: Keep where moving bodies were before each fixed
+                step, so :meth:`get_interpolated_positions` can blend them
         """
         self._environment = environment or EnvironmentService()
         self._collision = collision or CollisionService()
+        self._solver = solver or ContactSolver()
         self._bodies: List[IPhysicsBody2D] = []
 
+        # Bodies that act on whatever rests on them, in registration order
+        self._effectors: Dict[IPhysicsBody2D, None] = {}
+
+        # Bodies that queue detection events, dispatched after each step
+        self._sensors: Dict[IPhysicsBody2D, None] = {}
+
         # Fixed timestep parameters
         self._physics_step = physics_step
         self._accumulator = 0.0
         self._time_scale = 1.0
 
+        # Array-backed simulation state
+        self._use_arrays = use_arrays
+        self._arrays = PhysicsBodyArrays()
+
+        # Parallel island solving. Threads only run islands truly in parallel
+        # on a free-threaded build; with the GIL the results are the same
+        # but the solve is slower (see get_stats()['gil_enabled']).
+        self._parallel_islands = parallel_islands
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Sleep state: time each body has been at rest, and the island each
+        # sleeping body was put to sleep with
+        self._rest_times: Dict[IPhysicsBody2D, float] = {}
+        self._islands: Dict[IPhysicsBody2D, List[IPhysicsBody2D]] = {}
+
+        # Interpolation state: positions of moving bodies before the last
+        # fixed step (current positions are the bodies' own)
+        self._interpolation = interpolation
+        self._previous_positions: Dict[IPhysicsBody2D, Tuple[float, float]] = {}
+
         # Performance tracking
         self._total_time = 0.0
         self._step_count = 0
+        self._dropped_steps = 0
+        self._profiler: PhysicsProfiler | None = PhysicsProfiler() if profiling else None
 
     @property
     def environment(self) -> EnvironmentService:
@@ -64,11 +156,107 @@ class PhysicsEngineService(IPhysicsEngine):
         """Get the collision service."""
         return self._collision
 
+    @property
+    def solver(self) -> ContactSolver:
+        """Get the contact solver."""
+        return self._solver
+
     @property
     def bodies(self) -> List[IPhysicsBody2D]:
         """Get list of registered bodies."""
         return self._bodies.copy()
 
+    @property
+    def arrays(self) -> PhysicsBodyArrays:
+        """Get the array-backed body state used when ``use_arrays`` is enabled."""
+        return self._arrays
+
+    @property
+    def use_arrays(self) -> bool:
+        """Whether body state is kept in arrays and stepped as vectorized passes."""
+        return self._use_arrays
+
+    @use_arrays.setter
+    def use_arrays(self, value: bool) -> None:
+        if value and not self._use_arrays:
+            for body in self._bodies:
+                self._arrays.add(body)
+        elif not value:
+            self._arrays.clear()
+        self._use_arrays = value
+
+    @property
+    def parallel_islands(self) -> bool:
+        """Whether independent contact islands are solved on a thread pool.
+
+        Off by default. Enable it only on free-threaded builds, where the
+        islands actually run in parallel.
+        """
+        return self._parallel_islands
+
+    @parallel_islands.setter
+    def parallel_islands(self, value: bool) -> None:
+        self._parallel_islands = value
+        if not value:
+            self.shutdown()
+
+    @property
+    def profiling(self) -> bool:
+        """Whether each phase of the fixed step is timed."""
+        return self._profiler is not None
+
+    @profiling.setter
+    def profiling(self, value: bool) -> None:
+        if value and self._profiler is None:
+            self._profiler = PhysicsProfiler()
+        elif not value:
+            self._profiler = None
+
+    @property
+    def interpolation(self) -> bool:
+        """Whether positions before each fixed step are kept for interpolation."""
+        return self._interpolation
+
+    @interpolation.setter
+    def interpolation(self, value: bool) -> None:
+        self._interpolation = value
+        if not value:
+            self._previous_positions.clear()
+
+    @property
+    def profiler(self) -> PhysicsProfiler | None:
+        """Get the step profiler, or None if profiling is disabled."""
+        return self._profiler
+
+    @property
+    def step_count(self) -> int:
+        """Get the number of fixed steps run since the engine was created or reset."""
+        return self._step_count
+
+    @property
+    def interpolation_alpha(self) -> float:
+        """Get how far the leftover frame time reaches into the next fixed step.
+
+        0.0 means the bodies' current positions are exact, values toward
+        1.0 mean the next fixed step is nearly due.
+        """
+        return min(self._accumulator / self._physics_step, 1.0)
+
+    def shutdown(self) -> None:
+        """Stop the island solver's thread pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the island solver's thread pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix='pyrox-islands',
+            )
+        return self._executor
+
     # IPhysicsEngine protocol implementation
 
     def get_gravity(self) -> tuple[float, float]:
@@ -111,6 +299,12 @@ class PhysicsEngineService(IPhysicsEngine):
         if body not in self._bodies:
             self._bodies.append(body)
             self._collision.register_body(body)
+            if self._use_arrays:
+                self._arrays.add(body)
+            if isinstance(body, ISurfaceEffector):
+                self._effectors[body] = None
+            if isinstance(body, ISensorEventQueue):
+                self._sensors[body] = None
 
     def unregister_body(self, body: IPhysicsBody2D) -> None:
         """Remove a physics body from the engine.
@@ -121,6 +315,32 @@ class PhysicsEngineService(IPhysicsEngine):
         if body in self._bodies:
             self._bodies.remove(body)
             self._collision.unregister_body(body)
+            self._arrays.remove(body)
+            self._effectors.pop(body, None)
+            self._sensors.pop(body, None)
+            self._previous_positions.pop(body, None)
+            self._solver.forget(body)
+            self._rest_times.pop(body, None)
+            island = self._islands.pop(body, None)
+            if island is not None:
+                island.remove(body)
+
+    def refresh_body(self, body: IPhysicsBody2D) -> None:
+        """Notify the engine that a body was moved outside of the simulation.
+
+        Static and sleeping bodies are not re-binned by the broad phase each
+        step, so callers that reposition them (e.g. editor drags) must call
+        this for collisions to see the new position.
+
+        The body is also drawn at its new position straight away, rather
+        than interpolated from where it was.
+
+        Args:
+            body: The physics body that moved
+        """
+        self._collision.refresh_body(body)
+        self._arrays.mark_dirty(body)
+        self._previous_positions.pop(body, None)
 
     def step(self, dt: float) -> None:
         """Advance physics simulation by dt seconds.
@@ -149,6 +369,10 @@ class PhysicsEngineService(IPhysicsEngine):
 
         # If we hit max steps, reset accumulator to prevent falling behind
         if steps_this_frame >= max_steps:
+            dropped = int(self._accumulator / self._physics_step)
+            self._dropped_steps += dropped
+            if self._profiler is not None:
+                self._profiler.record_dropped(dropped)
             self._accumulator = 0.0
 
     def _fixed_step(self, dt: float) -> None:
@@ -157,31 +381,218 @@ class PhysicsEngineService(IPhysicsEngine):
         Args:
             dt: Fixed timestep duration in seconds
         """
-        # 1. Apply forces (gravity, drag)
-        self._apply_forces(dt)
+        profiler = self._profiler
+        lap = None
+        if profiler is not None:
+            profiler.begin_step()
+            lap = profiler.lap
+
+        # Bring the array rows up to date with edits made since the last step
+        if self._use_arrays:
+            self._arrays.prepare()
+
+        # Keep where moving bodies start, to interpolate between steps
+        if self._interpolation and self._use_arrays:
+            self._previous_positions = self._arrays.get_moving_positions()
+        elif self._interpolation:
+            static = BodyType.STATIC
+            previous_positions = self._previous_positions
+            previous_positions.clear()
+            for body in self._bodies:
+                if body.enabled and not body.sleeping and body.body_type != static:
+                    previous_positions[body] = (body.x, body.y)
+
+        # Note where bullets start so their movement can be swept
+        bullets = [
+            (body, body.x, body.y) for body in self._bodies
+            if getattr(body, 'bullet', False) and body.enabled and not body.sleeping
+            and body.body_type == BodyType.DYNAMIC
+        ]
+
+        if self._use_arrays:
+            # 1-2. Forces and integration as vectorized passes
+            self._arrays.step(self._environment, dt)
+            if lap:
+                lap('integrate')
+        else:
+            # 1. Apply forces (gravity, drag)
+            self._apply_forces(dt)
+            if lap:
+                lap('forces')
+
+            # 2. Integrate velocities and update positions
+            self._integrate(dt)
+            if lap:
+                lap('integrate')
+
+        # 3. Update spatial grid for collision detection, then sweep bullets
+        if self._use_arrays:
+            self._collision.update_spatial_grid(self._arrays.iter_grid_updates())
+        else:
+            self._collision.update_spatial_grid()
+        if lap:
+            lap('grid')
+        if bullets:
+            self._sweep_bullets(bullets)
+            if lap:
+                lap('sweep')
+
+        # 4. Detect collisions, waking sleeping bodies that were run into
+        collisions = self._collision.detect_collisions()
+        for body in self._collision.sleeping_contacts:
+            if body.sleeping:
+                self._wake_island(body)
+        if lap:
+            lap('detect')
+
+        # 5. Apply conveyor and floor effects to the bodies touching them
+        if self._effectors and collisions:
+            self._apply_surface_effects(collisions, dt)
+            if lap:
+                lap('surface')
+
+        # 6. Resolve collisions over several velocity iterations
+        if self._parallel_islands:
+            self._solver.solve_islands(collisions, self._environment, executor=self._get_executor())
+        else:
+            self._solver.solve(collisions, self._environment)
+        if lap:
+            lap('resolve')
+
+        # 7. Call update on each body (for custom behavior)
+        for body in self._bodies:
+            if body.enabled and not body.sleeping:
+                body.update(dt)
+        if lap:
+            lap('update')
 
-        # 2. Integrate velocities and update positions
-        self._integrate(dt)
+        # 8. Check for sleeping bodies
+        self._update_sleep_state(dt, collisions)
+        if lap:
+            lap('sleep')
 
-        # 3. Update spatial grid for collision detection
-        self._collision.update_spatial_grid()
+        # 9. Dispatch sensor events queued during detection, now that the
+        # step is done and callbacks can safely change the simulation
+        if self._sensors:
+            self._dispatch_sensor_events()
+            if lap:
+                lap('events')
 
-        # 4. Detect collisions
-        collisions = self._collision.detect_collisions()
+        self._total_time += dt
+        if profiler is not None:
+            profiler.end_step(self._collision.candidate_pair_count, len(collisions))
 
-        # 5. Resolve collisions
+    def _apply_surface_effects(self, collisions: list, dt: float) -> None:
+        """Hand each surface effector every dynamic body it touches, in one call.
+
+        Contacts are grouped per effector in a single pass over the step's
+        collisions, so a belt carrying many bodies is applied once rather
+        than once per contact.
+
+        Args:
+            collisions: Contacts detected this step
+            dt: Timestep duration in seconds
+        """
+        effectors = self._effectors
+        dynamic = BodyType.DYNAMIC
+        touching: Dict[IPhysicsBody2D, List[IPhysicsBody2D]] = {}
         for collision in collisions:
-            self._collision.resolve_collision(collision, self._environment)
+            body_a = collision.body_a
+            body_b = collision.body_b
+            if body_a in effectors and body_b.body_type == dynamic:
+                touching.setdefault(body_a, []).append(body_b)
+            if body_b in effectors and body_a.body_type == dynamic:
+                touching.setdefault(body_b, []).append(body_a)
+
+        get_cached_bounds = self._collision.broad_phase.get_cached_bounds
+        for effector, bodies in touching.items():
+            effector.apply_surface_effect(bodies, [get_cached_bounds(body) for body in bodies], dt)  # type: ignore
+
+    def get_interpolated_positions(self, alpha: float | None = None) -> Dict[IPhysicsBody2D, Tuple[float, float]]:
+        """Get every body's position blended between the last two fixed steps.
+
+        Renderers running faster than the physics step draw these instead of
+        the bodies' positions, so motion stays smooth while physics steps at
+        a lower rate. Bodies that didn't move in the last step (static,
+        sleeping, or just registered or refreshed) are at their current
+        position, as is every body unless :attr:`interpolation` is enabled.
+
+        Args:
+            alpha: Blend factor from the previous (0.0) to the current (1.0)
+                position. Defaults to :attr:`interpolation_alpha`.
 
-        # 6. Call update on each body (for custom behavior)
+        Returns:
+            Dictionary of body to interpolated (x, y)
+        """
+        if alpha is None:
+            alpha = self.interpolation_alpha
+        previous_positions = self._previous_positions
+        positions: Dict[IPhysicsBody2D, Tuple[float, float]] = {}
         for body in self._bodies:
-            if body.enabled and not body.sleeping:
-                body.update(dt)
+            x = body.x
+            y = body.y
+            previous = previous_positions.get(body)
+            if previous is not None:
+                x = previous[0] + (x - previous[0]) * alpha
+                y = previous[1] + (y - previous[1]) * alpha
+            positions[body] = (x, y)
+        return positions
+
+    def iter_moving_positions(self, alpha: float | None = None) -> Iterator[Tuple[IPhysicsBody2D, Tuple[float, float]]]:
+        """Iterate the positions of the bodies that moved in the last step.
+
+        Like :meth:`get_interpolated_positions`, but only for enabled, awake,
+        non-static bodies, so renderers can skip everything that didn't move
+        without the engine building a position for every registered body.
+        With :attr:`interpolation` enabled only the bodies it kept are
+        visited; bodies that stopped since keep their current position.
+
+        Args:
+            alpha: Blend factor from the previous (0.0) to the current (1.0)
+                position. Defaults to :attr:`interpolation_alpha`.
 
-        # 7. Check for sleeping bodies
-        self._update_sleep_state()
+        Yields:
+            (body, interpolated (x, y))
+        """
+        if self._interpolation:
+            if alpha is None:
+                alpha = self.interpolation_alpha
+            for body, (previous_x, previous_y) in self._previous_positions.items():
+                yield body, (previous_x + (body.x - previous_x) * alpha, previous_y + (body.y - previous_y) * alpha)
+        elif self._use_arrays:
+            # Pick up bodies put to sleep or moved through their setters since the step
+            self._arrays.flush()
+            yield from self._arrays.get_moving_positions().items()
+        else:
+            static = BodyType.STATIC
+            for body in self._bodies:
+                if body.enabled and not body.sleeping and body.body_type != static:
+                    yield body, (body.x, body.y)
+
+    def _dispatch_sensor_events(self) -> None:
+        """Dispatch the events every sensor queued during this step."""
+        pending = [sensor for sensor in self._sensors if sensor.has_pending_events]  # type: ignore
+        for sensor in pending:
+            sensor.dispatch_events()  # type: ignore
+
+    def _sweep_bullets(self, bullets: List[tuple]) -> None:
+        """Sweep bullet bodies over their last move and stop them at the first solid hit.
+
+        A bullet that would have passed into or through a solid body is
+        moved back to where it first touches it, leaving the contact for the
+        solver. Triggers crossed on the way get a speculative contact.
 
-        self._total_time += dt
+        Args:
+            bullets: Tuples of (body, start_x, start_y) for each bullet
+        """
+        collision = self._collision
+        for body, start_x, start_y in bullets:
+            toi = collision.sweep_body(body, start_x, start_y)
+            if toi is None:
+                continue
+            body.x = start_x + (body.x - start_x) * toi
+            body.y = start_y + (body.y - start_y) * toi
+            collision.refresh_body(body)
 
     def _apply_forces(self, dt: float) -> None:
         """Apply environmental forces to all bodies.
@@ -334,15 +745,34 @@ class PhysicsEngineService(IPhysicsEngine):
                 angular_vel = body.angular_velocity
                 body.roll += angular_vel * dt
 
-    def _update_sleep_state(self) -> None:
+    def _update_sleep_state(
+        self,
+        dt: float = 0.0,
+        collisions: Optional[list] = None,
+    ) -> None:
         """Update sleep state for bodies to optimize performance.
 
-        Bodies with velocity below threshold for extended time can sleep
-        to skip physics calculations.
+        Dynamic bodies accumulate rest time while both their linear and
+        angular speeds stay below the environment's sleep threshold. Bodies
+        in contact with each other form an island, and an island is put to
+        sleep only once every member has rested for ``time_to_sleep``
+        seconds. Sleeping bodies that start moving, or whose island has a
+        member that was woken, wake the whole island.
+
+        Args:
+            dt: Timestep duration in seconds
+            collisions: Contacts detected this step, used to build islands
         """
         threshold = self._environment.sleep_threshold
-
-        for body in self._bodies:
+        time_to_sleep = self._environment.time_to_sleep
+        rest_times = self._rest_times
+        islands = self._islands
+        # Ordered so islands are built, and put to sleep, in body order
+        resting: Dict[IPhysicsBody2D, None] = {}
+        # Array rows are in body order, so speeds can be read from them
+        speeds, spins = self._arrays.get_speeds() if self._use_arrays else (None, None)
+
+        for index, body in enumerate(self._bodies):
             if not body.enabled:
                 continue
 
@@ -352,21 +782,121 @@ class PhysicsEngineService(IPhysicsEngine):
                 continue
 
             # Check velocity
-            vx, vy = body.linear_velocity
-            speed = (vx**2 + vy**2)**0.5
+            if speeds is None:
+                vx, vy = body.linear_velocity
+                speed = (vx**2 + vy**2)**0.5
+                spin = abs(body.angular_velocity)
+            else:
+                speed = speeds[index]
+                spin = spins[index]
 
-            if speed < threshold:
-                # Could add timer here to sleep after N frames below threshold
-                pass  # For now, don't auto-sleep
+            if body.sleeping:
+                if speed >= threshold:
+                    self._wake_island(body)
+                continue
+
+            if body in islands:
+                # Woken from outside the engine; bring its island with it
+                self._wake_island(body)
+
+            if speed < threshold and spin < threshold:
+                rest_time = rest_times.get(body, 0.0) + dt
+                rest_times[body] = rest_time
+                if rest_time >= time_to_sleep:
+                    resting[body] = None
             else:
                 # Wake up if moving
+                rest_times[body] = 0.0
                 body.set_sleeping(False)
 
+        if not resting:
+            return
+
+        for island in self._build_islands(resting, collisions or ()):
+            if all(member in resting for member in island):
+                self._sleep_island(island)
+
+    def _build_islands(self, resting: Dict[IPhysicsBody2D, None], collisions) -> List[List[IPhysicsBody2D]]:
+        """Group resting bodies with the awake dynamic bodies they touch.
+
+        Args:
+            resting: Bodies that have rested long enough to sleep
+            collisions: Contacts detected this step
+
+        Returns:
+            List of islands, each a list of bodies connected by contacts
+        """
+        parents: Dict[IPhysicsBody2D, IPhysicsBody2D] = {body: body for body in resting}
+
+        def find(body):
+            root = parents.setdefault(body, body)
+            while root is not parents[root]:
+                root = parents[root]
+            while body is not root:
+                parents[body], body = root, parents[body]
+            return root
+
+        for collision in collisions:
+            body_a = collision.body_a
+            body_b = collision.body_b
+            if body_a.body_type != BodyType.DYNAMIC or body_b.body_type != BodyType.DYNAMIC:
+                continue
+            if body_a.is_trigger or body_b.is_trigger:
+                continue
+            if body_a not in resting and body_b not in resting:
+                continue
+            root_a = find(body_a)
+            root_b = find(body_b)
+            if root_a is not root_b:
+                parents[root_b] = root_a
+
+        islands: Dict[IPhysicsBody2D, List[IPhysicsBody2D]] = {}
+        for body in parents:
+            islands.setdefault(find(body), []).append(body)
+        return list(islands.values())
+
+    def _sleep_island(self, island: List[IPhysicsBody2D]) -> None:
+        """Put every body of an island to sleep.
+
+        Args:
+            island: Bodies to put to sleep together
+        """
+        for body in island:
+            body.set_sleeping(True)
+            body.set_linear_velocity(0.0, 0.0)
+            body.set_angular_velocity(0.0)
+            body.clear_forces()
+            self._rest_times.pop(body, None)
+            self._islands[body] = island
+
+            # Sleeping bodies are skipped by broad-phase updates, so store
+            # the position the body came to rest at
+            self._collision.refresh_body(body)
+
+    def _wake_island(self, body: IPhysicsBody2D) -> None:
+        """Wake a body and every body that fell asleep with it.
+
+        Args:
+            body: The body to wake
+        """
+        island = self._islands.pop(body, None) or [body]
+        for member in island:
+            self._islands.pop(member, None)
+            self._rest_times[member] = 0.0
+            member.set_sleeping(False)
+
     def reset(self) -> None:
         """Reset the physics engine to initial state."""
         self._accumulator = 0.0
         self._total_time = 0.0
         self._step_count = 0
+        self._dropped_steps = 0
+        self._rest_times.clear()
+        self._islands.clear()
+        self._previous_positions.clear()
+        self._solver.clear()
+        if self._profiler is not None:
+            self._profiler.reset()
 
         # Clear forces on all bodies
         for body in self._bodies:
@@ -375,30 +905,214 @@ class PhysicsEngineService(IPhysicsEngine):
     def clear(self) -> None:
         """Remove all bodies and reset the engine."""
         self._bodies.clear()
+        self._effectors.clear()
+        self._sensors.clear()
         self._collision.clear()
+        self._arrays.clear()
         self.reset()
 
+    def snapshot(self) -> bytes:
+        """Capture the simulation state as a compact binary blob.
+
+        Holds each registered body's position, rotation, velocities,
+        accelerations, pending forces and enabled/sleeping flags, plus the
+        accumulator, step counters, rest times, sleeping islands, colliding
+        pairs and the solver's warm-start impulses. Bodies are stored by
+        their index in :attr:`bodies`, so the blob can be restored into this
+        engine (rewind) or into another engine whose bodies were registered
+        in the same order (fork).
+
+        State kept by the bodies themselves (e.g. what a sensor has detected)
+        is not included.
+
+        Returns:
+            The snapshot, to pass to :meth:`restore`
+        """
+        bodies = self._bodies
+        indices = {body: index for index, body in enumerate(bodies)}
+        parts = [_SNAPSHOT_HEADER.pack(
+            _SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, len(bodies),
+            self._accumulator, self._total_time, self._step_count, self._dropped_steps,
+        )]
+
+        pack_body = _SNAPSHOT_BODY.pack
+        for body in bodies:
+            vx, vy = body.linear_velocity
+            ax, ay = body.linear_acceleration
+            fx, fy = body.force
+            flags = (_BODY_ENABLED if body.enabled else 0) | (_BODY_SLEEPING if body.sleeping else 0)
+            parts.append(pack_body(
+                body.x, body.y, body.roll, vx, vy, ax, ay,
+                body.angular_velocity, fx, fy, body.torque, flags,
+            ))
+
+        rest_times = [(indices[body], rest) for body, rest in self._rest_times.items() if body in indices]
+        parts.append(_SNAPSHOT_COUNT.pack(len(rest_times)))
+        parts.extend(_SNAPSHOT_REST_TIME.pack(index, rest) for index, rest in rest_times)
+
+        # Members of an island share one list; store each list once
+        islands = list({id(island): island for island in self._islands.values()}.values())
+        parts.append(_SNAPSHOT_COUNT.pack(len(islands)))
+        for island in islands:
+            parts.append(_SNAPSHOT_COUNT.pack(len(island)))
+            parts.append(struct.pack(f'<{len(island)}I', *(indices[body] for body in island)))
+
+        pairs = [
+            (indices[body_a], indices[body_b]) for body_a, body_b in self._collision.colliding_pairs
+            if body_a in indices and body_b in indices
+        ]
+        parts.append(_SNAPSHOT_COUNT.pack(len(pairs)))
+        parts.extend(_SNAPSHOT_PAIR.pack(a, b) for a, b in pairs)
+
+        impulses = [
+            (indices[body_a], indices[body_b], impulse)
+            for (body_a, body_b), impulse in self._solver.cached_impulses.items()
+            if body_a in indices and body_b in indices
+        ]
+        parts.append(_SNAPSHOT_COUNT.pack(len(impulses)))
+        parts.extend(_SNAPSHOT_IMPULSE.pack(a, b, *impulse) for a, b, impulse in impulses)
+
+        return b''.join(parts)
+
+    def restore(self, snapshot: bytes) -> None:
+        """Return the simulation to a state captured by :meth:`snapshot`.
+
+        Stepping after a restore with the same inputs reproduces the steps
+        that followed the snapshot exactly. No collision callbacks are fired
+        by the restore itself.
+
+        Args:
+            snapshot: Blob returned by :meth:`snapshot`
+
+        Raises:
+            ValueError: If the blob is malformed, from another format version,
+                or holds a different number of bodies than are registered
+        """
+        try:
+            state = self._read_snapshot(snapshot)
+        except (struct.error, IndexError) as e:
+            raise ValueError(f"Malformed physics snapshot: {e}") from e
+
+        header, body_records, rest_times, islands, pairs, impulses = state
+        _, _, _, accumulator, total_time, step_count, dropped_steps = header
+        bodies = self._bodies
+
+        self._accumulator = accumulator
+        self._total_time = total_time
+        self._step_count = step_count
+        self._dropped_steps = dropped_steps
+
+        for body, record in zip(bodies, body_records):
+            x, y, roll, vx, vy, ax, ay, angular_velocity, fx, fy, torque, flags = record
+            body.x = x
+            body.y = y
+            body.roll = roll
+            body.set_linear_velocity(vx, vy)
+            body.set_linear_acceleration(ax, ay)
+            body.set_angular_velocity(angular_velocity)
+            body.set_force(fx, fy)
+            body.set_torque(torque)
+            enabled = bool(flags & _BODY_ENABLED)
+            if body.enabled != enabled:
+                body.enabled = enabled
+            body.set_sleeping(bool(flags & _BODY_SLEEPING))
+
+            # Static and sleeping bodies aren't re-binned each step
+            self._collision.refresh_body(body)
+
+        self._rest_times = {bodies[index]: rest for index, rest in rest_times}
+        self._previous_positions.clear()
+        self._islands = {}
+        for members in islands:
+            island = [bodies[index] for index in members]
+            for body in island:
+                self._islands[body] = island
+        self._collision.colliding_pairs = [(bodies[a], bodies[b]) for a, b in pairs]
+        self._solver.cached_impulses = {(bodies[a], bodies[b]): impulse for a, b, impulse in impulses}
+
+    def _read_snapshot(self, snapshot: bytes) -> tuple:
+        """Unpack and validate a snapshot blob without applying it.
+
+        Args:
+            snapshot: Blob returned by :meth:`snapshot`
+
+        Returns:
+            Tuple of (header, body records, rest times, islands, pairs, impulses)
+        """
+        header = _SNAPSHOT_HEADER.unpack_from(snapshot, 0)
+        magic, version, body_count = header[:3]
+        if magic != _SNAPSHOT_MAGIC:
+            raise ValueError("Not a physics snapshot")
+        if version != _SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported physics snapshot version: {version}")
+        if body_count != len(self._bodies):
+            raise ValueError(
+                f"Snapshot holds {body_count} bodies but {len(self._bodies)} are registered"
+            )
+        offset = _SNAPSHOT_HEADER.size
+
+        def read(record: struct.Struct, count: int) -> list:
+            nonlocal offset
+            records = [record.unpack_from(snapshot, offset + i * record.size) for i in range(count)]
+            offset += count * record.size
+            return records
+
+        def read_count() -> int:
+            return read(_SNAPSHOT_COUNT, 1)[0][0]
+
+        body_records = read(_SNAPSHOT_BODY, body_count)
+        rest_times = read(_SNAPSHOT_REST_TIME, read_count())
+        islands = []
+        for _ in range(read_count()):
+            length = read_count()
+            islands.append(struct.unpack_from(f'<{length}I', snapshot, offset))
+            offset += length * _SNAPSHOT_COUNT.size
+        pairs = read(_SNAPSHOT_PAIR, read_count())
+        impulses = [(a, b, tuple(impulse)) for a, b, *impulse in read(_SNAPSHOT_IMPULSE, read_count())]
+
+        if offset != len(snapshot):
+            raise ValueError("Physics snapshot has trailing data")
+        referenced = [index for index, _ in rest_times]
+        referenced.extend(index for island in islands for index in island)
+        referenced.extend(index for pair in pairs for index in pair)
+        referenced.extend(index for a, b, _ in impulses for index in (a, b))
+        if any(index >= body_count for index in referenced):
+            raise ValueError("Physics snapshot references a body it doesn't hold")
+        return header, body_records, rest_times, islands, pairs, impulses
+
     # Additional utility methods
 
     def get_stats(self) -> dict:
         """Get physics engine statistics.
 
+        The ``profile`` entry holds the profiler's histograms while
+        profiling is enabled and is None otherwise.
+
         Returns:
             Dictionary with engine statistics
         """
         return {
             'total_time': self._total_time,
             'step_count': self._step_count,
+            'dropped_steps': self._dropped_steps,
             'body_count': len(self._bodies),
             'active_bodies': sum(1 for b in self._bodies if b.enabled and not b.sleeping),
+            'sleeping_bodies': sum(1 for b in self._bodies if b.enabled and b.sleeping),
             'physics_step': self._physics_step,
             'time_scale': self._time_scale,
             'accumulator': self._accumulator,
+            'interpolation_alpha': self.interpolation_alpha,
+            'use_arrays': self._use_arrays,
+            'parallel_islands': self._parallel_islands,
+            'gil_enabled': _gil_enabled(),
+            'profile': self._profiler.to_dict() if self._profiler is not None else None,
         }
 
     def query_bodies_at_point(self, x: float, y: float) -> List[IPhysicsBody2D]:
         """Find all bodies at a given point.
 
+        Uses the collision service's broad phase instead of scanning every body.
+
         Args:
             x: X coordinate
             y: Y coordinate
@@ -406,16 +1120,13 @@ class PhysicsEngineService(IPhysicsEngine):
         Returns:
             List of bodies containing the point
         """
-        result = []
-        for body in self._bodies:
-            min_x, min_y, max_x, max_y = body.get_bounds()
-            if min_x <= x <= max_x and min_y <= y <= max_y:
-                result.append(body)
-        return result
+        return self._collision.query_point(x, y)
 
     def query_bodies_in_area(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[IPhysicsBody2D]:
         """Find all bodies overlapping an area.
 
+        Uses the collision service's broad phase instead of scanning every body.
+
         Args:
             min_x: Minimum X coordinate
             min_y: Minimum Y coordinate
@@ -425,10 +1136,18 @@ class PhysicsEngineService(IPhysicsEngine):
         Returns:
             List of bodies overlapping the area
         """
-        result = []
-        for body in self._bodies:
-            bmin_x, bmin_y, bmax_x, bmax_y = body.get_bounds()
-            # Check AABB overlap
-            if bmax_x >= min_x and bmin_x <= max_x and bmax_y >= min_y and bmin_y <= max_y:
-                result.append(body)
-        return result
+        return self._collision.query_area(min_x, min_y, max_x, max_y)
+
+    def query_bodies_on_ray(self, x1: float, y1: float, x2: float, y2: float) -> List[IPhysicsBody2D]:
+        """Find all bodies crossed by a ray segment, nearest first.
+
+        Args:
+            x1: Ray start X coordinate
+            y1: Ray start Y coordinate
+            x2: Ray end X coordinate
+            y2: Ray end Y coordinate
+
+        Returns:
+            List of bodies hit by the ray, ordered by distance from the start
+        """
+        return [body for body, _ in self._collision.query_ray(x1, y1, x2, y2)]
@@ -0,0 +1,480 @@
+"""Array-backed physics state for vectorized simulation.
+
+Keeps the simulation state of every registered body in one contiguous NumPy
+matrix, so that environmental forces and integration run as whole-array
+passes instead of per-body property calls.
+
+While a body is attached (see ``PhysicsBody2D.set_array_store``), its row
+is the stored state: a step only updates the arrays, and the body copies
+its row into its own fields the next time one of them is read. Writes
+through the body's setters mark the row dirty, and dirty rows are read back
+from the body before the arrays are used again. Edits the body counts in
+its ``revision`` (mass, size, type, material) are picked up the same way.
+
+Bodies that can't be attached are read in full before every step and
+written back through their setters after it.
+"""
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+import numpy as np
+from pyrox.interfaces.protocols.physics import IPhysicsBody2D, BodyType
+
+# Scale area from game units to m² for the drag equation.
+# Game units are roughly pixels, 100 pixels ≈ 1 meter, so 100² = 10,000.
+AREA_SCALE_FACTOR = 0.0001
+
+# Body kind codes stored in the kind column
+KIND_STATIC = 0
+KIND_DYNAMIC = 1
+KIND_KINEMATIC = 2
+
+_KINDS = {
+    BodyType.STATIC: KIND_STATIC,
+    BodyType.DYNAMIC: KIND_DYNAMIC,
+    BodyType.KINEMATIC: KIND_KINEMATIC,
+}
+
+# Column layout of the state matrix
+_COL_X = 0
+_COL_Y = 1
+_COL_VX = 2
+_COL_VY = 3
+_COL_FX = 4
+_COL_FY = 5
+_COL_AX = 6
+_COL_AY = 7
+_COL_MASS = 8
+_COL_INV_MASS = 9
+_COL_DRAG = 10
+_COL_WIDTH = 11
+_COL_HEIGHT = 12
+_COL_ANGULAR_VELOCITY = 13
+_COL_ROLL = 14
+_COL_TORQUE = 15
+_COL_KIND = 16
+_COL_ENABLED = 17
+_COL_SLEEPING = 18
+_COL_BOX = 19
+_NUM_COLS = 20
+
+
+def _gather_row(body: IPhysicsBody2D) -> tuple:
+    """Read one body's simulation state as a flat row.
+
+    Uses the protocol getters directly to skip the property indirection.
+    """
+    vx, vy = body.get_linear_velocity()
+    fx, fy = body.get_force()
+    ax, ay = body.get_linear_acceleration()
+    return (
+        body.get_x(), body.get_y(),
+        vx, vy,
+        fx, fy,
+        ax, ay,
+        body.get_mass(), body.get_inverse_mass(),
+        body.get_material().get_drag(),
+        body.get_width(), body.get_height(),
+        body.get_angular_velocity(),
+        body.get_roll(),
+        body.get_torque(),
+        _KINDS.get(body.get_body_type(), KIND_STATIC),
+        body.get_enabled(),
+        body.get_sleeping(),
+        _has_box_bounds(body),
+    )
+
+
+def _has_box_bounds(body: IPhysicsBody2D) -> bool:
+    """Check whether a body's bounds are its position and size while unrotated."""
+    has_box_bounds = getattr(body, 'has_box_bounds', None)
+    return has_box_bounds is not None and has_box_bounds()
+
+
+def _apply_forces(state: np.ndarray, environment, dt: float) -> None:
+    """Apply gravity and clamped drag to the dynamic rows of a state matrix."""
+    dynamic = state[:, _COL_KIND] == KIND_DYNAMIC
+    if not dynamic.any():
+        return
+
+    gx, gy = environment.gravity
+    mass = state[:, _COL_MASS]
+    vx = state[:, _COL_VX]
+    vy = state[:, _COL_VY]
+
+    # Gravity
+    fx = state[:, _COL_FX] + gx * mass
+    fy = state[:, _COL_FY] + gy * mass
+
+    # Drag: F = 0.5 * rho * v² * Cd * A, opposing velocity
+    speed = np.sqrt(vx * vx + vy * vy)
+    moving = speed >= 0.01
+    safe_speed = np.where(moving, speed, 1.0)
+    area = state[:, _COL_WIDTH] * state[:, _COL_HEIGHT] * AREA_SCALE_FACTOR
+    magnitude = 0.5 * environment.air_density * speed * speed * state[:, _COL_DRAG] * area
+    drag_x = np.where(moving, -magnitude * (vx / safe_speed), 0.0)
+    drag_y = np.where(moving, -magnitude * (vy / safe_speed), 0.0)
+
+    # Clamp drag so it never reverses velocity within one step
+    if dt > 0:
+        finite = state[:, _COL_INV_MASS] > 0
+        max_x = np.abs(mass * vx / dt)
+        max_y = np.abs(mass * vy / dt)
+        over_x = finite & (np.abs(drag_x) > max_x)
+        over_y = finite & (np.abs(drag_y) > max_y)
+        drag_x = np.where(over_x, np.where(vx > 0, -max_x, max_x), drag_x)
+        drag_y = np.where(over_y, np.where(vy > 0, -max_y, max_y), drag_y)
+
+    state[:, _COL_FX] = np.where(dynamic, fx + drag_x, state[:, _COL_FX])
+    state[:, _COL_FY] = np.where(dynamic, fy + drag_y, state[:, _COL_FY])
+
+
+def _integrate(state: np.ndarray, environment, dt: float) -> None:
+    """Integrate the velocities and positions of a state matrix (semi-implicit Euler)."""
+    dynamic = state[:, _COL_KIND] == KIND_DYNAMIC
+    inv_mass = state[:, _COL_INV_MASS]
+    finite = dynamic & (inv_mass > 0)
+
+    # Forces -> acceleration (zero for infinite mass bodies)
+    ax = np.where(finite, state[:, _COL_FX] * inv_mass, 0.0)
+    ay = np.where(finite, state[:, _COL_FY] * inv_mass, 0.0)
+    state[:, _COL_AX] = np.where(dynamic, ax, state[:, _COL_AX])
+    state[:, _COL_AY] = np.where(dynamic, ay, state[:, _COL_AY])
+
+    # Acceleration -> velocity
+    vx = state[:, _COL_VX] + ax * dt
+    vy = state[:, _COL_VY] + ay * dt
+
+    # Terminal velocity clamp
+    terminal = environment.terminal_velocity
+    speed = np.sqrt(vx * vx + vy * vy)
+    scale = np.where(speed > terminal, terminal / np.where(speed > 0, speed, 1.0), 1.0)
+    vx = vx * scale
+    vy = vy * scale
+
+    # Linear damping (per-second retention applied per step)
+    damping_factor = environment.linear_damping ** dt
+    vx = vx * damping_factor
+    vy = vy * damping_factor
+
+    # Snap tiny velocities to zero
+    threshold = environment.velocity_threshold
+    vx = np.where(np.abs(vx) < threshold, 0.0, vx)
+    vy = np.where(np.abs(vy) < threshold, 0.0, vy)
+
+    state[:, _COL_VX] = np.where(finite, vx, state[:, _COL_VX])
+    state[:, _COL_VY] = np.where(finite, vy, state[:, _COL_VY])
+
+    # Forces are consumed by dynamic bodies each step
+    state[:, _COL_FX] = np.where(dynamic, 0.0, state[:, _COL_FX])
+    state[:, _COL_FY] = np.where(dynamic, 0.0, state[:, _COL_FY])
+    state[:, _COL_TORQUE] = np.where(dynamic, 0.0, state[:, _COL_TORQUE])
+
+    # Velocity -> position (dynamic and kinematic)
+    state[:, _COL_X] += state[:, _COL_VX] * dt
+    state[:, _COL_Y] += state[:, _COL_VY] * dt
+
+    # Torque is cleared with the other forces, so rotation follows angular velocity
+    state[:, _COL_ROLL] = np.where(
+        dynamic,
+        state[:, _COL_ROLL] + state[:, _COL_ANGULAR_VELOCITY] * dt,
+        state[:, _COL_ROLL],
+    )
+
+
+class PhysicsBodyArrays:
+    """Structure-of-arrays store of the engine's bodies.
+
+    Every body registered with the engine has a row, in registration
+    order. Each fixed step the engine calls :meth:`prepare` and then
+    :meth:`step`, which runs gravity, clamped drag, terminal-velocity
+    clamping, linear damping, threshold snapping and semi-implicit Euler
+    integration over the rows of enabled, awake, non-static bodies.
+
+    The numerics mirror :meth:`PhysicsEngineService._apply_forces` and
+    :meth:`PhysicsEngineService._integrate` so the two modes are
+    interchangeable.
+
+    Attributes:
+        bodies: Bodies with a row, in row order
+        positions: (n, 2) view of the stored positions
+        velocities: (n, 2) view of the stored velocities
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._bodies: List[IPhysicsBody2D] = []
+        self._rows: Dict[IPhysicsBody2D, int] = {}
+        # Rows live at the front of buffers that grow by doubling, so adding
+        # a body doesn't copy every other row; _state and _revisions are
+        # views of the rows in use
+        self._state_buffer = np.zeros((0, _NUM_COLS), dtype=np.float64)
+        self._revision_buffer = np.zeros(0, dtype=np.int64)
+        self._state = self._state_buffer
+        self._revisions = self._revision_buffer
+        # Bodies whose fields are newer than their row
+        self._dirty: Set[IPhysicsBody2D] = set()
+        # Bodies without array support, read and written back every step
+        self._detached: Set[IPhysicsBody2D] = set()
+        # Bumped by every step; a body whose sync epoch differs is stale
+        self._epoch = 0
+
+    @property
+    def bodies(self) -> List[IPhysicsBody2D]:
+        """Get the bodies with a row, in row order."""
+        return self._bodies.copy()
+
+    @property
+    def count(self) -> int:
+        """Get the number of bodies with a row."""
+        return len(self._bodies)
+
+    @property
+    def epoch(self) -> int:
+        """Get the number of steps run since the store was created."""
+        return self._epoch
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Get an (n, 2) view of the stored positions."""
+        return self._state[:, _COL_X:_COL_Y + 1]
+
+    @property
+    def velocities(self) -> np.ndarray:
+        """Get an (n, 2) view of the stored velocities."""
+        return self._state[:, _COL_VX:_COL_VY + 1]
+
+    def add(self, body: IPhysicsBody2D) -> None:
+        """Give a body a row at the end of the store and attach it.
+
+        Args:
+            body: Body registered with the engine
+        """
+        if body in self._rows:
+            return
+        row = len(self._bodies)
+        if row == len(self._revision_buffer):
+            capacity = max(16, row * 2)
+            state_buffer = np.zeros((capacity, _NUM_COLS), dtype=np.float64)
+            state_buffer[:row] = self._state
+            revision_buffer = np.zeros(capacity, dtype=np.int64)
+            revision_buffer[:row] = self._revisions
+            self._state_buffer = state_buffer
+            self._revision_buffer = revision_buffer
+        self._state_buffer[row] = _gather_row(body)
+        self._revision_buffer[row] = getattr(body, 'revision', 0)
+        self._rows[body] = row
+        self._bodies.append(body)
+        self._state = self._state_buffer[:row + 1]
+        self._revisions = self._revision_buffer[:row + 1]
+
+        set_array_store = getattr(body, 'set_array_store', None)
+        if set_array_store is None:
+            self._detached.add(body)
+        else:
+            set_array_store(self)
+
+    def remove(self, body: IPhysicsBody2D) -> None:
+        """Write a body's row back to it, detach it and drop the row.
+
+        Args:
+            body: Body unregistered from the engine
+        """
+        row = self._rows.get(body)
+        if row is None:
+            return
+        self._detach(body)
+        bodies = self._bodies
+        count = len(bodies) - 1
+        del bodies[row]
+        del self._rows[body]
+        # Close the gap, keeping the remaining rows in registration order
+        self._state_buffer[row:count] = self._state_buffer[row + 1:count + 1]
+        self._revision_buffer[row:count] = self._revision_buffer[row + 1:count + 1]
+        self._state = self._state_buffer[:count]
+        self._revisions = self._revision_buffer[:count]
+        rows = self._rows
+        for index in range(row, count):
+            rows[bodies[index]] = index
+
+    def clear(self) -> None:
+        """Write every row back to its body, detach them all and drop the rows."""
+        for body in self._bodies:
+            self._detach(body)
+        self._bodies = []
+        self._rows = {}
+        self._state = self._state_buffer[:0]
+        self._revisions = self._revision_buffer[:0]
+        self._dirty.clear()
+        self._detached.clear()
+
+    def _detach(self, body: IPhysicsBody2D) -> None:
+        """Bring a body's fields up to date and stop it using the store."""
+        self._dirty.discard(body)
+        if body in self._detached:
+            self._detached.discard(body)
+        else:
+            body.set_array_store(None)
+
+    def sync(self, body: IPhysicsBody2D) -> None:
+        """Copy a body's row into its fields if a step ran since they were last synced.
+
+        Called by attached bodies before any of the fields the store owns
+        is read or written.
+
+        Args:
+            body: Attached body
+        """
+        epoch = self._epoch
+        if body._array_epoch == epoch:
+            return
+        body._array_epoch = epoch
+        row = self._state[self._rows[body]].tolist()
+        body._x = row[_COL_X]
+        body._y = row[_COL_Y]
+        body._velocity_x = row[_COL_VX]
+        body._velocity_y = row[_COL_VY]
+        body._force_x = row[_COL_FX]
+        body._force_y = row[_COL_FY]
+        body._acceleration_x = row[_COL_AX]
+        body._acceleration_y = row[_COL_AY]
+        body._roll = row[_COL_ROLL]
+        body._torque = row[_COL_TORQUE]
+
+    def touch(self, body: IPhysicsBody2D) -> None:
+        """Sync a body about to be written and mark its row dirty.
+
+        Args:
+            body: Attached body
+        """
+        self.sync(body)
+        self._dirty.add(body)
+
+    def mark_dirty(self, body: IPhysicsBody2D) -> None:
+        """Re-read a body into its row before the store is next used.
+
+        Use after changing a body in a way its setters don't report, e.g.
+        swapping the shape of its collider in place.
+
+        Args:
+            body: Body with a row
+        """
+        if body in self._rows and body not in self._detached:
+            self.touch(body)
+
+    def flush(self) -> None:
+        """Read dirty and detached bodies back into their rows."""
+        state = self._state
+        rows = self._rows
+        if self._dirty:
+            dirty = self._dirty
+            self._dirty = set()
+            for body in dirty:
+                state[rows[body]] = _gather_row(body)
+        for body in self._detached:
+            state[rows[body]] = _gather_row(body)
+
+    def prepare(self) -> None:
+        """Bring the rows up to date with edits made since the last step.
+
+        Bodies whose revision changed (mass, size, type, material, ...)
+        are read back in full, as are dirty and detached bodies.
+        """
+        bodies = self._bodies
+        if not bodies:
+            return
+        revisions = np.fromiter(
+            (getattr(body, 'revision', 0) for body in bodies), dtype=np.int64, count=len(bodies),
+        )
+        edited = np.flatnonzero(revisions != self._revisions)
+        if edited.size:
+            self._revisions[:] = revisions
+            for row in edited.tolist():
+                self.mark_dirty(bodies[row])
+        self.flush()
+
+    def step(self, environment, dt: float) -> None:
+        """Simulate one fixed step over the rows of enabled, awake, non-static bodies.
+
+        Call :meth:`prepare` first. Attached bodies become stale and sync
+        on their next read; detached bodies are written back.
+
+        Args:
+            environment: EnvironmentService providing physics constants
+            dt: Fixed timestep duration in seconds
+        """
+        state = self._state
+        simulated = np.flatnonzero(self._simulated_mask())
+        if simulated.size:
+            rows = state[simulated]
+            _apply_forces(rows, environment, dt)
+            _integrate(rows, environment, dt)
+            state[simulated] = rows
+        self._epoch += 1
+
+        if self._detached:
+            self._write_back(self._detached)
+
+    def _simulated_mask(self) -> np.ndarray:
+        """Get which rows belong to enabled, awake, non-static bodies."""
+        state = self._state
+        return (
+            (state[:, _COL_KIND] != KIND_STATIC)
+            & (state[:, _COL_ENABLED] != 0)
+            & (state[:, _COL_SLEEPING] == 0)
+        )
+
+    def _write_back(self, bodies: Set[IPhysicsBody2D]) -> None:
+        """Write detached bodies' rows back through their setters."""
+        state = self._state
+        rows = self._rows
+        for body in bodies:
+            row = state[rows[body]].tolist()
+            body.set_linear_acceleration(row[_COL_AX], row[_COL_AY])
+            body.set_linear_velocity(row[_COL_VX], row[_COL_VY])
+            body.set_force(row[_COL_FX], row[_COL_FY])
+            body.set_torque(row[_COL_TORQUE])
+            body.set_x(row[_COL_X])
+            body.set_y(row[_COL_Y])
+            body.set_roll(row[_COL_ROLL])
+
+    def get_moving_positions(self) -> Dict[IPhysicsBody2D, Tuple[float, float]]:
+        """Get the positions of enabled, awake, non-static bodies, by body."""
+        simulated = np.flatnonzero(self._simulated_mask())
+        bodies = self._bodies
+        positions = self._state[simulated, _COL_X:_COL_Y + 1].tolist()
+        return {bodies[row]: (x, y) for row, (x, y) in zip(simulated.tolist(), positions)}
+
+    def iter_grid_updates(self) -> Iterator[Tuple[IPhysicsBody2D, Optional[Tuple[float, float, float, float]]]]:
+        """Iterate the awake, non-static bodies with their bounds, for the broad phase.
+
+        Bounds are computed from the arrays for unrotated boxes and left as
+        None for other shapes, whose bodies are asked instead. Pairs are
+        made one at a time, so thousands of short-lived tuples don't pile
+        up for the garbage collector.
+
+        Yields:
+            (body, bounds or None), in row order
+        """
+        state = self._state
+        rows = np.flatnonzero((state[:, _COL_KIND] != KIND_STATIC) & (state[:, _COL_SLEEPING] == 0))
+        if not rows.size:
+            return
+        bodies = self._bodies
+        box = ((state[rows, _COL_BOX] != 0) & (state[rows, _COL_ROLL] == 0)).tolist()
+        x = state[rows, _COL_X]
+        y = state[rows, _COL_Y]
+        max_x = (x + state[rows, _COL_WIDTH]).tolist()
+        max_y = (y + state[rows, _COL_HEIGHT]).tolist()
+        for row, is_box, min_x, min_y, right, bottom in zip(rows.tolist(), box, x.tolist(), y.tolist(), max_x, max_y):
+            yield bodies[row], ((min_x, min_y, right, bottom) if is_box else None)
+
+    def get_speeds(self) -> Tuple[List[float], List[float]]:
+        """Get every body's linear speed and absolute angular velocity, in row order.
+
+        Dirty rows are read back first, so changes made since the step
+        (e.g. by collision response) are included.
+        """
+        self.flush()
+        state = self._state
+        vx = state[:, _COL_VX]
+        vy = state[:, _COL_VY]
+        return np.sqrt(vx * vx + vy * vy).tolist(), np.abs(state[:, _COL_ANGULAR_VELOCITY]).tolist()
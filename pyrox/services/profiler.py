@@ -0,0 +1,232 @@
+"""Per-phase timing for the physics step.
+
+Keeps rolling histograms of how long each phase of a fixed physics step
+takes, along with broad-phase candidate and narrow-phase hit counts, so
+the slowest phase of a scene can be found before optimizing it.
+"""
+from bisect import bisect_left
+from collections import deque
+from time import perf_counter
+from typing import Deque, Dict, List, Sequence, Tuple
+
+
+# Bucket upper edges for phase timings, in milliseconds
+DEFAULT_TIME_EDGES_MS: Tuple[float, ...] = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0)
+
+# Bucket upper edges for per-step pair counts
+DEFAULT_COUNT_EDGES: Tuple[float, ...] = (0, 10, 50, 100, 500, 1000, 5000, 10000)
+
+
+class RollingHistogram:
+    """Histogram over a fixed window of the most recent samples.
+
+    Bucket counts are kept up to date as samples are added and evicted, so
+    adding is constant time; percentiles sort the window when asked for.
+    """
+
+    def __init__(
+        self,
+        window: int = 300,
+        edges: Sequence[float] = DEFAULT_TIME_EDGES_MS,
+    ):
+        """Initialize the histogram.
+
+        Args:
+            window: Number of most recent samples to keep
+            edges: Ascending upper edges of the buckets; a final bucket
+                catches everything above the last edge
+
+        Raises:
+            ValueError: If the window is not positive or the edges aren't ascending
+        """
+        if window <= 0:
+            raise ValueError("Window must be positive")
+        if any(b <= a for a, b in zip(edges, edges[1:])):
+            raise ValueError("Bucket edges must be ascending")
+        self._edges = tuple(edges)
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._counts = [0] * (len(self._edges) + 1)
+        self._total = 0.0
+
+    @property
+    def window(self) -> int:
+        """Get the number of samples kept."""
+        return self._samples.maxlen or 0
+
+    @property
+    def edges(self) -> Tuple[float, ...]:
+        """Get the bucket upper edges."""
+        return self._edges
+
+    @property
+    def count(self) -> int:
+        """Get the number of samples in the window."""
+        return len(self._samples)
+
+    @property
+    def last(self) -> float:
+        """Get the most recent sample, or 0.0 if there are none."""
+        return self._samples[-1] if self._samples else 0.0
+
+    @property
+    def mean(self) -> float:
+        """Get the mean of the samples in the window."""
+        return self._total / len(self._samples) if self._samples else 0.0
+
+    @property
+    def max(self) -> float:
+        """Get the largest sample in the window."""
+        return max(self._samples) if self._samples else 0.0
+
+    def add(self, value: float) -> None:
+        """Add a sample, evicting the oldest one if the window is full."""
+        samples = self._samples
+        if len(samples) == samples.maxlen:
+            evicted = samples[0]
+            self._counts[bisect_left(self._edges, evicted)] -= 1
+            self._total -= evicted
+        samples.append(value)
+        self._counts[bisect_left(self._edges, value)] += 1
+        self._total += value
+
+    def percentile(self, percent: float) -> float:
+        """Get a percentile of the samples in the window (nearest rank).
+
+        Args:
+            percent: Percentile from 0 to 100
+        """
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        rank = int(round(percent / 100.0 * (len(ordered) - 1)))
+        return ordered[min(max(rank, 0), len(ordered) - 1)]
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Get (upper edge, count) for every bucket, ending with an infinite edge."""
+        return list(zip(self._edges + (float('inf'),), self._counts))
+
+    def clear(self) -> None:
+        """Drop every sample."""
+        self._samples.clear()
+        self._counts = [0] * (len(self._edges) + 1)
+        self._total = 0.0
+
+    def to_dict(self) -> dict:
+        """Summarize the window for stats output."""
+        return {
+            'count': self.count,
+            'last': self.last,
+            'mean': self.mean,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': self.max,
+            'buckets': self.buckets(),
+        }
+
+
+class PhysicsProfiler:
+    """Rolling per-phase timings and pair counts for the physics step.
+
+    The engine calls :meth:`begin_step` at the start of a fixed step,
+    :meth:`lap` after each phase, and :meth:`end_step` once the step is
+    done. Phase times are in milliseconds.
+
+    Attributes:
+        phases: Timing histogram for each phase in :attr:`PHASES`
+        step_time: Timing histogram for whole steps
+        candidate_pairs: Broad-phase candidate pairs per step
+        narrow_hits: Narrow-phase contacts per step
+        dropped_steps: Fixed steps skipped by the spiral-of-death guard
+    """
+
+    PHASES: Tuple[str, ...] = (
+        'forces', 'integrate', 'grid', 'sweep', 'detect', 'surface', 'resolve', 'update', 'sleep', 'events',
+    )
+
+    def __init__(self, window: int = 300):
+        """Initialize the profiler.
+
+        Args:
+            window: Number of recent steps each histogram covers
+        """
+        self._window = window
+        self.phases: Dict[str, RollingHistogram] = {phase: RollingHistogram(window) for phase in self.PHASES}
+        self.step_time = RollingHistogram(window)
+        self.candidate_pairs = RollingHistogram(window, DEFAULT_COUNT_EDGES)
+        self.narrow_hits = RollingHistogram(window, DEFAULT_COUNT_EDGES)
+        self.dropped_steps = 0
+        self._step_start = 0.0
+        self._mark = 0.0
+
+    @property
+    def window(self) -> int:
+        """Get the number of recent steps each histogram covers."""
+        return self._window
+
+    def begin_step(self) -> None:
+        """Start timing a step."""
+        self._step_start = self._mark = perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Record the time since the previous lap (or the step start) against a phase."""
+        now = perf_counter()
+        self.phases[phase].add((now - self._mark) * 1000.0)
+        self._mark = now
+
+    def end_step(self, candidate_pairs: int, narrow_hits: int) -> None:
+        """Finish timing a step and record its pair counts.
+
+        Args:
+            candidate_pairs: Pairs the broad phase passed to the narrow phase
+            narrow_hits: Contacts the narrow phase found
+        """
+        self.step_time.add((perf_counter() - self._step_start) * 1000.0)
+        self.candidate_pairs.add(candidate_pairs)
+        self.narrow_hits.add(narrow_hits)
+
+    def record_dropped(self, steps: int) -> None:
+        """Count fixed steps the engine skipped to catch up."""
+        self.dropped_steps += steps
+
+    def reset(self) -> None:
+        """Clear every histogram and counter."""
+        for histogram in self.phases.values():
+            histogram.clear()
+        self.step_time.clear()
+        self.candidate_pairs.clear()
+        self.narrow_hits.clear()
+        self.dropped_steps = 0
+
+    def to_dict(self) -> dict:
+        """Summarize every histogram for stats output."""
+        candidates = self.candidate_pairs.mean
+        return {
+            'window': self._window,
+            'phases': {phase: histogram.to_dict() for phase, histogram in self.phases.items()},
+            'step': self.step_time.to_dict(),
+            'candidate_pairs': self.candidate_pairs.to_dict(),
+            'narrow_hits': self.narrow_hits.to_dict(),
+            'hit_ratio': self.narrow_hits.mean / candidates if candidates else 0.0,
+            'dropped_steps': self.dropped_steps,
+        }
+
+    @staticmethod
+    def format_lines(profile: dict) -> List[str]:
+        """Format a profile as short text lines for an on-screen overlay.
+
+        Args:
+            profile: Output of :meth:`to_dict`
+
+        Returns:
+            One line for the whole step, one per timed phase, and one for pair counts
+        """
+        step = profile['step']
+        lines = [f"Step {step['mean']:.2f}ms (p95 {step['p95']:.2f}, max {step['max']:.2f})"]
+        for phase, summary in profile['phases'].items():
+            if summary['count']:
+                lines.append(f"  {phase:<9} {summary['mean']:6.3f}ms  p95 {summary['p95']:6.3f}")
+        lines.append(
+            f"Pairs {profile['candidate_pairs']['mean']:.0f} -> hits {profile['narrow_hits']['mean']:.0f}"
+            f" ({profile['hit_ratio']:.0%}), dropped {profile['dropped_steps']}"
+        )
+        return lines
@@ -0,0 +1,377 @@
+"""Recorded-input replay for regression runs of scenes.
+
+An :class:`InputRecorder` logs every value a scene bridge applies from its
+source (e.g. a :class:`KeyboardSource`) to the scene, stamped with the
+physics engine's fixed-step index, along with a trajectory of scene object
+positions. An :class:`InputReplayer` rebuilds the scene from the recording,
+feeds the same values back headless at the same steps, and reports the
+wall time and the first step whose positions diverge from the recording.
+
+Example:
+    recorder = InputRecorder(bridge, engine)
+    recorder.start()
+    ...  # Run the scene as usual
+    recorder.stop().save('jam.replay.json')
+
+    result = InputReplayer(InputRecording.load('jam.replay.json')).run()
+    print(result.wall_time, result.divergence)
+"""
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from pyrox.interfaces import IScene, ISceneBinding, ISceneBridge
+from pyrox.services import environment as env
+from pyrox.services import physics
+from pyrox.services.scene import HeadlessSceneRunner
+
+
+@dataclass
+class InputEvent:
+    """A value applied to a scene object property.
+
+    Attributes:
+        step: Fixed-step index the value was applied after
+        object_id: ID of the scene object the value was applied to
+        property_path: Dot-separated property path on the scene object
+        value: Value written to the scene (after any binding transform)
+    """
+    step: int
+    object_id: str
+    property_path: str
+    value: Any
+
+
+@dataclass
+class InputRecording:
+    """Inputs and positions recorded from a scene run.
+
+    Attributes:
+        scene_data: Scene in its ``Scene.to_dict`` form when recording started
+        physics_step: Fixed physics timestep of the recorded engine
+        steps: Number of fixed steps recorded
+        events: Applied input values, in the order they were applied
+        trajectory: Positions of scene objects by step, as ``{object_id: (x, y)}``
+    """
+    scene_data: dict
+    physics_step: float
+    steps: int = 0
+    events: List[InputEvent] = field(default_factory=list)
+    trajectory: Dict[int, Dict[str, Tuple[float, float]]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """Convert the recording to a JSON-serializable dictionary."""
+        return {
+            'scene_data': self.scene_data,
+            'physics_step': self.physics_step,
+            'steps': self.steps,
+            'events': [
+                [event.step, event.object_id, event.property_path, event.value]
+                for event in self.events
+            ],
+            'trajectory': {
+                str(step): {object_id: list(position) for object_id, position in positions.items()}
+                for step, positions in self.trajectory.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'InputRecording':
+        """Create a recording from its dictionary form.
+
+        Args:
+            data: Dictionary created by :meth:`to_dict`
+        """
+        return cls(
+            scene_data=data['scene_data'],
+            physics_step=data['physics_step'],
+            steps=data.get('steps', 0),
+            events=[InputEvent(*event) for event in data.get('events', [])],
+            trajectory={
+                int(step): {object_id: (position[0], position[1]) for object_id, position in positions.items()}
+                for step, positions in data.get('trajectory', {}).items()
+            },
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the recording to a JSON file."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'InputRecording':
+        """Read a recording from a JSON file."""
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+
+class InputRecorder:
+    """Record the values a scene bridge applies to its scene, and the scene's trajectory.
+
+    Values are logged when they change, whether they arrive through the
+    bridge's tick, a pushed source update or a poll. Positions of every
+    scene object are sampled every ``trajectory_interval`` fixed steps.
+
+    Recording captures the scene through ``Scene.to_dict`` when it starts,
+    so start it before running the scene, or while the state that
+    ``to_dict`` doesn't hold (velocities, contacts) is at rest.
+    """
+
+    def __init__(
+        self,
+        bridge: ISceneBridge,
+        physics_engine: physics.PhysicsEngineService,
+        trajectory_interval: int = 1,
+    ):
+        """Initialize the recorder.
+
+        Args:
+            bridge: Bridge whose source-to-scene values are recorded
+            physics_engine: Engine stepping the bridge's scene
+            trajectory_interval: Fixed steps between trajectory samples
+
+        Raises:
+            ValueError: If the trajectory interval is not positive
+        """
+        if trajectory_interval <= 0:
+            raise ValueError("Trajectory interval must be positive")
+        self._bridge = bridge
+        self._physics_engine = physics_engine
+        self._trajectory_interval = trajectory_interval
+        self._scene: IScene | None = None
+        self._recording: InputRecording | None = None
+        self._start_step = 0
+        self._last_values: Dict[Tuple[str, str], Any] = {}
+
+    @property
+    def recording(self) -> InputRecording | None:
+        """Get the recording in progress or last finished, or None before the first start."""
+        return self._recording
+
+    @property
+    def active(self) -> bool:
+        """Whether the recorder is currently recording."""
+        return self._scene is not None
+
+    def start(self) -> InputRecording:
+        """Start a new recording.
+
+        Returns:
+            The recording that will be filled in
+
+        Raises:
+            RuntimeError: If already recording or the bridge has no scene
+        """
+        if self._scene is not None:
+            raise RuntimeError("Recorder is already recording")
+        scene = self._bridge.get_scene()
+        if scene is None:
+            raise RuntimeError("Cannot record a bridge without a scene")
+
+        self._scene = scene
+        self._start_step = self._physics_engine.step_count
+        self._last_values.clear()
+        self._recording = InputRecording(
+            scene_data=scene.to_dict(),
+            physics_step=self._physics_engine.get_physics_step(),
+        )
+        self._sample(0)
+        self._bridge.on_source_applied.append(self._on_source_applied)
+        scene.on_scene_updated.append(self._on_scene_updated)
+        return self._recording
+
+    def stop(self) -> InputRecording:
+        """Stop recording.
+
+        Returns:
+            The finished recording
+
+        Raises:
+            RuntimeError: If not recording
+        """
+        scene = self._scene
+        if scene is None or self._recording is None:
+            raise RuntimeError("Recorder is not recording")
+
+        if self._on_source_applied in self._bridge.on_source_applied:
+            self._bridge.on_source_applied.remove(self._on_source_applied)
+        if self._on_scene_updated in scene.on_scene_updated:
+            scene.on_scene_updated.remove(self._on_scene_updated)
+        self._scene = None
+        self._recording.steps = self._current_step()
+        return self._recording
+
+    def _current_step(self) -> int:
+        """Get the fixed-step index relative to the start of the recording."""
+        return self._physics_engine.step_count - self._start_step
+
+    def _on_source_applied(self, binding: ISceneBinding, value: Any) -> None:
+        """Log a value applied by the bridge if it changed."""
+        target = (binding.object_id, binding.property_path)
+        if target in self._last_values and self._last_values[target] == value:
+            return
+        self._last_values[target] = value
+        self._recording.events.append(  # type: ignore
+            InputEvent(self._current_step(), binding.object_id, binding.property_path, value)
+        )
+
+    def _on_scene_updated(self, *_) -> None:
+        """Sample positions on steps that fall on the trajectory interval."""
+        step = self._current_step()
+        self._recording.steps = step  # type: ignore
+        if step % self._trajectory_interval == 0 and step not in self._recording.trajectory:  # type: ignore
+            self._sample(step)
+
+    def _sample(self, step: int) -> None:
+        """Record the position of every scene object at a step."""
+        self._recording.trajectory[step] = {  # type: ignore
+            object_id: (scene_object.x, scene_object.y)
+            for object_id, scene_object in self._scene.get_scene_objects().items()  # type: ignore
+        }
+
+
+@dataclass
+class ReplayDivergence:
+    """Where a replay first left the recorded trajectory.
+
+    Attributes:
+        step: First fixed step whose positions differ
+        object_id: Scene object whose position differs
+        expected: Recorded position
+        actual: Replayed position, or None if the object is missing
+    """
+    step: int
+    object_id: str
+    expected: Tuple[float, float]
+    actual: Optional[Tuple[float, float]]
+
+
+@dataclass
+class ReplayResult:
+    """Summary of a replay.
+
+    Attributes:
+        steps: Number of fixed steps replayed
+        simulated_time: Simulated seconds covered
+        wall_time: Wall-clock seconds the replay took
+        events_applied: Number of recorded input values fed back
+        divergence: First divergence from the recorded trajectory, or None
+    """
+    steps: int = 0
+    simulated_time: float = 0.0
+    wall_time: float = 0.0
+    events_applied: int = 0
+    divergence: Optional[ReplayDivergence] = None
+
+    @property
+    def matched(self) -> bool:
+        """Whether the replay followed the recorded trajectory."""
+        return self.divergence is None
+
+    @property
+    def realtime_factor(self) -> float:
+        """Simulated seconds per wall-clock second."""
+        if self.wall_time <= 0.0:
+            return float('inf') if self.simulated_time > 0.0 else 0.0
+        return self.simulated_time / self.wall_time
+
+
+class InputReplayer:
+    """Replay a recording headless and compare it to the recorded trajectory.
+
+    The scene is rebuilt from the recording and stepped one fixed step per
+    frame; inputs recorded after step N are applied before step N + 1, as
+    they were when recorded.
+    """
+
+    def __init__(
+        self,
+        recording: InputRecording,
+        environment: env.EnvironmentService | None = None,
+        tolerance: float = 1e-9,
+    ):
+        """Initialize the replayer.
+
+        Args:
+            recording: Recording to replay
+            environment: Environment to simulate in (should match the
+                recorded one; creates a default one if None)
+            tolerance: Largest position difference not counted as a divergence
+        """
+        self._recording = recording
+        self._environment = environment
+        self._tolerance = tolerance
+
+    @property
+    def recording(self) -> InputRecording:
+        """Get the recording being replayed."""
+        return self._recording
+
+    def run(self, stop_on_divergence: bool = True) -> ReplayResult:
+        """Replay the recording.
+
+        Args:
+            stop_on_divergence: End the replay at the first divergence
+                instead of running every recorded step
+
+        Returns:
+            Timing and divergence of the replay
+        """
+        # Imported here so the models package (and its body templates) only
+        # loads when a replay is run
+        from pyrox.models.scene import Scene, SceneBridge
+
+        recording = self._recording
+        scene = Scene.from_dict(recording.scene_data)
+        engine = physics.PhysicsEngineService(
+            environment=self._environment or env.EnvironmentService(),
+            physics_step=recording.physics_step,
+        )
+        runner = HeadlessSceneRunner(scene, physics_engine=engine, frame_time=recording.physics_step)
+
+        # Recorded values are already transformed, so they go straight to the scene
+        bridge = SceneBridge(scene)
+        for object_id, property_path in dict.fromkeys((e.object_id, e.property_path) for e in recording.events):
+            bridge.add_binding('replay', object_id, property_path)
+
+        result = ReplayResult()
+        events = recording.events
+        next_event = 0
+        start = time.perf_counter()
+        try:
+            step = 0
+            result.divergence = self._compare(scene, step)
+            while step < recording.steps and not (result.divergence and stop_on_divergence):
+                while next_event < len(events) and events[next_event].step <= step:
+                    event = events[next_event]
+                    bridge.handle_source_update('replay', event.value, event.object_id, event.property_path)
+                    next_event += 1
+                runner.step()
+                step += 1
+                if result.divergence is None:
+                    result.divergence = self._compare(scene, step)
+        finally:
+            result.wall_time = time.perf_counter() - start
+            runner.close()
+            engine.shutdown()
+
+        result.steps = step
+        result.simulated_time = step * recording.physics_step
+        result.events_applied = next_event
+        return result
+
+    def _compare(self, scene: IScene, step: int) -> Optional[ReplayDivergence]:
+        """Compare the scene to the recorded trajectory at a step, if one was sampled."""
+        expected_positions = self._recording.trajectory.get(step)
+        if not expected_positions:
+            return None
+        tolerance = self._tolerance
+        for object_id, expected in expected_positions.items():
+            scene_object = scene.get_scene_object(object_id)
+            if scene_object is None:
+                return ReplayDivergence(step, object_id, expected, None)
+            actual = (scene_object.x, scene_object.y)
+            if abs(actual[0] - expected[0]) > tolerance or abs(actual[1] - expected[1]) > tolerance:
+                return ReplayDivergence(step, object_id, expected, actual)
+        return None
@@ -2,6 +2,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import auto
 import importlib
+import threading
+import time
 from typing import Any, Callable
 import json
 from pathlib import Path
@@ -14,7 +16,7 @@ from pyrox.interfaces import (
     ISceneRunnerService,
 )
 
-from pyrox.services import TkGuiManager, log, physics
+from pyrox.services import TkGuiManager, log, physics, scene_binary
 from pyrox.services import environment as env
 from pyrox.services.bus import EventBus, Event, EventType
 from pyrox.services.file import get_open_file, get_save_file
@@ -334,6 +336,7 @@ class SceneRunnerService(
     _enable_physics: bool = False
     _update_interval_ms: int = 16
     _current_time = datetime.now().timestamp()
+    _reach_margin: float = 100.0  # Built around moving bodies of lazily loaded scenes
 
     # Objects and services
     _scene: IScene | None = None
@@ -381,7 +384,8 @@ class SceneRunnerService(
             importlib.reload(env)
             cls.set_environment(environment or env.EnvironmentService())
             cls.set_physics_engine(physics_engine or physics.PhysicsEngineService(
-                environment=cls._environment
+                environment=cls._environment,
+                interpolation=True,
             ))
         else:
             cls.set_environment(None)
@@ -444,12 +448,27 @@ class SceneRunnerService(
     @classmethod
     def load_scene(
         cls,
-        filepath: str | Path | None = None
+        filepath: str | Path | None = None,
+        lazy: bool = False,
     ) -> None:
+        """Load a scene from a JSON or binary scene file and make it current.
+
+        Args:
+            filepath: Scene file to load (asks for one if None)
+            lazy: Only index the scene's objects, building each one when it
+                is first asked for, comes into view, or comes within the
+                reach margin of a moving body while running
+                (see ``Scene.from_dict`` and ``Scene.materialize_reachable``)
+        """
         if not filepath:
             filepath = get_open_file(
                 title="Load Scene",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+                filetypes=[
+                    ("Scene files", f"*.json *{scene_binary.SUFFIX}"),
+                    ("JSON files", "*.json"),
+                    ("Binary scene files", f"*{scene_binary.SUFFIX}"),
+                    ("All files", "*.*"),
+                ]
             )
             if not filepath:
                 log(cls).info("Scene load cancelled")
@@ -460,12 +479,11 @@ class SceneRunnerService(
             return
 
         filepath = Path(filepath)
-        with open(filepath, 'r') as f:
-            from pyrox.models.scene import Scene
-            data = json.load(f)
-            scene = Scene.from_dict(data)
-            cls._last_scene_filepath = filepath
-            cls.set_scene(scene)
+        from pyrox.models.scene import Scene
+        data = scene_binary.load_file(filepath)
+        scene = Scene.from_dict(data, lazy=lazy)
+        cls._last_scene_filepath = filepath
+        cls.set_scene(scene)
 
     @classmethod
     def save_scene(
@@ -478,7 +496,11 @@ class SceneRunnerService(
 
         if not filepath:
             filepath = get_save_file(
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+                filetypes=[
+                    ("JSON files", "*.json"),
+                    ("Binary scene files", f"*{scene_binary.SUFFIX}"),
+                    ("All files", "*.*"),
+                ]
             )
             if not filepath:
                 log(cls).info("Scene save cancelled")
@@ -486,8 +508,7 @@ class SceneRunnerService(
 
         filepath = Path(filepath)
         data = cls._scene.to_dict()
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=4)
+        scene_binary.save_file(filepath, data, indent=4)
 
         SceneEventBus.publish(SceneEvent(
             event_type=SceneEventType.SCENE_SAVED,
@@ -619,6 +640,7 @@ class SceneRunnerService(
 
         # Update physics (if enabled)
         if cls._enable_physics and cls._physics_engine:
+            _materialize_reachable(cls._scene, cls._reach_margin)
             cls._physics_engine.step(time_delta)
 
         # Update scene
@@ -630,6 +652,60 @@ class SceneRunnerService(
             lambda: cls._run_scene()
         )
 
+    @classmethod
+    def run_headless(
+        cls,
+        duration: float | None = None,
+        frames: int | None = None,
+        realtime_factor: float | None = None,
+        stop_condition: Callable[['HeadlessSceneRunner'], bool] | None = None,
+    ) -> 'HeadlessRunResult':
+        """Run the current scene without the GUI event loop.
+
+        Steps the service's physics engine and scene in a tight loop on the
+        calling thread. See :class:`HeadlessSceneRunner` for the arguments.
+
+        Returns:
+            Summary of the run
+
+        Raises:
+            RuntimeError: If no scene is loaded or the GUI runner is running
+        """
+        if not cls._scene:
+            raise RuntimeError("No scene loaded to run headless")
+        if cls._running:
+            raise RuntimeError("Scene runner is already running")
+
+        runner = HeadlessSceneRunner(
+            scene=cls._scene,
+            physics_engine=cls._physics_engine if cls._enable_physics else None,
+            register_bodies=False,
+            reach_margin=cls._reach_margin,
+        )
+        return runner.run(
+            duration=duration,
+            frames=frames,
+            realtime_factor=realtime_factor,
+            stop_condition=stop_condition,
+        )
+
+    @classmethod
+    def get_reach_margin(cls) -> float:
+        """Get the distance built around moving bodies of a lazily loaded scene each frame."""
+        return cls._reach_margin
+
+    @classmethod
+    def set_reach_margin(cls, margin: float) -> None:
+        """Set the distance built around moving bodies of a lazily loaded scene each frame.
+
+        Args:
+            margin: Distance in scene units; it should exceed how far a body
+                travels in one frame (see ``Scene.materialize_reachable``)
+        """
+        if margin < 0.0:
+            raise ValueError("Reach margin cannot be negative")
+        cls._reach_margin = margin
+
     @classmethod
     def get_update_rate(cls) -> float:
         """Get the current update rate in frames per second.
@@ -666,12 +742,15 @@ class SceneRunnerService(
             cls._physics_engine.register_body(body)
 
     @classmethod
-    def remove_physics_body(cls, body) -> None:
+    def remove_physics_body(cls, body: IPhysicsBody2D | ISceneObject) -> None:
         """Remove a physics body from the simulation.
 
         Args:
             body: Object to remove
         """
+        if isinstance(body, ISceneObject):
+            body = body.physics_body
+
         if cls._physics_engine:
             cls._physics_engine.unregister_body(body)
 
@@ -685,3 +764,225 @@ class SceneRunnerService(
         if cls._physics_engine:
             return cls._physics_engine.get_stats()
         return {}
+
+
+@dataclass
+class HeadlessRunResult:
+    """Summary of a headless scene run.
+
+    Attributes:
+        frames: Number of frames stepped
+        simulated_time: Simulated seconds covered by the run
+        wall_time: Wall-clock seconds the run took
+        stopped: Whether the run ended early through stop() or its stop condition
+    """
+    frames: int = 0
+    simulated_time: float = 0.0
+    wall_time: float = 0.0
+    stopped: bool = False
+
+    @property
+    def realtime_factor(self) -> float:
+        """Simulated seconds per wall-clock second."""
+        if self.wall_time <= 0.0:
+            return float('inf') if self.simulated_time > 0.0 else 0.0
+        return self.simulated_time / self.wall_time
+
+
+class HeadlessSceneRunner:
+    """Run a scene without a GUI, as fast as possible or at a multiple of real time.
+
+    Unlike :class:`SceneRunnerService`, which paces frames through the Tk
+    event loop, this steps the physics engine and ``Scene.update`` with a
+    fixed frame time in a plain loop. Each runner owns its scene and engine,
+    so separate runners can be used from worker threads or subprocesses.
+
+    Lazily loaded scenes are built as the simulation needs them: moving
+    bodies first, then whatever comes within ``reach_margin`` of them.
+
+    Example:
+        runner = HeadlessSceneRunner(scene)
+        result = runner.run(duration=3600.0)  # An hour of simulated time
+        print(result.realtime_factor)
+    """
+
+    def __init__(
+        self,
+        scene: IScene,
+        physics_engine: physics.PhysicsEngineService | None = None,
+        environment: env.EnvironmentService | None = None,
+        enable_physics: bool = True,
+        frame_time: float | None = None,
+        register_bodies: bool = True,
+        reach_margin: float = 100.0,
+    ):
+        """Initialize the runner.
+
+        Args:
+            scene: The scene to run
+            physics_engine: Physics engine to step (creates one if None and
+                enable_physics is True)
+            environment: Environment for a created physics engine
+            enable_physics: Whether to step physics at all
+            frame_time: Simulated seconds per frame (defaults to the physics
+                step, or 1/60 without physics)
+            register_bodies: Register the scene's physics bodies with the
+                engine and follow objects added to or removed from the scene
+            reach_margin: Distance built around moving bodies of a lazily
+                loaded scene each frame (see ``Scene.materialize_reachable``)
+        """
+        self._scene = scene
+        self._reach_margin = reach_margin
+        if physics_engine is None and enable_physics:
+            physics_engine = physics.PhysicsEngineService(environment=environment or env.EnvironmentService())
+        self._physics_engine = physics_engine if enable_physics else None
+
+        if frame_time is None:
+            frame_time = self._physics_engine.get_physics_step() if self._physics_engine else 1.0 / 60.0
+        if frame_time <= 0.0:
+            raise ValueError("Frame time must be positive")
+        self._frame_time = frame_time
+
+        self._frames = 0
+        self._simulated_time = 0.0
+        self._stop_event = threading.Event()
+
+        self._bound = False
+        if register_bodies and self._physics_engine:
+            for scene_object in scene.get_scene_objects().values():
+                self._add_physics_body(scene_object)
+            scene.on_scene_object_added.append(self._add_physics_body)
+            scene.on_scene_object_removed.append(self._remove_physics_body)
+            self._bound = True
+
+    @property
+    def scene(self) -> IScene:
+        """Get the scene being run."""
+        return self._scene
+
+    @property
+    def physics_engine(self) -> physics.PhysicsEngineService | None:
+        """Get the physics engine, or None if physics is disabled."""
+        return self._physics_engine
+
+    @property
+    def frame_time(self) -> float:
+        """Get the simulated seconds per frame."""
+        return self._frame_time
+
+    @property
+    def frames(self) -> int:
+        """Get the number of frames stepped so far."""
+        return self._frames
+
+    @property
+    def simulated_time(self) -> float:
+        """Get the simulated seconds stepped so far."""
+        return self._simulated_time
+
+    def step(self) -> None:
+        """Advance the scene by one frame."""
+        frame_time = self._frame_time
+        if self._physics_engine:
+            _materialize_reachable(self._scene, self._reach_margin)
+            self._physics_engine.step(frame_time)
+        self._scene.update(frame_time)
+        self._frames += 1
+        self._simulated_time = self._frames * frame_time
+
+    def run(
+        self,
+        duration: float | None = None,
+        frames: int | None = None,
+        realtime_factor: float | None = None,
+        stop_condition: Callable[['HeadlessSceneRunner'], bool] | None = None,
+    ) -> HeadlessRunResult:
+        """Step the scene until a limit is reached or the run is stopped.
+
+        Args:
+            duration: Simulated seconds to run for
+            frames: Number of frames to run for
+            realtime_factor: Pace the run at this multiple of real time
+                (None or 0 runs as fast as possible)
+            stop_condition: Called after each frame; the run ends when it
+                returns True
+
+        Returns:
+            Summary of this run
+
+        Raises:
+            ValueError: If no limit or stop condition is given, or the
+                realtime factor is negative
+        """
+        if duration is None and frames is None and stop_condition is None:
+            raise ValueError("A duration, frame count or stop condition is required")
+        if realtime_factor is not None and realtime_factor < 0.0:
+            raise ValueError("Realtime factor cannot be negative")
+
+        target_frames = frames
+        if duration is not None:
+            duration_frames = int(round(duration / self._frame_time))
+            target_frames = duration_frames if target_frames is None else min(target_frames, duration_frames)
+
+        self._stop_event.clear()
+        start_frames = self._frames
+        stopped = False
+        start = time.perf_counter()
+        step = self.step
+        while target_frames is None or self._frames - start_frames < target_frames:
+            if self._stop_event.is_set():
+                stopped = True
+                break
+
+            step()
+
+            if stop_condition is not None and stop_condition(self):
+                stopped = True
+                break
+
+            if realtime_factor:
+                # Sleep off any lead over the paced schedule
+                scheduled = (self._frames - start_frames) * self._frame_time / realtime_factor
+                ahead = scheduled - (time.perf_counter() - start)
+                if ahead > 0.0:
+                    time.sleep(ahead)
+
+        run_frames = self._frames - start_frames
+        return HeadlessRunResult(
+            frames=run_frames,
+            simulated_time=run_frames * self._frame_time,
+            wall_time=time.perf_counter() - start,
+            stopped=stopped,
+        )
+
+    def stop(self) -> None:
+        """Stop a run in progress after its current frame. Safe to call from another thread."""
+        self._stop_event.set()
+
+    def close(self) -> None:
+        """Stop following the scene's object changes."""
+        if self._bound:
+            if self._add_physics_body in self._scene.on_scene_object_added:
+                self._scene.on_scene_object_added.remove(self._add_physics_body)
+            if self._remove_physics_body in self._scene.on_scene_object_removed:
+                self._scene.on_scene_object_removed.remove(self._remove_physics_body)
+            self._bound = False
+
+    def _add_physics_body(self, scene_object: ISceneObject) -> None:
+        """Register a scene object's physics body with the engine."""
+        if not isinstance(scene_object.physics_body, IPhysicsBody2D):
+            raise TypeError("Scene object physics body does not implement IPhysicsBody2D protocol")
+        if self._physics_engine:
+            self._physics_engine.register_body(scene_object.physics_body)
+
+    def _remove_physics_body(self, scene_object: ISceneObject) -> None:
+        """Unregister a scene object's physics body from the engine."""
+        if self._physics_engine:
+            self._physics_engine.unregister_body(scene_object.physics_body)
+
+
+def _materialize_reachable(scene: IScene, margin: float) -> None:
+    """Build the parts of a lazily loaded scene that physics is about to need."""
+    materialize_reachable = getattr(scene, 'materialize_reachable', None)
+    if materialize_reachable is not None:
+        materialize_reachable(margin)
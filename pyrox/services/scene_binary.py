@@ -0,0 +1,462 @@
+"""Compact binary encoding of scene dictionaries.
+
+Encodes the dictionary produced by ``Scene.to_dict`` so that
+``loads(dumps(data)) == data``. Scene objects are grouped by the layout
+of their dictionaries (the nested keys, in order), and each group stores
+its values column by column: numbers and booleans as packed arrays,
+strings as indices into a single deduplicated string table, and anything
+else (lists, mixed types) as one JSON array per column. A plant scene of thousands of
+crates is then one group whose ``x`` column is a single float array.
+
+The encoded payload can optionally be compressed with lzma or zstd (zstd
+needs Python 3.14's ``compression.zstd`` or the ``zstandard`` package).
+
+:func:`save_file` and :func:`load_file` read and write scene files in
+either format; binary files are recognized by their header, so loading
+needs no hint.
+
+Example:
+    blob = scene_binary.dumps(scene.to_dict(), compression='lzma')
+    data = scene_binary.loads(blob)
+"""
+import json
+import lzma
+from pathlib import Path
+import struct
+from typing import Any, Dict, List, Tuple
+import numpy as np
+
+
+MAGIC = b'PXSC'
+VERSION = 1
+SUFFIX = '.pxscene'
+
+COMPRESSION_NONE = 'none'
+COMPRESSION_LZMA = 'lzma'
+COMPRESSION_ZSTD = 'zstd'
+COMPRESSIONS: Tuple[str, ...] = (COMPRESSION_NONE, COMPRESSION_LZMA, COMPRESSION_ZSTD)
+
+_HEADER = struct.Struct('<4sHB')
+_COUNT = struct.Struct('<I')
+_COLUMN_TYPE = struct.Struct('<B')
+
+# Column types
+_NONE = 0  # Every value is None, nothing stored
+_FLOAT = 1  # float64 per row
+_INT = 2  # int64 per row
+_BOOL = 3  # uint8 per row
+_STR = 4  # uint32 string table index per row, _NULL_INDEX for None
+_JSON = 5  # Length-prefixed JSON array of the column's values
+
+_NULL_INDEX = 0xFFFFFFFF
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+# A layout is a tuple of (key, child layout) entries, with None as the
+# child of a leaf value
+Layout = Tuple[Tuple[str, Any], ...]
+
+
+def is_binary_scene(data: bytes) -> bool:
+    """Check whether data starts with a binary scene header.
+
+    Args:
+        data: Leading bytes of a file or blob (at least 4 bytes)
+
+    Returns:
+        True if the data is a binary scene
+    """
+    return data[:len(MAGIC)] == MAGIC
+
+
+def dumps(data: Dict[str, Any], compression: str = COMPRESSION_NONE) -> bytes:
+    """Encode a scene dictionary.
+
+    Args:
+        data: Scene dictionary, as created by ``Scene.to_dict``
+        compression: One of :data:`COMPRESSIONS`
+
+    Returns:
+        Encoded scene
+
+    Raises:
+        ValueError: If the compression is unknown
+        ImportError: If zstd is requested but not available
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown scene compression '{compression}', expected one of {COMPRESSIONS}")
+
+    strings = _StringTable()
+    scene_objects: List[dict] = data.get('scene_objects', [])
+    meta = {key: value for key, value in data.items() if key != 'scene_objects'}
+
+    # Group rows by layout, keeping each row's index to restore the order
+    groups: Dict[Layout, Tuple[List[int], List[List[Any]]]] = {}
+    for index, scene_object in enumerate(scene_objects):
+        leaves: List[Any] = []
+        indices, rows = groups.setdefault(_flatten(scene_object, leaves), ([], []))
+        indices.append(index)
+        rows.append(leaves)
+
+    parts = [
+        _pack_str(json.dumps(meta)),
+        _COUNT.pack(len(scene_objects)),
+        _COUNT.pack(len(groups)),
+    ]
+    for layout, (indices, rows) in groups.items():
+        parts.append(_pack_str(json.dumps(_layout_to_json(layout))))
+        parts.append(_COUNT.pack(len(indices)))
+        parts.append(np.asarray(indices, dtype='<u4').tobytes())
+        for column in zip(*rows):
+            parts.append(_pack_column(column, strings))
+
+    payload = strings.pack() + b''.join(parts)
+    return _HEADER.pack(MAGIC, VERSION, COMPRESSIONS.index(compression)) + _compress(payload, compression)
+
+
+def loads(blob: bytes) -> Dict[str, Any]:
+    """Decode a scene dictionary.
+
+    Args:
+        blob: Data created by :func:`dumps`
+
+    Returns:
+        Scene dictionary, equal to the one that was encoded
+
+    Raises:
+        ValueError: If the data is not a binary scene, is a newer version
+            or is truncated
+        ImportError: If the data is zstd compressed and zstd is not available
+    """
+    if len(blob) < _HEADER.size or not is_binary_scene(blob):
+        raise ValueError("Not a binary scene")
+    _, version, compression_index = _HEADER.unpack_from(blob)
+    if version != VERSION:
+        raise ValueError(f"Unsupported binary scene version {version}")
+    if compression_index >= len(COMPRESSIONS):
+        raise ValueError(f"Unknown binary scene compression {compression_index}")
+    payload = _decompress(blob[_HEADER.size:], COMPRESSIONS[compression_index])
+
+    try:
+        return _Reader(payload).read_scene()
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"Truncated or corrupt binary scene: {e}") from e
+
+
+def save_file(
+    filepath: str | Path,
+    data: Dict[str, Any],
+    binary: bool | None = None,
+    compression: str = COMPRESSION_NONE,
+    indent: int | None = 2,
+) -> None:
+    """Write a scene dictionary to a file.
+
+    Args:
+        filepath: Path to write
+        data: Scene dictionary, as created by ``Scene.to_dict``
+        binary: Write the binary format (defaults to binary for files
+            ending in :data:`SUFFIX`, JSON otherwise)
+        compression: Compression of the binary format, one of :data:`COMPRESSIONS`
+        indent: JSON indentation (ignored for the binary format)
+    """
+    filepath = Path(filepath)
+    if binary is None:
+        binary = filepath.suffix == SUFFIX
+    if binary:
+        filepath.write_bytes(dumps(data, compression))
+    else:
+        with open(filepath, 'w') as f:
+            json.dump(data, f, indent=indent)
+
+
+def load_file(filepath: str | Path) -> Dict[str, Any]:
+    """Read a scene dictionary from a binary or JSON file.
+
+    Args:
+        filepath: Path to read
+
+    Returns:
+        Scene dictionary
+    """
+    raw = Path(filepath).read_bytes()
+    if is_binary_scene(raw):
+        return loads(raw)
+    return json.loads(raw)
+
+
+def zstd_available() -> bool:
+    """Check whether zstd compression can be used."""
+    try:
+        _zstd()
+    except ImportError:
+        return False
+    return True
+
+
+class _StringTable:
+    """Deduplicated strings, referenced by index."""
+
+    def __init__(self):
+        self._indices: Dict[str, int] = {}
+
+    def index(self, value: str) -> int:
+        """Get the index of a string, adding it if new."""
+        index = self._indices.get(value)
+        if index is None:
+            index = self._indices[value] = len(self._indices)
+        return index
+
+    def pack(self) -> bytes:
+        """Encode the table as a count, the byte length of each string and the strings."""
+        encoded = [value.encode('utf-8') for value in self._indices]
+        return (
+            _COUNT.pack(len(encoded))
+            + np.asarray([len(value) for value in encoded], dtype='<u4').tobytes()
+            + b''.join(encoded)
+        )
+
+
+def _flatten(value: dict, leaves: List[Any]) -> Layout:
+    """Get the nested key layout of a dictionary, collecting its leaf values.
+
+    Non-empty dictionaries are descended into; anything else (including
+    empty dictionaries) is a leaf.
+
+    Args:
+        value: Dictionary to flatten
+        leaves: List the leaf values are appended to, in layout order
+
+    Returns:
+        The dictionary's layout
+    """
+    layout = []
+    for key, child in value.items():
+        if type(child) is dict and child:
+            layout.append((key, _flatten(child, leaves)))
+        else:
+            layout.append((key, None))
+            leaves.append(child)
+    return tuple(layout)
+
+
+def _plan(layout: Layout) -> tuple:
+    """Turn a layout into build steps, merging runs of leaves.
+
+    Returns:
+        Steps of either (tuple of leaf keys, None) or (key, child steps)
+    """
+    steps: List[tuple] = []
+    run: List[str] = []
+    for key, child in layout:
+        if child is None:
+            run.append(key)
+            continue
+        if run:
+            steps.append((tuple(run), None))
+            run = []
+        steps.append((key, _plan(child)))
+    if run:
+        steps.append((tuple(run), None))
+    return tuple(steps)
+
+
+def _build(plan: tuple, values: Tuple[Any, ...], position: int) -> Tuple[dict, int]:
+    """Rebuild a dictionary from flattened leaf values.
+
+    Args:
+        plan: Build steps from :func:`_plan`
+        values: Leaf values of one row, in layout order
+        position: Index of the dictionary's first leaf value
+
+    Returns:
+        The dictionary and the position of the next unused value
+    """
+    result: dict = {}
+    for keys, child in plan:
+        if child is None:
+            end = position + len(keys)
+            result.update(zip(keys, values[position:end]))
+            position = end
+        else:
+            result[keys], position = _build(child, values, position)
+    return result, position
+
+
+def _layout_to_json(layout: Layout) -> list:
+    """Convert a layout to nested lists for JSON."""
+    return [[key, None if child is None else _layout_to_json(child)] for key, child in layout]
+
+
+def _layout_from_json(data: list) -> Layout:
+    """Convert a layout from its JSON form."""
+    return tuple((key, None if child is None else _layout_from_json(child)) for key, child in data)
+
+
+def _column_type(column: Tuple[Any, ...]) -> int:
+    """Pick the most compact type holding every value of a column exactly."""
+    types = set(map(type, column))
+    if types == {type(None)}:
+        return _NONE
+    if types == {float}:
+        return _FLOAT
+    if types == {bool}:
+        return _BOOL
+    if types == {int} and _INT64_MIN <= min(column) and max(column) <= _INT64_MAX:
+        return _INT
+    if types <= {str, type(None)}:
+        return _STR
+    return _JSON
+
+
+def _pack_column(column: Tuple[Any, ...], strings: _StringTable) -> bytes:
+    """Encode one column as its type and values."""
+    column_type = _column_type(column)
+    header = _COLUMN_TYPE.pack(column_type)
+    if column_type == _NONE:
+        return header
+    if column_type == _FLOAT:
+        return header + np.asarray(column, dtype='<f8').tobytes()
+    if column_type == _INT:
+        return header + np.asarray(column, dtype='<i8').tobytes()
+    if column_type == _BOOL:
+        return header + np.asarray(column, dtype='<u1').tobytes()
+    if column_type == _STR:
+        indices = [_NULL_INDEX if value is None else strings.index(value) for value in column]
+        return header + np.asarray(indices, dtype='<u4').tobytes()
+    return header + _pack_str(json.dumps(column))
+
+
+def _pack_str(value: str) -> bytes:
+    """Encode a length-prefixed UTF-8 string."""
+    encoded = value.encode('utf-8')
+    return _COUNT.pack(len(encoded)) + encoded
+
+
+class _Reader:
+    """Sequential reader over a decompressed payload."""
+
+    def __init__(self, payload: bytes):
+        self._payload = payload
+        self._position = 0
+        self._strings: List[str] = []
+
+    def read_scene(self) -> Dict[str, Any]:
+        """Read the string table, scene fields and scene objects."""
+        self._strings = self._read_strings()
+        data = json.loads(self._read_str())
+        object_count = self._read_count()
+        scene_objects: List[Any] = [None] * object_count
+        for _ in range(self._read_count()):
+            layout = _layout_from_json(json.loads(self._read_str()))
+            row_count = self._read_count()
+            indices = self._read_array('<u4', row_count).tolist()
+            columns = [self._read_column(row_count) for _ in range(_leaf_count(layout))]
+            if columns:
+                rows = zip(*columns)
+            else:
+                rows = iter([()] * row_count)
+            plan = _plan(layout)
+            for index, values in zip(indices, rows):
+                scene_objects[index] = _build(plan, values, 0)[0]
+        if self._position != len(self._payload):
+            raise ValueError("Unexpected data after binary scene")
+        if any(scene_object is None for scene_object in scene_objects):
+            raise ValueError("Binary scene is missing scene objects")
+        data['scene_objects'] = scene_objects
+        return data
+
+    def _read_count(self) -> int:
+        (count,) = _COUNT.unpack_from(self._payload, self._position)
+        self._position += _COUNT.size
+        return count
+
+    def _read_bytes(self, size: int) -> bytes:
+        end = self._position + size
+        if end > len(self._payload):
+            raise ValueError("Truncated binary scene")
+        data = self._payload[self._position:end]
+        self._position = end
+        return data
+
+    def _read_str(self) -> str:
+        return self._read_bytes(self._read_count()).decode('utf-8')
+
+    def _read_array(self, dtype: str, count: int) -> np.ndarray:
+        itemsize = np.dtype(dtype).itemsize
+        return np.frombuffer(self._read_bytes(itemsize * count), dtype=dtype)
+
+    def _read_strings(self) -> List[str]:
+        count = self._read_count()
+        lengths = self._read_array('<u4', count).tolist()
+        blob = self._read_bytes(sum(lengths))
+        strings = []
+        start = 0
+        for length in lengths:
+            strings.append(blob[start:start + length].decode('utf-8'))
+            start += length
+        return strings
+
+    def _read_column(self, row_count: int) -> List[Any]:
+        (column_type,) = _COLUMN_TYPE.unpack(self._read_bytes(_COLUMN_TYPE.size))
+        if column_type == _NONE:
+            return [None] * row_count
+        if column_type == _FLOAT:
+            return self._read_array('<f8', row_count).tolist()
+        if column_type == _INT:
+            return self._read_array('<i8', row_count).tolist()
+        if column_type == _BOOL:
+            return [bool(value) for value in self._read_array('<u1', row_count).tolist()]
+        if column_type == _STR:
+            strings = self._strings
+            return [None if index == _NULL_INDEX else strings[index]
+                    for index in self._read_array('<u4', row_count).tolist()]
+        if column_type == _JSON:
+            values = json.loads(self._read_str())
+            if len(values) != row_count:
+                raise ValueError("Binary scene column has the wrong number of values")
+            return values
+        raise ValueError(f"Unknown binary scene column type {column_type}")
+
+
+def _leaf_count(layout: Layout) -> int:
+    """Count the leaf values of a layout."""
+    return sum(1 if child is None else _leaf_count(child) for _, child in layout)
+
+
+def _compress(payload: bytes, compression: str) -> bytes:
+    """Compress a payload."""
+    if compression == COMPRESSION_LZMA:
+        return lzma.compress(payload)
+    if compression == COMPRESSION_ZSTD:
+        return _zstd().compress(payload)
+    return payload
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    """Decompress a payload."""
+    if compression == COMPRESSION_LZMA:
+        return lzma.decompress(data)
+    if compression == COMPRESSION_ZSTD:
+        return _zstd().decompress(data)
+    return data
+
+
+def _zstd() -> Any:
+    """Get a zstd codec with ``compress`` and ``decompress`` functions.
+
+    Raises:
+        ImportError: If neither ``compression.zstd`` nor ``zstandard`` is installed
+    """
+    try:
+        from compression import zstd  # type: ignore  # Python 3.14+
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "zstd scene compression needs Python 3.14+ or the 'zstandard' package"
+        ) from None
+    return zstandard
@@ -0,0 +1,491 @@
+"""Incremental autosave of scenes through an append-only change journal.
+
+Saving a scene serializes every object through ``Scene.to_dict``, which
+stalls the UI for seconds on big scenes. A :class:`SceneJournal` instead
+records only what changed since the scene file was last written: objects
+added, removed, edited through their own or their physics body's setters
+or moved by physics. Edits are reported as they happen by the setters'
+changed callbacks (see ``SceneObject.set_changed_callback`` and
+``PhysicsBody2D.set_changed_callback``), and only the objects whose bodies
+are awake and not static are checked for motion, so a flush costs time in
+proportion to what changed rather than to the size of the scene. At each
+interval the changed objects are serialized on the calling thread, and a
+background thread appends them to a journal file next to the scene file
+as one JSON line per flush.
+
+Objects without changed callbacks are compared on every flush instead, as
+are the connections of a registry without a ``revision``. Edits made on a
+material directly, rather than through the body, are not reported; use
+:meth:`SceneJournal.mark_dirty` after them.
+
+An explicit save (:meth:`SceneJournal.compact`, or a ``SCENE_SAVED`` event
+for the same scene and file) writes the whole scene to the scene file and
+empties the journal. After a crash, :meth:`SceneJournal.recover` replays
+the journal over the scene file.
+
+The journal covers a scene kept in one file; chunked scenes save their
+chunks as they unload instead.
+
+Example:
+    journal = SceneJournal(scene, 'plant.pxscene', interval=10.0)
+    journal.start()  # Flushes as the scene updates
+    ...
+    journal.compact()  # Explicit save
+    journal.close()
+
+    data = SceneJournal.recover('plant.pxscene')
+    scene = Scene.from_dict(data)
+"""
+from functools import partial
+import json
+import os
+from pathlib import Path
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Tuple
+from pyrox.interfaces import BodyType, IScene, ISceneObject
+from pyrox.services import scene_binary
+from pyrox.services.logging import log
+from pyrox.services.scene import SceneEvent, SceneEventBus, SceneEventType
+
+
+JOURNAL_SUFFIX = '.journal'
+
+# Per object: (revision, body revision, x, y) when last written
+_Snapshot = Tuple[int, int, float, float]
+
+
+def journal_path(scene_filepath: str | Path) -> Path:
+    """Get the journal path for a scene file.
+
+    Example: ``plant.pxscene`` → ``plant.pxscene.journal``
+    """
+    scene_filepath = Path(scene_filepath)
+    return scene_filepath.with_name(scene_filepath.name + JOURNAL_SUFFIX)
+
+
+class SceneJournal:
+    """Append the changes made to a scene to a journal beside its file.
+
+    The scene file is assumed to match the scene when the journal starts
+    (the scene was just loaded from it or saved to it). Flushes run on the
+    thread that calls :meth:`flush` or updates the scene and only
+    serialize changed objects; encoding and writing the journal happen on
+    a background thread.
+    """
+
+    def __init__(
+        self,
+        scene: IScene,
+        filepath: str | Path,
+        interval: float = 5.0,
+        track_motion: bool = True,
+    ):
+        """Initialize the journal.
+
+        Args:
+            scene: Scene to journal
+            filepath: Scene file the journal belongs to
+            interval: Seconds between flushes while the scene updates
+            track_motion: Also journal objects moved without their setters
+                (as the physics engine moves bodies)
+
+        Raises:
+            ValueError: If the interval is negative
+        """
+        if interval < 0.0:
+            raise ValueError("Interval cannot be negative")
+        self._scene = scene
+        self._filepath = Path(filepath)
+        self._journal_filepath = journal_path(filepath)
+        self._interval = interval
+        self._track_motion = track_motion
+
+        self._snapshot: Dict[str, _Snapshot] = {}
+        self._unbuilt: set[str] = set()
+        self._changed: set[str] = set()
+        self._moving: set[str] = set()
+        self._polled: set[str] = set()
+        self._connections: List[dict] = []
+        self._registry: Any = None
+        self._connections_revision: int | None = None
+        self._header: Dict[str, Any] = {}
+        self._dirty: set[str] = set()
+        self._removed: set[str] = set()
+        self._sequence = 0
+        self._last_flush = 0.0
+
+        self._queue: queue.Queue = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._active = False
+
+    @property
+    def scene(self) -> IScene:
+        """Get the scene being journaled."""
+        return self._scene
+
+    @property
+    def filepath(self) -> Path:
+        """Get the scene file the journal belongs to."""
+        return self._filepath
+
+    @property
+    def journal_filepath(self) -> Path:
+        """Get the journal file."""
+        return self._journal_filepath
+
+    @property
+    def interval(self) -> float:
+        """Get the seconds between flushes while the scene updates."""
+        return self._interval
+
+    @property
+    def active(self) -> bool:
+        """Whether the journal is following the scene."""
+        return self._active
+
+    @property
+    def entry_count(self) -> int:
+        """Get the number of entries queued or written since the journal was last emptied."""
+        return self._sequence
+
+    def start(self) -> None:
+        """Start following the scene, taking its current state as already saved.
+
+        Raises:
+            RuntimeError: If the journal is already active
+        """
+        if self._active:
+            raise RuntimeError("Journal is already active")
+        for scene_object in self._scene.get_scene_objects().values():
+            self._track(scene_object)
+        self._take_snapshot()
+        self._last_flush = time.monotonic()
+
+        self._scene.on_scene_object_added.append(self._on_scene_object_added)
+        self._scene.on_scene_object_removed.append(self._on_scene_object_removed)
+        self._scene.on_scene_updated.append(self._on_scene_updated)
+        SceneEventBus.subscribe(SceneEventType.SCENE_SAVED, self._on_scene_saved)
+
+        self._writer = threading.Thread(target=self._write_loop, name="SceneJournalWriter", daemon=True)
+        self._writer.start()
+        self._active = True
+
+    def close(self, flush: bool = True) -> None:
+        """Stop following the scene and wait for the journal to be written.
+
+        Args:
+            flush: Journal the changes made since the last flush first
+        """
+        if not self._active:
+            return
+        if flush:
+            self.flush()
+
+        for callbacks, callback in (
+            (self._scene.on_scene_object_added, self._on_scene_object_added),
+            (self._scene.on_scene_object_removed, self._on_scene_object_removed),
+            (self._scene.on_scene_updated, self._on_scene_updated),
+        ):
+            if callback in callbacks:
+                callbacks.remove(callback)
+        for scene_object in self._scene.get_scene_objects().values():
+            self._untrack(scene_object)
+        SceneEventBus.unsubscribe(SceneEventType.SCENE_SAVED, self._on_scene_saved)
+
+        self._queue.put(None)
+        if self._writer:
+            self._writer.join()
+        self._writer = None
+        self._active = False
+
+    def mark_dirty(self, scene_object_id: str) -> None:
+        """Journal a scene object at the next flush, whether or not it looks changed."""
+        self._dirty.add(scene_object_id)
+
+    def flush(self) -> int:
+        """Queue the changes made since the last flush for writing.
+
+        Returns:
+            Number of objects journaled (written or removed)
+        """
+        self._last_flush = time.monotonic()
+        scene_objects = self._scene.get_scene_objects()
+        dirty = self._dirty
+        removed = self._removed
+        changed = self._changed
+        self._dirty = set()
+        self._removed = set()
+        self._changed = set()
+
+        # Compare only what reported a change, or may have moved
+        snapshot = self._snapshot
+        track_motion = self._track_motion
+        candidates = changed | self._polled
+        if track_motion:
+            candidates |= self._moving
+            self._moving = moving = set()
+        for object_id in candidates:
+            scene_object = scene_objects.get(object_id)
+            if scene_object is None:
+                continue
+            state = self._state(scene_object, track_motion)
+            if snapshot.get(object_id) != state:
+                snapshot[object_id] = state
+                dirty.add(object_id)
+            if track_motion and self._is_moving(scene_object):
+                moving.add(object_id)
+
+        if self._unbuilt:
+            # Objects removed before a lazy scene built them never reach the callbacks
+            remaining = {record.id for record in self._scene.get_object_records()}  # type: ignore[attr-defined]
+            removed.update(self._unbuilt - remaining - scene_objects.keys())
+            self._unbuilt &= remaining
+
+        entry: Dict[str, Any] = {}
+        upserts = []
+        for object_id in dirty:
+            scene_object = scene_objects.get(object_id)
+            if scene_object is not None:
+                snapshot[object_id] = self._state(scene_object, track_motion)
+                upserts.append(scene_object.to_dict())
+        if upserts:
+            entry["upsert"] = upserts
+        removes = [object_id for object_id in removed if object_id not in scene_objects]
+        if removes:
+            entry["remove"] = removes
+
+        if self._connections_changed():
+            connections = self._scene.get_connection_registry().serialize()["connections"]
+            if connections != self._connections:
+                self._connections = connections
+                entry["connections"] = connections
+        header = self._scene_header()
+        if header != self._header:
+            self._header = header
+            entry.update(header)
+
+        if not entry:
+            return 0
+        self._sequence += 1
+        entry["sequence"] = self._sequence
+        self._queue.put(entry)
+        return len(upserts) + len(removes)
+
+    def wait(self) -> None:
+        """Block until every queued entry has been written."""
+        if self._writer:
+            self._queue.join()
+
+    def compact(self, binary: bool | None = None, compression: str = scene_binary.COMPRESSION_NONE) -> None:
+        """Write the whole scene to the scene file and empty the journal.
+
+        Args:
+            binary: Write the binary scene format (defaults to binary for
+                files ending in ``scene_binary.SUFFIX``)
+            compression: Compression of the binary format
+        """
+        scene_binary.save_file(self._filepath, self._scene.to_dict(), binary=binary, compression=compression)
+        self._discard()
+
+    @classmethod
+    def recover(cls, filepath: str | Path) -> Dict[str, Any]:
+        """Read a scene file with its journal replayed over it.
+
+        A journal line cut short by a crash is ignored, along with any
+        after it.
+
+        Args:
+            filepath: Scene file
+
+        Returns:
+            Scene dictionary, for ``Scene.from_dict``
+        """
+        filepath = Path(filepath)
+        if filepath.exists():
+            data = scene_binary.load_file(filepath)
+        else:
+            data = {"name": "Untitled Scene", "description": "", "scene_objects": [], "connections": []}
+        return cls.apply(data, cls.read_entries(journal_path(filepath)))
+
+    @staticmethod
+    def read_entries(journal_filepath: str | Path) -> Iterator[Dict[str, Any]]:
+        """Read the entries of a journal file, stopping at the first incomplete line.
+
+        Args:
+            journal_filepath: Journal file (a missing file has no entries)
+        """
+        journal_filepath = Path(journal_filepath)
+        if not journal_filepath.exists():
+            return
+        with open(journal_filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    return
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    log(SceneJournal).warning(f"Corrupt entry in scene journal {journal_filepath}, ignoring the rest")
+                    return
+
+    @staticmethod
+    def apply(data: Dict[str, Any], entries: Iterator[Dict[str, Any]]) -> Dict[str, Any]:
+        """Apply journal entries to a scene dictionary.
+
+        Args:
+            data: Scene dictionary, as created by ``Scene.to_dict``
+            entries: Journal entries, oldest first
+
+        Returns:
+            The updated scene dictionary (``data`` itself)
+        """
+        scene_objects = {scene_object["id"]: scene_object for scene_object in data.get("scene_objects", [])}
+        for entry in entries:
+            for object_id in entry.get("remove", []):
+                scene_objects.pop(object_id, None)
+            for scene_object in entry.get("upsert", []):
+                scene_objects[scene_object["id"]] = scene_object
+            if "connections" in entry:
+                data["connections"] = entry["connections"]
+            for key in ("name", "description"):
+                if key in entry:
+                    data[key] = entry[key]
+        data["scene_objects"] = list(scene_objects.values())
+        return data
+
+    def _connections_changed(self) -> bool:
+        """Check whether connections were added or removed since the last check.
+
+        Registries without a ``revision`` are always assumed changed, so
+        their serialized connections are compared instead.
+        """
+        registry = self._scene.get_connection_registry()
+        revision = getattr(registry, "revision", None)
+        if revision is not None and registry is self._registry and revision == self._connections_revision:
+            return False
+        self._registry = registry
+        self._connections_revision = revision
+        return True
+
+    @staticmethod
+    def _is_moving(scene_object: ISceneObject) -> bool:
+        """Check whether the physics engine may move an object's body."""
+        body = scene_object.physics_body
+        return body.enabled and not body.sleeping and body.body_type != BodyType.STATIC
+
+    def _track(self, scene_object: ISceneObject) -> None:
+        """Have an object and its body report their changes to the journal.
+
+        Objects that can't report them are compared on every flush instead.
+        """
+        callback = partial(self._on_object_changed, scene_object.id)
+        reporters = (scene_object, scene_object.physics_body)
+        set_callbacks = [getattr(reporter, "set_changed_callback", None) for reporter in reporters]
+        for set_changed_callback in set_callbacks:
+            if set_changed_callback is not None:
+                set_changed_callback(callback)
+        if None in set_callbacks:
+            self._polled.add(scene_object.id)
+
+    def _untrack(self, scene_object: ISceneObject) -> None:
+        """Stop an object and its body reporting their changes to the journal."""
+        for reporter in (scene_object, scene_object.physics_body):
+            set_changed_callback = getattr(reporter, "set_changed_callback", None)
+            if set_changed_callback is not None:
+                set_changed_callback(None)
+        self._polled.discard(scene_object.id)
+
+    def _on_object_changed(self, scene_object_id: str, _reporter: Any) -> None:
+        """Check an object that reported a change at the next flush."""
+        self._changed.add(scene_object_id)
+
+    def _state(self, scene_object: ISceneObject, track_motion: bool) -> _Snapshot:
+        """Get the values compared between flushes to tell whether an object changed."""
+        revision = getattr(scene_object, "revision", 0)
+        body_revision = getattr(scene_object.physics_body, "revision", 0)
+        if track_motion:
+            return (revision, body_revision, scene_object.x, scene_object.y)
+        return (revision, body_revision, 0.0, 0.0)
+
+    def _scene_header(self) -> Dict[str, Any]:
+        """Get the scene-level values written with an entry when they change."""
+        return {"name": self._scene.name, "description": self._scene.description}
+
+    def _take_snapshot(self) -> None:
+        """Take the scene's current state as the saved state."""
+        track_motion = self._track_motion
+        scene_objects = self._scene.get_scene_objects()
+        self._snapshot = {
+            object_id: self._state(scene_object, track_motion)
+            for object_id, scene_object in scene_objects.items()
+        }
+        self._moving = {
+            object_id for object_id, scene_object in scene_objects.items() if self._is_moving(scene_object)
+        } if track_motion else set()
+        get_object_records = getattr(self._scene, "get_object_records", None)
+        self._unbuilt = {record.id for record in get_object_records()} if get_object_records else set()
+        self._connections = self._scene.get_connection_registry().serialize()["connections"]
+        self._connections_changed()
+        self._header = self._scene_header()
+        self._dirty.clear()
+        self._removed.clear()
+        self._changed.clear()
+
+    def _discard(self) -> None:
+        """Empty the journal once the scene file holds every change."""
+        self.wait()
+        self._journal_filepath.unlink(missing_ok=True)
+        self._sequence = 0
+        self._take_snapshot()
+
+    def _on_scene_object_added(self, scene_object: ISceneObject) -> None:
+        """Journal an added object, unless it was only just built from the scene file."""
+        self._track(scene_object)
+        if scene_object.id in self._unbuilt:
+            self._unbuilt.discard(scene_object.id)
+            self._snapshot[scene_object.id] = self._state(scene_object, self._track_motion)
+            self._changed.add(scene_object.id)  # Checked for motion from now on
+            return
+        self._removed.discard(scene_object.id)
+        self._dirty.add(scene_object.id)
+        self._changed.add(scene_object.id)
+
+    def _on_scene_object_removed(self, scene_object: ISceneObject) -> None:
+        """Journal a removed object."""
+        self._untrack(scene_object)
+        self._snapshot.pop(scene_object.id, None)
+        self._dirty.discard(scene_object.id)
+        self._changed.discard(scene_object.id)
+        self._moving.discard(scene_object.id)
+        self._removed.add(scene_object.id)
+
+    def _on_scene_updated(self, scene: IScene, delta_time: float) -> None:
+        """Flush once the interval has passed."""
+        if time.monotonic() - self._last_flush >= self._interval:
+            self.flush()
+
+    def _on_scene_saved(self, event: SceneEvent) -> None:
+        """Empty the journal when the scene is saved to its file."""
+        filepath = (event.data or {}).get("filepath")
+        if event.scene is not self._scene or not filepath:
+            return
+        if Path(filepath).resolve() == self._filepath.resolve():
+            self._discard()
+
+    def _write_loop(self) -> None:
+        """Append queued entries to the journal file until closed."""
+        while True:
+            entry = self._queue.get()
+            try:
+                if entry is None:
+                    return
+                line = json.dumps(entry, separators=(',', ':')) + '\n'
+                with open(self._journal_filepath, 'a', encoding='utf-8') as f:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception as e:
+                log(self).error(f"Failed to write scene journal {self._journal_filepath}: {e}")
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,461 @@
+"""Sequential-impulse contact solver.
+
+Resolves all contacts of a physics step together instead of one at a time.
+Each contact gets a normal impulse that stops the bodies approaching (plus a
+restitution bounce for fast impacts) and a Coulomb friction impulse clamped
+by the normal impulse. Impulses are refined over several velocity iterations
+so stacked and sandwiched bodies settle instead of jittering.
+
+Accumulated impulses are cached by body pair and reapplied on the next step
+(warm starting), so resting contacts start each step close to their solution.
+Remaining overlap is then pushed out over a few position iterations.
+
+Contacts only interact through the dynamic bodies they share, so a step's
+contacts split into independent islands that can be solved concurrently
+with the same result as solving them together. The solve is pure Python,
+so solving islands on threads only pays off on free-threaded builds.
+"""
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Tuple
+from pyrox.interfaces.protocols.physics import IPhysicsBody2D, BodyType
+
+# Cached impulses are reused while the contact normal turns by less than ~18 degrees
+_WARM_START_ALIGNMENT = 0.95
+
+# Warm-start impulses by body pair, as (normal_impulse, tangent_impulse, normal_x, normal_y)
+ImpulseCache = Dict[Tuple[IPhysicsBody2D, IPhysicsBody2D], Tuple[float, float, float, float]]
+
+
+class _Contact:
+    """Per-step solver state for one contact."""
+
+    __slots__ = (
+        'body_a', 'body_b', 'index_a', 'index_b', 'inv_mass_a', 'inv_mass_b',
+        'normal_x', 'normal_y', 'normal_mass', 'friction', 'bias', 'penetration',
+        'normal_impulse', 'tangent_impulse',
+    )
+
+    def __init__(self):
+        self.body_a: Optional[IPhysicsBody2D] = None
+        self.body_b: Optional[IPhysicsBody2D] = None
+        self.index_a = 0
+        self.index_b = 0
+        self.inv_mass_a = 0.0
+        self.inv_mass_b = 0.0
+        self.normal_x = 0.0
+        self.normal_y = 0.0
+        self.normal_mass = 0.0
+        self.friction = 0.0
+        self.bias = 0.0
+        self.penetration = 0.0
+        self.normal_impulse = 0.0
+        self.tangent_impulse = 0.0
+
+
+class ContactSolver:
+    """Multi-iteration sequential-impulse contact solver with warm starting.
+
+    Velocities are gathered once per solve, iterated on locally and written
+    back to the bodies at the end, so the iterations don't go through body
+    properties. Only dynamic bodies receive impulses; kinematic and static
+    bodies act as moving or fixed obstacles.
+
+    Attributes:
+        correction_percent: Fraction of remaining penetration removed per position iteration
+        slop: Penetration allowed before positions are corrected
+        restitution_threshold: Approach speed below which contacts don't bounce
+        position_iterations: Number of position correction passes per step
+    """
+
+    def __init__(
+        self,
+        correction_percent: float = 0.4,
+        slop: float = 0.05,
+        restitution_threshold: float = 1.0,
+        position_iterations: int = 3,
+    ):
+        """Initialize the solver.
+
+        Args:
+            correction_percent: Fraction of remaining penetration removed per position iteration
+            slop: Penetration allowed before positions are corrected
+            restitution_threshold: Approach speed below which contacts don't bounce
+            position_iterations: Number of position correction passes per step
+        """
+        self.correction_percent = correction_percent
+        self.slop = slop
+        self.restitution_threshold = restitution_threshold
+        self.position_iterations = position_iterations
+        self._impulses: ImpulseCache = {}
+
+    @property
+    def cached_impulses(self) -> ImpulseCache:
+        """Get impulses kept for warm starting.
+
+        Keyed by ``(body_a, body_b)`` as reported by collision detection, each
+        value is ``(normal_impulse, tangent_impulse, normal_x, normal_y)``.
+        """
+        return self._impulses
+
+    @cached_impulses.setter
+    def cached_impulses(self, impulses: ImpulseCache) -> None:
+        """Replace the impulses kept for warm starting, e.g. when restoring a snapshot."""
+        self._impulses = dict(impulses)
+
+    def solve(
+        self,
+        collisions: list,
+        environment,
+        iterations: Optional[int] = None,
+    ) -> None:
+        """Resolve a step's contacts.
+
+        Args:
+            collisions: CollisionInfo objects detected this step
+            environment: EnvironmentService for restitution, friction and
+                the default iteration count
+            iterations: Velocity iterations to run (defaults to the
+                environment's ``collision_iterations``)
+        """
+        if iterations is None:
+            iterations = environment.collision_iterations
+        self._impulses = self._solve_group(collisions, environment, iterations)
+
+    def solve_islands(
+        self,
+        collisions: list,
+        environment,
+        iterations: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """Resolve a step's contacts island by island.
+
+        Islands share no dynamic bodies, so they are solved independently,
+        concurrently when an executor is given. Cached impulses are merged
+        in island order, so the outcome matches :meth:`solve` regardless of
+        scheduling.
+
+        Args:
+            collisions: CollisionInfo objects detected this step
+            environment: EnvironmentService for restitution, friction and
+                the default iteration count
+            iterations: Velocity iterations to run (defaults to the
+                environment's ``collision_iterations``)
+            executor: Executor used to solve islands concurrently (solves
+                them one after another if None). Threads only speed this
+                up on free-threaded builds.
+        """
+        if iterations is None:
+            iterations = environment.collision_iterations
+
+        islands = self.build_islands(collisions)
+        if executor is None or len(islands) < 2:
+            results = [self._solve_group(island, environment, iterations) for island in islands]
+        else:
+            futures = [
+                executor.submit(self._solve_group, island, environment, iterations)
+                for island in islands
+            ]
+            results = [future.result() for future in futures]
+
+        impulses = {}
+        for island_impulses in results:
+            impulses.update(island_impulses)
+        self._impulses = impulses
+
+    @staticmethod
+    def build_islands(collisions: list) -> List[list]:
+        """Group contacts into islands connected through dynamic bodies.
+
+        Static and kinematic bodies are never moved by the solver, so they
+        don't join islands together.
+
+        Args:
+            collisions: CollisionInfo objects detected this step
+
+        Returns:
+            List of islands, each a list of contacts in detection order.
+            Islands are ordered by their first contact.
+        """
+        parents: Dict[IPhysicsBody2D, IPhysicsBody2D] = {}
+
+        def find(body):
+            root = parents.setdefault(body, body)
+            while root is not parents[root]:
+                root = parents[root]
+            while body is not root:
+                parents[body], body = root, parents[body]
+            return root
+
+        dynamic = BodyType.DYNAMIC
+        anchors = []
+        for collision in collisions:
+            body_a = collision.body_a
+            body_b = collision.body_b
+            a_dynamic = body_a.body_type == dynamic
+            b_dynamic = body_b.body_type == dynamic
+            if a_dynamic and b_dynamic:
+                root_a = find(body_a)
+                root_b = find(body_b)
+                if root_a is not root_b:
+                    parents[root_b] = root_a
+                anchors.append(body_a)
+            elif a_dynamic:
+                anchors.append(body_a)
+            elif b_dynamic:
+                anchors.append(body_b)
+            else:
+                anchors.append(None)
+
+        islands: Dict[object, list] = {}
+        for index, (collision, anchor) in enumerate(zip(collisions, anchors)):
+            # Contacts without a dynamic body get solved on their own
+            key = find(anchor) if anchor is not None else index
+            islands.setdefault(key, []).append(collision)
+        return list(islands.values())
+
+    def _solve_group(
+        self,
+        collisions: list,
+        environment,
+        iterations: int,
+    ) -> ImpulseCache:
+        """Solve a group of contacts and return their impulses for warm starting.
+
+        Only reads the impulse cache, so independent groups can be solved
+        concurrently.
+        """
+        bodies: List[IPhysicsBody2D] = []
+        velocities_x: List[float] = []
+        velocities_y: List[float] = []
+        contacts = self._prepare(collisions, environment, bodies, velocities_x, velocities_y)
+
+        self._warm_start(contacts, velocities_x, velocities_y)
+        for _ in range(iterations):
+            for contact in contacts:
+                self._solve_contact(contact, velocities_x, velocities_y)
+
+        # Write back velocities that changed
+        for index, body in enumerate(bodies):
+            vx = velocities_x[index]
+            vy = velocities_y[index]
+            if body.linear_velocity != (vx, vy):
+                body.set_linear_velocity(vx, vy)
+
+        self._correct_positions(contacts, bodies)
+
+        return {
+            (contact.body_a, contact.body_b): (
+                contact.normal_impulse, contact.tangent_impulse, contact.normal_x, contact.normal_y
+            )
+            for contact in contacts
+        }
+
+    def forget(self, body: IPhysicsBody2D) -> None:
+        """Drop cached impulses involving a body.
+
+        Args:
+            body: The body being removed from the simulation
+        """
+        self._impulses = {
+            pair: impulse for pair, impulse in self._impulses.items() if body not in pair
+        }
+
+    def clear(self) -> None:
+        """Drop all cached impulses."""
+        self._impulses.clear()
+
+    def _prepare(
+        self,
+        collisions: list,
+        environment,
+        bodies: List[IPhysicsBody2D],
+        velocities_x: List[float],
+        velocities_y: List[float],
+    ) -> List[_Contact]:
+        """Build solver contacts and gather the velocities of the bodies involved."""
+        slots: Dict[IPhysicsBody2D, int] = {}
+        contacts = []
+        restitution_threshold = self.restitution_threshold
+
+        for collision in collisions:
+            body_a = collision.body_a
+            body_b = collision.body_b
+
+            # Triggers only report overlaps
+            if body_a.collider.is_trigger or body_b.collider.is_trigger:
+                continue
+
+            inv_mass_a = body_a.inverse_mass if body_a.body_type == BodyType.DYNAMIC else 0.0
+            inv_mass_b = body_b.inverse_mass if body_b.body_type == BodyType.DYNAMIC else 0.0
+            if inv_mass_a + inv_mass_b == 0:
+                continue  # Both infinite mass
+
+            contact = _Contact()
+            contact.body_a = body_a
+            contact.body_b = body_b
+            contact.index_a = self._slot(body_a, slots, bodies, velocities_x, velocities_y)
+            contact.index_b = self._slot(body_b, slots, bodies, velocities_x, velocities_y)
+            contact.inv_mass_a = inv_mass_a
+            contact.inv_mass_b = inv_mass_b
+            contact.normal_x, contact.normal_y = collision.normal
+            contact.normal_mass = 1.0 / (inv_mass_a + inv_mass_b)
+            contact.penetration = collision.penetration_depth
+
+            material_a = body_a.material
+            material_b = body_b.material
+            contact.friction = environment.calculate_combined_friction(material_a.friction, material_b.friction)
+
+            # Bounce only on impacts, so resting contacts don't jitter
+            vel_along_normal = (
+                (velocities_x[contact.index_b] - velocities_x[contact.index_a]) * contact.normal_x
+                + (velocities_y[contact.index_b] - velocities_y[contact.index_a]) * contact.normal_y
+            )
+            if vel_along_normal < -restitution_threshold:
+                e = environment.calculate_combined_restitution(material_a.restitution, material_b.restitution)
+                contact.bias = -e * vel_along_normal
+
+            contacts.append(contact)
+
+        return contacts
+
+    @staticmethod
+    def _slot(
+        body: IPhysicsBody2D,
+        slots: Dict[IPhysicsBody2D, int],
+        bodies: List[IPhysicsBody2D],
+        velocities_x: List[float],
+        velocities_y: List[float],
+    ) -> int:
+        """Get a body's slot in the local velocity lists, adding it if needed."""
+        index = slots.get(body)
+        if index is None:
+            index = len(bodies)
+            slots[body] = index
+            bodies.append(body)
+            vx, vy = body.linear_velocity
+            velocities_x.append(vx)
+            velocities_y.append(vy)
+        return index
+
+    def _warm_start(self, contacts: List[_Contact], velocities_x: List[float], velocities_y: List[float]) -> None:
+        """Reapply last step's impulses to contacts that persist with a similar normal.
+
+        Rotated and rounded shapes produce normals that drift slightly from
+        step to step, so the cached normal only has to stay roughly aligned.
+        """
+        impulses = self._impulses
+        if not impulses:
+            return
+
+        for contact in contacts:
+            cached = impulses.get((contact.body_a, contact.body_b))
+            if cached is None:
+                continue
+            normal_impulse, tangent_impulse, cached_x, cached_y = cached
+            normal_x = contact.normal_x
+            normal_y = contact.normal_y
+            if cached_x * normal_x + cached_y * normal_y < _WARM_START_ALIGNMENT:
+                continue
+
+            contact.normal_impulse = normal_impulse
+            contact.tangent_impulse = tangent_impulse
+            impulse_x = normal_impulse * normal_x - tangent_impulse * normal_y
+            impulse_y = normal_impulse * normal_y + tangent_impulse * normal_x
+            a = contact.index_a
+            b = contact.index_b
+            velocities_x[a] -= impulse_x * contact.inv_mass_a
+            velocities_y[a] -= impulse_y * contact.inv_mass_a
+            velocities_x[b] += impulse_x * contact.inv_mass_b
+            velocities_y[b] += impulse_y * contact.inv_mass_b
+
+    @staticmethod
+    def _solve_contact(contact: _Contact, velocities_x: List[float], velocities_y: List[float]) -> None:
+        """Run one velocity iteration for a contact: friction, then the normal impulse."""
+        a = contact.index_a
+        b = contact.index_b
+        inv_mass_a = contact.inv_mass_a
+        inv_mass_b = contact.inv_mass_b
+        normal_x = contact.normal_x
+        normal_y = contact.normal_y
+
+        # Friction along the tangent (normal rotated 90 degrees)
+        rel_x = velocities_x[b] - velocities_x[a]
+        rel_y = velocities_y[b] - velocities_y[a]
+        vel_along_tangent = rel_y * normal_x - rel_x * normal_y
+        max_friction = contact.friction * contact.normal_impulse
+        old_impulse = contact.tangent_impulse
+        new_impulse = old_impulse - vel_along_tangent * contact.normal_mass
+        if new_impulse > max_friction:
+            new_impulse = max_friction
+        elif new_impulse < -max_friction:
+            new_impulse = -max_friction
+        contact.tangent_impulse = new_impulse
+        delta = new_impulse - old_impulse
+        if delta:
+            impulse_x = -delta * normal_y
+            impulse_y = delta * normal_x
+            velocities_x[a] -= impulse_x * inv_mass_a
+            velocities_y[a] -= impulse_y * inv_mass_a
+            velocities_x[b] += impulse_x * inv_mass_b
+            velocities_y[b] += impulse_y * inv_mass_b
+
+        # Normal impulse, accumulated and clamped so contacts only push
+        rel_x = velocities_x[b] - velocities_x[a]
+        rel_y = velocities_y[b] - velocities_y[a]
+        vel_along_normal = rel_x * normal_x + rel_y * normal_y
+        old_impulse = contact.normal_impulse
+        new_impulse = old_impulse - (vel_along_normal - contact.bias) * contact.normal_mass
+        if new_impulse < 0.0:
+            new_impulse = 0.0
+        contact.normal_impulse = new_impulse
+        delta = new_impulse - old_impulse
+        if delta:
+            impulse_x = delta * normal_x
+            impulse_y = delta * normal_y
+            velocities_x[a] -= impulse_x * inv_mass_a
+            velocities_y[a] -= impulse_y * inv_mass_a
+            velocities_x[b] += impulse_x * inv_mass_b
+            velocities_y[b] += impulse_y * inv_mass_b
+
+    def _correct_positions(self, contacts: List[_Contact], bodies: List[IPhysicsBody2D]) -> None:
+        """Push overlapping bodies apart to prevent sinking.
+
+        Each pass re-estimates a contact's penetration from how far its
+        bodies have already been moved, so stacks are corrected as a whole.
+        """
+        if not contacts:
+            return
+
+        slop = self.slop
+        correction_percent = self.correction_percent
+        offsets_x = [0.0] * len(bodies)
+        offsets_y = [0.0] * len(bodies)
+
+        for _ in range(self.position_iterations):
+            for contact in contacts:
+                a = contact.index_a
+                b = contact.index_b
+                normal_x = contact.normal_x
+                normal_y = contact.normal_y
+                separation = (offsets_x[b] - offsets_x[a]) * normal_x + (offsets_y[b] - offsets_y[a]) * normal_y
+                penetration = contact.penetration - separation
+                if penetration <= slop:
+                    continue
+
+                # Move bodies apart based on inverse mass ratio
+                correction = (penetration - slop) * contact.normal_mass * correction_percent
+                correction_x = correction * normal_x
+                correction_y = correction * normal_y
+                offsets_x[a] -= correction_x * contact.inv_mass_a
+                offsets_y[a] -= correction_y * contact.inv_mass_a
+                offsets_x[b] += correction_x * contact.inv_mass_b
+                offsets_y[b] += correction_y * contact.inv_mass_b
+
+        for index, body in enumerate(bodies):
+            offset_x = offsets_x[index]
+            offset_y = offsets_y[index]
+            if offset_x:
+                body.x += offset_x
+            if offset_y:
+                body.y += offset_y
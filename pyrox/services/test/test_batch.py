@@ -0,0 +1,208 @@
+"""Unit tests for the batch scenario runner."""
+
+import json
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pyrox.models import Scene, SceneObject
+from pyrox.models.physics.crate import CrateBody
+from pyrox.models.physics.sensor import ProximitySensorBody
+from pyrox.services import scene_binary
+from pyrox.services.batch import (
+    BatchScenarioRunner,
+    ScenarioResult,
+    apply_parameters,
+    expand_grid,
+    run_scenario,
+)
+from pyrox.services.environment import EnvironmentService
+
+
+def _scene_data():
+    """Build a scene with a crate falling toward a checkpoint sensor."""
+    scene = Scene(name="Batch Test")
+    sensor = ProximitySensorBody(name="Checkpoint", x=-20.0, y=60.0, width=60.0, height=5.0)
+    crate = CrateBody(name="Crate", x=0.0, y=0.0)
+    for body in (sensor, crate):
+        scene.add_scene_object(SceneObject(name=body.name, scene_object_type="body", physics_body=body))
+    return scene.to_dict()
+
+
+FALLING = {'environment.gravity': (0.0, 400.0)}
+
+
+class TestExpandGrid(unittest.TestCase):
+    """Test cases for expand_grid."""
+
+    def test_cartesian_product(self):
+        """Test every combination is produced with the last key varying fastest."""
+        variants = expand_grid({'a': [1, 2], 'b': ['x', 'y', 'z']})
+
+        self.assertEqual(len(variants), 6)
+        self.assertEqual(variants[0], {'a': 1, 'b': 'x'})
+        self.assertEqual(variants[1], {'a': 1, 'b': 'y'})
+        self.assertEqual(variants[-1], {'a': 2, 'b': 'z'})
+
+    def test_empty_grid(self):
+        """Test an empty grid runs the scene once as is."""
+        self.assertEqual(expand_grid({}), [{}])
+
+
+class TestApplyParameters(unittest.TestCase):
+    """Test cases for apply_parameters."""
+
+    def setUp(self):
+        """Set up a scene and environment."""
+        self.scene = Scene.from_dict(_scene_data())
+        self.environment = EnvironmentService()
+
+    def _body(self, name):
+        for scene_object in self.scene.get_scene_objects().values():
+            if scene_object.name == name:
+                return scene_object.physics_body
+        raise KeyError(name)
+
+    def test_applies_object_and_environment_parameters(self):
+        """Test parameters reach scene bodies and the environment."""
+        apply_parameters(self.scene, self.environment, {
+            'environment': 'moon',
+            'environment.terminal_velocity': 500.0,
+            'Checkpoint.y': 250.0,
+        })
+
+        self.assertEqual(self.environment.gravity, EnvironmentService.PRESETS['moon'].gravity)
+        self.assertEqual(self.environment.terminal_velocity, 500.0)
+        self.assertEqual(self._body('Checkpoint').y, 250.0)
+
+    def test_preset_applied_before_attributes(self):
+        """Test an explicit environment attribute overrides the preset whatever the key order."""
+        for parameters in (
+            {'environment.gravity': (0.0, -20.0), 'environment': 'moon'},
+            {'environment': 'moon', 'environment.gravity': (0.0, -20.0)},
+        ):
+            with self.subTest(order=list(parameters)):
+                environment = EnvironmentService()
+                apply_parameters(self.scene, environment, parameters)
+
+                self.assertEqual(environment.gravity, (0.0, -20.0))
+                self.assertEqual(environment.air_density, EnvironmentService.PRESETS['moon'].air_density)
+
+    def test_unknown_targets_raise(self):
+        """Test unknown objects, attributes and malformed keys are rejected."""
+        with self.assertRaises(KeyError):
+            apply_parameters(self.scene, self.environment, {'Missing.x': 1.0})
+        with self.assertRaises(AttributeError):
+            apply_parameters(self.scene, self.environment, {'Crate.not_an_attribute': 1.0})
+        with self.assertRaises(KeyError):
+            apply_parameters(self.scene, self.environment, {'gravity': 1.0})
+
+
+class TestRunScenario(unittest.TestCase):
+    """Test cases for run_scenario."""
+
+    def test_collects_sensor_counts_and_histogram(self):
+        """Test a falling crate is counted by the sensor and sampled into the histogram."""
+        result = run_scenario(_scene_data(), FALLING, duration=2.0, index=3, histogram_cell_size=50.0)
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.index, 3)
+        self.assertEqual(result.frames, 120)
+        self.assertAlmostEqual(result.simulated_time, 2.0)
+        self.assertEqual(result.sensor_activations, {'Checkpoint': 1})
+        self.assertEqual(result.sensor_detections, {'Checkpoint': 1})
+        self.assertEqual(sum(result.position_histogram.values()), 2)
+        self.assertTrue(all(cell_y > 0 for _, cell_y in result.position_histogram))
+
+    def test_sensor_out_of_reach(self):
+        """Test a sensor the crate never reaches stays at zero."""
+        result = run_scenario(_scene_data(), {**FALLING, 'Checkpoint.y': 100000.0}, duration=1.0)
+
+        self.assertEqual(result.sensor_activations, {'Checkpoint': 0})
+
+
+class TestBatchScenarioRunner(unittest.TestCase):
+    """Test cases for BatchScenarioRunner."""
+
+    def test_runs_variants_in_order(self):
+        """Test every variant is run and results keep the grid's order."""
+        runner = BatchScenarioRunner(
+            _scene_data(),
+            grid={'environment.gravity': [(0.0, 400.0), (0.0, 0.0)], 'Checkpoint.y': [60.0, 100000.0]},
+            duration=1.0,
+        )
+        collected = []
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = runner.run(executor=executor, on_result=collected.append)
+
+        self.assertEqual([result.index for result in results], [0, 1, 2, 3])
+        self.assertEqual(collected, results)
+        self.assertEqual([result.parameters for result in results], runner.variants)
+        self.assertEqual(
+            [result.sensor_activations['Checkpoint'] for result in results],
+            [1, 0, 0, 0],
+        )
+
+    def test_process_pool(self):
+        """Test the default process pool runs variants in worker processes."""
+        runner = BatchScenarioRunner(
+            _scene_data(),
+            grid={**{key: [value] for key, value in FALLING.items()}, 'Checkpoint.x': [-20.0, 500.0]},
+            duration=1.0,
+            max_workers=2,
+        )
+
+        results = runner.run()
+
+        self.assertTrue(all(result.succeeded for result in results))
+        self.assertEqual([result.sensor_activations['Checkpoint'] for result in results], [1, 0])
+
+    def test_failed_variant_reported(self):
+        """Test a variant that raises is reported without ending the batch."""
+        runner = BatchScenarioRunner(_scene_data(), grid={'Missing.x': [1.0], 'Crate.x': [0.0, 5.0]}, duration=0.1)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = runner.run(executor=executor)
+
+        self.assertEqual(len(results), 2)
+        self.assertIsInstance(results[0], ScenarioResult)
+        self.assertFalse(results[0].succeeded)
+        self.assertIn('Missing', results[0].error)  # type: ignore
+
+    def test_loads_scene_file(self):
+        """Test a scene can be given as a file path."""
+        fd, path = tempfile.mkstemp(suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(_scene_data(), f)
+
+            runner = BatchScenarioRunner(path, grid={}, duration=1.0)
+
+            self.assertEqual(runner.scene_data['name'], "Batch Test")
+            self.assertEqual(runner.variants, [{}])
+        finally:
+            os.remove(path)
+
+    def test_loads_binary_scene_file(self):
+        """Test a scene can be given as a binary scene file."""
+        fd, path = tempfile.mkstemp(suffix=scene_binary.SUFFIX)
+        os.close(fd)
+        try:
+            scene_binary.save_file(path, _scene_data())
+
+            runner = BatchScenarioRunner(path, grid={}, duration=1.0)
+
+            self.assertEqual(runner.scene_data['name'], "Batch Test")
+        finally:
+            os.remove(path)
+
+    def test_duration_must_be_positive(self):
+        """Test a non-positive duration is rejected."""
+        with self.assertRaises(ValueError):
+            BatchScenarioRunner(_scene_data(), grid={}, duration=0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,655 @@
+"""Unit tests for broad-phase collision strategies."""
+
+import random
+import unittest
+
+from pyrox.interfaces.protocols.physics import BodyType, CollisionLayer
+from pyrox.models.protocols.physics import PhysicsBody2D
+from pyrox.services.broadphase import (
+    BroadPhase,
+    CollisionLayerMatrix,
+    DynamicAABBTree,
+    SpatialGrid,
+    SweepAndPrune,
+)
+from pyrox.services.collision import CollisionService
+from pyrox.services.physics import PhysicsEngineService
+
+
+def _pair_keys(pairs):
+    """Normalize a list of body pairs to a set of unordered id pairs."""
+    return {frozenset((id(a), id(b))) for a, b in pairs}
+
+
+def _as_bodies(broad_phase, pairs):
+    """Convert index pairs to body pairs, checking the i < j rule."""
+    for i, j in pairs:
+        assert i < j, (i, j)
+    return [(broad_phase.bodies[i], broad_phase.bodies[j]) for i, j in pairs]
+
+
+def _overlapping_pairs(bodies):
+    """Brute-force all pairs whose bounds overlap (inclusive)."""
+    pairs = []
+    for i, body in enumerate(bodies):
+        a = body.get_bounds()
+        for other in bodies[i + 1:]:
+            b = other.get_bounds()
+            if a[2] >= b[0] and a[0] <= b[2] and a[3] >= b[1] and a[1] <= b[3]:
+                pairs.append((body, other))
+    return pairs
+
+
+def _random_bodies(rng, count):
+    """Create bodies with a mix of tiny and huge sizes."""
+    bodies = []
+    for _ in range(count):
+        size = rng.choice([2.0, 5.0, 20.0, 60.0, 800.0])
+        bodies.append(PhysicsBody2D(
+            x=rng.uniform(-500.0, 500.0),
+            y=rng.uniform(-500.0, 500.0),
+            width=size,
+            height=rng.choice([2.0, 20.0, size]),
+        ))
+    return bodies
+
+
+class TestBroadPhase(unittest.TestCase):
+    """Test cases for the BroadPhase base class."""
+
+    def test_cannot_instantiate(self):
+        """Test that the base class is abstract."""
+        with self.assertRaises(TypeError):
+            BroadPhase()  # type: ignore
+
+    def test_strategies_are_broad_phases(self):
+        """Test that the concrete strategies implement the interface."""
+        self.assertIsInstance(SpatialGrid(), BroadPhase)
+        self.assertIsInstance(SweepAndPrune(), BroadPhase)
+        self.assertIsInstance(DynamicAABBTree(), BroadPhase)
+
+
+class TestBroadPhaseIndices(unittest.TestCase):
+    """Test cases for stable body indices and the bounds buffer."""
+
+    def test_indices_are_stable_and_reused(self):
+        """Test that indices survive other removals and freed ones are reused."""
+        for broad_phase in (SpatialGrid(), SweepAndPrune(), DynamicAABBTree()):
+            bodies = [PhysicsBody2D(x=i * 20.0) for i in range(4)]
+            for body in bodies:
+                broad_phase.insert(body)
+            with self.subTest(strategy=type(broad_phase).__name__):
+                self.assertEqual([broad_phase.get_index(body) for body in bodies], [0, 1, 2, 3])
+
+                broad_phase.remove(bodies[1])
+                self.assertIsNone(broad_phase.bodies[1])
+                self.assertEqual(broad_phase.get_index(bodies[3]), 3)
+
+                newcomer = PhysicsBody2D()
+                broad_phase.insert(newcomer)
+                self.assertEqual(broad_phase.get_index(newcomer), 1)
+                with self.assertRaises(KeyError):
+                    broad_phase.get_index(bodies[1])
+
+    def test_bounds_buffer(self):
+        """Test that bounds are cached in the flat buffer on insert and update."""
+        for broad_phase in (SpatialGrid(), SweepAndPrune(), DynamicAABBTree()):
+            body1 = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=20.0)
+            body2 = PhysicsBody2D(x=5.0, y=6.0, width=1.0, height=2.0)
+            broad_phase.insert(body1)
+            broad_phase.insert(body2)
+            with self.subTest(strategy=type(broad_phase).__name__):
+                self.assertEqual(broad_phase.bounds, [0.0, 0.0, 10.0, 20.0, 5.0, 6.0, 6.0, 8.0])
+
+                body1.x = 3.0
+                self.assertEqual(broad_phase.get_cached_bounds(body1), (0.0, 0.0, 10.0, 20.0))
+                broad_phase.update(body1)
+                self.assertEqual(broad_phase.get_cached_bounds(body1), (3.0, 0.0, 13.0, 20.0))
+
+    def test_pairs_do_not_call_bodies(self):
+        """Test that pair generation works purely from cached state."""
+        for broad_phase in (SpatialGrid(cell_size=10.0), SweepAndPrune(), DynamicAABBTree()):
+            body1 = PhysicsBody2D(x=0.0, y=0.0, width=50.0, height=50.0)
+            body2 = PhysicsBody2D(x=5.0, y=5.0, width=50.0, height=50.0)
+            broad_phase.insert(body1)
+            broad_phase.insert(body2)
+            body1.get_bounds = body2.get_bounds = None
+            with self.subTest(strategy=type(broad_phase).__name__):
+                self.assertEqual(broad_phase.query_pairs(), [(0, 1)])
+
+    def test_sweep_and_prune_area_does_not_call_bodies(self):
+        """Test that sweep and prune area queries work from cached state."""
+        sap = SweepAndPrune()
+        body1 = PhysicsBody2D(x=0.0, y=0.0, width=50.0, height=50.0)
+        body2 = PhysicsBody2D(x=100.0, y=0.0, width=50.0, height=50.0)
+        sap.insert(body1)
+        sap.insert(body2)
+        body1.get_bounds = body2.get_bounds = None
+
+        self.assertEqual(sap.query_area(40.0, 40.0, 60.0, 60.0), [body1])
+        self.assertEqual(sap.query_point(120.0, 10.0), [body2])
+
+
+class TestSpatialGridPairs(unittest.TestCase):
+    """Test cases for SpatialGrid.query_pairs."""
+
+    def test_pairs_reported_once(self):
+        """Test that bodies sharing several cells are paired once."""
+        grid = SpatialGrid(cell_size=10.0)
+        body1 = PhysicsBody2D(x=0.0, y=0.0, width=50.0, height=50.0)
+        body2 = PhysicsBody2D(x=5.0, y=5.0, width=50.0, height=50.0)
+        grid.insert(body1)
+        grid.insert(body2)
+
+        self.assertEqual(len(grid.query_pairs()), 1)
+
+    def test_pairs_cover_overlaps(self):
+        """Test that every overlapping pair is a candidate."""
+        rng = random.Random(3)
+        bodies = _random_bodies(rng, 80)
+        grid = SpatialGrid(cell_size=50.0)
+        for body in bodies:
+            grid.insert(body)
+
+        expected = _pair_keys(_overlapping_pairs(bodies))
+        self.assertLessEqual(expected, _pair_keys(_as_bodies(grid, grid.query_pairs())))
+
+    def test_pairs_match_brute_force_while_moving(self):
+        """Test that pairs spanning many cells are reported exactly once."""
+        rng = random.Random(23)
+        bodies = _random_bodies(rng, 120)
+        grid = SpatialGrid(cell_size=40.0)
+        for body in bodies:
+            grid.insert(body)
+
+        for _ in range(10):
+            for body in bodies:
+                body.x += rng.uniform(-30.0, 30.0)
+                body.y += rng.uniform(-30.0, 30.0)
+                grid.update(body)
+
+            pairs = _as_bodies(grid, grid.query_pairs())
+            self.assertEqual(len(pairs), len(_pair_keys(pairs)))
+            self.assertEqual(_pair_keys(pairs), _pair_keys(_overlapping_pairs(bodies)))
+
+
+class TestSweepAndPrune(unittest.TestCase):
+    """Test cases for SweepAndPrune."""
+
+    def test_invalid_axis(self):
+        """Test that only the x and y axes are accepted."""
+        with self.assertRaises(ValueError):
+            SweepAndPrune(axis=2)
+
+    def test_insert_keeps_endpoints_sorted(self):
+        """Test that inserted endpoints are placed in sorted order."""
+        sap = SweepAndPrune()
+        for x in (50.0, -10.0, 20.0, 5.0):
+            sap.insert(PhysicsBody2D(x=x, y=0.0, width=10.0, height=10.0))
+
+        values = [endpoint.value for endpoint in sap._endpoints]
+        self.assertEqual(values, sorted(values))
+        self.assertEqual(len(values), 8)
+
+    def test_query_pairs_overlap(self):
+        """Test that only bodies overlapping on both axes are paired."""
+        sap = SweepAndPrune()
+        body1 = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        body2 = PhysicsBody2D(x=5.0, y=5.0, width=10.0, height=10.0)
+        body3 = PhysicsBody2D(x=5.0, y=100.0, width=10.0, height=10.0)  # Overlaps on x only
+        for body in (body1, body2, body3):
+            sap.insert(body)
+
+        self.assertEqual(_pair_keys(_as_bodies(sap, sap.query_pairs())), _pair_keys([(body1, body2)]))
+
+    def test_touching_bodies_are_paired(self):
+        """Test that touching edges count as overlap, matching the narrow phase."""
+        sap = SweepAndPrune()
+        body1 = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        body2 = PhysicsBody2D(x=10.0, y=0.0, width=10.0, height=10.0)
+        sap.insert(body1)
+        sap.insert(body2)
+
+        self.assertEqual(len(sap.query_pairs()), 1)
+
+    def test_update_resorts(self):
+        """Test that moved bodies are re-sorted before the next sweep."""
+        sap = SweepAndPrune()
+        body1 = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        body2 = PhysicsBody2D(x=100.0, y=0.0, width=10.0, height=10.0)
+        sap.insert(body1)
+        sap.insert(body2)
+        self.assertEqual(sap.query_pairs(), [])
+
+        body2.x = 5.0
+        self.assertTrue(sap.update(body2))
+        self.assertEqual(len(sap.query_pairs()), 1)
+
+        values = [endpoint.value for endpoint in sap._endpoints]
+        self.assertEqual(values, sorted(values))
+
+    def test_update_unchanged_returns_false(self):
+        """Test that updating a body that did not move is a no-op."""
+        sap = SweepAndPrune()
+        body = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        sap.insert(body)
+
+        self.assertFalse(sap.update(body))
+        self.assertFalse(sap._dirty)
+
+    def test_remove(self):
+        """Test removing a body drops its endpoints."""
+        sap = SweepAndPrune()
+        body1 = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        body2 = PhysicsBody2D(x=5.0, y=0.0, width=10.0, height=10.0)
+        sap.insert(body1)
+        sap.insert(body2)
+
+        sap.remove(body1)
+
+        self.assertFalse(sap.contains(body1))
+        self.assertEqual(len(sap._endpoints), 2)
+        self.assertEqual(sap.query_pairs(), [])
+        sap.remove(body1)  # Removing twice is harmless
+
+    def test_query_nearby(self):
+        """Test finding bodies near a single body."""
+        sap = SweepAndPrune()
+        body1 = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        body2 = PhysicsBody2D(x=5.0, y=5.0, width=10.0, height=10.0)
+        body3 = PhysicsBody2D(x=300.0, y=300.0, width=10.0, height=10.0)
+        for body in (body1, body2, body3):
+            sap.insert(body)
+
+        self.assertEqual(sap.query_nearby(body1), {body2})
+
+    def test_matches_brute_force_while_moving(self):
+        """Test pair results against brute force across many moving steps."""
+        rng = random.Random(7)
+        bodies = _random_bodies(rng, 120)
+        sap = SweepAndPrune(axis=1)
+        for body in bodies:
+            sap.insert(body)
+
+        for _ in range(20):
+            for body in bodies:
+                body.x += rng.uniform(-15.0, 15.0)
+                body.y += rng.uniform(-15.0, 15.0)
+                sap.update(body)
+
+            pairs = _as_bodies(sap, sap.query_pairs())
+            self.assertEqual(len(pairs), len(_pair_keys(pairs)))
+            self.assertEqual(_pair_keys(pairs), _pair_keys(_overlapping_pairs(bodies)))
+
+    def test_query_area_while_moving(self):
+        """Test area queries against brute force on either axis, from cached state only."""
+        for axis in (0, 1):
+            rng = random.Random(11)
+            bodies = _random_bodies(rng, 120)
+            sap = SweepAndPrune(axis=axis)
+            for body in bodies:
+                sap.insert(body)
+
+            for _ in range(5):
+                for body in bodies:
+                    body.x += rng.uniform(-40.0, 40.0)
+                    body.y += rng.uniform(-40.0, 40.0)
+                    sap.update(body)
+                area = (rng.uniform(-400.0, 300.0), rng.uniform(-400.0, 300.0))
+                area += (area[0] + 100.0, area[1] + 100.0)
+                probe = PhysicsBody2D(x=area[0], y=area[1], width=100.0, height=100.0)
+                expected = {id(body) for body in bodies if _overlapping_pairs([body, probe])}
+                with self.subTest(axis=axis, area=area):
+                    self.assertEqual({id(body) for body in sap.query_area(*area)}, expected)
+
+    def test_clear(self):
+        """Test clearing all bodies."""
+        sap = SweepAndPrune()
+        sap.insert(PhysicsBody2D())
+        sap.clear()
+
+        self.assertEqual(sap._endpoints, [])
+        self.assertEqual(sap.query_pairs(), [])
+
+
+class TestBroadPhaseQueries(unittest.TestCase):
+    """Test cases for point, area and ray queries across strategies."""
+
+    def _strategies(self):
+        return (SpatialGrid(cell_size=50.0), SweepAndPrune(), DynamicAABBTree(margin=3.0))
+
+    def test_query_area_matches_brute_force(self):
+        """Test area queries against a linear scan of current bounds."""
+        bodies = _random_bodies(random.Random(13), 150)
+        areas = [(-100.0, -100.0, 100.0, 100.0), (0.0, 0.0, 0.0, 0.0), (-2000.0, -2000.0, 2000.0, 2000.0)]
+        for broad_phase in self._strategies():
+            for body in bodies:
+                broad_phase.insert(body)
+            for area in areas:
+                expected = {
+                    id(body) for body in bodies
+                    if _overlapping_pairs([body, PhysicsBody2D(
+                        x=area[0], y=area[1], width=area[2] - area[0], height=area[3] - area[1]
+                    )])
+                }
+                with self.subTest(strategy=type(broad_phase).__name__, area=area):
+                    self.assertEqual({id(body) for body in broad_phase.query_area(*area)}, expected)
+
+    def test_query_point(self):
+        """Test that point queries return the containing bodies."""
+        body1 = PhysicsBody2D(x=0.0, y=0.0, width=20.0, height=20.0)
+        body2 = PhysicsBody2D(x=10.0, y=10.0, width=20.0, height=20.0)
+        for broad_phase in self._strategies():
+            broad_phase.insert(body1)
+            broad_phase.insert(body2)
+            with self.subTest(strategy=type(broad_phase).__name__):
+                self.assertEqual(set(broad_phase.query_point(15.0, 15.0)), {body1, body2})
+                self.assertEqual(broad_phase.query_point(5.0, 5.0), [body1])
+                self.assertEqual(broad_phase.query_point(100.0, 100.0), [])
+
+    def test_query_ray(self):
+        """Test that ray queries report hits nearest first."""
+        near = PhysicsBody2D(x=10.0, y=-5.0, width=10.0, height=10.0)
+        far = PhysicsBody2D(x=50.0, y=-5.0, width=10.0, height=10.0)
+        off_ray = PhysicsBody2D(x=30.0, y=50.0, width=10.0, height=10.0)
+        for broad_phase in self._strategies():
+            for body in (far, off_ray, near):
+                broad_phase.insert(body)
+            with self.subTest(strategy=type(broad_phase).__name__):
+                hits = broad_phase.query_ray(0.0, 0.0, 100.0, 0.0)
+                self.assertEqual([body for body, _ in hits], [near, far])
+                self.assertAlmostEqual(hits[0][1], 0.1)
+                self.assertAlmostEqual(hits[1][1], 0.5)
+                self.assertEqual(broad_phase.query_ray(0.0, 0.0, 5.0, 0.0), [])
+
+
+class TestDynamicAABBTree(unittest.TestCase):
+    """Test cases for DynamicAABBTree."""
+
+    def _assert_valid(self, tree):
+        """Check parent links, box containment and heights of the whole tree."""
+        root = tree._root
+        if root is None:
+            self.assertEqual(tree._leaves, {})
+            return
+        self.assertIsNone(root.parent)
+        leaves = 0
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node.child1 is None:
+                self.assertIs(tree._leaves[node.body], node)
+                self.assertEqual(node.height, 0)
+                leaves += 1
+                continue
+            for child in (node.child1, node.child2):
+                self.assertIs(child.parent, node)
+                self.assertLessEqual(node.min_x, child.min_x)
+                self.assertLessEqual(node.min_y, child.min_y)
+                self.assertGreaterEqual(node.max_x, child.max_x)
+                self.assertGreaterEqual(node.max_y, child.max_y)
+                stack.append(child)
+            self.assertEqual(node.height, 1 + max(node.child1.height, node.child2.height))
+            self.assertLessEqual(abs(node.child1.height - node.child2.height), 1)
+        self.assertEqual(leaves, len(tree._leaves))
+
+    def test_invalid_margin(self):
+        """Test that a negative margin is rejected."""
+        with self.assertRaises(ValueError):
+            DynamicAABBTree(margin=-1.0)
+
+    def test_insert_keeps_tree_balanced(self):
+        """Test that many inserts produce a valid, shallow tree."""
+        tree = DynamicAABBTree()
+        for i in range(512):
+            tree.insert(PhysicsBody2D(x=i * 20.0, y=0.0, width=10.0, height=10.0))
+
+        self._assert_valid(tree)
+        self.assertLessEqual(tree.height, 20)
+
+    def test_fat_bounds(self):
+        """Test that leaves store bounds grown by the margin."""
+        tree = DynamicAABBTree(margin=5.0)
+        body = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        tree.insert(body)
+
+        self.assertEqual(tree.get_fat_bounds(body), (-5.0, -5.0, 15.0, 15.0))
+
+    def test_update_inside_fat_box_is_noop(self):
+        """Test that small motions do not re-insert the leaf."""
+        tree = DynamicAABBTree(margin=5.0)
+        body = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        tree.insert(body)
+
+        body.x = 4.0
+        self.assertFalse(tree.update(body))
+
+        body.x = 6.0
+        self.assertTrue(tree.update(body))
+        self.assertEqual(tree.get_fat_bounds(body), (1.0, -5.0, 21.0, 15.0))
+
+    def test_remove(self):
+        """Test removing leaves keeps the tree valid."""
+        tree = DynamicAABBTree()
+        bodies = _random_bodies(random.Random(17), 100)
+        for body in bodies:
+            tree.insert(body)
+
+        for body in bodies[::2]:
+            tree.remove(body)
+        self._assert_valid(tree)
+        self.assertFalse(tree.contains(bodies[0]))
+        self.assertTrue(tree.contains(bodies[1]))
+
+        for body in bodies[1::2]:
+            tree.remove(body)
+        self._assert_valid(tree)
+        self.assertEqual(tree.height, 0)
+
+    def test_static_pairs_not_reported(self):
+        """Test that pairs of two static bodies are skipped."""
+        tree = DynamicAABBTree()
+        floor1 = PhysicsBody2D(x=0.0, y=0.0, width=100.0, height=10.0, body_type=BodyType.STATIC)
+        floor2 = PhysicsBody2D(x=50.0, y=0.0, width=100.0, height=10.0, body_type=BodyType.STATIC)
+        crate = PhysicsBody2D(x=10.0, y=0.0, width=10.0, height=10.0)
+        for body in (floor1, floor2, crate):
+            tree.insert(body)
+
+        self.assertEqual(_pair_keys(_as_bodies(tree, tree.query_pairs())), _pair_keys([(crate, floor1)]))
+
+    def test_searching_follows_sleep_and_wake(self):
+        """Test that pairs stop being searched from a body while it sleeps."""
+        tree = DynamicAABBTree()
+        floor = PhysicsBody2D(x=0.0, y=0.0, width=100.0, height=10.0, body_type=BodyType.STATIC)
+        crate = PhysicsBody2D(x=10.0, y=0.0, width=10.0, height=10.0)
+        tree.insert(floor)
+        tree.insert(crate)
+
+        crate.sleeping = True
+        tree.update(crate)
+        self.assertEqual(tree.query_pairs(), [])
+
+        crate.sleeping = False
+        tree.update(crate)
+        self.assertEqual(_pair_keys(_as_bodies(tree, tree.query_pairs())), _pair_keys([(crate, floor)]))
+
+    def test_searching_follows_type_changes(self):
+        """Test that type changes reach the searching set through the collision service."""
+        service = CollisionService(broad_phase=DynamicAABBTree())
+        left = PhysicsBody2D(x=0.0, y=0.0, width=100.0, height=10.0, body_type=BodyType.STATIC)
+        right = PhysicsBody2D(x=50.0, y=0.0, width=100.0, height=10.0, body_type=BodyType.STATIC)
+        service.register_body(left)
+        service.register_body(right)
+        service.update_spatial_grid()
+        self.assertEqual(service.broad_phase.query_pairs(), [])
+
+        left.body_type = BodyType.DYNAMIC
+        service.update_spatial_grid()
+        self.assertEqual(len(service.broad_phase.query_pairs()), 1)
+
+        left.body_type = BodyType.STATIC
+        service.update_spatial_grid()
+        self.assertEqual(service.broad_phase.query_pairs(), [])
+
+    def test_pairs_match_brute_force_while_moving(self):
+        """Test pair results against brute force across many moving steps."""
+        rng = random.Random(19)
+        bodies = _random_bodies(rng, 150)
+        for body in bodies[::3]:
+            body.body_type = BodyType.STATIC
+        tree = DynamicAABBTree(margin=4.0)
+        for body in bodies:
+            tree.insert(body)
+
+        moving = [body for body in bodies if body.body_type != BodyType.STATIC]
+        for _ in range(20):
+            for body in moving:
+                body.x += rng.uniform(-6.0, 6.0)
+                body.y += rng.uniform(-6.0, 6.0)
+                tree.update(body)
+            self._assert_valid(tree)
+
+            pairs = _as_bodies(tree, tree.query_pairs())
+            self.assertEqual(len(pairs), len(_pair_keys(pairs)))
+            expected = _pair_keys(
+                (a, b) for a, b in _overlapping_pairs(bodies)
+                if a.body_type != BodyType.STATIC or b.body_type != BodyType.STATIC
+            )
+            self.assertLessEqual(expected, _pair_keys(pairs))
+
+
+class TestCollisionLayerMatrix(unittest.TestCase):
+    """Test cases for layer-pair filtering in the broad phase."""
+
+    def _layered_bodies(self):
+        return [
+            PhysicsBody2D(x=0.0, y=0.0, width=20.0, height=20.0, collision_layer=CollisionLayer.PLAYER),
+            PhysicsBody2D(x=5.0, y=5.0, width=20.0, height=20.0, collision_layer=CollisionLayer.ENEMY),
+            PhysicsBody2D(x=10.0, y=10.0, width=20.0, height=20.0, collision_layer=CollisionLayer.UI),
+            PhysicsBody2D(x=15.0, y=15.0, width=20.0, height=20.0, collision_layer=CollisionLayer.PLAYER),
+        ]
+
+    def test_default_disables_ui_and_transparent(self):
+        """Test that UI and TRANSPARENT layers never pair by default."""
+        matrix = CollisionLayerMatrix()
+
+        self.assertTrue(matrix.can_collide(CollisionLayer.PLAYER, CollisionLayer.ENEMY))
+        for layer in CollisionLayer:
+            self.assertFalse(matrix.can_collide(CollisionLayer.UI, layer))
+            self.assertFalse(matrix.can_collide(layer, CollisionLayer.TRANSPARENT))
+
+    def test_set_pair_is_symmetric(self):
+        """Test that disabling a pair affects both orders."""
+        matrix = CollisionLayerMatrix(disabled_layers=())
+        matrix.set_pair(CollisionLayer.PLAYER, CollisionLayer.ENEMY, False)
+
+        self.assertFalse(matrix.can_collide(CollisionLayer.PLAYER, CollisionLayer.ENEMY))
+        self.assertFalse(matrix.can_collide(CollisionLayer.ENEMY, CollisionLayer.PLAYER))
+        self.assertTrue(matrix.can_collide(CollisionLayer.PLAYER, CollisionLayer.PLAYER))
+
+        matrix.set_pair(CollisionLayer.ENEMY, CollisionLayer.PLAYER, True)
+        self.assertTrue(matrix.can_collide(CollisionLayer.PLAYER, CollisionLayer.ENEMY))
+
+    def test_strategies_filter_pairs(self):
+        """Test that every strategy drops pairs the matrix forbids."""
+        matrix = CollisionLayerMatrix()
+        matrix.set_pair(CollisionLayer.PLAYER, CollisionLayer.ENEMY, False)
+
+        for broad_phase in (SpatialGrid(cell_size=10.0), SweepAndPrune(), DynamicAABBTree()):
+            with self.subTest(broad_phase=type(broad_phase).__name__):
+                bodies = self._layered_bodies()
+                for body in bodies:
+                    broad_phase.insert(body)
+                self.assertEqual(len(broad_phase.query_pairs()), 6)
+
+                broad_phase.layer_matrix = matrix
+                pairs = _pair_keys(_as_bodies(broad_phase, broad_phase.query_pairs()))
+                self.assertEqual(pairs, _pair_keys([(bodies[0], bodies[3])]))
+
+    def test_update_layer(self):
+        """Test that layer changes are picked up by update_layer."""
+        broad_phase = SpatialGrid()
+        broad_phase.layer_matrix = CollisionLayerMatrix()
+        body_a = PhysicsBody2D(width=20.0, height=20.0)
+        body_b = PhysicsBody2D(width=20.0, height=20.0, collision_layer=CollisionLayer.UI)
+        broad_phase.insert(body_a)
+        broad_phase.insert(body_b)
+        self.assertEqual(broad_phase.query_pairs(), [])
+
+        body_b.set_collision_layer(CollisionLayer.DEFAULT)
+        broad_phase.update_layer(body_b)
+
+        self.assertEqual(broad_phase.query_pairs(), [(0, 1)])
+
+
+class TestCollisionServiceBroadPhase(unittest.TestCase):
+    """Test cases for selecting a broad phase on CollisionService."""
+
+    def test_default_is_spatial_grid(self):
+        """Test that the service defaults to a spatial grid."""
+        service = CollisionService(cell_size=25.0)
+        self.assertIsInstance(service.broad_phase, SpatialGrid)
+        self.assertEqual(service.broad_phase.cell_size, 25.0)
+
+    def test_strategies_detect_same_collisions(self):
+        """Test that grid and sweep and prune report the same contacts."""
+        results = []
+        for broad_phase in (SpatialGrid(cell_size=50.0), SweepAndPrune(), DynamicAABBTree()):
+            service = CollisionService(broad_phase=broad_phase)
+            self.assertIs(service.broad_phase, broad_phase)
+            bodies = _random_bodies(random.Random(5), 60)
+            for body in bodies:
+                service.register_body(body)
+            collisions = service.detect_collisions()
+            results.append({
+                (bodies.index(c.body_a), bodies.index(c.body_b), c.penetration_depth, c.normal)
+                for c in collisions
+            })
+
+        self.assertEqual(results[0], results[1])
+
+    def test_pairs_in_registration_order(self):
+        """Test that contacts keep registration order regardless of strategy."""
+        service = CollisionService(broad_phase=SweepAndPrune())
+        late = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        early = PhysicsBody2D(x=5.0, y=0.0, width=10.0, height=10.0)
+        service.register_body(early)
+        service.register_body(late)
+
+        collisions = service.detect_collisions()
+
+        self.assertEqual(len(collisions), 1)
+        self.assertIs(collisions[0].body_a, early)
+        self.assertIs(collisions[0].body_b, late)
+
+
+class TestPhysicsEngineQueries(unittest.TestCase):
+    """Test cases for engine queries backed by the broad phase."""
+
+    def test_queries_use_broad_phase(self):
+        """Test that engine queries go through the collision broad phase."""
+        tree = DynamicAABBTree()
+        engine = PhysicsEngineService(collision=CollisionService(broad_phase=tree))
+        body1 = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        body2 = PhysicsBody2D(x=40.0, y=0.0, width=10.0, height=10.0)
+        engine.register_body(body1)
+        engine.register_body(body2)
+
+        self.assertEqual(engine.query_bodies_at_point(5.0, 5.0), [body1])
+        self.assertEqual(engine.query_bodies_in_area(-100.0, -100.0, 100.0, 100.0), [body1, body2])
+        self.assertEqual(engine.query_bodies_on_ray(100.0, 5.0, -100.0, 5.0), [body2, body1])
+
+    def test_queries_see_moved_bodies(self):
+        """Test that queries reflect movement since the last step."""
+        engine = PhysicsEngineService()
+        body = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        engine.register_body(body)
+
+        body.x = 500.0
+
+        self.assertEqual(engine.query_bodies_at_point(505.0, 5.0), [body])
+        self.assertEqual(engine.query_bodies_at_point(5.0, 5.0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 """Unit tests for collision service."""
 
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from pyrox.models.protocols.physics import PhysicsBody2D
 
@@ -12,10 +12,16 @@ from pyrox.services.collision import (
 )
 from pyrox.interfaces.protocols.physics import (
     BodyType,
+    ColliderType,
     CollisionLayer,
 )
 
 
+def _cell_bodies(grid, cell):
+    """Get the bodies stored in a grid cell."""
+    return {grid.bodies[index] for index in grid._grid.get(cell, ())}
+
+
 class MockEnvironmentService:
     """Mock environment service for testing."""
 
@@ -72,6 +78,18 @@ class TestCollisionInfo(unittest.TestCase):
         self.assertIsInstance(info.normal, tuple)
         self.assertIsInstance(info.contact_point, tuple)
 
+    def test_collision_info_is_slotted(self):
+        """Test that CollisionInfo carries no per-instance dict."""
+        info = CollisionInfo(
+            body_a=PhysicsBody2D(),
+            body_b=PhysicsBody2D(),
+            penetration_depth=1.0,
+            normal=(1.0, 0.0),
+            contact_point=(0.0, 0.0)
+        )
+
+        self.assertFalse(hasattr(info, '__dict__'))
+
 
 class TestSpatialGrid(unittest.TestCase):
     """Test cases for SpatialGrid class."""
@@ -126,7 +144,7 @@ class TestSpatialGrid(unittest.TestCase):
 
         # Body should be in cell (0, 0)
         self.assertIn((0, 0), grid._grid)
-        self.assertIn(body, grid._grid[(0, 0)])
+        self.assertIn(body, _cell_bodies(grid, (0, 0)))
 
     def test_insert_body_spanning_multiple_cells(self):
         """Test inserting a body that spans multiple cells."""
@@ -136,10 +154,10 @@ class TestSpatialGrid(unittest.TestCase):
         grid.insert(body)
 
         # Body spans cells (0,0), (1,0), (0,1), (1,1)
-        self.assertIn(body, grid._grid[(0, 0)])
-        self.assertIn(body, grid._grid[(1, 0)])
-        self.assertIn(body, grid._grid[(0, 1)])
-        self.assertIn(body, grid._grid[(1, 1)])
+        self.assertIn(body, _cell_bodies(grid, (0, 0)))
+        self.assertIn(body, _cell_bodies(grid, (1, 0)))
+        self.assertIn(body, _cell_bodies(grid, (0, 1)))
+        self.assertIn(body, _cell_bodies(grid, (1, 1)))
 
     def test_insert_multiple_bodies(self):
         """Test inserting multiple bodies."""
@@ -150,9 +168,9 @@ class TestSpatialGrid(unittest.TestCase):
         grid.insert(body1)
         grid.insert(body2)
 
-        self.assertEqual(len(grid._grid[(0, 0)]), 2)
-        self.assertIn(body1, grid._grid[(0, 0)])
-        self.assertIn(body2, grid._grid[(0, 0)])
+        self.assertEqual(len(_cell_bodies(grid, (0, 0))), 2)
+        self.assertIn(body1, _cell_bodies(grid, (0, 0)))
+        self.assertIn(body2, _cell_bodies(grid, (0, 0)))
 
     def test_remove_body(self):
         """Test removing a body from the grid."""
@@ -160,10 +178,10 @@ class TestSpatialGrid(unittest.TestCase):
         body = PhysicsBody2D(x=10.0, y=10.0, width=10.0, height=10.0)
 
         grid.insert(body)
-        self.assertIn(body, grid._grid[(0, 0)])
+        self.assertIn(body, _cell_bodies(grid, (0, 0)))
 
         grid.remove(body)
-        self.assertNotIn(body, grid._grid[(0, 0)])
+        self.assertNotIn(body, _cell_bodies(grid, (0, 0)))
 
     def test_remove_body_from_multiple_cells(self):
         """Test removing a body that was in multiple cells."""
@@ -174,8 +192,8 @@ class TestSpatialGrid(unittest.TestCase):
         grid.remove(body)
 
         # Body should be removed from all cells
-        for cell_bodies in grid._grid.values():
-            self.assertNotIn(body, cell_bodies)
+        for cell in grid._grid:
+            self.assertNotIn(body, _cell_bodies(grid, cell))
 
     def test_query_nearby_single_cell(self):
         """Test querying nearby bodies in the same cell."""
@@ -230,6 +248,63 @@ class TestSpatialGrid(unittest.TestCase):
 
         grid.clear()
         self.assertEqual(len(grid._grid), 0)
+        self.assertFalse(grid.contains(body1))
+
+    def test_update_within_cell_is_noop(self):
+        """Test that moving inside the same cells does not touch the grid."""
+        grid = SpatialGrid(cell_size=100.0)
+        body = PhysicsBody2D(x=10.0, y=10.0, width=10.0, height=10.0)
+        grid.insert(body)
+
+        body.x = 40.0
+        moved = grid.update(body)
+
+        self.assertFalse(moved)
+        self.assertIn(body, _cell_bodies(grid, (0, 0)))
+
+    def test_update_crossing_cell_boundary(self):
+        """Test that crossing a cell boundary moves the body between cells."""
+        grid = SpatialGrid(cell_size=100.0)
+        body = PhysicsBody2D(x=80.0, y=10.0, width=10.0, height=10.0)
+        grid.insert(body)
+
+        body.x = 95.0  # Now spans cells (0, 0) and (1, 0)
+        self.assertTrue(grid.update(body))
+        self.assertIn(body, _cell_bodies(grid, (0, 0)))
+        self.assertIn(body, _cell_bodies(grid, (1, 0)))
+
+        body.x = 150.0  # Only cell (1, 0)
+        self.assertTrue(grid.update(body))
+        self.assertNotIn(body, _cell_bodies(grid, (0, 0)))
+        self.assertIn(body, _cell_bodies(grid, (1, 0)))
+
+    def test_insert_existing_body_updates(self):
+        """Test that re-inserting a body does not leave stale cells."""
+        grid = SpatialGrid(cell_size=100.0)
+        body = PhysicsBody2D(x=10.0, y=10.0, width=10.0, height=10.0)
+        grid.insert(body)
+
+        body.x = 310.0
+        grid.insert(body)
+
+        self.assertNotIn(body, _cell_bodies(grid, (0, 0)))
+        self.assertIn(body, _cell_bodies(grid, (3, 0)))
+
+    def test_remove_only_visits_occupied_cells(self):
+        """Test that removal does not scan unrelated cells."""
+        grid = SpatialGrid(cell_size=100.0)
+        body = PhysicsBody2D(x=10.0, y=10.0, width=10.0, height=10.0)
+        far = PhysicsBody2D(x=5000.0, y=5000.0, width=10.0, height=10.0)
+        grid.insert(body)
+        grid.insert(far)
+
+        far_cell = grid._grid[(50, 50)]
+        grid._grid[(50, 50)] = Mock(wraps=far_cell)
+        grid.remove(body)
+
+        grid._grid[(50, 50)].remove.assert_not_called()
+        self.assertFalse(grid.contains(body))
+        self.assertTrue(grid.contains(far))
 
 
 class TestCollisionService(unittest.TestCase):
@@ -244,7 +319,7 @@ class TestCollisionService(unittest.TestCase):
         """Test CollisionService initialization."""
         service = CollisionService(cell_size=50.0)
 
-        self.assertEqual(service._spatial_grid.cell_size, 50.0)
+        self.assertEqual(service._broad_phase.cell_size, 50.0)
         self.assertEqual(len(service._registered_bodies), 0)
         self.assertEqual(len(service._colliding_pairs), 0)
 
@@ -299,9 +374,63 @@ class TestCollisionService(unittest.TestCase):
         self.service.update_spatial_grid()
 
         # Bodies should be in new locations in grid
-        nearby_to_body1 = self.service._spatial_grid.query_nearby(body1)
+        nearby_to_body1 = self.service._broad_phase.query_nearby(body1)
         self.assertNotIn(body2, nearby_to_body1)
 
+    def test_update_spatial_grid_skips_static_bodies(self):
+        """Test that static bodies are not re-binned every step."""
+        static = PhysicsBody2D(x=10.0, y=10.0, width=10.0, height=10.0, body_type=BodyType.STATIC)
+        self.service.register_body(static)
+
+        with patch.object(self.service._broad_phase, 'update') as mock_update:
+            self.service.update_spatial_grid()
+            mock_update.assert_not_called()
+
+    def test_update_spatial_grid_rebins_moved_static_bodies(self):
+        """Test that a static body moved through its setters is re-binned on the next update."""
+        static = PhysicsBody2D(x=10.0, y=10.0, width=10.0, height=10.0, body_type=BodyType.STATIC)
+        self.service.register_body(static)
+
+        static.x = 500.0
+        self.service.update_spatial_grid()
+
+        self.assertNotIn(static, _cell_bodies(self.service._broad_phase, (0, 0)))
+        self.assertIn(static, _cell_bodies(self.service._broad_phase, (5, 0)))
+        self.assertEqual(self.service.query_point(505.0, 15.0), [static])
+
+    def test_update_spatial_grid_rebins_resized_sleeping_bodies(self):
+        """Test that a sleeping body resized through its setters is re-binned on the next update."""
+        body = PhysicsBody2D(x=10.0, y=10.0, width=10.0, height=10.0)
+        self.service.register_body(body)
+        body.set_sleeping(True)
+        self.service.update_spatial_grid()
+
+        body.width = 200.0
+        self.service.update_spatial_grid()
+
+        self.assertIn(body, _cell_bodies(self.service._broad_phase, (2, 0)))
+
+    def test_unregistered_body_stops_reporting_moves(self):
+        """Test that unregistering a body drops its moved callback."""
+        static = PhysicsBody2D(body_type=BodyType.STATIC)
+        self.service.register_body(static)
+        self.service.unregister_body(static)
+
+        static.x = 500.0
+
+        self.assertEqual(self.service._moved_bodies, {})
+
+    def test_update_spatial_grid_skips_sleeping_bodies(self):
+        """Test that sleeping bodies are not re-binned every step."""
+        body = PhysicsBody2D(x=10.0, y=10.0, width=10.0, height=10.0)
+        self.service.register_body(body)
+        body.set_sleeping(True)
+        self.service.update_spatial_grid()
+
+        with patch.object(self.service._broad_phase, 'update') as mock_update:
+            self.service.update_spatial_grid()
+            mock_update.assert_not_called()
+
     def test_detect_collisions_no_collision(self):
         """Test detecting collisions when bodies don't overlap."""
         body1 = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
@@ -327,6 +456,24 @@ class TestCollisionService(unittest.TestCase):
         self.assertEqual(len(collisions), 1)
         self.assertIsInstance(collisions[0], CollisionInfo)
 
+    def test_detect_collisions_reads_cached_bounds(self):
+        """Test that detection uses bounds cached by the broad phase."""
+        body1 = PhysicsBody2D(x=0.0, y=0.0, width=50.0, height=50.0)
+        body2 = PhysicsBody2D(x=25.0, y=25.0, width=50.0, height=50.0)
+        self.service.register_body(body1)
+        self.service.register_body(body2)
+        self.service.update_spatial_grid()
+
+        with patch.object(body1, 'get_bounds') as mock_a, patch.object(body2, 'get_bounds') as mock_b:
+            collisions = self.service.detect_collisions()
+
+            mock_a.assert_not_called()
+            mock_b.assert_not_called()
+
+        self.assertEqual(len(collisions), 1)
+        self.assertIs(collisions[0].body_a, body1)
+        self.assertEqual(collisions[0].penetration_depth, 25.0)
+
     def test_detect_collisions_skips_disabled_bodies(self):
         """Test that disabled bodies are skipped."""
         body1 = PhysicsBody2D(x=0.0, y=0.0, width=50.0, height=50.0)
@@ -350,6 +497,38 @@ class TestCollisionService(unittest.TestCase):
         collisions = self.service.detect_collisions()
 
         self.assertEqual(len(collisions), 0)
+        self.assertEqual(self.service.sleeping_contacts, [body2])
+
+    def test_detect_collisions_static_does_not_touch_sleeping(self):
+        """Test that static bodies overlapping a sleeper do not report it."""
+        ground = PhysicsBody2D(x=0.0, y=0.0, width=50.0, height=50.0, body_type=BodyType.STATIC)
+        body = PhysicsBody2D(x=25.0, y=25.0, width=50.0, height=50.0, sleeping=True)
+
+        self.service.register_body(ground)
+        self.service.register_body(body)
+        self.service.detect_collisions()
+
+        self.assertEqual(self.service.sleeping_contacts, [])
+
+    def test_sleeping_pair_kept_without_exit(self):
+        """Test that a contact is kept without exit callbacks while a body sleeps."""
+        body1 = PhysicsBody2D(x=0.0, y=0.0, width=50.0, height=50.0)
+        body2 = PhysicsBody2D(x=25.0, y=25.0, width=50.0, height=50.0)
+        body1.on_collision_exit = Mock()
+        self.service.register_body(body1)
+        self.service.register_body(body2)
+        self.service.detect_collisions()
+
+        body1.set_sleeping(True)
+        body2.set_sleeping(True)
+        self.service.detect_collisions()
+
+        body1.on_collision_exit.assert_not_called()
+        self.assertEqual(len(self.service._colliding_pairs), 1)
+
+        self.service.unregister_body(body2)
+        self.service.detect_collisions()
+        body1.on_collision_exit.assert_called_once_with(body2)
 
     def test_collision_callbacks_on_enter(self):
         """Test collision enter callbacks are triggered."""
@@ -463,6 +642,36 @@ class TestCollisionService(unittest.TestCase):
         should_collide = self.service._should_collide(body1, body2)
         self.assertTrue(should_collide)
 
+    def test_service_attaches_layer_matrix(self):
+        """Test that the broad phase filters pairs with the service's layer matrix."""
+        self.assertIs(self.service.broad_phase.layer_matrix, self.service.layer_matrix)
+
+        body = PhysicsBody2D(x=0.0, y=0.0, width=50.0, height=50.0)
+        panel = PhysicsBody2D(
+            x=25.0, y=25.0, width=50.0, height=50.0,
+            collision_layer=CollisionLayer.UI
+        )
+        self.service.register_body(body)
+        self.service.register_body(panel)
+
+        self.assertEqual(self.service.detect_collisions(), [])
+
+    def test_refresh_body_picks_up_layer_change(self):
+        """Test that refreshing a body re-reads its collision layer."""
+        body = PhysicsBody2D(x=0.0, y=0.0, width=50.0, height=50.0)
+        other = PhysicsBody2D(
+            x=25.0, y=25.0, width=50.0, height=50.0,
+            collision_layer=CollisionLayer.TRANSPARENT
+        )
+        self.service.register_body(body)
+        self.service.register_body(other)
+        self.assertEqual(self.service.detect_collisions(), [])
+
+        other.set_collision_layer(CollisionLayer.DEFAULT)
+        self.service.refresh_body(other)
+
+        self.assertEqual(len(self.service.detect_collisions()), 1)
+
     def test_check_collision_overlapping(self):
         """Test narrow-phase collision detection with overlap."""
         body1 = PhysicsBody2D(x=0.0, y=0.0, width=50.0, height=50.0)
@@ -496,6 +705,68 @@ class TestCollisionService(unittest.TestCase):
         self.assertEqual(collision.normal[1], 0.0)  # type: ignore
         self.assertNotEqual(collision.normal[0], 0.0)  # type: ignore
 
+    def test_check_collision_circles_use_shape(self):
+        """Test circles whose boxes overlap only at the corners don't collide."""
+        body1 = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0, collider_type=ColliderType.CIRCLE)
+        body2 = PhysicsBody2D(x=8.0, y=8.0, width=10.0, height=10.0, collider_type=ColliderType.CIRCLE)
+
+        self.assertIsNone(self.service._check_collision(body1, body2))
+
+        body2.x = 8.0
+        body2.y = 0.0
+        collision = self.service._check_collision(body1, body2)
+        self.assertIsNotNone(collision)
+        self.assertAlmostEqual(collision.penetration_depth, 2.0)  # type: ignore
+        self.assertEqual(collision.normal, (1.0, 0.0))  # type: ignore
+
+    def test_detect_collisions_dispatches_on_collider_type(self):
+        """Test detect_collisions uses the shape test for rotated boxes."""
+        box = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        diamond = PhysicsBody2D(x=12.0, y=12.0, width=10.0, height=10.0, roll=45.0)
+        self.service.register_body(box)
+        self.service.register_body(diamond)
+
+        # The diamond's bounds overlap the box, but its outline doesn't
+        self.assertEqual(self.service.detect_collisions(), [])
+
+        diamond.x = 8.0
+        diamond.y = 8.0
+        self.service.update_spatial_grid()
+        collisions = self.service.detect_collisions()
+        self.assertEqual(len(collisions), 1)
+        normal_x, normal_y = collisions[0].normal
+        self.assertAlmostEqual(normal_x, 0.5 ** 0.5)
+        self.assertAlmostEqual(normal_y, 0.5 ** 0.5)
+
+    def test_sweep_body_queues_speculative_contacts(self):
+        """Test a sweep reports the solid hit and queues contacts for crossed triggers."""
+        sensor = PhysicsBody2D(body_type=BodyType.STATIC, is_trigger=True, x=-10.0, y=50.0, width=30.0, height=5.0)
+        wall = PhysicsBody2D(body_type=BodyType.STATIC, x=-10.0, y=100.0, width=30.0, height=5.0)
+        beyond = PhysicsBody2D(body_type=BodyType.STATIC, is_trigger=True, x=-10.0, y=150.0, width=30.0, height=5.0)
+        body = PhysicsBody2D(x=0.0, y=200.0, width=10.0, height=10.0)
+        for registered in (sensor, wall, beyond, body):
+            self.service.register_body(registered)
+        sensor.on_collision_enter = Mock()
+
+        toi = self.service.sweep_body(body, 0.0, 0.0)
+
+        self.assertAlmostEqual(toi, 0.45)  # type: ignore
+        queued = {contact.body_b for contact in self.service.speculative_contacts}
+        self.assertEqual(queued, {sensor, wall})
+
+        collisions = self.service.detect_collisions()
+        self.assertEqual({c.body_a for c in collisions} | {c.body_b for c in collisions}, {sensor, wall, body})
+        sensor.on_collision_enter.assert_called_once_with(body)
+        self.assertEqual(self.service.speculative_contacts, [])
+
+    def test_sweep_body_without_movement(self):
+        """Test a body that didn't move is not swept."""
+        body = PhysicsBody2D(x=0.0, y=0.0)
+        self.service.register_body(body)
+
+        self.assertIsNone(self.service.sweep_body(body, 0.0, 0.0))
+        self.assertEqual(self.service.speculative_contacts, [])
+
     def test_resolve_collision_applies_impulse(self):
         """Test that collision resolution applies impulses."""
         body1 = PhysicsBody2D(x=0.0, y=0.0, width=50.0, height=50.0, mass=1.0)
@@ -299,6 +299,38 @@ class TestEnvironmentService(unittest.TestCase):
 
         self.assertIn("non-negative", str(context.exception))
 
+    def test_velocity_threshold_does_not_change_collision_iterations(self):
+        """Test that setting the velocity threshold leaves solver iterations alone."""
+        env = EnvironmentService()
+        env.collision_iterations = 8
+        env.velocity_threshold = 0.5
+
+        self.assertEqual(env.velocity_threshold, 0.5)
+        self.assertEqual(env.collision_iterations, 8)
+
+    def test_time_to_sleep_property_getter(self):
+        """Test time to sleep property getter."""
+        env = EnvironmentService()
+
+        self.assertEqual(env.time_to_sleep, 0.5)
+
+    def test_time_to_sleep_property_setter(self):
+        """Test time to sleep property setter."""
+        env = EnvironmentService()
+        env.time_to_sleep = 2.0
+
+        self.assertEqual(env.time_to_sleep, 2.0)
+        self.assertEqual(env.get_config()['time_to_sleep'], 2.0)
+
+    def test_time_to_sleep_negative_raises_error(self):
+        """Test that negative time to sleep raises ValueError."""
+        env = EnvironmentService()
+
+        with self.assertRaises(ValueError) as context:
+            env.time_to_sleep = -1.0
+
+        self.assertIn("non-negative", str(context.exception))
+
     def test_collision_iterations_property_getter(self):
         """Test collision iterations property getter."""
         env = EnvironmentService()
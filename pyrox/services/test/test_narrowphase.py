@@ -0,0 +1,247 @@
+"""Unit tests for the shape-specific narrow phase."""
+
+import unittest
+
+from pyrox.interfaces.protocols.physics import ColliderType
+from pyrox.models.protocols.physics import Collider2D
+from pyrox.services.narrowphase import (
+    NARROW_PHASE_TESTS,
+    collide_circle_polygon,
+    collide_circles,
+    collide_polygon_circle,
+    collide_polygons,
+    sweep_bounds,
+)
+
+
+def _circle(x, y, radius):
+    """Build a circle collider centered at (x, y)."""
+    return Collider2D(
+        collider_type=ColliderType.CIRCLE,
+        x=x - radius,
+        y=y - radius,
+        width=radius * 2,
+        height=radius * 2,
+    )
+
+
+def _box(x, y, width, height, roll=0.0):
+    """Build a box collider, optionally rotated."""
+    collider = Collider2D(x=x, y=y, width=width, height=height)
+    collider.set_roll(roll)
+    return collider
+
+
+class _BoxOnly:
+    """Collider stand-in without get_radius or get_world_vertices."""
+
+    def __init__(self, x, y, width, height):
+        self.width = width
+        self.height = height
+        self._bounds = (x, y, x + width, y + height)
+
+    def get_bounds(self):
+        return self._bounds
+
+    def get_center(self):
+        return (self._bounds[0] + self.width / 2, self._bounds[1] + self.height / 2)
+
+
+class TestCircles(unittest.TestCase):
+    """Test cases for circle-circle contacts."""
+
+    def test_overlapping_circles(self):
+        """Test penetration, normal and contact point of overlapping circles."""
+        contact = collide_circles(_circle(0.0, 0.0, 5.0), _circle(8.0, 0.0, 5.0))
+        penetration, normal_x, normal_y, contact_x, contact_y = contact
+
+        self.assertAlmostEqual(penetration, 2.0)
+        self.assertEqual((normal_x, normal_y), (1.0, 0.0))
+        self.assertAlmostEqual(contact_x, 4.0)
+        self.assertAlmostEqual(contact_y, 0.0)
+
+    def test_separated_circles(self):
+        """Test circles whose bounds overlap diagonally but which don't touch."""
+        self.assertIsNone(collide_circles(_circle(0.0, 0.0, 5.0), _circle(8.0, 8.0, 5.0)))
+
+    def test_concentric_circles(self):
+        """Test concentric circles still get a unit normal."""
+        penetration, normal_x, normal_y, _, _ = collide_circles(_circle(0.0, 0.0, 5.0), _circle(0.0, 0.0, 3.0))
+        self.assertAlmostEqual(penetration, 8.0)
+        self.assertEqual((normal_x, normal_y), (1.0, 0.0))
+
+
+class TestPolygonCircle(unittest.TestCase):
+    """Test cases for box/polygon-circle contacts."""
+
+    def test_circle_against_box_face(self):
+        """Test a circle resting into the top face of a box."""
+        contact = collide_polygon_circle(_box(0.0, 0.0, 20.0, 10.0), _circle(10.0, 14.0, 5.0))
+        penetration, normal_x, normal_y, contact_x, contact_y = contact
+
+        self.assertAlmostEqual(penetration, 1.0)
+        self.assertAlmostEqual(normal_x, 0.0)
+        self.assertAlmostEqual(normal_y, 1.0)
+        self.assertAlmostEqual(contact_x, 10.0)
+        self.assertAlmostEqual(contact_y, 10.0)
+
+    def test_circle_clear_of_box_corner(self):
+        """Test a circle near a corner, inside the bounds but outside the box."""
+        self.assertIsNone(collide_polygon_circle(_box(0.0, 0.0, 10.0, 10.0), _circle(14.0, 14.0, 5.0)))
+
+    def test_circle_center_inside_box(self):
+        """Test a circle whose center is inside the box is pushed out of the nearest face."""
+        contact = collide_polygon_circle(_box(0.0, 0.0, 20.0, 20.0), _circle(18.0, 10.0, 5.0))
+        penetration, normal_x, normal_y, _, _ = contact
+
+        self.assertAlmostEqual(penetration, 7.0)
+        self.assertAlmostEqual(normal_x, 1.0)
+        self.assertAlmostEqual(normal_y, 0.0)
+
+    def test_circle_inside_polygon_with_repeated_vertex(self):
+        """Test a repeated vertex doesn't shift the edges used for the inside test."""
+        square = Collider2D(
+            collider_type=ColliderType.POLYGON,
+            x=0.0,
+            y=0.0,
+            width=20.0,
+            height=20.0,
+            vertices=[(0.0, 0.0), (0.0, 0.0), (20.0, 0.0), (20.0, 20.0), (0.0, 20.0)],
+        )
+        penetration, normal_x, normal_y, _, _ = collide_polygon_circle(square, _circle(10.0, 18.0, 5.0))
+
+        self.assertAlmostEqual(penetration, 7.0)
+        self.assertAlmostEqual(normal_x, 0.0)
+        self.assertAlmostEqual(normal_y, 1.0)
+
+    def test_colliders_without_shape_methods(self):
+        """Test colliders that don't describe their shape fall back to their box."""
+        contact = collide_polygon_circle(_BoxOnly(0.0, 0.0, 20.0, 10.0), _BoxOnly(5.0, 9.0, 10.0, 10.0))
+        penetration, normal_x, normal_y, contact_x, contact_y = contact
+
+        self.assertAlmostEqual(penetration, 1.0)
+        self.assertAlmostEqual(normal_x, 0.0)
+        self.assertAlmostEqual(normal_y, 1.0)
+        self.assertAlmostEqual(contact_x, 10.0)
+        self.assertAlmostEqual(contact_y, 10.0)
+
+    def test_circle_first_flips_normal(self):
+        """Test the circle-first test points the normal from the circle to the box."""
+        box = _box(0.0, 0.0, 20.0, 10.0)
+        circle = _circle(10.0, 14.0, 5.0)
+        penetration, normal_x, normal_y, _, _ = collide_circle_polygon(circle, box)
+
+        self.assertAlmostEqual(penetration, 1.0)
+        self.assertAlmostEqual(normal_x, 0.0)
+        self.assertAlmostEqual(normal_y, -1.0)
+
+
+class TestPolygons(unittest.TestCase):
+    """Test cases for the separating axis test."""
+
+    def test_axis_aligned_boxes(self):
+        """Test SAT agrees with the AABB test for unrotated boxes."""
+        contact = collide_polygons(_box(0.0, 0.0, 10.0, 10.0), _box(8.0, 2.0, 10.0, 10.0))
+        penetration, normal_x, normal_y, _, _ = contact
+
+        self.assertAlmostEqual(penetration, 2.0)
+        self.assertAlmostEqual(normal_x, 1.0)
+        self.assertAlmostEqual(normal_y, 0.0)
+
+    def test_rotated_box_separated(self):
+        """Test a diamond whose bounds overlap a box it doesn't touch."""
+        box = _box(0.0, 0.0, 10.0, 10.0)
+        # A 10x10 box rotated 45 degrees around (17, 17) reaches ~7.07 from its center
+        diamond = _box(12.0, 12.0, 10.0, 10.0, roll=45.0)
+
+        self.assertLess(diamond.get_bounds()[0], 10.0)
+        self.assertIsNone(collide_polygons(box, diamond))
+
+    def test_rotated_box_corner_contact(self):
+        """Test a diamond's corner pushed into the top of a box."""
+        box = _box(0.0, 0.0, 20.0, 10.0)
+        diamond = _box(5.0, 11.0, 10.0, 10.0, roll=45.0)
+        penetration, normal_x, normal_y, contact_x, contact_y = collide_polygons(box, diamond)
+
+        # The diamond's lowest corner sits 50 ** 0.5 below its center at (10, 16)
+        self.assertAlmostEqual(penetration, 10.0 - (16.0 - 50.0 ** 0.5))
+        self.assertAlmostEqual(normal_x, 0.0)
+        self.assertAlmostEqual(normal_y, 1.0)
+        self.assertAlmostEqual(contact_x, 10.0)
+        self.assertAlmostEqual(contact_y, 16.0 - 50.0 ** 0.5)
+
+    def test_polygon_outline(self):
+        """Test a triangle against a box using its own vertices."""
+        triangle = Collider2D(
+            collider_type=ColliderType.POLYGON,
+            x=0.0,
+            y=8.0,
+            width=10.0,
+            height=10.0,
+            vertices=[(0.0, 0.0), (10.0, 0.0), (5.0, 10.0)],
+        )
+        box = _box(0.0, 0.0, 10.0, 10.0)
+        penetration, normal_x, normal_y, _, _ = collide_polygons(box, triangle)
+
+        self.assertAlmostEqual(penetration, 2.0)
+        self.assertAlmostEqual(normal_x, 0.0)
+        self.assertAlmostEqual(normal_y, 1.0)
+
+    def test_polygon_with_repeated_vertex(self):
+        """Test a repeated vertex is skipped without changing the result."""
+        triangle = Collider2D(
+            collider_type=ColliderType.POLYGON,
+            x=0.0,
+            y=8.0,
+            width=10.0,
+            height=10.0,
+            vertices=[(0.0, 0.0), (10.0, 0.0), (10.0, 0.0), (5.0, 10.0)],
+        )
+        box = _box(0.0, 0.0, 10.0, 10.0)
+        penetration, normal_x, normal_y, _, _ = collide_polygons(box, triangle)
+
+        self.assertAlmostEqual(penetration, 2.0)
+        self.assertAlmostEqual(normal_x, 0.0)
+        self.assertAlmostEqual(normal_y, 1.0)
+
+    def test_dispatch_table_covers_shape_pairs(self):
+        """Test every pair of solid shapes has a narrow-phase test."""
+        shapes = (ColliderType.RECTANGLE, ColliderType.CIRCLE, ColliderType.POLYGON)
+        for type_a in shapes:
+            for type_b in shapes:
+                self.assertIn((type_a, type_b), NARROW_PHASE_TESTS)
+        self.assertNotIn((ColliderType.NONE, ColliderType.RECTANGLE), NARROW_PHASE_TESTS)
+
+
+class TestSweepBounds(unittest.TestCase):
+    """Test cases for swept-AABB time of impact."""
+
+    def test_hit_along_motion(self):
+        """Test the fraction and normal of a box moving onto a thin target."""
+        hit = sweep_bounds((0.0, 0.0, 10.0, 10.0), 0.0, 200.0, (-10.0, 100.0, 20.0, 105.0))
+        self.assertEqual(hit, (0.45, 0.0, 1.0))
+
+    def test_hit_moving_left(self):
+        """Test the normal points against the motion's direction."""
+        hit = sweep_bounds((100.0, 0.0, 110.0, 10.0), -200.0, 0.0, (0.0, 0.0, 10.0, 10.0))
+        self.assertEqual(hit, (0.45, -1.0, 0.0))
+
+    def test_miss_beside_target(self):
+        """Test a move that passes beside the target."""
+        self.assertIsNone(sweep_bounds((0.0, 0.0, 10.0, 10.0), 0.0, 200.0, (50.0, 100.0, 80.0, 105.0)))
+
+    def test_miss_short_of_target(self):
+        """Test a move that ends before reaching the target."""
+        self.assertIsNone(sweep_bounds((0.0, 0.0, 10.0, 10.0), 0.0, 50.0, (0.0, 100.0, 10.0, 105.0)))
+
+    def test_diagonal_miss_past_corner(self):
+        """Test a diagonal move whose axes never overlap at the same time."""
+        self.assertIsNone(sweep_bounds((0.0, 0.0, 10.0, 10.0), 100.0, 20.0, (50.0, 40.0, 60.0, 50.0)))
+
+    def test_already_overlapping(self):
+        """Test overlaps at the start of the move are left to the discrete test."""
+        self.assertIsNone(sweep_bounds((0.0, 0.0, 10.0, 10.0), 0.0, 50.0, (5.0, 5.0, 15.0, 15.0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
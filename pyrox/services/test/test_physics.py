@@ -9,8 +9,18 @@ from unittest.mock import Mock, patch
 from pyrox.services.physics import PhysicsEngineService
 from pyrox.services.environment import EnvironmentService
 from pyrox.services.collision import CollisionService
-from pyrox.interfaces.protocols.physics import BodyType
+from pyrox.interfaces.protocols.physics import (
+    BodyType,
+    IBulletBody2D,
+    ICollider2D,
+    ICollisionBits,
+    IPhysicsBody2D,
+    IShapeCollider2D,
+)
 from pyrox.models.protocols import PhysicsBody2D
+from pyrox.models.physics.conveyor import ConveyorBody
+from pyrox.models.physics.floor import FloorBody
+from pyrox.models.physics.sensor import ProximitySensorBody
 
 
 class TestPhysicsEngineService(unittest.TestCase):
@@ -535,6 +545,16 @@ class TestPhysicsEngineService(unittest.TestCase):
         self.collision.update_spatial_grid.assert_called()
         self.collision.detect_collisions.assert_called()
 
+    def test_contacts_resolved_by_solver(self):
+        """Test that detected contacts are handed to the contact solver."""
+        collision = Mock()
+        self.engine.register_body(PhysicsBody2D())
+        self.collision.detect_collisions = Mock(return_value=[collision])
+
+        with patch.object(self.engine.solver, 'solve') as mock_solve:
+            self.engine.step(0.020)
+            mock_solve.assert_called_once_with([collision], self.environment)
+
     def test_reset(self):
         """Test resetting the engine state."""
         body = PhysicsBody2D()
@@ -659,6 +679,18 @@ class TestPhysicsEngineService(unittest.TestCase):
         result = self.engine.query_bodies_at_point(50.0, 50.0)
         self.assertEqual(len(result), 0)
 
+    def test_query_bodies_at_point_finds_moved_static_body(self):
+        """Test that a static body moved through its setters is found at its new position."""
+        body = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0, body_type=BodyType.STATIC)
+        self.engine.register_body(body)
+        self.assertEqual(self.engine.query_bodies_at_point(5.0, 5.0), [body])
+
+        body.x = 500.0
+        body.y = 500.0
+
+        self.assertEqual(self.engine.query_bodies_at_point(505.0, 505.0), [body])
+        self.assertEqual(self.engine.query_bodies_in_area(0.0, 0.0, 20.0, 20.0), [])
+
     def test_query_bodies_at_point_overlapping(self):
         """Test querying bodies at a point where multiple bodies overlap."""
         body1 = PhysicsBody2D()
@@ -745,8 +777,8 @@ class TestPhysicsEngineService(unittest.TestCase):
         # Call update sleep state directly
         self.engine._update_sleep_state()
 
-        # Currently doesn't auto-sleep, just checks threshold
-        # This test documents current behavior
+        # A single step is far below time_to_sleep
+        self.assertFalse(body.sleeping)
 
     def test_bodies_property(self):
         """Test that bodies property returns current list."""
@@ -775,5 +807,709 @@ class TestPhysicsEngineService(unittest.TestCase):
         self.assertIsInstance(collision, CollisionService)
 
 
+class TestPhysicsEngineSleeping(unittest.TestCase):
+    """Test cases for rest timers, sleep islands and waking."""
+
+    def setUp(self):
+        """Set up an engine without gravity or drag."""
+        self.environment = EnvironmentService(preset='space')
+        self.environment.time_to_sleep = 0.5
+        self.engine = PhysicsEngineService(environment=self.environment)
+        self.dt = self.engine.get_physics_step()
+
+    def _run(self, seconds):
+        for _ in range(int(round(seconds / self.dt))):
+            self.engine.step(self.dt)
+
+    def test_resting_body_sleeps_after_time_to_sleep(self):
+        """Test that a body at rest sleeps once its rest timer expires."""
+        body = PhysicsBody2D(x=0.0, y=0.0)
+        self.engine.register_body(body)
+
+        self._run(0.4)
+        self.assertFalse(body.sleeping)
+
+        self._run(0.2)
+        self.assertTrue(body.sleeping)
+        self.assertEqual(self.engine.get_stats()['sleeping_bodies'], 1)
+
+    def test_moving_body_does_not_sleep(self):
+        """Test that moving bodies keep resetting their rest timer."""
+        body = PhysicsBody2D(x=0.0, y=0.0, velocity_x=5.0)
+        self.engine.register_body(body)
+
+        self._run(1.0)
+
+        self.assertFalse(body.sleeping)
+
+    def test_island_sleeps_together(self):
+        """Test that touching bodies only sleep once all of them are at rest."""
+        still = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        settling = PhysicsBody2D(x=9.0, y=0.0, width=10.0, height=10.0)
+        self.engine.register_body(still)
+        self.engine.register_body(settling)
+
+        self._run(0.3)
+        settling.set_angular_velocity(1.0)
+        self._run(0.3)
+        self.assertFalse(still.sleeping)
+        self.assertFalse(settling.sleeping)
+
+        settling.set_angular_velocity(0.0)
+        self._run(0.6)
+        self.assertTrue(still.sleeping)
+        self.assertTrue(settling.sleeping)
+
+    def test_contact_wakes_island(self):
+        """Test that a moving body hitting a sleeping island wakes all of it."""
+        first = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        second = PhysicsBody2D(x=9.0, y=0.0, width=10.0, height=10.0)
+        self.engine.register_body(first)
+        self.engine.register_body(second)
+        self._run(0.6)
+        self.assertTrue(first.sleeping)
+        self.assertTrue(second.sleeping)
+
+        mover = PhysicsBody2D(x=40.0, y=0.0, width=10.0, height=10.0, velocity_x=-300.0)
+        self.engine.register_body(mover)
+        self._run(0.2)
+
+        self.assertFalse(first.sleeping)
+        self.assertFalse(second.sleeping)
+
+    def test_static_contact_does_not_wake(self):
+        """Test that static bodies touching a sleeper do not wake it."""
+        ground = PhysicsBody2D(x=0.0, y=10.0, width=100.0, height=10.0, body_type=BodyType.STATIC)
+        body = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        self.engine.register_body(ground)
+        self.engine.register_body(body)
+
+        self._run(1.0)
+
+        self.assertTrue(body.sleeping)
+
+    def test_impulse_and_velocity_wake_body(self):
+        """Test that impulses and non-zero velocities wake a sleeping body."""
+        body = PhysicsBody2D(sleeping=True)
+        body.set_linear_velocity(0.0, 0.0)
+        self.assertTrue(body.sleeping)
+        body.apply_impulse(1.0, 0.0)
+        self.assertFalse(body.sleeping)
+
+        body.set_sleeping(True)
+        body.set_linear_velocity(0.0, 2.0)
+        self.assertFalse(body.sleeping)
+
+    def test_external_wake_wakes_island(self):
+        """Test that waking one member outside the engine wakes its island."""
+        first = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        second = PhysicsBody2D(x=9.0, y=0.0, width=10.0, height=10.0)
+        self.engine.register_body(first)
+        self.engine.register_body(second)
+        self._run(0.6)
+
+        first.apply_impulse(0.0, 1.0)
+        self.engine.step(self.dt)
+
+        self.assertFalse(second.sleeping)
+
+    def test_sleeping_contact_has_no_exit_callback(self):
+        """Test that contacts are kept, not exited, when bodies fall asleep."""
+        first = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        second = PhysicsBody2D(x=9.0, y=0.0, width=10.0, height=10.0)
+        self.engine.register_body(first)
+        self.engine.register_body(second)
+
+        with patch.object(first, 'on_collision_exit') as mock_exit:
+            self._run(1.0)
+            self.assertTrue(first.sleeping)
+            mock_exit.assert_not_called()
+
+    def test_unregister_and_clear_drop_sleep_state(self):
+        """Test that removing bodies drops their rest timers and islands."""
+        first = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0)
+        second = PhysicsBody2D(x=9.0, y=0.0, width=10.0, height=10.0)
+        self.engine.register_body(first)
+        self.engine.register_body(second)
+        self._run(0.6)
+
+        self.engine.unregister_body(first)
+        self.assertNotIn(first, self.engine._islands)
+        self.assertEqual(self.engine._islands[second], [second])
+
+        self.engine.clear()
+        self.assertEqual(self.engine._islands, {})
+        self.assertEqual(self.engine._rest_times, {})
+
+
+class TestPhysicsEngineContinuousCollision(unittest.TestCase):
+    """Test cases for sweeping bullet bodies between steps."""
+
+    def setUp(self):
+        """Set up an engine without gravity or drag, and a thin floor."""
+        self.environment = EnvironmentService(preset='space')
+        self.environment.terminal_velocity = 100000.0
+        self.engine = PhysicsEngineService(environment=self.environment)
+        self.dt = self.engine.get_physics_step()
+
+    def _fast_body(self, bullet):
+        # Moves ~117 units per step, far more than a 10 unit body plus a 5 unit sensor
+        body = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0, velocity_y=7000.0, bullet=bullet)
+        self.engine.register_body(body)
+        return body
+
+    def _sensor(self):
+        sensor = PhysicsBody2D(
+            body_type=BodyType.STATIC, mass=0.0, is_trigger=True,
+            x=-10.0, y=100.0, width=30.0, height=5.0,
+        )
+        sensor.on_collision_enter = Mock()
+        sensor.on_collision_exit = Mock()
+        self.engine.register_body(sensor)
+        return sensor
+
+    def test_fast_body_tunnels_without_bullet(self):
+        """Test that discrete steps miss a thin sensor."""
+        sensor = self._sensor()
+        body = self._fast_body(bullet=False)
+
+        self.engine.step(self.dt)
+
+        self.assertGreater(body.y, 105.0)
+        sensor.on_collision_enter.assert_not_called()
+
+    def test_bullet_triggers_thin_sensor(self):
+        """Test that a bullet crossing a sensor within one step enters and then exits it."""
+        sensor = self._sensor()
+        body = self._fast_body(bullet=True)
+
+        self.engine.step(self.dt)
+        sensor.on_collision_enter.assert_called_once_with(body)
+        sensor.on_collision_exit.assert_not_called()
+        self.assertGreater(body.y, 105.0)  # Triggers don't stop the body
+
+        self.engine.step(self.dt)
+        sensor.on_collision_exit.assert_called_once_with(body)
+
+    def test_bullet_stops_at_thin_wall(self):
+        """Test that a bullet is stopped at the first solid body in its path."""
+        wall = PhysicsBody2D(body_type=BodyType.STATIC, mass=0.0, x=-10.0, y=100.0, width=30.0, height=5.0)
+        self.engine.register_body(wall)
+        body = self._fast_body(bullet=True)
+
+        self.engine.step(self.dt)
+
+        self.assertAlmostEqual(body.y, 90.0)
+        self.assertLessEqual(body.velocity_y, 0.0)
+
+    def test_bullet_flag_toggle(self):
+        """Test that the bullet flag can be changed at runtime."""
+        sensor = self._sensor()
+        body = self._fast_body(bullet=False)
+        body.bullet = True
+
+        self.engine.step(self.dt)
+
+        self.assertTrue(body.bullet)
+        sensor.on_collision_enter.assert_called_once_with(body)
+
+
+class TestPhysicsEngineProfiling(unittest.TestCase):
+    """Test cases for opt-in step profiling."""
+
+    def setUp(self):
+        """Set up an engine with two resting boxes on a floor."""
+        self.engine = PhysicsEngineService(profiling=True)
+        self.dt = self.engine.get_physics_step()
+        floor = PhysicsBody2D(body_type=BodyType.STATIC, mass=0.0, x=0.0, y=0.0, width=100.0, height=10.0)
+        self.engine.register_body(floor)
+        for x in (10.0, 60.0):
+            self.engine.register_body(PhysicsBody2D(x=x, y=9.0, width=10.0, height=10.0))
+
+    def test_disabled_by_default(self):
+        """Test that engines don't profile unless asked to."""
+        engine = PhysicsEngineService()
+        engine.step(engine.get_physics_step())
+
+        self.assertFalse(engine.profiling)
+        self.assertIsNone(engine.profiler)
+        self.assertIsNone(engine.get_stats()['profile'])
+
+    def test_phases_timed(self):
+        """Test that every phase that ran is timed once per step."""
+        for _ in range(3):
+            self.engine.step(self.dt)
+
+        profile = self.engine.get_stats()['profile']
+        self.assertEqual(profile['step']['count'], 3)
+        for phase in ('forces', 'integrate', 'grid', 'detect', 'resolve', 'update', 'sleep'):
+            self.assertEqual(profile['phases'][phase]['count'], 3, phase)
+        self.assertEqual(profile['phases']['sweep']['count'], 0)  # No bullets
+
+    def test_pair_counts(self):
+        """Test that candidate pairs and narrow-phase hits are counted."""
+        self.engine.step(self.dt)
+
+        profiler = self.engine.profiler
+        self.assertEqual(profiler.candidate_pairs.last, 2)  # Each box against the floor
+        self.assertEqual(profiler.narrow_hits.last, 2)
+        self.assertEqual(self.engine.get_stats()['profile']['hit_ratio'], 1.0)
+
+    def test_dropped_steps_counted(self):
+        """Test that steps skipped by the max steps guard are counted."""
+        self.engine.step(self.dt * 15.5)
+
+        stats = self.engine.get_stats()
+        self.assertEqual(stats['step_count'], 10)
+        self.assertEqual(stats['dropped_steps'], 5)
+        self.assertEqual(stats['profile']['dropped_steps'], 5)
+
+    def test_toggle_and_reset(self):
+        """Test that profiling can be switched at runtime and is cleared on reset."""
+        self.engine.step(self.dt)
+        self.engine.reset()
+        self.assertEqual(self.engine.profiler.step_time.count, 0)
+
+        self.engine.profiling = False
+        self.engine.step(self.dt)
+        self.assertIsNone(self.engine.profiler)
+
+        self.engine.profiling = True
+        self.engine.step(self.dt)
+        self.assertEqual(self.engine.profiler.step_time.count, 1)
+
+
+class TestPhysicsEngineSnapshot(unittest.TestCase):
+    """Test cases for snapshot and restore."""
+
+    def _build_engine(self):
+        """Build an engine with boxes dropped and thrown onto a floor."""
+        engine = PhysicsEngineService()
+        engine.environment.gravity = (0.0, 400.0)
+        engine.environment.sleep_threshold = 10.0  # Above what gravity adds in a step, so stacks can sleep
+        engine.register_body(PhysicsBody2D(
+            body_type=BodyType.STATIC, mass=0.0, x=0.0, y=100.0, width=300.0, height=10.0,
+        ))
+        for i in range(6):
+            box = PhysicsBody2D(x=20.0 + i * 12.0, y=40.0 - i * 15.0, width=10.0, height=10.0)
+            box.set_linear_velocity(30.0 - i * 10.0, 0.0)
+            engine.register_body(box)
+        return engine
+
+    @staticmethod
+    def _state(engine):
+        return [
+            (body.x, body.y, body.roll, body.linear_velocity, body.angular_velocity, body.sleeping)
+            for body in engine.bodies
+        ]
+
+    def _run(self, engine, steps):
+        dt = engine.get_physics_step()
+        for _ in range(steps):
+            engine.step(dt)
+
+    def test_rewind_and_replay(self):
+        """Test that replaying from a snapshot reproduces the same steps exactly."""
+        engine = self._build_engine()
+        self._run(engine, 20)
+        snapshot = engine.snapshot()
+        self._run(engine, 120)
+        first = self._state(engine)
+        stats = engine.get_stats()
+
+        engine.restore(snapshot)
+        self.assertEqual(engine.get_stats()['step_count'], 20)
+        self._run(engine, 120)
+
+        self.assertEqual(self._state(engine), first)
+        self.assertEqual(engine.get_stats()['step_count'], stats['step_count'])
+        self.assertTrue(any(sleeping for *_, sleeping in first))
+
+    def test_contact_state_restored(self):
+        """Test that colliding pairs, warm-start impulses and islands come back."""
+        engine = self._build_engine()
+        self._run(engine, 90)
+        pairs = engine.collision.colliding_pairs
+        impulses = dict(engine.solver.cached_impulses)
+        snapshot = engine.snapshot()
+        self.assertTrue(pairs)
+
+        self._run(engine, 1)
+        engine.solver.clear()
+        engine.collision.colliding_pairs = []
+        engine.restore(snapshot)
+
+        self.assertEqual(engine.collision.colliding_pairs, pairs)
+        self.assertEqual(engine.solver.cached_impulses, impulses)
+
+    def test_fork_into_another_engine(self):
+        """Test that a snapshot forks into an engine with the same bodies registered."""
+        engine = self._build_engine()
+        self._run(engine, 30)
+        fork = self._build_engine()
+        fork.restore(engine.snapshot())
+        self.assertEqual(self._state(fork), self._state(engine))
+
+        self._run(engine, 60)
+        self._run(fork, 60)
+
+        self.assertEqual(self._state(fork), self._state(engine))
+
+    def test_sleeping_body_refreshed_in_broad_phase(self):
+        """Test that restored positions of sleeping bodies reach the broad phase."""
+        engine = self._build_engine()
+        floor = engine.bodies[0]
+        snapshot = engine.snapshot()
+
+        floor.x = 1000.0
+        engine.refresh_body(floor)
+        engine.restore(snapshot)
+
+        self.assertIn(floor, engine.query_bodies_at_point(150.0, 105.0))
+
+    def test_invalid_snapshots_rejected(self):
+        """Test that foreign, truncated and mismatched blobs raise ValueError."""
+        engine = self._build_engine()
+        snapshot = engine.snapshot()
+
+        with self.assertRaises(ValueError):
+            engine.restore(b'XXXX' + snapshot[4:])
+        with self.assertRaises(ValueError):
+            engine.restore(snapshot[:-3])
+        with self.assertRaises(ValueError):
+            engine.restore(snapshot + b'\x00')
+
+        engine.unregister_body(engine.bodies[-1])
+        with self.assertRaises(ValueError):
+            engine.restore(snapshot)
+
+
+class TestPhysicsEngineSurfaceEffects(unittest.TestCase):
+    """Test cases for the batched conveyor and floor stage."""
+
+    def setUp(self):
+        """Set up an engine with gravity and a belt running east."""
+        self.engine = PhysicsEngineService()
+        self.engine.environment.gravity = (0.0, 400.0)
+        self.dt = self.engine.get_physics_step()
+        self.belt = ConveyorBody(x=0.0, y=100.0, width=400.0, height=20.0, belt_speed=60.0)
+        self.engine.register_body(self.belt)
+
+    def _crate(self, x, y=90.5, **kwargs):
+        crate = PhysicsBody2D(x=x, y=y, width=10.0, height=10.0, **kwargs)
+        self.engine.register_body(crate)
+        return crate
+
+    def test_belt_carries_crates(self):
+        """Test that crates resting on the belt move at belt speed."""
+        crates = [self._crate(x) for x in (20.0, 60.0, 100.0)]
+
+        for _ in range(10):
+            self.engine.step(self.dt)
+
+        # Solver friction still acts after the stage, so the crates move
+        # close to, not exactly at, belt speed
+        for start, crate in zip((20.0, 60.0, 100.0), crates):
+            self.assertGreater(crate.linear_velocity[0], 30.0)
+            self.assertGreater(crate.x, start)
+        self.assertEqual(self.belt.get_objects_on_belt(), set(crates))
+
+    def test_effector_called_once_per_step_with_dynamic_contacts(self):
+        """Test that each effector gets all of its dynamic contacts in one call."""
+        crates = [self._crate(x) for x in (20.0, 60.0, 100.0)]
+        self.engine.register_body(PhysicsBody2D(
+            body_type=BodyType.KINEMATIC, x=200.0, y=90.5, width=10.0, height=10.0,
+        ))
+
+        with patch.object(ConveyorBody, 'apply_surface_effect') as apply_surface_effect:
+            self.engine.step(self.dt)
+
+        apply_surface_effect.assert_called_once()
+        bodies, bounds, dt = apply_surface_effect.call_args.args
+        self.assertEqual(bodies, crates)
+        self.assertEqual(bounds, [self.engine.collision.broad_phase.get_cached_bounds(crate) for crate in crates])
+        self.assertEqual(dt, self.dt)
+
+    def test_unregistered_effector_not_applied(self):
+        """Test that removing a belt stops its stage."""
+        self._crate(20.0)
+        self.engine.unregister_body(self.belt)
+
+        with patch.object(ConveyorBody, 'apply_surface_effect') as apply_surface_effect:
+            self.engine.step(self.dt)
+
+        apply_surface_effect.assert_not_called()
+
+    def test_trigger_floor_damps_velocity(self):
+        """Test that a top-down floor damps the bodies sliding over it."""
+        engine = PhysicsEngineService(environment=EnvironmentService(preset='space'))
+        engine.environment.linear_damping = 1.0
+        floor = FloorBody(x=0.0, y=0.0, width=1000.0, height=1000.0, surface_type='ice')
+        crate = PhysicsBody2D(x=100.0, y=100.0, width=10.0, height=10.0, velocity_x=100.0)
+        stopped = PhysicsBody2D(x=300.0, y=100.0, width=10.0, height=10.0, velocity_x=0.5)
+        for body in (floor, crate, stopped):
+            engine.register_body(body)
+
+        engine.step(engine.get_physics_step())
+
+        retention = (1.0 - 0.1 * 0.15) * (1.0 - 0.5 * 0.01)
+        self.assertAlmostEqual(crate.linear_velocity[0], 100.0 * retention)
+        self.assertEqual(stopped.linear_velocity, (0.0, 0.0))
+
+
+class TestPhysicsEngineSensorEvents(unittest.TestCase):
+    """Test cases for dispatching queued sensor events after each step."""
+
+    def setUp(self):
+        """Set up an engine without gravity and a row of sensors."""
+        self.engine = PhysicsEngineService(environment=EnvironmentService(preset='space'))
+        self.dt = self.engine.get_physics_step()
+        self.sensors = [ProximitySensorBody(x=i * 20.0, y=0.0, width=10.0, height=10.0) for i in range(50)]
+        for sensor in self.sensors:
+            self.engine.register_body(sensor)
+
+    def test_events_dispatched_after_detection(self):
+        """Test that sensor callbacks run once collision detection is done."""
+        box = PhysicsBody2D(x=2.0, y=2.0, width=4.0, height=4.0)
+        self.engine.register_body(box)
+        seen = []
+        self.sensors[0].on_object_enter_callbacks.append(
+            lambda sensor, other: seen.append((other, self.engine.collision.colliding_pairs))
+        )
+
+        self.engine.step(self.dt)
+
+        self.assertEqual(len(seen), 1)
+        other, pairs = seen[0]
+        self.assertIs(other, box)
+        self.assertTrue(any(box in pair for pair in pairs))
+
+    def test_many_sensors_activate_in_one_step(self):
+        """Test that every sensor changing state in a step reports once."""
+        activated = []
+        for sensor in self.sensors:
+            sensor.on_activate_callbacks.append(activated.append)
+            self.engine.register_body(PhysicsBody2D(x=sensor.x + 2.0, y=2.0, width=4.0, height=4.0))
+
+        self.engine.step(self.dt)
+        self.engine.step(self.dt)
+
+        self.assertEqual(activated, self.sensors)
+
+    def test_callback_can_remove_detected_body(self):
+        """Test that a callback can change the simulation without breaking the step."""
+        boxes = [PhysicsBody2D(x=sensor.x + 2.0, y=2.0, width=4.0, height=4.0) for sensor in self.sensors[:10]]
+        for box in boxes:
+            self.engine.register_body(box)
+        for sensor in self.sensors:
+            sensor.on_object_enter_callbacks.append(lambda sensor, other: self.engine.unregister_body(other))
+
+        self.engine.step(self.dt)
+
+        for box in boxes:
+            self.assertNotIn(box, self.engine.bodies)
+
+    def test_unregistered_sensor_not_dispatched(self):
+        """Test that removing a sensor stops the engine dispatching it."""
+        sensor = self.sensors[0]
+        self.engine.unregister_body(sensor)
+        sensor.on_collision_enter(PhysicsBody2D())
+
+        self.engine.step(self.dt)
+
+        self.assertTrue(sensor.has_pending_events)
+
+
+class TestPhysicsEngineInterpolation(unittest.TestCase):
+    """Test cases for interpolating positions between fixed steps."""
+
+    def setUp(self):
+        """Set up a 30 Hz engine without gravity and a moving box."""
+        self.engine = PhysicsEngineService(
+            environment=EnvironmentService(preset='space'),
+            physics_step=1.0 / 30.0,
+            interpolation=True,
+        )
+        self.box = PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0, velocity_x=30.0)
+        self.wall = PhysicsBody2D(body_type=BodyType.STATIC, x=500.0, y=0.0, width=10.0, height=10.0)
+        self.engine.register_body(self.box)
+        self.engine.register_body(self.wall)
+
+    def test_alpha_tracks_accumulator(self):
+        """Test that alpha is the leftover time as a fraction of a step."""
+        self.assertEqual(self.engine.interpolation_alpha, 0.0)
+
+        self.engine.step(1.0 / 60.0)
+
+        self.assertAlmostEqual(self.engine.interpolation_alpha, 0.5)
+
+    def test_positions_blend_between_steps(self):
+        """Test that rendering at 60 Hz sees positions between 30 Hz steps."""
+        self.engine.step(1.0 / 30.0)
+        start_x = self.box.x
+        self.engine.step(1.0 / 30.0)
+        end_x = self.box.x
+        self.engine.step(1.0 / 60.0)
+
+        positions = self.engine.get_interpolated_positions()
+
+        self.assertEqual(self.box.x, end_x)
+        self.assertAlmostEqual(positions[self.box][0], (start_x + end_x) / 2.0)
+        self.assertEqual(positions[self.wall], (500.0, 0.0))
+
+    def test_explicit_alpha(self):
+        """Test that alpha can be given explicitly."""
+        self.engine.step(1.0 / 30.0)
+
+        self.assertEqual(self.engine.get_interpolated_positions(0.0)[self.box], (0.0, 0.0))
+        self.assertEqual(self.engine.get_interpolated_positions(1.0)[self.box], (self.box.x, self.box.y))
+
+    def test_refresh_body_snaps_to_new_position(self):
+        """Test that a body moved outside the simulation isn't interpolated from its old position."""
+        self.engine.step(1.0 / 30.0)
+        self.box.x = 200.0
+        self.engine.refresh_body(self.box)
+
+        positions = self.engine.get_interpolated_positions(0.5)
+
+        self.assertEqual(positions[self.box], (200.0, 0.0))
+
+    def test_reset_clears_previous_positions(self):
+        """Test that reset leaves every body at its current position."""
+        self.engine.step(1.0 / 30.0)
+        self.engine.reset()
+
+        positions = self.engine.get_interpolated_positions(0.0)
+
+        self.assertEqual(positions[self.box], (self.box.x, self.box.y))
+
+    def test_disabled_by_default(self):
+        """Test that an engine without interpolation keeps no previous positions."""
+        engine = PhysicsEngineService(environment=EnvironmentService(preset='space'))
+        engine.register_body(self.box)
+        engine.step(1.0 / 30.0)
+
+        self.assertFalse(engine.interpolation)
+        self.assertEqual(engine.get_interpolated_positions(0.0)[self.box], (self.box.x, self.box.y))
+
+    def test_disabling_clears_previous_positions(self):
+        """Test that turning interpolation off leaves every body at its current position."""
+        self.engine.step(1.0 / 30.0)
+        self.engine.interpolation = False
+
+        self.assertEqual(self.engine.get_interpolated_positions(0.0)[self.box], (self.box.x, self.box.y))
+
+    def test_static_bodies_not_recorded(self):
+        """Test that static bodies are not kept for interpolation."""
+        self.engine.step(1.0 / 30.0)
+
+        self.assertIn(self.box, self.engine._previous_positions)
+        self.assertNotIn(self.wall, self.engine._previous_positions)
+
+    def test_moving_positions_skip_still_bodies(self):
+        """Test that only bodies that moved are visited, at their interpolated positions."""
+        self.engine.step(1.0 / 30.0)
+        start_x = self.box.x
+        self.engine.step(1.0 / 30.0)
+
+        moving = dict(self.engine.iter_moving_positions(0.5))
+
+        self.assertEqual(list(moving), [self.box])
+        self.assertAlmostEqual(moving[self.box][0], (start_x + self.box.x) / 2.0)
+
+    def test_moving_positions_without_interpolation(self):
+        """Test that moving bodies are still visited at their current positions when interpolation is off."""
+        for use_arrays in (False, True):
+            with self.subTest(use_arrays=use_arrays):
+                self.engine.use_arrays = use_arrays
+                self.engine.interpolation = False
+                self.box.sleeping = False
+                self.engine.step(1.0 / 30.0)
+
+                self.assertEqual(dict(self.engine.iter_moving_positions()), {self.box: (self.box.x, self.box.y)})
+
+                self.box.sleeping = True
+                self.assertEqual(dict(self.engine.iter_moving_positions()), {})
+
+
+# Members added to the physics models after the original protocols
+_NEWER_MEMBERS = frozenset((
+    'bullet', 'get_bullet', 'set_bullet',
+    'layer_bits', 'mask_bits', 'get_layer_bits', 'get_mask_bits',
+    'get_radius', 'get_world_vertices',
+    'set_moved_callback', 'set_array_store', 'has_box_bounds',
+))
+
+
+def _forward(wrapper, name, own=()):
+    """Look up an attribute on a baseline wrapper's model, hiding the newer members."""
+    if name in _NEWER_MEMBERS:
+        raise AttributeError(name)
+    if name.startswith('__') or name in own:
+        return object.__getattribute__(wrapper, name)
+    return getattr(object.__getattribute__(wrapper, '_target'), name)
+
+
+class _BaselineCollider(ICollider2D):
+    """Third-party collider that only implements the original ICollider2D."""
+
+    def __init__(self, collider):
+        self._target = collider
+
+    def __getattribute__(self, name):
+        return _forward(self, name)
+
+
+class _BaselineBody(IPhysicsBody2D):
+    """Third-party body that only implements the original IPhysicsBody2D."""
+
+    def __init__(self, body):
+        self._target = body
+        self._baseline_collider = _BaselineCollider(body.collider)
+
+    def __getattribute__(self, name):
+        return _forward(self, name, own=('collider', 'get_collider', '_baseline_collider'))
+
+    def get_collider(self):
+        return self._baseline_collider
+
+
+class TestPhysicsEngineBaselineBodies(unittest.TestCase):
+    """Test cases for bodies written against the original physics protocols."""
+
+    def _simulate(self, wrap):
+        """Move a box onto a wall for a second and return the box."""
+        engine = PhysicsEngineService(environment=EnvironmentService(preset='space'))
+        wall = wrap(PhysicsBody2D(
+            body_type=BodyType.STATIC, mass=0.0, x=-50.0, y=20.0, width=100.0, height=10.0,
+        ))
+        box = wrap(PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0, velocity_y=100.0))
+        engine.register_body(wall)
+        engine.register_body(box)
+        for _ in range(60):
+            engine.step(engine.get_physics_step())
+        self.assertIn(box, engine.bodies)
+        return box
+
+    def test_optional_protocols_are_separate(self):
+        """Test the original protocols don't require the optional capabilities."""
+        box = _BaselineBody(PhysicsBody2D())
+        self.assertIsInstance(box, IPhysicsBody2D)
+        self.assertIsInstance(box.collider, ICollider2D)
+        self.assertNotIsInstance(box, IBulletBody2D)
+        self.assertNotIsInstance(box.collider, ICollisionBits)
+        self.assertNotIsInstance(box.collider, IShapeCollider2D)
+        self.assertIsInstance(PhysicsBody2D(), IBulletBody2D)
+
+    def test_baseline_bodies_register_and_collide(self):
+        """Test baseline-only bodies are simulated like the models and bounce off each other."""
+        box = self._simulate(_BaselineBody)
+        expected = self._simulate(lambda body: body)
+
+        self.assertLess(box.velocity_y, 0.0)
+        self.assertAlmostEqual(box.y, expected.y)
+        self.assertEqual(box.linear_velocity, expected.linear_velocity)
+
+
 if __name__ == '__main__':
     unittest.main()
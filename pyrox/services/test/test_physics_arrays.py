@@ -0,0 +1,297 @@
+"""Unit tests for the array-backed physics state.
+
+Verifies that the vectorized force/integration passes match the per-body
+engine path, that bodies sync from their rows only when read, and that
+edits made through the bodies reach the rows.
+"""
+
+import copy
+import unittest
+from pyrox.services.physics import PhysicsEngineService
+from pyrox.services.physics_arrays import PhysicsBodyArrays
+from pyrox.services.environment import EnvironmentService
+from pyrox.interfaces.protocols.physics import BodyType
+from pyrox.models.protocols import PhysicsBody2D
+
+
+def _make_bodies():
+    """Create a mixed set of bodies covering every integration branch."""
+    return [
+        PhysicsBody2D(x=0.0, y=0.0, width=10.0, height=10.0, velocity_x=30.0, velocity_y=-5.0),
+        PhysicsBody2D(x=50.0, y=10.0, width=40.0, height=20.0, mass=5.0, velocity_x=-300.0),
+        PhysicsBody2D(x=-20.0, y=5.0, width=5.0, height=5.0, velocity_x=1.0, velocity_y=1.0),
+        PhysicsBody2D(x=0.0, y=0.0, mass=0.0, velocity_x=4.0),
+        PhysicsBody2D(x=10.0, y=20.0, body_type=BodyType.KINEMATIC, velocity_x=5.0, velocity_y=3.0),
+        PhysicsBody2D(x=100.0, y=100.0, body_type=BodyType.STATIC, velocity_x=5.0),
+        PhysicsBody2D(x=0.0, y=0.0, angular_velocity=1.5, velocity_y=12.0),
+        PhysicsBody2D(x=0.0, y=0.0, velocity_x=50.0, sleeping=True),
+        PhysicsBody2D(x=0.0, y=0.0, velocity_x=50.0, enabled=False),
+    ]
+
+
+def _make_arrays(bodies) -> PhysicsBodyArrays:
+    """Create an array store with a row for each body."""
+    arrays = PhysicsBodyArrays()
+    for body in bodies:
+        arrays.add(body)
+    return arrays
+
+
+def _step(arrays: PhysicsBodyArrays, environment, dt: float) -> None:
+    """Run one step the way the engine does."""
+    arrays.prepare()
+    arrays.step(environment, dt)
+
+
+def _free_space() -> EnvironmentService:
+    """Create an environment where bodies keep their velocity."""
+    environment = EnvironmentService(preset='space')
+    environment.linear_damping = 1.0
+    return environment
+
+
+class _UnattachableBody(PhysicsBody2D):
+    """Body that keeps its own state, like bodies without array support."""
+
+    set_array_store = None
+
+
+def _make_engine(use_arrays: bool) -> PhysicsEngineService:
+    """Create an engine with collisions effectively disabled."""
+    engine = PhysicsEngineService(
+        environment=EnvironmentService(preset='earth'),
+        use_arrays=use_arrays,
+    )
+    engine.environment.air_density = 50.0
+    return engine
+
+
+class TestPhysicsBodyArrays(unittest.TestCase):
+    """Test cases for PhysicsBodyArrays."""
+
+    def _assert_bodies_match(self, expected, actual):
+        for body_a, body_b in zip(expected, actual):
+            self.assertAlmostEqual(body_a.x, body_b.x, places=9)
+            self.assertAlmostEqual(body_a.y, body_b.y, places=9)
+            self.assertAlmostEqual(body_a.velocity_x, body_b.velocity_x, places=9)
+            self.assertAlmostEqual(body_a.velocity_y, body_b.velocity_y, places=9)
+            self.assertAlmostEqual(body_a.acceleration_x, body_b.acceleration_x, places=9)
+            self.assertAlmostEqual(body_a.acceleration_y, body_b.acceleration_y, places=9)
+            self.assertAlmostEqual(body_a.roll, body_b.roll, places=9)
+            self.assertEqual(body_a.force, body_b.force)
+
+    def test_step_skips_static_sleeping_and_disabled(self):
+        """Test that every body has a row but only simulated rows move."""
+        bodies = _make_bodies()
+        arrays = _make_arrays(bodies)
+
+        _step(arrays, EnvironmentService(preset='earth'), 0.016)
+
+        self.assertEqual(arrays.count, 9)
+        self.assertEqual(arrays.bodies, bodies)
+        self.assertEqual(arrays.positions.shape, (9, 2))
+        self.assertEqual(bodies[5].position, (100.0, 100.0))
+        self.assertEqual(bodies[7].position, (0.0, 0.0))
+        self.assertEqual(bodies[8].position, (0.0, 0.0))
+        self.assertNotEqual(bodies[0].position, (0.0, 0.0))
+
+    def test_matches_per_body_path(self):
+        """Test that forces and integration match the per-body engine path."""
+        scalar_bodies = _make_bodies()
+        array_bodies = _make_bodies()
+        scalar_engine = _make_engine(use_arrays=False)
+        array_engine = _make_engine(use_arrays=True)
+
+        for scalar_body, array_body in zip(scalar_bodies, array_bodies):
+            scalar_body.set_force(3.0, -2.0)
+            array_body.set_force(3.0, -2.0)
+
+        scalar_engine._bodies = scalar_bodies
+        arrays = _make_arrays(array_bodies)
+        dt = scalar_engine.get_physics_step()
+        for _ in range(30):
+            scalar_engine._apply_forces(dt)
+            scalar_engine._integrate(dt)
+            _step(arrays, array_engine.environment, dt)
+
+        self._assert_bodies_match(scalar_bodies, array_bodies)
+
+    def test_matches_engine_step(self):
+        """Test full engine steps agree between modes."""
+        scalar_bodies = _make_bodies()
+        array_bodies = _make_bodies()
+        scalar_engine = _make_engine(use_arrays=False)
+        array_engine = _make_engine(use_arrays=True)
+        for body in scalar_bodies:
+            scalar_engine.register_body(body)
+        for body in array_bodies:
+            array_engine.register_body(body)
+
+        for _ in range(20):
+            scalar_engine.step(1.0 / 60.0)
+            array_engine.step(1.0 / 60.0)
+
+        self._assert_bodies_match(scalar_bodies, array_bodies)
+
+    def test_edits_between_steps_match_engine_step(self):
+        """Test that edits made through the bodies between steps reach the rows."""
+        engines = []
+        for use_arrays in (False, True):
+            engine = _make_engine(use_arrays=use_arrays)
+            bodies = _make_bodies()
+            for body in bodies:
+                engine.register_body(body)
+            engines.append((engine, bodies))
+
+        for frame in range(20):
+            for engine, bodies in engines:
+                if frame == 5:
+                    bodies[0].set_mass(3.0)
+                    bodies[1].get_material().set_drag(2.0)
+                    bodies[2].set_size((30.0, 30.0))
+                    bodies[4].set_body_type(BodyType.DYNAMIC)
+                    bodies[6].apply_force(0.0, -500.0)
+                    bodies[7].set_linear_velocity(-20.0, 0.0)
+                    bodies[8].set_enabled(True)
+                if frame == 10:
+                    bodies[0].x += 5.0
+                    bodies[1].velocity_y = 40.0
+                    bodies[6].set_sleeping(True)
+                engine.step(1.0 / 60.0)
+
+        self._assert_bodies_match(engines[0][1], engines[1][1])
+
+    def test_bodies_sync_when_read(self):
+        """Test that a step only updates the rows until a body is read."""
+        body = PhysicsBody2D(velocity_x=60.0)
+        arrays = _make_arrays([body])
+
+        _step(arrays, _free_space(), 0.5)
+
+        self.assertEqual(body._x, 0.0)
+        self.assertEqual(arrays.positions[0, 0], 30.0)
+        self.assertEqual(body.x, 30.0)
+        self.assertEqual(body._x, 30.0)
+
+    def test_writes_reach_rows(self):
+        """Test that writes through a body's setters are read back into its row."""
+        body = PhysicsBody2D()
+        arrays = _make_arrays([body])
+        _step(arrays, _free_space(), 0.5)
+
+        body.set_linear_velocity(4.0, -2.0)
+        body.y = 7.0
+        arrays.prepare()
+
+        self.assertEqual(arrays.velocities[0].tolist(), [4.0, -2.0])
+        self.assertEqual(arrays.positions[0].tolist(), [0.0, 7.0])
+
+    def test_unattachable_body_written_back(self):
+        """Test that bodies without array support are written back every step."""
+        body = _UnattachableBody(velocity_x=60.0)
+        arrays = _make_arrays([body])
+
+        _step(arrays, _free_space(), 0.5)
+        body.set_linear_velocity(0.0, 10.0)
+        _step(arrays, _free_space(), 0.5)
+
+        self.assertEqual(body._x, 30.0)
+        self.assertEqual(body._y, 5.0)
+
+    def test_copy_leaves_store(self):
+        """Test that copies start synced and detached from the store."""
+        body = PhysicsBody2D(velocity_x=60.0)
+        arrays = _make_arrays([body])
+        _step(arrays, _free_space(), 0.5)
+
+        clone = copy.copy(body)
+        _step(arrays, _free_space(), 0.5)
+
+        self.assertEqual(clone.x, 30.0)
+        self.assertEqual(body.x, 60.0)
+
+    def test_terminal_velocity_clamped(self):
+        """Test that velocities are clamped to terminal velocity."""
+        environment = EnvironmentService(preset='space')
+        environment.terminal_velocity = 10.0
+        body = PhysicsBody2D()
+        arrays = _make_arrays([body])
+
+        for _ in range(50):
+            body.set_force(1000.0, 1000.0)
+            _step(arrays, environment, 0.016)
+
+        self.assertLessEqual(body.get_speed(), 10.0 + 1e-9)
+
+    def test_infinite_mass_body_clears_forces(self):
+        """Test that zero-mass dynamic bodies drop accumulated forces."""
+        environment = EnvironmentService(preset='space')
+        body = PhysicsBody2D(mass=0.0)
+        body.set_force(10.0, 10.0)
+        arrays = _make_arrays([body])
+
+        _step(arrays, environment, 0.016)
+
+        self.assertEqual(body.force, (0.0, 0.0))
+        self.assertEqual(body.linear_velocity, (0.0, 0.0))
+
+    def test_engine_use_arrays_toggle(self):
+        """Test switching array mode on and off."""
+        engine = PhysicsEngineService()
+        self.assertFalse(engine.use_arrays)
+        self.assertFalse(engine.get_stats()['use_arrays'])
+
+        first = PhysicsBody2D(velocity_x=100.0)
+        engine.register_body(first)
+        engine.use_arrays = True
+        second = PhysicsBody2D(velocity_x=100.0)
+        engine.register_body(second)
+        self.assertEqual(engine.arrays.bodies, [first, second])
+
+        engine.step(0.02)
+        engine.use_arrays = False
+        self.assertEqual(engine.arrays.count, 0)
+        self.assertGreater(first._x, 0.0)
+        self.assertEqual(first._x, second._x)
+
+        engine.step(0.02)
+        self.assertGreater(first.x, second._x - 1e-9)
+
+    def test_rows_follow_registration(self):
+        """Test that registering and unregistering bodies adds and drops rows."""
+        engine = _make_engine(use_arrays=True)
+        bodies = _make_bodies()[:3]
+        for body in bodies:
+            engine.register_body(body)
+        engine.step(0.02)
+
+        engine.unregister_body(bodies[1])
+
+        self.assertEqual(engine.arrays.bodies, [bodies[0], bodies[2]])
+        self.assertEqual(engine.arrays.positions[1].tolist(), list(bodies[2].position))
+        self.assertNotEqual(bodies[1]._x, 50.0)
+        bodies[1].x = 0.0
+        engine.step(0.02)
+        self.assertEqual(bodies[1].x, 0.0)
+
+    def test_snapshot_restore(self):
+        """Test that restoring a snapshot reaches the rows."""
+        engine = _make_engine(use_arrays=True)
+        bodies = _make_bodies()
+        for body in bodies:
+            engine.register_body(body)
+        engine.step(0.02)
+        snapshot = engine.snapshot()
+        positions = [body.position for body in bodies]
+
+        for _ in range(5):
+            engine.step(0.02)
+        engine.restore(snapshot)
+        engine.arrays.prepare()
+
+        self.assertEqual([body.position for body in bodies], positions)
+        self.assertEqual(engine.arrays.positions.tolist(), [list(position) for position in positions])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Unit tests for the physics step profiler."""
+
+import unittest
+
+from pyrox.services.profiler import PhysicsProfiler, RollingHistogram
+
+
+class TestRollingHistogram(unittest.TestCase):
+    """Test cases for RollingHistogram."""
+
+    def test_buckets_and_summary(self):
+        """Test samples land in the bucket whose upper edge contains them."""
+        histogram = RollingHistogram(window=10, edges=(1.0, 5.0))
+        for value in (0.5, 1.0, 3.0, 9.0):
+            histogram.add(value)
+
+        self.assertEqual(histogram.buckets(), [(1.0, 2), (5.0, 1), (float('inf'), 1)])
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.last, 9.0)
+        self.assertEqual(histogram.max, 9.0)
+        self.assertAlmostEqual(histogram.mean, 13.5 / 4)
+
+    def test_window_evicts_oldest(self):
+        """Test the oldest sample leaves the buckets and mean once the window is full."""
+        histogram = RollingHistogram(window=2, edges=(1.0,))
+        for value in (10.0, 0.5, 0.5):
+            histogram.add(value)
+
+        self.assertEqual(histogram.buckets(), [(1.0, 2), (float('inf'), 0)])
+        self.assertAlmostEqual(histogram.mean, 0.5)
+        self.assertEqual(histogram.max, 0.5)
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles over the window."""
+        histogram = RollingHistogram(window=100)
+        for value in range(1, 101):
+            histogram.add(float(value))
+
+        self.assertEqual(histogram.percentile(0), 1.0)
+        self.assertEqual(histogram.percentile(50), 51.0)
+        self.assertEqual(histogram.percentile(100), 100.0)
+        self.assertEqual(RollingHistogram().percentile(95), 0.0)
+
+    def test_clear(self):
+        """Test clearing drops every sample."""
+        histogram = RollingHistogram()
+        histogram.add(1.0)
+        histogram.clear()
+
+        self.assertEqual(histogram.count, 0)
+        self.assertEqual(histogram.mean, 0.0)
+        self.assertTrue(all(count == 0 for _, count in histogram.buckets()))
+
+    def test_invalid_arguments(self):
+        """Test a non-positive window or unordered edges are rejected."""
+        with self.assertRaises(ValueError):
+            RollingHistogram(window=0)
+        with self.assertRaises(ValueError):
+            RollingHistogram(edges=(5.0, 1.0))
+
+
+class TestPhysicsProfiler(unittest.TestCase):
+    """Test cases for PhysicsProfiler."""
+
+    def test_step_records_phases_and_counts(self):
+        """Test a step records each lapped phase and its pair counts."""
+        profiler = PhysicsProfiler(window=5)
+        profiler.begin_step()
+        profiler.lap('forces')
+        profiler.lap('detect')
+        profiler.end_step(candidate_pairs=8, narrow_hits=2)
+
+        profile = profiler.to_dict()
+        self.assertEqual(profile['window'], 5)
+        self.assertEqual(profile['phases']['forces']['count'], 1)
+        self.assertEqual(profile['phases']['detect']['count'], 1)
+        self.assertEqual(profile['phases']['resolve']['count'], 0)
+        self.assertEqual(profile['step']['count'], 1)
+        self.assertGreaterEqual(profile['step']['last'], 0.0)
+        self.assertEqual(profile['candidate_pairs']['last'], 8)
+        self.assertAlmostEqual(profile['hit_ratio'], 0.25)
+
+    def test_unknown_phase_rejected(self):
+        """Test lapping a phase the profiler doesn't track raises."""
+        profiler = PhysicsProfiler()
+        profiler.begin_step()
+        with self.assertRaises(KeyError):
+            profiler.lap('render')
+
+    def test_reset(self):
+        """Test reset clears histograms and the dropped step count."""
+        profiler = PhysicsProfiler()
+        profiler.begin_step()
+        profiler.end_step(1, 1)
+        profiler.record_dropped(3)
+        profiler.reset()
+
+        profile = profiler.to_dict()
+        self.assertEqual(profile['step']['count'], 0)
+        self.assertEqual(profile['dropped_steps'], 0)
+        self.assertEqual(profile['hit_ratio'], 0.0)
+
+    def test_format_lines(self):
+        """Test the overlay text lists only phases that ran."""
+        profiler = PhysicsProfiler()
+        profiler.begin_step()
+        profiler.lap('detect')
+        profiler.end_step(4, 1)
+        profiler.record_dropped(2)
+
+        lines = PhysicsProfiler.format_lines(profiler.to_dict())
+
+        self.assertTrue(lines[0].startswith('Step '))
+        self.assertEqual(len(lines), 3)
+        self.assertIn('detect', lines[1])
+        self.assertIn('Pairs 4 -> hits 1 (25%), dropped 2', lines[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
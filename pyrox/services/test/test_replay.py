@@ -0,0 +1,138 @@
+"""Unit tests for recorded-input replay."""
+
+import os
+import tempfile
+import unittest
+
+from pyrox.models import Scene, SceneObject
+from pyrox.models.physics.crate import CrateBody
+from pyrox.models.scene import KeyboardSource, SceneBridge
+from pyrox.services.environment import EnvironmentService
+from pyrox.services.physics import PhysicsEngineService
+from pyrox.services.replay import InputEvent, InputRecorder, InputRecording, InputReplayer
+from pyrox.services.scene import HeadlessSceneRunner
+
+
+def _record(frames_before=10, frames_held=30, frames_after=20):
+    """Record a crate driven right while the 'd' key is held."""
+    scene = Scene(name="Replay Test")
+    crate = SceneObject(name="Crate", scene_object_type="body", physics_body=CrateBody(name="Crate"))
+    scene.add_scene_object(crate)
+
+    engine = PhysicsEngineService(environment=EnvironmentService(preset='space'))
+    runner = HeadlessSceneRunner(scene, physics_engine=engine)
+    keyboard = KeyboardSource()
+    bridge = SceneBridge(scene, bound_object=keyboard)  # type: ignore
+    bridge.set_read_throttle(0.0)
+    bridge.add_binding("d", crate.id, "velocity_x", transform=lambda held: 120.0 if held else 0.0)
+    bridge.start()
+
+    recorder = InputRecorder(bridge, engine)
+    recorder.start()
+    runner.run(frames=frames_before)
+    keyboard.press("d")
+    runner.run(frames=frames_held)
+    keyboard.release("d")
+    runner.run(frames=frames_after)
+    recording = recorder.stop()
+
+    bridge.stop()
+    runner.close()
+    return recording, crate
+
+
+class TestInputRecorder(unittest.TestCase):
+    """Test cases for InputRecorder."""
+
+    def test_records_value_changes_with_step(self):
+        """Test that each applied change is logged once with the step the bridge applied it after."""
+        recording, crate = _record()
+
+        self.assertEqual(recording.steps, 60)
+        self.assertEqual(
+            [(event.step, event.value) for event in recording.events],
+            [(1, 0.0), (11, 120.0), (41, 0.0)],
+        )
+        self.assertTrue(all(event.object_id == crate.id for event in recording.events))
+        self.assertEqual(len(recording.trajectory), 61)
+        self.assertEqual(recording.trajectory[60][crate.id], (crate.x, crate.y))
+
+    def test_start_and_stop_errors(self):
+        """Test that recording twice, or stopping when idle, raises."""
+        scene = Scene(name="Empty")
+        bridge = SceneBridge(scene)
+        recorder = InputRecorder(bridge, PhysicsEngineService())
+
+        with self.assertRaises(RuntimeError):
+            recorder.stop()
+        recorder.start()
+        self.assertTrue(recorder.active)
+        with self.assertRaises(RuntimeError):
+            recorder.start()
+        recorder.stop()
+        self.assertFalse(recorder.active)
+        self.assertNotIn(recorder._on_source_applied, bridge.on_source_applied)
+
+        with self.assertRaises(RuntimeError):
+            InputRecorder(SceneBridge(), PhysicsEngineService()).start()
+        with self.assertRaises(ValueError):
+            InputRecorder(bridge, PhysicsEngineService(), trajectory_interval=0)
+
+
+class TestInputRecording(unittest.TestCase):
+    """Test cases for InputRecording serialization."""
+
+    def test_save_and_load_round_trip(self):
+        """Test that a recording survives a trip through a JSON file."""
+        recording, _ = _record(frames_before=2, frames_held=3, frames_after=2)
+        fd, path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            recording.save(path)
+            loaded = InputRecording.load(path)
+        finally:
+            os.remove(path)
+
+        self.assertEqual(loaded, recording)
+
+
+class TestInputReplayer(unittest.TestCase):
+    """Test cases for InputReplayer."""
+
+    def test_replay_matches_recording(self):
+        """Test that replaying the recorded inputs follows the recorded trajectory."""
+        recording, _ = _record()
+
+        result = InputReplayer(recording, environment=EnvironmentService(preset='space')).run()
+
+        self.assertTrue(result.matched)
+        self.assertEqual(result.steps, 60)
+        self.assertEqual(result.events_applied, 3)
+        self.assertAlmostEqual(result.simulated_time, 1.0)
+        self.assertGreater(result.wall_time, 0.0)
+
+    def test_reports_first_diverging_step(self):
+        """Test that a replay with different inputs reports where it first diverged."""
+        recording, crate = _record()
+        recording.events[2] = InputEvent(46, crate.id, "velocity_x", 0.0)  # Released 5 steps late
+
+        result = InputReplayer(recording, environment=EnvironmentService(preset='space')).run()
+
+        self.assertFalse(result.matched)
+        self.assertEqual(result.divergence.step, 42)  # type: ignore
+        self.assertEqual(result.divergence.object_id, crate.id)  # type: ignore
+        self.assertEqual(result.steps, 42)
+
+    def test_run_past_divergence(self):
+        """Test that the replay can keep going after diverging."""
+        recording, crate = _record()
+        recording.events.pop()
+
+        result = InputReplayer(recording, environment=EnvironmentService(preset='space')).run(stop_on_divergence=False)
+
+        self.assertEqual(result.steps, 60)
+        self.assertEqual(result.divergence.step, 42)  # type: ignore
+
+
+if __name__ == '__main__':
+    unittest.main()
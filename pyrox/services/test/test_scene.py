@@ -5,10 +5,17 @@ updates, providing a complete runtime environment with frame-rate independent
 rendering.
 """
 
+import threading
 import unittest
 from unittest.mock import Mock, patch
 from pyrox.interfaces import ISceneObject, IPhysicsBody2D
+from pyrox.models.physics.crate import CrateBody
+from pyrox.models.physics.sensor import ProximitySensorBody
+from pyrox.models.protocols import PhysicsBody2D
+from pyrox.models.scene import Scene, SceneObject
 from pyrox.services.scene import (
+    HeadlessRunResult,
+    HeadlessSceneRunner,
     SceneRunnerService,
     SceneEventBus,
     SceneEventType,
@@ -690,5 +697,170 @@ class TestSceneRunnerService(unittest.TestCase):
         self.assertEqual(SceneEventBus.get_subscriber_count(SceneEventType.SCENE_STARTED), 0)
 
 
+class TestHeadlessSceneRunner(unittest.TestCase):
+    """Test cases for HeadlessSceneRunner."""
+
+    def setUp(self):
+        """Set up a mock scene holding one moving body."""
+        self.body = PhysicsBody2D(x=0.0, y=0.0, velocity_x=60.0)
+        self.scene_object = Mock(physics_body=self.body)
+        self.scene = Mock()
+        self.scene.get_scene_objects = Mock(return_value={'crate': self.scene_object})
+        self.scene.on_scene_object_added = []
+        self.scene.on_scene_object_removed = []
+        environment = EnvironmentService(preset='space')
+        environment.linear_damping = 1.0
+        self.engine = PhysicsEngineService(environment=environment)
+
+    def test_run_frames_steps_physics_and_scene(self):
+        """Test that each frame steps the engine and updates the scene."""
+        runner = HeadlessSceneRunner(self.scene, physics_engine=self.engine)
+
+        result = runner.run(frames=30)
+
+        self.assertEqual(result.frames, 30)
+        self.assertAlmostEqual(result.simulated_time, 0.5)
+        self.assertFalse(result.stopped)
+        self.assertEqual(self.scene.update.call_count, 30)
+        self.scene.update.assert_called_with(self.engine.get_physics_step())
+        self.assertAlmostEqual(self.body.x, 30.0)
+        self.assertEqual(runner.frames, 30)
+
+    def test_run_duration(self):
+        """Test that a duration is converted to frames of the frame time."""
+        runner = HeadlessSceneRunner(self.scene, physics_engine=self.engine, frame_time=0.1)
+
+        result = runner.run(duration=2.0)
+
+        self.assertEqual(result.frames, 20)
+        self.assertAlmostEqual(runner.simulated_time, 2.0)
+
+    def test_run_requires_a_limit(self):
+        """Test that an unbounded run is rejected."""
+        runner = HeadlessSceneRunner(self.scene, physics_engine=self.engine)
+
+        with self.assertRaises(ValueError):
+            runner.run()
+        with self.assertRaises(ValueError):
+            runner.run(frames=1, realtime_factor=-1.0)
+        with self.assertRaises(ValueError):
+            HeadlessSceneRunner(self.scene, physics_engine=self.engine, frame_time=0.0)
+
+    def test_stop_condition_ends_run(self):
+        """Test that the stop condition is checked after every frame."""
+        runner = HeadlessSceneRunner(self.scene, physics_engine=self.engine)
+
+        result = runner.run(duration=60.0, stop_condition=lambda r: self.body.x >= 10.0)
+
+        self.assertTrue(result.stopped)
+        self.assertEqual(result.frames, 10)
+
+    def test_realtime_factor_paces_run(self):
+        """Test that a realtime factor slows the run to match wall-clock time."""
+        runner = HeadlessSceneRunner(self.scene, physics_engine=self.engine, frame_time=0.01)
+
+        result = runner.run(frames=10, realtime_factor=2.0)
+
+        self.assertGreaterEqual(result.wall_time, 0.045)
+        self.assertLessEqual(result.realtime_factor, 2.2)
+
+    def test_stop_from_another_thread(self):
+        """Test that a run on a worker thread can be stopped."""
+        runner = HeadlessSceneRunner(self.scene, physics_engine=self.engine)
+        results = []
+        started = threading.Event()
+
+        def worker():
+            results.append(runner.run(stop_condition=lambda r: started.set() or False))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        started.wait(timeout=5.0)
+        runner.stop()
+        thread.join(timeout=5.0)
+
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(results[0].stopped)
+
+    def test_follows_scene_objects_until_closed(self):
+        """Test that added and removed scene objects are registered with the engine."""
+        runner = HeadlessSceneRunner(self.scene, physics_engine=self.engine)
+        self.assertIn(self.body, self.engine.bodies)
+
+        other = Mock(physics_body=PhysicsBody2D())
+        for callback in self.scene.on_scene_object_added:
+            callback(other)
+        self.assertIn(other.physics_body, self.engine.bodies)
+
+        for callback in self.scene.on_scene_object_removed:
+            callback(other)
+        self.assertNotIn(other.physics_body, self.engine.bodies)
+
+        runner.close()
+        self.assertEqual(self.scene.on_scene_object_added, [])
+        self.assertEqual(self.scene.on_scene_object_removed, [])
+
+    def test_without_physics(self):
+        """Test a physics-free run only updates the scene."""
+        runner = HeadlessSceneRunner(self.scene, enable_physics=False)
+
+        runner.run(frames=3)
+
+        self.assertIsNone(runner.physics_engine)
+        self.assertAlmostEqual(runner.frame_time, 1.0 / 60.0)
+        self.assertEqual(self.scene.update.call_count, 3)
+        self.assertEqual(self.body.x, 0.0)
+
+    def test_result_realtime_factor(self):
+        """Test the realtime factor of a run summary."""
+        self.assertEqual(HeadlessRunResult(simulated_time=10.0, wall_time=2.0).realtime_factor, 5.0)
+        self.assertEqual(HeadlessRunResult().realtime_factor, 0.0)
+
+    def test_lazy_scene_built_as_bodies_reach_it(self):
+        """Test a lazily loaded scene builds moving bodies and what they come near."""
+        scene = Scene(name="Lazy")
+        crate = CrateBody(x=0.0, y=0.0)
+        scene.add_scene_object(SceneObject(name="Crate", scene_object_type="crate", physics_body=crate))
+        for x in (100.0, 500.0):
+            sensor = ProximitySensorBody(name=f"Sensor{x}", x=x, y=0.0, width=10.0, height=10.0)
+            scene.add_scene_object(SceneObject(name=sensor.name, scene_object_type="sensor", physics_body=sensor))
+        lazy = Scene.from_dict(scene.to_dict(), lazy=True)
+        runner = HeadlessSceneRunner(lazy, physics_engine=self.engine, reach_margin=50.0)
+        try:
+            runner.step()
+            self.assertEqual([body.name for body in self.engine.bodies], ["Crate"])
+            lazy.get_scene_object(crate.id).velocity_x = 120.0
+            runner.run(frames=60)
+        finally:
+            runner.close()
+
+        names = sorted(body.name for body in self.engine.bodies)
+        self.assertEqual(names, ["Crate", "Sensor100.0"])
+        self.assertAlmostEqual(lazy.get_scene_object(crate.id).x, 120.0)
+        self.assertEqual(lazy.lazy_object_count, 1)
+
+    @patch('pyrox.services.scene.TkGuiManager')
+    def test_service_run_headless(self, mock_gui_manager):
+        """Test SceneRunnerService.run_headless runs the service's scene without the GUI loop."""
+        SceneRunnerService._scene = self.scene
+        SceneRunnerService._physics_engine = self.engine
+        SceneRunnerService._enable_physics = True
+        self.engine.register_body(self.body)
+        try:
+            result = SceneRunnerService.run_headless(frames=6)
+        finally:
+            SceneRunnerService._scene = None
+            SceneRunnerService._physics_engine = None
+            SceneRunnerService._enable_physics = False
+
+        self.assertEqual(result.frames, 6)
+        self.assertAlmostEqual(self.body.x, 6.0)
+        self.assertEqual(self.scene.on_scene_object_added, [])
+        mock_gui_manager.schedule_event.assert_not_called()
+
+        with self.assertRaises(RuntimeError):
+            SceneRunnerService.run_headless(frames=1)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,139 @@
+"""Unit tests for scene_binary.py module."""
+import json
+import os
+import struct
+import tempfile
+import timeit
+import unittest
+from pathlib import Path
+
+from pyrox.models.physics.conveyor import ConveyorBody
+from pyrox.models.physics.crate import CrateBody
+from pyrox.models.scene import Scene, SceneObject
+from pyrox.services import scene_binary
+
+
+def _plant_scene(count: int) -> Scene:
+    """Build a scene of crates with a belt every 50 objects."""
+    scene = Scene(name="Plant", description="Crates on belts")
+    for index in range(count):
+        if index % 50:
+            body = CrateBody(name=f"Crate{index}", x=float(index), y=float(index % 100))
+        else:
+            body = ConveyorBody(name=f"Belt{index}", x=float(index), y=5.0)
+        scene.add_scene_object(SceneObject(name=body.name, scene_object_type="physics", physics_body=body))
+    return scene
+
+
+class TestSceneBinary(unittest.TestCase):
+    """Test cases for encoding and decoding scene dictionaries."""
+
+    def test_roundtrip_scene(self):
+        """Test that a scene dictionary survives encoding unchanged."""
+        data = _plant_scene(120).to_dict()
+
+        decoded = scene_binary.loads(scene_binary.dumps(data))
+
+        self.assertEqual(decoded, data)
+        self.assertEqual([o["id"] for o in decoded["scene_objects"]], [o["id"] for o in data["scene_objects"]])
+
+    def test_roundtrip_mixed_values(self):
+        """Test columns whose values don't share a type, and unusual layouts."""
+        data = {
+            "name": "Mixed",
+            "connections": [{"source": "a", "output": "o", "target": "b", "input": "i", "enabled": True}],
+            "scene_objects": [
+                {"id": "a", "group_id": None, "n": 1, "v": 1.5, "flag": True, "tags": ["x"], "props": {}},
+                {"id": "b", "group_id": "g", "n": 2 ** 70, "v": 2, "flag": False, "tags": [], "props": {}},
+                {"id": "c", "props": {"nested": {"deep": 1.0}, "other": None}, "n": -3},
+                {},
+                {"id": "d", "group_id": None, "n": 1, "v": 1.5, "flag": True, "tags": ["y"], "props": {}},
+            ],
+        }
+
+        decoded = scene_binary.loads(scene_binary.dumps(data))
+
+        self.assertEqual(decoded, data)
+        self.assertIs(type(decoded["scene_objects"][1]["v"]), int)
+        self.assertIs(type(decoded["scene_objects"][0]["flag"]), bool)
+        self.assertIsNot(decoded["scene_objects"][0]["tags"], decoded["scene_objects"][4]["tags"])
+
+    def test_lzma_compression(self):
+        """Test that lzma compressed scenes round-trip and are smaller."""
+        data = _plant_scene(200).to_dict()
+
+        plain = scene_binary.dumps(data)
+        compressed = scene_binary.dumps(data, compression=scene_binary.COMPRESSION_LZMA)
+
+        self.assertLess(len(compressed), len(plain))
+        self.assertEqual(scene_binary.loads(compressed), data)
+
+    @unittest.skipUnless(scene_binary.zstd_available(), "zstd is not available")
+    def test_zstd_compression(self):
+        """Test that zstd compressed scenes round-trip."""
+        data = _plant_scene(50).to_dict()
+
+        blob = scene_binary.dumps(data, compression=scene_binary.COMPRESSION_ZSTD)
+
+        self.assertEqual(scene_binary.loads(blob), data)
+
+    def test_unknown_compression_rejected(self):
+        """Test that unknown compressions are rejected."""
+        with self.assertRaises(ValueError):
+            scene_binary.dumps({"scene_objects": []}, compression="gzip")
+
+    def test_invalid_data_rejected(self):
+        """Test that data that isn't a valid binary scene raises ValueError."""
+        blob = scene_binary.dumps(_plant_scene(5).to_dict())
+        newer = blob[:4] + struct.pack('<H', scene_binary.VERSION + 1) + blob[6:]
+
+        for invalid in (b"", b'{"name": "json"}', newer, blob[:len(blob) // 2], blob + b"\x00"):
+            with self.subTest(size=len(invalid)):
+                with self.assertRaises(ValueError):
+                    scene_binary.loads(invalid)
+
+    def test_file_format_detection(self):
+        """Test that files are written by suffix and read by contents."""
+        data = _plant_scene(10).to_dict()
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = Path(directory) / "plant.json"
+            binary_path = Path(directory) / f"plant{scene_binary.SUFFIX}"
+
+            scene_binary.save_file(json_path, data)
+            scene_binary.save_file(binary_path, data)
+
+            self.assertEqual(json.loads(json_path.read_text()), data)
+            self.assertTrue(scene_binary.is_binary_scene(binary_path.read_bytes()))
+            self.assertEqual(scene_binary.load_file(json_path), data)
+            self.assertEqual(scene_binary.load_file(binary_path), data)
+
+    def test_smaller_than_json(self):
+        """Test that binary scenes are much smaller than JSON.
+
+        Plant scenes of thousands of objects saved as indented JSON are
+        hundreds of MB; the binary format stores each column once.
+        """
+        data = _plant_scene(2000).to_dict()
+        text = json.dumps(data, indent=2)
+        blob = scene_binary.dumps(data)
+
+        self.assertLess(len(blob), len(text.encode('utf-8')) / 3)
+
+    @unittest.skipUnless(os.environ.get('PYROX_BENCHMARKS'), "set PYROX_BENCHMARKS to run timing benchmarks")
+    def test_benchmark_against_json(self):
+        """Benchmark: binary scenes load at least as fast as JSON."""
+        data = _plant_scene(2000).to_dict()
+        text = json.dumps(data, indent=2)
+        blob = scene_binary.dumps(data)
+
+        def seconds(function):
+            return min(timeit.repeat(function, number=1, repeat=5))
+
+        json_load = seconds(lambda: json.loads(text))
+        binary_load = seconds(lambda: scene_binary.loads(blob))
+
+        self.assertLess(binary_load, json_load * 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,321 @@
+"""Unit tests for scene_journal.py module."""
+import json
+import os
+import tempfile
+import timeit
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from pyrox.models.physics.conveyor import ConveyorBody
+from pyrox.models.physics.crate import CrateBody
+from pyrox.models.physics.sensor import ProximitySensorBody
+from pyrox.models.scene import Scene, SceneObject
+from pyrox.services import scene_binary
+from pyrox.services.scene import SceneEvent, SceneEventBus, SceneEventType
+from pyrox.services.scene_journal import SceneJournal, journal_path
+
+
+def _crate_scene(count: int) -> Scene:
+    """Build a scene of crates in a row."""
+    scene = Scene(name="Plant", description="Crates")
+    for index in range(count):
+        body = CrateBody(name=f"Crate{index}", x=float(index * 20), y=0.0)
+        scene.add_scene_object(SceneObject(name=body.name, scene_object_type="physics", physics_body=body))
+    return scene
+
+
+def _by_id(data: dict) -> dict:
+    return {scene_object["id"]: scene_object for scene_object in data["scene_objects"]}
+
+
+class TestSceneJournal(unittest.TestCase):
+    """Test cases for journaling scene changes."""
+
+    def setUp(self):
+        """Save a small scene and start a journal for it."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.filepath = Path(self.temp_dir.name) / "plant.json"
+        self.scene = _crate_scene(5)
+        self.ids = list(self.scene.scene_objects)
+        self.scene.save(self.filepath)
+        self.journal = SceneJournal(self.scene, self.filepath, interval=60.0)
+        self.journal.start()
+
+    def tearDown(self):
+        """Stop the journal and remove the files."""
+        self.journal.close(flush=False)
+        self.temp_dir.cleanup()
+
+    def _entries(self):
+        self.journal.wait()
+        return list(SceneJournal.read_entries(self.journal.journal_filepath))
+
+    def test_journal_path(self):
+        """Test that the journal sits next to the scene file."""
+        self.assertEqual(journal_path("dir/plant.pxscene"), Path("dir/plant.pxscene.journal"))
+        self.assertEqual(self.journal.journal_filepath, Path(self.temp_dir.name) / "plant.json.journal")
+
+    def test_flush_without_changes_writes_nothing(self):
+        """Test that an unchanged scene is not journaled."""
+        self.assertEqual(self.journal.flush(), 0)
+        self.assertEqual(self._entries(), [])
+        self.assertFalse(self.journal.journal_filepath.exists())
+
+    def test_only_changed_objects_written(self):
+        """Test that edits through setters and motion journal just those objects."""
+        scene_objects = self.scene.get_scene_objects()
+        scene_objects[self.ids[1]].set_layer(7)
+        scene_objects[self.ids[3]].physics_body.x = 500.0  # As the physics engine moves bodies
+
+        self.assertEqual(self.journal.flush(), 2)
+
+        entries = self._entries()
+        self.assertEqual(len(entries), 1)
+        upserts = _by_id({"scene_objects": entries[0]["upsert"]})
+        self.assertEqual(set(upserts), {self.ids[1], self.ids[3]})
+        self.assertEqual(upserts[self.ids[1]]["layer"], 7)
+        self.assertEqual(upserts[self.ids[3]]["body"]["x"], 500.0)
+
+    def test_body_attribute_edits_written(self):
+        """Test that edits made on the physics body itself are journaled and recovered."""
+        body = ConveyorBody(name="Belt", x=0.0, y=100.0, belt_speed=50.0)
+        belt = SceneObject(name="Belt", scene_object_type="conveyor", physics_body=body)
+        self.scene.add_scene_object(belt)
+        self.journal.flush()
+
+        belt.physics_body.belt_speed = 80.0
+        crate = self.scene.get_scene_objects()[self.ids[2]]
+        crate.physics_body.mass = 4.0
+        crate.physics_body.material.set_friction(0.9)
+
+        self.assertEqual(self.journal.flush(), 2)
+        self.assertEqual(self.journal.flush(), 0)
+        self.journal.wait()
+
+        data = _by_id(SceneJournal.recover(self.filepath))
+        self.assertEqual(data[belt.id]["body"]["belt_speed"], 80.0)
+        self.assertEqual(data[self.ids[2]]["body"]["mass"], 4.0)
+        self.assertEqual(data[self.ids[2]]["body"]["material"]["friction"], 0.9)
+
+    def test_added_and_removed_objects(self):
+        """Test that added and removed objects are journaled."""
+        body = CrateBody(name="New", x=-50.0, y=0.0)
+        added = SceneObject(name="New", scene_object_type="physics", physics_body=body)
+        self.scene.add_scene_object(added)
+        self.scene.remove_scene_object(self.ids[0])
+
+        self.journal.flush()
+
+        entry = self._entries()[0]
+        self.assertEqual([data["id"] for data in entry["upsert"]], [added.id])
+        self.assertEqual(entry["remove"], [self.ids[0]])
+
+    def test_scene_level_changes(self):
+        """Test that connections and the scene name are journaled when they change."""
+        sensors = []
+        for name in ("Source", "Target"):
+            body = ProximitySensorBody(name=name)
+            sensors.append(SceneObject(name=name, scene_object_type="sensor", physics_body=body))
+            self.scene.add_scene_object(sensors[-1])
+        self.journal.flush()
+        self.scene.get_connection_registry().connect(
+            sensors[0].id, "on_activate_callbacks", sensors[1].id, "clear_detected_objects",
+        )
+        self.scene.set_name("Renamed")
+
+        self.journal.flush()
+
+        entry = self._entries()[1]
+        self.assertEqual(entry["connections"], self.scene.to_dict()["connections"])
+        self.assertEqual(entry["name"], "Renamed")
+        self.assertNotIn("upsert", entry)
+
+    def test_recover_matches_scene(self):
+        """Test that replaying the journal over the scene file gives the current scene."""
+        scene_objects = self.scene.get_scene_objects()
+        scene_objects[self.ids[2]].x = 123.0
+        self.journal.flush()
+        self.scene.remove_scene_object(self.ids[4])
+        scene_objects[self.ids[2]].y = 45.0
+        self.journal.flush()
+        self.journal.wait()
+
+        recovered = SceneJournal.recover(self.filepath)
+
+        self.assertEqual(_by_id(recovered), _by_id(self.scene.to_dict()))
+
+    def test_recover_ignores_torn_line(self):
+        """Test that a line cut short by a crash is ignored."""
+        self.scene.get_scene_objects()[self.ids[2]].x = 123.0
+        self.journal.flush()
+        self.journal.wait()
+        with open(self.journal.journal_filepath, 'a') as f:
+            f.write('{"sequence": 2, "remove": ["')
+
+        recovered = _by_id(SceneJournal.recover(self.filepath))
+
+        self.assertEqual(recovered[self.ids[2]]["body"]["x"], 123.0)
+        self.assertEqual(len(recovered), 5)
+
+    def test_compact_writes_scene_and_empties_journal(self):
+        """Test that an explicit save writes the scene file and removes the journal."""
+        self.scene.get_scene_objects()[self.ids[2]].x = 123.0
+        self.journal.flush()
+
+        self.journal.compact()
+
+        self.assertFalse(self.journal.journal_filepath.exists())
+        self.assertEqual(self.journal.entry_count, 0)
+        self.assertEqual(_by_id(scene_binary.load_file(self.filepath)), _by_id(self.scene.to_dict()))
+        self.assertEqual(self.journal.flush(), 0)
+
+    def test_scene_saved_event_empties_journal(self):
+        """Test that saving the scene elsewhere in the app empties the journal."""
+        self.scene.get_scene_objects()[self.ids[2]].x = 123.0
+        self.journal.flush()
+        self.scene.save(self.filepath)
+
+        SceneEventBus.publish(SceneEvent(
+            event_type=SceneEventType.SCENE_SAVED,
+            scene=self.scene,
+            data={"filepath": self.filepath},
+        ))
+
+        self.assertFalse(self.journal.journal_filepath.exists())
+
+    def test_flushes_on_interval_while_updating(self):
+        """Test that scene updates flush once the interval has passed."""
+        journal = SceneJournal(_crate_scene(2), Path(self.temp_dir.name) / "other.json", interval=0.0)
+        journal.start()
+        try:
+            next(iter(journal.scene.get_scene_objects().values())).x = 99.0
+
+            journal.scene.update(0.016)
+
+            self.assertEqual(journal.entry_count, 1)
+        finally:
+            journal.close()
+
+    def test_lazy_scene_builds_not_journaled(self):
+        """Test that objects a lazy scene builds from its file are not journaled."""
+        journal = SceneJournal(Scene.load(self.filepath, lazy=True), self.filepath)
+        self.journal.close(flush=False)
+        journal.start()
+        try:
+            journal.scene.materialize_region(0.0, 0.0, 30.0, 30.0)
+            journal.scene.remove_scene_object(self.ids[4])  # Never built
+
+            journal.flush()
+            journal.wait()
+
+            entries = list(SceneJournal.read_entries(journal.journal_filepath))
+            self.assertEqual(entries, [{"remove": [self.ids[4]], "sequence": 1}])
+        finally:
+            journal.close(flush=False)
+
+    def test_flush_checks_only_reported_and_moving_objects(self):
+        """Test that a flush compares just the objects that reported a change or may be moving."""
+        scene_objects = self.scene.get_scene_objects()
+        for object_id in self.ids[1:]:
+            scene_objects[object_id].physics_body.sleeping = True
+        self.journal.flush()
+
+        scene_objects[self.ids[2]].physics_body.mass = 3.0
+        with patch.object(SceneJournal, '_state', autospec=True, side_effect=SceneJournal._state) as state:
+            self.assertEqual(self.journal.flush(), 1)
+
+        self.assertEqual({call.args[1].id for call in state.call_args_list}, {self.ids[0], self.ids[2]})
+
+    def test_sleeping_and_woken_bodies_tracked(self):
+        """Test that bodies moved while asleep, or by physics once woken, are journaled."""
+        body = self.scene.get_scene_objects()[self.ids[1]].physics_body
+        body.sleeping = True
+        self.journal.flush()
+
+        body.x = 300.0  # Reported, as the simulation won't move a sleeping body
+        self.assertEqual(self.journal.flush(), 1)
+
+        body.sleeping = False
+        self.assertEqual(self.journal.flush(), 0)
+        body.x = 320.0  # As the physics engine moves awake bodies
+        self.assertEqual(self.journal.flush(), 1)
+
+    def test_connections_serialized_only_when_changed(self):
+        """Test that flushes don't serialize the connections until one is added or removed."""
+        registry = self.scene.get_connection_registry()
+        with patch.object(registry, 'serialize', wraps=registry.serialize) as serialize:
+            self.journal.flush()
+            serialize.assert_not_called()
+
+            sensors = []
+            for name in ("Source", "Target"):
+                sensors.append(SceneObject(
+                    name=name, scene_object_type="sensor", physics_body=ProximitySensorBody(name=name),
+                ))
+                self.scene.add_scene_object(sensors[-1])
+            connection = registry.connect(
+                sensors[0].id, "on_activate_callbacks", sensors[1].id, "clear_detected_objects",
+            )
+            self.journal.flush()
+            registry.disconnect(connection)
+            self.journal.flush()
+
+        self.assertEqual(serialize.call_count, 2)
+        entries = self._entries()
+        self.assertEqual(len(entries[0]["connections"]), 1)
+        self.assertEqual(entries[1]["connections"], [])
+
+    def test_removed_objects_stop_reporting(self):
+        """Test that objects removed from the scene are no longer tracked."""
+        removed = self.scene.get_scene_objects()[self.ids[0]]
+        self.scene.remove_scene_object(self.ids[0])
+        self.journal.flush()
+
+        removed.set_layer(3)
+
+        self.assertEqual(self.journal.flush(), 0)
+        self.assertIsNone(removed._on_changed)
+
+    def test_invalid_interval(self):
+        """Test that a negative interval is rejected."""
+        with self.assertRaises(ValueError):
+            SceneJournal(self.scene, self.filepath, interval=-1.0)
+
+    def test_start_twice(self):
+        """Test that starting an active journal raises."""
+        with self.assertRaises(RuntimeError):
+            self.journal.start()
+
+
+@unittest.skipUnless(os.environ.get('PYROX_BENCHMARKS'), "set PYROX_BENCHMARKS to run timing benchmarks")
+class TestSceneJournalThroughput(unittest.TestCase):
+    """Microbenchmarks for journaling large scenes."""
+
+    def test_flush_cheaper_than_full_save(self):
+        """Microbenchmark: journaling a few changes beats serializing the whole scene."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath = Path(temp_dir) / "plant.json"
+            scene = _crate_scene(5000)
+            scene_objects = list(scene.get_scene_objects().values())
+            journal = SceneJournal(scene, filepath)
+            journal.start()
+            try:
+                def flush():
+                    for scene_object in scene_objects[:10]:
+                        scene_object.x += 1.0
+                    journal.flush()
+
+                def save():
+                    json.dumps(scene.to_dict())
+
+                flush_seconds = min(timeit.repeat(flush, number=1, repeat=5))
+                save_seconds = min(timeit.repeat(save, number=1, repeat=3))
+            finally:
+                journal.close(flush=False)
+
+        self.assertLess(flush_seconds, save_seconds / 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
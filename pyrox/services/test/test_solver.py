@@ -0,0 +1,371 @@
+"""Unit tests for the sequential-impulse contact solver."""
+
+import os
+import timeit
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from pyrox.interfaces.protocols.physics import BodyType
+from pyrox.models.protocols.physics import Material, PhysicsBody2D
+from pyrox.services.collision import CollisionInfo, CollisionService
+from pyrox.services.environment import EnvironmentService
+from pyrox.services.physics import PhysicsEngineService, _gil_enabled
+from pyrox.services.solver import ContactSolver
+
+
+def _contact(body_a, body_b, normal=(1.0, 0.0), penetration=0.0):
+    """Build a contact between two bodies."""
+    return CollisionInfo(
+        body_a=body_a,
+        body_b=body_b,
+        penetration_depth=penetration,
+        normal=normal,
+        contact_point=(0.0, 0.0),
+    )
+
+
+class TestContactSolver(unittest.TestCase):
+    """Test cases for ContactSolver."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.environment = EnvironmentService()
+        self.solver = ContactSolver()
+
+    def test_inelastic_head_on_collision(self):
+        """Test that equal bodies without restitution end at a common velocity."""
+        material = Material(restitution=0.0, friction=0.0)
+        body_a = PhysicsBody2D(velocity_x=10.0, material=material)
+        body_b = PhysicsBody2D(velocity_x=-10.0, material=material)
+
+        self.solver.solve([_contact(body_a, body_b)], self.environment)
+
+        self.assertAlmostEqual(body_a.velocity_x, 0.0)
+        self.assertAlmostEqual(body_b.velocity_x, 0.0)
+
+    def test_restitution_bounces_impacts(self):
+        """Test that fast impacts bounce with the combined restitution."""
+        material = Material(restitution=1.0, friction=0.0)
+        body_a = PhysicsBody2D(velocity_x=10.0, material=material)
+        body_b = PhysicsBody2D(velocity_x=-10.0, material=material)
+
+        self.solver.solve([_contact(body_a, body_b)], self.environment)
+
+        self.assertAlmostEqual(body_a.velocity_x, -10.0)
+        self.assertAlmostEqual(body_b.velocity_x, 10.0)
+
+    def test_slow_contacts_do_not_bounce(self):
+        """Test that approach speeds under the threshold don't bounce."""
+        material = Material(restitution=1.0, friction=0.0)
+        body = PhysicsBody2D(velocity_x=0.5, material=material)
+        wall = PhysicsBody2D(body_type=BodyType.STATIC, mass=0.0, material=material)
+
+        self.solver.solve([_contact(body, wall)], self.environment)
+
+        self.assertAlmostEqual(body.velocity_x, 0.0)
+
+    def test_friction_is_clamped_by_normal_impulse(self):
+        """Test that Coulomb friction removes at most mu times the normal impulse."""
+        material = Material(restitution=0.0, friction=0.5)
+        body = PhysicsBody2D(velocity_x=20.0, velocity_y=4.0, material=material)
+        floor = PhysicsBody2D(body_type=BodyType.STATIC, mass=0.0, material=material)
+
+        self.solver.solve([_contact(body, floor, normal=(0.0, 1.0))], self.environment)
+
+        self.assertAlmostEqual(body.velocity_y, 0.0)
+        self.assertAlmostEqual(body.velocity_x, 20.0 - 0.5 * 4.0)
+
+    def test_friction_stops_slow_sliding(self):
+        """Test that friction can stop a body sliding slower than its limit."""
+        material = Material(restitution=0.0, friction=1.0)
+        body = PhysicsBody2D(velocity_x=1.0, velocity_y=4.0, material=material)
+        floor = PhysicsBody2D(body_type=BodyType.STATIC, mass=0.0, material=material)
+
+        self.solver.solve([_contact(body, floor, normal=(0.0, 1.0))], self.environment)
+
+        self.assertAlmostEqual(body.velocity_x, 0.0)
+
+    def test_separating_contacts_unchanged(self):
+        """Test that bodies already moving apart keep their velocities."""
+        body_a = PhysicsBody2D(velocity_x=-10.0)
+        body_b = PhysicsBody2D(velocity_x=10.0)
+
+        self.solver.solve([_contact(body_a, body_b)], self.environment)
+
+        self.assertEqual(body_a.velocity_x, -10.0)
+        self.assertEqual(body_b.velocity_x, 10.0)
+
+    def test_triggers_and_static_pairs_skipped(self):
+        """Test that trigger and infinite-mass contacts are ignored."""
+        trigger = PhysicsBody2D(velocity_x=10.0, is_trigger=True)
+        body = PhysicsBody2D()
+        wall = PhysicsBody2D(body_type=BodyType.STATIC, mass=0.0)
+        other_wall = PhysicsBody2D(body_type=BodyType.STATIC, mass=0.0)
+
+        self.solver.solve([_contact(trigger, body), _contact(wall, other_wall)], self.environment)
+
+        self.assertEqual(trigger.velocity_x, 10.0)
+        self.assertEqual(self.solver.cached_impulses, {})
+
+    def test_kinematic_body_is_not_pushed(self):
+        """Test that kinematic bodies push dynamic bodies without being moved."""
+        material = Material(restitution=0.0, friction=0.0)
+        platform = PhysicsBody2D(body_type=BodyType.KINEMATIC, velocity_x=5.0, material=material)
+        body = PhysicsBody2D(material=material)
+
+        self.solver.solve([_contact(platform, body)], self.environment)
+
+        self.assertEqual(platform.velocity_x, 5.0)
+        self.assertAlmostEqual(body.velocity_x, 5.0)
+
+    def test_uses_environment_iterations(self):
+        """Test that the iteration count defaults to the environment setting."""
+        self.environment.collision_iterations = 3
+        body_a = PhysicsBody2D(velocity_x=10.0)
+        body_b = PhysicsBody2D()
+
+        with patch.object(ContactSolver, '_solve_contact') as mock_solve:
+            self.solver.solve([_contact(body_a, body_b)], self.environment)
+            self.assertEqual(mock_solve.call_count, 3)
+
+            mock_solve.reset_mock()
+            self.solver.solve([_contact(body_a, body_b)], self.environment, iterations=5)
+            self.assertEqual(mock_solve.call_count, 5)
+
+    def test_impulses_cached_for_warm_starting(self):
+        """Test that accumulated impulses are cached by body pair and reused."""
+        material = Material(restitution=0.0, friction=0.0)
+        body = PhysicsBody2D(velocity_y=4.0, material=material)
+        floor = PhysicsBody2D(body_type=BodyType.STATIC, mass=0.0, material=material)
+
+        self.solver.solve([_contact(body, floor, normal=(0.0, 1.0))], self.environment)
+        normal_impulse, _, _, normal_y = self.solver.cached_impulses[(body, floor)]
+        self.assertAlmostEqual(normal_impulse, 4.0)
+        self.assertEqual(normal_y, 1.0)
+
+        # With the same load, the warm start alone resolves the contact
+        body.set_linear_velocity(0.0, 4.0)
+        self.solver.solve([_contact(body, floor, normal=(0.0, 1.0))], self.environment, iterations=0)
+        self.assertAlmostEqual(body.velocity_y, 0.0)
+
+    def test_warm_start_ignored_when_normal_flips(self):
+        """Test that cached impulses are dropped if the contact normal changes."""
+        body = PhysicsBody2D(velocity_y=4.0)
+        floor = PhysicsBody2D(body_type=BodyType.STATIC, mass=0.0)
+        self.solver.solve([_contact(body, floor, normal=(0.0, 1.0))], self.environment)
+
+        body.set_linear_velocity(0.0, 0.0)
+        self.solver.solve([_contact(body, floor, normal=(1.0, 0.0))], self.environment, iterations=0)
+
+        self.assertEqual(body.linear_velocity, (0.0, 0.0))
+
+    def test_warm_start_tolerates_small_normal_changes(self):
+        """Test that cached impulses survive a slightly turned normal."""
+        material = Material(restitution=0.0, friction=0.0)
+        body = PhysicsBody2D(velocity_y=4.0, material=material)
+        floor = PhysicsBody2D(body_type=BodyType.STATIC, mass=0.0, material=material)
+        self.solver.solve([_contact(body, floor, normal=(0.0, 1.0))], self.environment)
+
+        body.set_linear_velocity(0.0, 0.0)
+        self.solver.solve([_contact(body, floor, normal=(0.1, 0.995))], self.environment, iterations=0)
+
+        self.assertLess(body.velocity_y, 0.0)
+
+    def test_forget_and_clear(self):
+        """Test dropping cached impulses."""
+        body_a = PhysicsBody2D(velocity_x=10.0)
+        body_b = PhysicsBody2D()
+        body_c = PhysicsBody2D(velocity_x=-10.0)
+        self.solver.solve([_contact(body_a, body_b), _contact(body_b, body_c)], self.environment)
+        self.assertEqual(len(self.solver.cached_impulses), 2)
+
+        self.solver.forget(body_a)
+        self.assertEqual(list(self.solver.cached_impulses), [(body_b, body_c)])
+
+        self.solver.clear()
+        self.assertEqual(self.solver.cached_impulses, {})
+
+    def test_positions_corrected_by_inverse_mass(self):
+        """Test that penetration is pushed out, only moving dynamic bodies."""
+        body = PhysicsBody2D(x=0.0, y=0.0)
+        wall = PhysicsBody2D(x=5.0, y=0.0, body_type=BodyType.STATIC, mass=0.0)
+
+        self.solver.solve([_contact(body, wall, penetration=5.0)], self.environment)
+
+        self.assertLess(body.x, 0.0)
+        self.assertGreater(body.x, -5.0)
+        self.assertEqual(wall.x, 5.0)
+
+
+class TestContactSolverIslands(unittest.TestCase):
+    """Test cases for island splitting and parallel island solving."""
+
+    def _lines(self, count):
+        """Build independent lines of a body pressed against a shared wall."""
+        wall = PhysicsBody2D(body_type=BodyType.STATIC, mass=0.0)
+        collisions = []
+        for line in range(count):
+            body_a = PhysicsBody2D(velocity_x=10.0 + line)
+            body_b = PhysicsBody2D(velocity_x=-5.0)
+            collisions.append(_contact(body_a, body_b, penetration=1.0))
+            collisions.append(_contact(body_b, wall, penetration=0.5))
+        return collisions
+
+    def _state(self, collisions):
+        bodies = []
+        for collision in collisions:
+            for body in (collision.body_a, collision.body_b):
+                if body not in bodies:
+                    bodies.append(body)
+        return [(body.x, body.y, body.velocity_x, body.velocity_y) for body in bodies]
+
+    def test_build_islands_splits_on_dynamic_bodies(self):
+        """Test that shared static bodies don't join islands."""
+        collisions = self._lines(3)
+
+        islands = ContactSolver.build_islands(collisions)
+
+        self.assertEqual(islands, [collisions[0:2], collisions[2:4], collisions[4:6]])
+
+    def test_build_islands_joins_chains(self):
+        """Test that contacts chained through dynamic bodies share an island."""
+        body_a = PhysicsBody2D()
+        body_b = PhysicsBody2D()
+        body_c = PhysicsBody2D()
+        collisions = [_contact(body_a, body_b), _contact(body_c, PhysicsBody2D()), _contact(body_b, body_c)]
+
+        islands = ContactSolver.build_islands(collisions)
+
+        self.assertEqual(islands, [collisions])
+
+    def test_solve_islands_matches_solve(self):
+        """Test that island solving, serial or threaded, matches a single solve."""
+        environment = EnvironmentService()
+        serial = self._lines(6)
+        islands = self._lines(6)
+        threaded = self._lines(6)
+        serial_solver = ContactSolver()
+        island_solver = ContactSolver()
+        threaded_solver = ContactSolver()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for _ in range(3):
+                serial_solver.solve(serial, environment)
+                island_solver.solve_islands(islands, environment)
+                threaded_solver.solve_islands(threaded, environment, executor=executor)
+
+        self.assertEqual(self._state(serial), self._state(islands))
+        self.assertEqual(self._state(serial), self._state(threaded))
+        self.assertEqual(
+            list(serial_solver.cached_impulses.values()),
+            list(threaded_solver.cached_impulses.values()),
+        )
+
+    def test_engine_parallel_islands_is_deterministic(self):
+        """Test that the engine gives identical results with parallel islands."""
+        results = []
+        for parallel in (False, True):
+            engine = PhysicsEngineService(
+                environment=EnvironmentService(gravity=(0.0, 400.0)),
+                parallel_islands=parallel,
+                max_workers=4,
+            )
+            for line in range(4):
+                engine.register_body(PhysicsBody2D(
+                    x=line * 100.0, y=100.0, width=60.0, height=20.0,
+                    body_type=BodyType.STATIC, mass=0.0
+                ))
+                for level in range(3):
+                    engine.register_body(PhysicsBody2D(
+                        x=line * 100.0 + 10.0, y=80.0 - 20.5 * level, width=20.0, height=20.0
+                    ))
+            for _ in range(60):
+                engine.step(engine.get_physics_step())
+            results.append([(body.x, body.y, body.linear_velocity) for body in engine.bodies])
+            self.assertEqual(engine.get_stats()['parallel_islands'], parallel)
+            engine.shutdown()
+
+        self.assertEqual(results[0], results[1])
+
+    def test_engine_parallel_islands_toggle(self):
+        """Test enabling parallel islands and shutting the pool down."""
+        engine = PhysicsEngineService()
+        self.assertFalse(engine.parallel_islands)
+        self.assertIn('gil_enabled', engine.get_stats())
+
+        engine.parallel_islands = True
+        executor = engine._get_executor()
+        self.assertIs(engine._get_executor(), executor)
+
+        engine.parallel_islands = False
+        self.assertIsNone(engine._executor)
+
+    @unittest.skipUnless(os.environ.get('PYROX_BENCHMARKS'), "set PYROX_BENCHMARKS to run timing benchmarks")
+    @unittest.skipIf(_gil_enabled(), "islands only run in parallel on free-threaded builds")
+    def test_parallel_islands_throughput(self):
+        """Benchmark: solving many islands on threads beats the serial solve."""
+        def step_seconds(parallel):
+            engine = PhysicsEngineService(parallel_islands=parallel)
+            for line in range(200):
+                engine.register_body(PhysicsBody2D(
+                    x=line * 40.0, y=200.0, width=30.0, height=10.0,
+                    body_type=BodyType.STATIC, mass=0.0
+                ))
+                for level in range(5):
+                    engine.register_body(PhysicsBody2D(
+                        x=line * 40.0, y=190.5 - 10.0 * level, width=30.0, height=10.0
+                    ))
+            for _ in range(10):
+                engine.step(engine.get_physics_step())
+            try:
+                return min(timeit.repeat(lambda: engine.step(engine.get_physics_step()), number=20, repeat=3))
+            finally:
+                engine.shutdown()
+
+        self.assertLess(step_seconds(True), step_seconds(False))
+
+
+class TestContactSolverStacking(unittest.TestCase):
+    """Test stacked bodies in the engine."""
+
+    def _settle_stack(self, physics_step):
+        environment = EnvironmentService(gravity=(0.0, 400.0))
+        environment.time_to_sleep = 1000.0
+        engine = PhysicsEngineService(
+            environment=environment,
+            collision=CollisionService(),
+            physics_step=physics_step,
+        )
+        floor = PhysicsBody2D(x=-50.0, y=100.0, width=200.0, height=20.0, body_type=BodyType.STATIC, mass=0.0)
+        engine.register_body(floor)
+        crates = [
+            PhysicsBody2D(x=0.0, y=80.0 - 20.5 * level, width=20.0, height=20.0)
+            for level in range(6)
+        ]
+        for crate in crates:
+            engine.register_body(crate)
+
+        for _ in range(int(3.0 / physics_step)):
+            engine.step(physics_step)
+        settled = [crate.y for crate in crates]
+        for _ in range(int(1.0 / physics_step)):
+            engine.step(physics_step)
+        return settled, crates
+
+    def test_stack_is_stable_at_coarse_step(self):
+        """Test that a crate stack settles without sinking or jitter at 30 Hz."""
+        settled, crates = self._settle_stack(1.0 / 30.0)
+
+        for before, crate in zip(settled, crates):
+            self.assertAlmostEqual(before, crate.y, delta=0.5)
+
+        # Each crate rests on the one below instead of sinking into it
+        for lower, upper in zip(crates, crates[1:]):
+            self.assertLess(lower.y - upper.y, 20.5)
+            self.assertGreater(lower.y - upper.y, 17.0)
+        self.assertLess(crates[0].y, 82.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ import tkinter as tk
 from tkinter import ttk
 from pyrox.interfaces import IViewport
 from pyrox.services import MenuRegistry, MenuItemDescriptor, Event, EventBus, EventType
+from pyrox.services.profiler import PhysicsProfiler
 
 
 class ViewportEventType(EventType):
@@ -39,8 +40,11 @@ class ViewportStatusService:
     - Grid/snap status
     - Current tool
     - Custom status messages
+    - Physics step profile (status bar summary and canvas overlay)
     """
 
+    PHYSICS_PROFILE_TAG = "physics_profile"
+
     def __init__(
         self,
         parent: tk.Widget | None = None,
@@ -78,6 +82,7 @@ class ViewportStatusService:
         # EMA smoothing factor: lower = smoother but slower to respond, higher = more reactive
         # 0.2 provides good balance between stability and responsiveness
         self._fps_alpha: float = 0.2
+        self._physics_profile_lines: list[str] = []
 
         ViewportEventBus.subscribe(
             ViewportEventType.GRID,
@@ -152,6 +157,7 @@ class ViewportStatusService:
 
         # FPS counter (right aligned)
         self._create_status_section("fps", "FPS: --", side=tk.RIGHT, width=10)
+        self._create_status_section("physics", "Physics: --", side=tk.RIGHT, width=16)
 
         # Bind mouse motion if canvas provided
         if self._canvas:
@@ -336,6 +342,38 @@ class ViewportStatusService:
         else:
             self.set_fps(0.0)
 
+    def set_physics_profile(self, profile: dict | None) -> None:
+        """Show a physics step profile in the status bar and as a canvas overlay.
+
+        Args:
+            profile: The 'profile' entry of PhysicsEngineService.get_stats(),
+                or None to hide the overlay
+        """
+        if self._canvas:
+            self._canvas.delete(self.PHYSICS_PROFILE_TAG)
+
+        if not profile:
+            self._physics_profile_lines = []
+            if "physics" in self._status_labels:
+                self._status_labels["physics"].config(text="Physics: --")
+            return
+
+        self._physics_profile_lines = PhysicsProfiler.format_lines(profile)
+        if "physics" in self._status_labels:
+            self._status_labels["physics"].config(text=f"Physics: {profile['step']['mean']:.2f}ms")
+
+        if self._canvas:
+            # Pin the overlay to the top-left of the visible area
+            self._canvas.create_text(
+                self._canvas.canvasx(8),
+                self._canvas.canvasy(8),
+                text="\n".join(self._physics_profile_lines),
+                anchor=tk.NW,
+                fill="#cccccc",
+                font=("Consolas", 8),
+                tags=(self.PHYSICS_PROFILE_TAG,),
+            )
+
     # ----------------------------------------
     # Setters and Getters
     # ----------------------------------------